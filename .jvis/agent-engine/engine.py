@@ -15,10 +15,14 @@ Usage:
     # Generate all agents for all platforms
     python engine.py generate-all --platform all
 
+    # Regenerate affected agents as configs, templates or extras change
+    python engine.py watch --platform all
+
     # Validate / report / stubs / list (delegated to engine_extras)
     python engine.py validate dev
     python engine.py validate-all
     python engine.py report
+    python engine.py report --tokens --diff
     python engine.py generate-stubs
     python engine.py list
 """
@@ -140,6 +144,21 @@ def setup_jinja_env() -> SandboxedEnvironment:
     return env
 
 
+_JINJA_ENV: SandboxedEnvironment | None = None
+
+
+def get_jinja_env() -> SandboxedEnvironment:
+    """Return the shared Jinja2 environment.
+
+    Compiled templates are cached across agents; the loader recompiles a
+    template when its file's mtime changes, so edits are still picked up.
+    """
+    global _JINJA_ENV  # noqa: PLW0603
+    if _JINJA_ENV is None:
+        _JINJA_ENV = setup_jinja_env()
+    return _JINJA_ENV
+
+
 # ---------------------------------------------------------------------------
 # Agent config loading
 # ---------------------------------------------------------------------------
@@ -216,6 +235,40 @@ def load_extras(agent_id: str, platform: str) -> str:
 # ---------------------------------------------------------------------------
 # Generation
 # ---------------------------------------------------------------------------
+def render_agent(agent_id: str, config: dict[str, Any], platform: str) -> str:
+    """Render *config* through the *platform* template without writing it.
+
+    *config* is not modified; the output is exactly what ``generate_agent``
+    writes, so it can be measured (``report --tokens``) without generating.
+    """
+    # Setup Jinja2
+    env = get_jinja_env()
+    template = env.get_template(PLATFORMS[platform]["template"])
+
+    # Set config defaults
+    config = dict(config)
+    config.setdefault("activation_extras", [])
+    config.setdefault("icon", "🤖")
+    config.setdefault("customization", None)
+    config.setdefault("inter_agent", {})
+    config.setdefault("dependencies", {})
+    config.setdefault("extended_docs", "")
+    config.setdefault("platform_meta", {})
+
+    # Load extras content
+    extras_content = load_extras(agent_id, platform)
+
+    # Platform-specific metadata — extract before passing config to template
+    plat_meta = config.pop("platform_meta", {}).get(platform, {})
+
+    # Render template
+    return template.render(
+        extras_content=extras_content,
+        platform_meta=plat_meta,
+        **config,
+    ).lstrip('\n')
+
+
 def generate_agent(
     agent_id: str,
     platform: str = "claude",
@@ -244,32 +297,8 @@ def generate_agent(
         else:
             print(f"  WARN: {agent_id} — {dep_status.missing}/{dep_status.total} dependencies missing")
 
-    # Setup Jinja2
-    env = setup_jinja_env()
+    output = render_agent(agent_id, config, platform)
     plat_cfg = PLATFORMS[platform]
-    template = env.get_template(plat_cfg["template"])
-
-    # Set config defaults
-    config.setdefault("activation_extras", [])
-    config.setdefault("icon", "🤖")
-    config.setdefault("customization", None)
-    config.setdefault("inter_agent", {})
-    config.setdefault("dependencies", {})
-    config.setdefault("extended_docs", "")
-    config.setdefault("platform_meta", {})
-
-    # Load extras content
-    extras_content = load_extras(agent_id, platform)
-
-    # Platform-specific metadata — extract before passing config to template
-    plat_meta = config.pop("platform_meta", {}).get(platform, {})
-
-    # Render template
-    output = template.render(
-        extras_content=extras_content,
-        platform_meta=plat_meta,
-        **config,
-    ).lstrip('\n')
 
     # Write to platform output directory
     output_dir = plat_cfg["output_dir"]
@@ -352,8 +381,11 @@ Examples:
   python engine.py validate-all                    # Validate all agents
   python engine.py report                          # Show completeness report
   python engine.py report --json                   # JSON format report
+  python engine.py report --tokens                 # Estimated tokens per agent/platform
+  python engine.py report --tokens --diff          # ... and sections grown since last run
   python engine.py generate-stubs                  # Create missing dependency files
   python engine.py generate-stubs --dry-run        # Preview without creating
+  python engine.py watch --platform all            # Regenerate on change
         """
     )
     subparsers = parser.add_subparsers(dest="command", help="Commands")
@@ -394,6 +426,10 @@ Examples:
     report_parser = subparsers.add_parser("report", help="Show completeness report")
     report_parser.add_argument("--json", action="store_true",
                                help="Output as JSON")
+    report_parser.add_argument("--tokens", action="store_true",
+                               help="Report estimated tokens of each generated output")
+    report_parser.add_argument("--diff", action="store_true",
+                               help="With --tokens: show sections that grew since the last run")
 
     # generate-stubs
     stubs_parser = subparsers.add_parser("generate-stubs",
@@ -401,6 +437,23 @@ Examples:
     stubs_parser.add_argument("--dry-run", action="store_true",
                               help="Preview without creating files")
 
+    # watch
+    watch_parser = subparsers.add_parser("watch",
+                                         help="Regenerate affected agents when their sources change")
+    watch_parser.add_argument("--platform", "-p", default="claude",
+                              choices=["claude", "cursor", "all"],
+                              help="Target platform (default: claude)")
+    watch_parser.add_argument("--strict", action="store_true",
+                              help="Fail on missing dependencies")
+    watch_parser.add_argument("--include-drafts", action="store_true",
+                              help="Include draft agents in generation")
+    watch_parser.add_argument("--poll", action="store_true",
+                              help="Poll file mtimes instead of using inotify")
+    watch_parser.add_argument("--interval", type=float, default=0.5,
+                              help="Polling interval in seconds (default: 0.5)")
+    watch_parser.add_argument("--debounce", type=int, default=200,
+                              help="Quiet period in ms that ends a burst of changes (default: 200)")
+
     args = parser.parse_args()
 
     if args.command == "generate":
@@ -422,6 +475,18 @@ Examples:
         if args.strict and len(results) < len(find_all_agents()):
             sys.exit(1)
 
+    elif args.command == "watch":
+        from engine_watch import watch
+
+        watch(
+            platform=args.platform,
+            strict=args.strict,
+            include_drafts=args.include_drafts,
+            poll=args.poll,
+            interval=args.interval,
+            debounce=args.debounce / 1000,
+        )
+
     elif args.command in ("validate", "validate-all", "report",
                           "generate-stubs", "list"):
         # Delegate to engine_extras
@@ -429,6 +494,7 @@ Examples:
             generate_report,
             generate_stubs,
             list_agents,
+            token_report,
             validate_all,
             validate_config,
         )
@@ -449,7 +515,10 @@ Examples:
 
         elif args.command == "report":
             output_format = "json" if args.json else "text"
-            generate_report(output_format)
+            if args.tokens or args.diff:
+                token_report(output_format, show_diff=args.diff)
+            else:
+                generate_report(output_format)
 
         elif args.command == "generate-stubs":
             count = generate_stubs(dry_run=args.dry_run)
@@ -8,7 +8,7 @@ Split from engine.py to keep the core generation pipeline lean.
 Usage:
     These functions are called from engine.py CLI commands:
     - validate, validate-all
-    - report
+    - report, report --tokens [--diff]
     - generate-stubs
     - list
 """
@@ -16,20 +16,32 @@ Usage:
 from __future__ import annotations
 
 import json
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 import yaml
-from jsonschema import ValidationError, validate
-
 from engine import (
     DEPS_DIRS,
+    JVIS_DIR,
     PACKS,
+    PLATFORMS,
     SCHEMA_FILE,
     find_all_agents,
     load_agent_config,
+    render_agent,
     validate_dependencies,
 )
+from jinja2 import TemplateNotFound
+from jsonschema import ValidationError, validate
+
+# Same heuristic as jvis.utils.tokens — the engine has no tokenizer dependency.
+CHARS_PER_TOKEN = 4
+
+# Section sizes of the last `report --tokens` run, for `report --tokens --diff`
+TOKENS_CACHE = JVIS_DIR / "cache" / "agent-tokens.json"
 
 _SCHEMA: dict[str, Any] | None = None
 
@@ -64,6 +76,17 @@ def validate_config(agent_id: str, check_deps: bool = True) -> bool:
         if dep_status.missing > 0:
             errors.append(f"{dep_status.missing}/{dep_status.total} dependencies missing")
 
+    # Token budget — every generated output is loaded into the assistant's context
+    budget = config.get("max_tokens")
+    if isinstance(budget, int):
+        for platform in PLATFORMS:
+            try:
+                tokens = estimate_tokens(render_agent(agent_id, config, platform))
+            except TemplateNotFound:
+                continue
+            if tokens > budget:
+                errors.append(f"{platform} output is ~{tokens:,} tokens, over max_tokens {budget:,}")
+
     if errors:
         print(f"✗ {agent_id}:")
         for err in errors:
@@ -179,6 +202,247 @@ def generate_report(output_format: str = "text") -> None:
                     print(f"  ... and {count - 10} more")
 
 
+# ---------------------------------------------------------------------------
+# Token accounting
+# ---------------------------------------------------------------------------
+_HEADING_RE = re.compile(r"^(#{1,2}) +(.+?)\s*$")
+
+
+@dataclass
+class OutputSize:
+    """Estimated size of one generated agent output."""
+    agent_id: str
+    pack: str
+    platform: str
+    chars: int
+    lines: int
+    tokens: int
+    sections: dict[str, int] = field(default_factory=dict)  # heading -> tokens
+
+
+@dataclass
+class SectionGrowth:
+    """A section of one output that grew since the last recorded run."""
+    output: str  # "<agent_id>/<platform>"
+    section: str
+    before: int
+    after: int
+
+    @property
+    def delta(self) -> int:
+        return self.after - self.before
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of *text* (~4 characters per token, rounded up)."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def section_tokens(text: str) -> dict[str, int]:
+    """Split markdown *text* at its ``#``/``##`` headings; estimated tokens per section.
+
+    Frontmatter and text before the first heading get their own entries;
+    ``###`` and deeper stay inside their parent, and headings in fenced code
+    are ignored. A repeated heading is suffixed `` (2)``, `` (3)``, ...
+    """
+    lines = text.splitlines(keepends=True)
+    parts: dict[str, list[str]] = {}
+    start = 0
+    if lines and lines[0].strip() == "---":
+        end = next((i for i in range(1, len(lines)) if lines[i].strip() == "---"), None)
+        if end is not None:
+            parts["(frontmatter)"] = lines[:end + 1]
+            start = end + 1
+
+    name = "(preamble)"
+    in_fence = False
+    for line in lines[start:]:
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADING_RE.match(line)
+        if match:
+            name = base = f"{match[1]} {match[2]}"
+            count = 1
+            while name in parts:
+                count += 1
+                name = f"{base} ({count})"
+        parts.setdefault(name, []).append(line)
+
+    return {name: estimate_tokens("".join(part)) for name, part in parts.items() if "".join(part).strip()}
+
+
+def measure_agent(agent_id: str, config: dict[str, Any], platform: str) -> OutputSize:
+    """Render one agent for *platform* (nothing is written) and measure it."""
+    text = render_agent(agent_id, config, platform)
+    return OutputSize(
+        agent_id=agent_id,
+        pack=config.get("pack", ""),
+        platform=platform,
+        chars=len(text),
+        lines=text.count("\n") + (1 if text and not text.endswith("\n") else 0),
+        tokens=estimate_tokens(text),
+        sections=section_tokens(text),
+    )
+
+
+def measure_outputs() -> tuple[list[OutputSize], dict[str, str]]:
+    """Measure every agent on every platform.
+
+    Returns the sizes and, per platform that could not be rendered, the reason.
+    """
+    sizes: list[OutputSize] = []
+    skipped: dict[str, str] = {}
+    for _pack, agent_id, config in find_all_agents():
+        for platform in PLATFORMS:
+            if platform in skipped:
+                continue
+            try:
+                sizes.append(measure_agent(agent_id, config, platform))
+            except TemplateNotFound as exc:
+                skipped[platform] = f"template {exc.name} not found"
+    return sizes, skipped
+
+
+def load_token_snapshot() -> dict[str, Any]:
+    """Load the sizes recorded by the last ``report --tokens`` run (empty if none)."""
+    try:
+        data = json.loads(TOKENS_CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_token_snapshot(sizes: list[OutputSize]) -> None:
+    """Record *sizes* as the baseline for the next ``report --tokens --diff``."""
+    data = {
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "outputs": {
+            f"{s.agent_id}/{s.platform}": {"tokens": s.tokens, "sections": s.sections}
+            for s in sizes
+        },
+    }
+    TOKENS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    TOKENS_CACHE.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def section_growth(previous: dict[str, Any], sizes: list[OutputSize]) -> list[SectionGrowth]:
+    """Sections of *sizes* larger than in the *previous* snapshot, biggest growth first.
+
+    Sections (and outputs) that did not exist before count as grown from 0.
+    """
+    recorded = previous.get("outputs", {})
+    grown: list[SectionGrowth] = []
+    for s in sizes:
+        output = f"{s.agent_id}/{s.platform}"
+        before_sections = recorded.get(output, {}).get("sections", {})
+        for section, after in s.sections.items():
+            before = before_sections.get(section, 0)
+            if after > before:
+                grown.append(SectionGrowth(output, section, before, after))
+    grown.sort(key=lambda g: (-g.delta, g.output, g.section))
+    return grown
+
+
+def token_report(output_format: str = "text", show_diff: bool = False) -> None:
+    """Report the estimated token size of every generated output, per agent and platform.
+
+    Each run records its section sizes; *show_diff* lists the sections that
+    grew since the previous run (the first run is only the baseline).
+    """
+    sizes, skipped = measure_outputs()
+    previous = load_token_snapshot() if show_diff else {}
+    growth = section_growth(previous, sizes) if previous else []
+
+    configs = {agent_id: config for _pack, agent_id, config in find_all_agents()}
+    platforms = [p for p in PLATFORMS if p not in skipped]
+    by_agent: dict[str, dict[str, OutputSize]] = {}
+    for s in sizes:
+        by_agent.setdefault(s.agent_id, {})[s.platform] = s
+    over = [
+        s for s in sizes
+        if isinstance(budget := configs[s.agent_id].get("max_tokens"), int) and s.tokens > budget
+    ]
+    save_token_snapshot(sizes)
+
+    if output_format == "json":
+        data: dict[str, Any] = {
+            "chars_per_token": CHARS_PER_TOKEN,
+            "summary": {
+                "total_tokens": {p: sum(s.tokens for s in sizes if s.platform == p) for p in platforms},
+                "over_budget": [f"{s.agent_id}/{s.platform}" for s in over],
+            },
+            "skipped_platforms": skipped,
+            "agents": [
+                {
+                    "id": agent_id,
+                    "pack": configs[agent_id].get("pack", ""),
+                    "max_tokens": configs[agent_id].get("max_tokens"),
+                    "outputs": {
+                        p: {"chars": s.chars, "lines": s.lines, "tokens": s.tokens, "sections": s.sections}
+                        for p, s in outputs.items()
+                    },
+                }
+                for agent_id, outputs in by_agent.items()
+            ],
+        }
+        if show_diff:
+            data["diff"] = {
+                "since": previous.get("recorded_at"),
+                "grown": [
+                    {"output": g.output, "section": g.section, "before": g.before, "after": g.after}
+                    for g in growth
+                ],
+            }
+        print(json.dumps(data, indent=2))
+        return
+
+    # Text format
+    print("=" * 70)
+    print(f"JVIS AGENT TOKEN REPORT (estimated, ~{CHARS_PER_TOKEN} chars/token)")
+    print("=" * 70)
+
+    # Largest outputs first
+    rows = sorted(by_agent.items(), key=lambda item: -max(s.tokens for s in item[1].values()))
+    print(f"\n  {'Agent':<20} {'Pack':<13}" + "".join(f"{p:>10}" for p in platforms) + f"{'Budget':>10}")
+    for agent_id, outputs in rows:
+        budget = configs[agent_id].get("max_tokens")
+        cells = "".join(f"{outputs[p].tokens:>10,}" if p in outputs else f"{'—':>10}" for p in platforms)
+        budget_cell = f"{budget:>10,}" if isinstance(budget, int) else f"{'—':>10}"
+        print(f"  {agent_id:<20} {configs[agent_id].get('pack', ''):<13}{cells}{budget_cell}")
+    totals = "".join(f"{sum(s.tokens for s in sizes if s.platform == p):>10,}" for p in platforms)
+    print(f"  {'Total':<34}{totals}")
+
+    if over:
+        print(f"\n{'=' * 70}")
+        print("OVER BUDGET")
+        print("=" * 70)
+        for s in over:
+            print(f"  ✗ {s.agent_id} ({s.platform}): ~{s.tokens:,} tokens > max_tokens "
+                  f"{configs[s.agent_id]['max_tokens']:,}")
+
+    for platform, reason in skipped.items():
+        print(f"\n  {platform}: not measured ({reason})")
+
+    if not show_diff:
+        return
+
+    print(f"\n{'=' * 70}")
+    print("SECTIONS THAT GREW SINCE THE LAST RUN")
+    print("=" * 70)
+    if not previous:
+        print("  No previous run recorded — this run is the baseline.")
+        return
+    print(f"  Since {previous.get('recorded_at', 'unknown')}")
+    if not growth:
+        print("  No section grew.")
+    for g in growth[:20]:
+        print(f"  +{g.delta:>6,}  {g.output:<28} {g.section}  ({g.before:,} → {g.after:,})")
+    if len(growth) > 20:
+        print(f"  ... and {len(growth) - 20} more")
+    before_total = sum(o.get("tokens", 0) for o in previous.get("outputs", {}).values())
+    print(f"\n  Net change: {sum(s.tokens for s in sizes) - before_total:+,} tokens")
+
+
 def generate_stubs(dry_run: bool = False) -> int:
     """Generate stub files for all missing dependencies."""
     agents = find_all_agents()
@@ -0,0 +1,456 @@
+"""
+JVIS Agent Engine - Watch
+=========================
+
+``engine.py watch`` regenerates agent outputs as their sources change,
+instead of rerunning ``generate-all`` by hand.
+
+What a change regenerates:
+    agents/<pack>/<id>.yaml               -> <id>, every selected platform
+    agent-engine/templates/<platform tpl> -> every agent, platforms using that template
+    agent-engine/templates/<other file>   -> every agent, every platform (shared partials)
+    platform/<platform>/<id>-extras.md    -> <id>, that platform
+    DEPS_DIRS (checklists, tasks, ...)    -> agents listing the file, when it is added or
+                                             removed (dependency contents are not rendered)
+
+Changes come from inotify on Linux (through ctypes, no extra dependency) and
+from mtime/size polling elsewhere, or with ``--poll``. A burst of events — an
+editor's save, a ``git checkout`` — is debounced into one cycle, and each
+cycle prints what it regenerated and how long it took.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+from engine import (
+    AGENTS_DIR,
+    DEPS_DIRS,
+    PLATFORM_DIR,
+    PLATFORMS,
+    PROJECT_ROOT,
+    TEMPLATES_DIR,
+    find_all_agents,
+    generate_agent,
+    load_agent_config,
+)
+
+DEFAULT_DEBOUNCE = 0.2  # seconds of quiet that end a burst
+MAX_BURST = 2.0  # a continuous burst still regenerates at least this often
+DEFAULT_INTERVAL = 0.5  # polling period in seconds
+
+# Editor swap/backup files never affect an output.
+_IGNORED_SUFFIXES = ("~", ".swp", ".swx", ".tmp")
+
+
+@dataclass(frozen=True)
+class Change:
+    """A watched file that was added, modified or removed.
+
+    ``kind == "rescan"`` means events were lost and everything is stale.
+    """
+
+    path: Path
+    kind: str
+
+
+class Watcher(Protocol):
+    backend: str
+
+    def read(self, timeout: float | None) -> list[Change]:
+        """Wait up to *timeout* seconds (None = forever) and return the changes seen."""
+        ...
+
+    def close(self) -> None: ...
+
+
+def watch_roots() -> list[Path]:
+    """Directories whose files feed generation."""
+    return [AGENTS_DIR, TEMPLATES_DIR, PLATFORM_DIR, *DEPS_DIRS.values()]
+
+
+def _ignored(name: str) -> bool:
+    return name.startswith(".") or name.endswith(_IGNORED_SUFFIXES)
+
+
+def _under(path: Path, root: Path) -> bool:
+    return path == root or root in path.parents
+
+
+# ---------------------------------------------------------------------------
+# Polling
+# ---------------------------------------------------------------------------
+def _snapshot(roots: Iterable[Path]) -> dict[Path, tuple[int, int]]:
+    """Map every file under *roots* to its (mtime_ns, size)."""
+    files: dict[Path, tuple[int, int]] = {}
+    stack = [root for root in roots if root.is_dir()]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if _ignored(entry.name):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    files[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return files
+
+
+def _diff(before: dict[Path, tuple[int, int]], after: dict[Path, tuple[int, int]]) -> list[Change]:
+    changes = [Change(path, "removed") for path in before.keys() - after.keys()]
+    for path, stamp in after.items():
+        if path not in before:
+            changes.append(Change(path, "added"))
+        elif before[path] != stamp:
+            changes.append(Change(path, "modified"))
+    return changes
+
+
+class PollingWatcher:
+    """Detect changes by comparing mtime/size snapshots every *interval* seconds."""
+
+    backend = "polling"
+
+    def __init__(self, roots: Iterable[Path], interval: float = DEFAULT_INTERVAL) -> None:
+        self.roots = list(roots)
+        self.interval = interval
+        self._files = _snapshot(self.roots)
+
+    def read(self, timeout: float | None) -> list[Change]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            pause = self.interval if deadline is None else max(0.0, min(self.interval, deadline - time.monotonic()))
+            time.sleep(pause)
+            current = _snapshot(self.roots)
+            changes = _diff(self._files, current)
+            self._files = current
+            if changes or (deadline is not None and time.monotonic() >= deadline):
+                return changes
+
+    def close(self) -> None:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# inotify (Linux)
+# ---------------------------------------------------------------------------
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_MASK = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len — followed by a NUL-padded name
+
+
+class InotifyWatcher:
+    """Receive change events from the kernel; watches are added for new subdirectories.
+
+    A root that does not exist yet is picked up when it is created, through a
+    watch on its parent.
+    """
+
+    backend = "inotify"
+
+    def __init__(self, roots: Iterable[Path]) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._fd: int = fd
+        self.roots = list(roots)
+        self._dirs: dict[int, Path] = {}
+        try:
+            for root in self.roots:
+                if root.is_dir():
+                    self._watch_tree(root)
+                elif root.parent.is_dir():
+                    self._watch(root.parent)
+        except OSError:
+            os.close(self._fd)
+            raise
+
+    def _watch(self, directory: Path) -> None:
+        wd = self._add_watch(self._fd, os.fsencode(directory), _IN_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_add_watch {directory}: {os.strerror(errno)}")
+        self._dirs[wd] = directory
+
+    def _watch_tree(self, root: Path) -> None:
+        self._watch(root)
+        for dirpath, dirnames, _ in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not _ignored(d)]
+            for name in dirnames:
+                self._watch(Path(dirpath) / name)
+
+    def _watched(self, path: Path) -> bool:
+        return any(_under(path, root) for root in self.roots)
+
+    def read(self, timeout: float | None) -> list[Change]:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return []
+        changes: list[Change] = []
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            changes.extend(self._parse(data))
+        return changes
+
+    def _parse(self, data: bytes) -> list[Change]:
+        changes: list[Change] = []
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            raw = data[offset + _EVENT.size : offset + _EVENT.size + length]
+            offset += _EVENT.size + length
+            if mask & _IN_Q_OVERFLOW:
+                changes.append(Change(self.roots[0], "rescan"))
+                continue
+            if mask & (_IN_IGNORED | _IN_DELETE_SELF):
+                self._dirs.pop(wd, None)
+                continue
+            directory = self._dirs.get(wd)
+            name = os.fsdecode(raw.split(b"\0", 1)[0])
+            if directory is None or not name or _ignored(name):
+                continue
+            path = directory / name
+            if not self._watched(path):
+                continue
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    # Files may land in a new directory before its watch exists.
+                    try:
+                        self._watch_tree(path)
+                    except OSError as exc:
+                        print(f"  WARN: cannot watch {path}: {exc}")
+                    changes.extend(Change(file, "added") for file in _snapshot([path]))
+            elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                changes.append(Change(path, "removed"))
+            elif mask & (_IN_CREATE | _IN_MOVED_TO):
+                changes.append(Change(path, "added"))
+            elif mask & _IN_CLOSE_WRITE:
+                changes.append(Change(path, "modified"))
+        return changes
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def make_watcher(roots: Iterable[Path], poll: bool = False, interval: float = DEFAULT_INTERVAL) -> Watcher:
+    """Return an inotify watcher when available, otherwise a polling one."""
+    roots = list(roots)
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError) as exc:
+            print(f"inotify unavailable ({exc}); polling every {interval:g}s")
+    return PollingWatcher(roots, interval)
+
+
+# ---------------------------------------------------------------------------
+# Debouncing and planning
+# ---------------------------------------------------------------------------
+def coalesce(changes: Iterable[Change]) -> list[Change]:
+    """Merge changes to the same path into their net effect, in first-seen order."""
+    merged: dict[Path, str] = {}
+    for change in changes:
+        before = merged.get(change.path)
+        kind = change.kind
+        if before == "added":
+            kind = "added" if kind != "removed" else ""
+        elif before in ("removed", "modified") and kind == "added":
+            kind = "modified"  # replaced, e.g. by an editor's rename-on-save
+        if kind:
+            merged[change.path] = kind
+        else:
+            del merged[change.path]  # created and deleted within the burst
+    return [Change(path, kind) for path, kind in merged.items()]
+
+
+def collect(watcher: Watcher, debounce: float = DEFAULT_DEBOUNCE, max_burst: float = MAX_BURST) -> list[Change]:
+    """Block until something changes, then until *debounce* seconds pass without changes."""
+    changes: list[Change] = []
+    while not changes:
+        changes = watcher.read(None)
+    first = time.monotonic()
+    while (remaining := max_burst - (time.monotonic() - first)) > 0:
+        more = watcher.read(min(debounce, remaining))
+        if not more:
+            break
+        changes.extend(more)
+    return coalesce(changes)
+
+
+class AgentIndex:
+    """Agent configs by id, kept current as their YAML files change."""
+
+    def __init__(self) -> None:
+        self.configs: dict[str, dict[str, Any]] = {agent_id: config for _, agent_id, config in find_all_agents()}
+
+    def refresh(self, agent_id: str) -> None:
+        config = load_agent_config(agent_id)
+        if config is None:
+            self.configs.pop(agent_id, None)
+        else:
+            self.configs[agent_id] = config
+
+
+def affected_outputs(change: Change, index: AgentIndex, platforms: list[str]) -> set[tuple[str, str]]:
+    """Return the (agent_id, platform) outputs that *change* makes stale."""
+    path = change.path
+    everything = {(agent_id, plat) for agent_id in index.configs for plat in platforms}
+    if change.kind == "rescan":
+        return everything
+
+    if _under(path, AGENTS_DIR):
+        if path.suffix != ".yaml" or change.kind == "removed" or path.stem not in index.configs:
+            return set()  # outputs of removed agents are left in place, as generate-all does
+        return {(path.stem, plat) for plat in platforms}
+
+    if _under(path, TEMPLATES_DIR):
+        name = path.relative_to(TEMPLATES_DIR).as_posix()
+        platform_templates = {cfg["template"] for cfg in PLATFORMS.values()}
+        if name not in platform_templates:
+            return everything  # a partial may be included by any platform template
+        return {(agent_id, plat) for agent_id, plat in everything if PLATFORMS[plat]["template"] == name}
+
+    if _under(path, PLATFORM_DIR):
+        parts = path.relative_to(PLATFORM_DIR).parts
+        if len(parts) == 2 and parts[0] in platforms and parts[1].endswith("-extras.md"):
+            agent_id = parts[1].removesuffix("-extras.md")
+            if agent_id in index.configs:
+                return {(agent_id, parts[0])}
+        return set()
+
+    for dep_type, dep_dir in DEPS_DIRS.items():
+        if _under(path, dep_dir):
+            if change.kind == "modified":
+                return set()
+            dep = path.relative_to(dep_dir).as_posix()
+            return {
+                (agent_id, plat)
+                for agent_id, config in index.configs.items()
+                if dep in (config.get("dependencies") or {}).get(dep_type, [])
+                for plat in platforms
+            }
+    return set()
+
+
+def plan(
+    changes: list[Change],
+    index: AgentIndex,
+    platforms: list[str],
+    include_drafts: bool = False,
+) -> list[tuple[str, str]]:
+    """Refresh *index* for changed agent configs and return the outputs to regenerate, sorted."""
+    for change in changes:
+        if _under(change.path, AGENTS_DIR) and change.path.suffix == ".yaml":
+            index.refresh(change.path.stem)
+
+    outputs: set[tuple[str, str]] = set()
+    for change in changes:
+        outputs |= affected_outputs(change, index, platforms)
+    if not include_drafts:
+        outputs = {(a, p) for a, p in outputs if index.configs[a].get("status", "draft") != "draft"}
+    return sorted(outputs, key=lambda output: (platforms.index(output[1]), output[0]))
+
+
+# ---------------------------------------------------------------------------
+# Watch loop
+# ---------------------------------------------------------------------------
+def regenerate(
+    changes: list[Change],
+    index: AgentIndex,
+    platforms: list[str],
+    strict: bool = False,
+    include_drafts: bool = False,
+) -> tuple[int, int]:
+    """Run one cycle for *changes* and print its report. Returns (generated, failed)."""
+    started = time.perf_counter()
+    outputs = plan(changes, index, platforms, include_drafts=include_drafts)
+    stamp = time.strftime("%H:%M:%S")
+    noun = "change" if len(changes) == 1 else "changes"
+
+    if not outputs:
+        names = ", ".join(str(c.path.relative_to(PROJECT_ROOT)) for c in changes[:3])
+        more = f" and {len(changes) - 3} more" if len(changes) > 3 else ""
+        print(f"[{stamp}] {len(changes)} {noun}, nothing to regenerate ({names}{more})")
+        return 0, 0
+
+    print(f"[{stamp}] {len(changes)} {noun} -> {len(outputs)} outputs")
+    generated = failed = 0
+    for agent_id, plat in outputs:
+        try:
+            result = generate_agent(agent_id, platform=plat, strict=strict)
+        except Exception as exc:  # a broken template must not stop the watcher
+            result = None
+            print(f"  ✗ {agent_id} ({plat}) - {type(exc).__name__}: {exc}")
+        else:
+            if result is None:
+                print(f"  ✗ {agent_id} ({plat}) - FAILED")
+            else:
+                print(f"  ✓ {agent_id} ({plat})")
+        if result is None:
+            failed += 1
+        else:
+            generated += 1
+
+    elapsed = (time.perf_counter() - started) * 1000
+    summary = f"  regenerated {generated}/{len(outputs)} in {elapsed:.0f} ms"
+    print(summary + (f" ({failed} failed)" if failed else ""))
+    return generated, failed
+
+
+def watch(
+    platform: str = "claude",
+    strict: bool = False,
+    include_drafts: bool = False,
+    poll: bool = False,
+    interval: float = DEFAULT_INTERVAL,
+    debounce: float = DEFAULT_DEBOUNCE,
+) -> None:
+    """Watch agent sources and regenerate affected outputs until interrupted."""
+    platforms = list(PLATFORMS.keys()) if platform == "all" else [platform]
+    roots = watch_roots()
+    watcher = make_watcher(roots, poll=poll, interval=interval)
+    index = AgentIndex()
+
+    watched = [str(root.relative_to(PROJECT_ROOT)) for root in roots if root.is_dir()]
+    print(f"Watching {', '.join(watched)} ({watcher.backend}) for {', '.join(platforms)}")
+    print(f"{len(index.configs)} agents indexed; debounce {debounce * 1000:.0f} ms. Press Ctrl+C to stop.")
+    try:
+        while True:
+            regenerate(collect(watcher, debounce), index, platforms, strict=strict, include_drafts=include_drafts)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        watcher.close()
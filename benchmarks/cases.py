@@ -0,0 +1,258 @@
+"""Benchmark cases — end-to-end scaffold paths timed by ``benchmarks/run.py``.
+
+Each case gets a shared directory (built once by ``setup``) and a fresh
+scratch directory per iteration (optionally populated by ``prepare``).
+Only ``run`` is timed; setup and prepare work is excluded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import subprocess
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+# Monorepo combinations scaffolded through jvis.api.scaffold (backend, frontend).
+MONOREPO_PAIRS = (
+    ("python-fastapi", "react-vite"),
+    ("nodejs-express", "vue-vite"),
+    ("python-django", "angular"),
+)
+
+# Synthetic tree sizes. Large enough that per-file overhead dominates,
+# small enough that `make bench` finishes in a couple of minutes.
+ENTITY_TREE_MODULES = 60
+ENTITY_TREE_FILES_PER_MODULE = 40
+NODE_MODULES_PACKAGES = 400
+NODE_MODULES_FILES_PER_PACKAGE = 12
+
+
+# Agent-engine platforms (engine.py PLATFORMS) whose template ships in .jvis/agent-engine/templates/.
+# claude.md is not in this tree, so "claude" would only ever be skipped; add it back with its template.
+ENGINE_PLATFORMS = ("cursor",)
+
+
+class SkipCase(Exception):
+    """Raised from ``setup`` when a case cannot run in this tree."""
+
+
+@dataclass
+class CaseContext:
+    """Directories handed to a case: ``shared`` persists across iterations, ``scratch`` does not."""
+
+    shared: Path
+    scratch: Path
+
+
+@dataclass
+class BenchCase:
+    """A single timed operation.
+
+    ``run`` is timed as a whole unless it returns a float: the seconds it
+    measured itself, for cases that time one stage of a larger call.
+    """
+
+    name: str
+    run: Callable[[CaseContext], object]
+    setup: Callable[[Path], None] | None = None
+    prepare: Callable[[CaseContext], None] | None = None
+
+
+# =============================================================================
+# jvis new
+# =============================================================================
+
+
+def _new_case(stack_id: str) -> BenchCase:
+    def run(ctx: CaseContext) -> None:
+        from click.testing import CliRunner
+
+        from jvis.cli import cli
+
+        args = ["new", "--name", "bench-app", "--stack", stack_id, "--path", str(ctx.scratch / "app"), "-y"]
+        result = CliRunner().invoke(cli, args)
+        if result.exit_code != 0:
+            raise RuntimeError(f"jvis new --stack {stack_id} failed:\n{result.output}") from result.exception
+
+    return BenchCase(f"new/{stack_id}", run)
+
+
+# =============================================================================
+# jvis.api monorepo scaffold
+# =============================================================================
+
+
+def _monorepo_case(backend_id: str, frontend_id: str) -> BenchCase:
+    def run(ctx: CaseContext) -> float:
+        from jvis.api import ProjectConfig, scaffold
+        from jvis.stacks.registry import get_stack
+
+        config = ProjectConfig(
+            project_name="bench-app",
+            project_description="",
+            project_dir=ctx.scratch / "app",
+            project_type="fullstack",
+            stacks={
+                "stack": None,
+                "backend": get_stack(backend_id),
+                "frontend": get_stack(frontend_id),
+                "mobile": None,
+            },
+            database="postgresql",
+        )
+        report = asyncio.run(scaffold(config))
+        missing = {f"run_stack[{backend_id}]", f"run_stack[{frontend_id}]"} - report.stages.keys()
+        if missing:
+            raise RuntimeError(f"monorepo scaffold did not render {', '.join(sorted(missing))}")
+        # Framework install, docs and git are covered by other cases; report only the monorepo stage.
+        return report.stages["scaffold"] / 1000
+
+    return BenchCase(f"monorepo/{backend_id}+{frontend_id}", run)
+
+
+# =============================================================================
+# apply_entity_name
+# =============================================================================
+
+_ENTITY_SOURCE = '''"""Item service."""
+
+from app.models.item import Item, ItemCreate
+
+
+class ItemService:
+    """CRUD operations for items."""
+
+    def list_items(self) -> list[Item]:
+        return self.repo.items()
+
+    def create_item(self, data: ItemCreate) -> Item:
+        item = Item(**data.model_dump())
+        return self.repo.add(item)
+'''
+
+
+def _build_entity_tree(shared: Path) -> None:
+    root = shared / "tree"
+    for m in range(ENTITY_TREE_MODULES):
+        module = root / "src" / f"module_{m}" / "items"
+        module.mkdir(parents=True)
+        for f in range(ENTITY_TREE_FILES_PER_MODULE):
+            name = f"item_{f}.py" if f % 2 else f"handler_{f}.py"
+            (module / name).write_text(_ENTITY_SOURCE * 4)
+    # Skipped by apply_entity_name, but still walked.
+    _build_node_modules(root / "node_modules", packages=100)
+
+
+def _copy_entity_tree(ctx: CaseContext) -> None:
+    shutil.copytree(ctx.shared / "tree", ctx.scratch / "tree")
+
+
+def _rename_entity(ctx: CaseContext) -> None:
+    from jvis.scaffold.entity_rename import apply_entity_name
+
+    apply_entity_name(ctx.scratch / "tree", "product")
+
+
+# =============================================================================
+# Brownfield detection
+# =============================================================================
+
+
+def _build_node_modules(node_modules: Path, packages: int = NODE_MODULES_PACKAGES) -> None:
+    for p in range(packages):
+        pkg = node_modules / f"pkg-{p}"
+        (pkg / "lib").mkdir(parents=True)
+        (pkg / "package.json").write_text(f'{{"name": "pkg-{p}", "version": "1.0.0", "main": "lib/index.js"}}\n')
+        (pkg / "README.md").write_text(f"# pkg-{p}\n")
+        for f in range(NODE_MODULES_FILES_PER_PACKAGE):
+            (pkg / "lib" / f"file_{f}.js").write_text("module.exports = function () { return 42; };\n")
+
+
+def _build_brownfield(shared: Path) -> None:
+    """A JVIS-less monorepo: TypeScript client with a large node_modules, Python backend.
+
+    No config file at the root, so detect_project_state falls through to
+    walking client/ (node_modules included) for source files.
+    """
+    repo = shared / "brownfield"
+    client = repo / "client"
+    (client / "src").mkdir(parents=True)
+    (client / "package.json").write_text('{"dependencies": {"react": "^18.0.0", "@prisma/client": "^5.0.0"}}\n')
+    (client / "tsconfig.json").write_text("{}\n")
+    for f in range(200):
+        (client / "src" / f"component_{f}.tsx").write_text("export const C = () => null;\n")
+    _build_node_modules(client / "node_modules")
+
+    backend = repo / "backend"
+    (backend / "app").mkdir(parents=True)
+    (backend / "pyproject.toml").write_text('[project]\nname = "backend"\ndependencies = ["fastapi", "psycopg"]\n')
+    for f in range(100):
+        (backend / "app" / f"module_{f}.py").write_text("VALUE = 1\n")
+    (repo / "README.md").write_text("# Brownfield\n")
+
+
+def _detect_tech_stack(ctx: CaseContext) -> None:
+    from jvis.detection.tech_stack import detect_tech_stack
+
+    detect_tech_stack(ctx.shared / "brownfield")
+
+
+def _detect_project_state(ctx: CaseContext) -> None:
+    from jvis.detection.project_state import detect_project_state
+
+    detect_project_state(ctx.shared / "brownfield")
+
+
+# =============================================================================
+# Framework install + agent engine
+# =============================================================================
+
+
+def _install_framework(ctx: CaseContext) -> None:
+    from jvis.scaffold.framework import install_framework
+
+    install_framework(ctx.scratch / "app")
+
+
+def _engine_case(platform: str) -> BenchCase:
+    def setup(shared: Path) -> None:
+        from jvis.scaffold.framework import install_framework
+
+        install_framework(shared / "app")
+        template = shared / "app" / ".jvis" / "agent-engine" / "templates" / f"{platform}.md"
+        if not template.is_file():
+            raise SkipCase(f"agent-engine template {template.name} not found")
+
+    def run(ctx: CaseContext) -> None:
+        engine = ctx.shared / "app" / ".jvis" / "agent-engine" / "engine.py"
+        subprocess.run(
+            [sys.executable, str(engine), "generate-all", "--platform", platform],
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+
+    return BenchCase(f"engine/generate-all[{platform}]", run, setup=setup)
+
+
+# =============================================================================
+# Registry
+# =============================================================================
+
+
+def all_cases() -> list[BenchCase]:
+    """Return every benchmark case, in a stable order."""
+    from jvis.stacks.registry import discover_stacks
+
+    cases = [_new_case(stack_id) for stack_id in sorted(discover_stacks())]
+    cases += [_monorepo_case(backend, frontend) for backend, frontend in MONOREPO_PAIRS]
+    cases += [
+        BenchCase("entity-rename/large-tree", _rename_entity, setup=_build_entity_tree, prepare=_copy_entity_tree),
+        BenchCase("detect/tech-stack", _detect_tech_stack, setup=_build_brownfield),
+        BenchCase("detect/project-state", _detect_project_state, setup=_build_brownfield),
+        BenchCase("framework/install", _install_framework),
+    ]
+    cases += [_engine_case(platform) for platform in ENGINE_PLATFORMS]
+    return cases
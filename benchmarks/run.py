@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""Run the scaffold benchmarks and compare them against a committed baseline.
+
+Usage:
+    python benchmarks/run.py                         # run all, compare to baseline.json
+    python benchmarks/run.py --filter new/ --repeat 3
+    python benchmarks/run.py --tolerance 0.5         # allow 50% slowdown before failing
+    python benchmarks/run.py --update-baseline       # rewrite baseline.json from this run
+
+Results are written as JSON (``--output``). The gate compares each case's
+fastest run (``min``), which is far less sensitive to background load than
+the median. A case regresses when it exceeds the baseline by more than the
+tolerance *and* by more than ``--min-delta`` seconds, so millisecond-scale
+cases don't flap on noise.
+A per-case ``"tolerance"`` key in the baseline overrides the global value.
+Exit status is 1 when any case regresses.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent / "src"))
+
+from cases import BenchCase, CaseContext, SkipCase, all_cases  # noqa: E402
+
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_OUTPUT = BENCH_DIR / "results.json"
+DEFAULT_TOLERANCE = float(os.environ.get("BENCH_TOLERANCE", "0.25"))
+DEFAULT_MIN_DELTA = 0.005
+
+
+def time_case(case: BenchCase, repeat: int, warmup: int) -> dict[str, Any]:
+    """Time *case* ``repeat`` times after ``warmup`` untimed runs; return summary stats in seconds."""
+    samples: list[float] = []
+    with tempfile.TemporaryDirectory(prefix="jvis-bench-") as tmp:
+        shared = Path(tmp) / "shared"
+        shared.mkdir()
+        if case.setup:
+            case.setup(shared)
+        for i in range(warmup + repeat):
+            scratch = Path(tmp) / f"iter-{i}"
+            scratch.mkdir()
+            ctx = CaseContext(shared=shared, scratch=scratch)
+            if case.prepare:
+                case.prepare(ctx)
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                measured = case.run(ctx)
+                elapsed = time.perf_counter() - start
+            if isinstance(measured, float):
+                elapsed = measured
+            if i >= warmup:
+                samples.append(elapsed)
+    return {
+        "median": round(statistics.median(samples), 6),
+        "min": round(min(samples), 6),
+        "max": round(max(samples), 6),
+        "repeat": repeat,
+    }
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    tolerance: float,
+    min_delta: float,
+) -> list[dict[str, Any]]:
+    """Return one row per current result with its baseline delta and status (ok/regressed/faster/new)."""
+    rows = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        row: dict[str, Any] = {"name": name, "min": current["min"], "baseline": None, "delta": None}
+        if base is None:
+            row["status"] = "new"
+            rows.append(row)
+            continue
+        allowed = base.get("tolerance", tolerance)
+        delta = (current["min"] - base["min"]) / base["min"] if base["min"] else 0.0
+        row.update(baseline=base["min"], delta=delta)
+        if delta > allowed and current["min"] - base["min"] > min_delta:
+            row["status"] = "regressed"
+        elif delta < -allowed:
+            row["status"] = "faster"
+        else:
+            row["status"] = "ok"
+        rows.append(row)
+    return rows
+
+
+def _print_table(rows: list[dict[str, Any]]) -> None:
+    width = max((len(r["name"]) for r in rows), default=10)
+    print(f"\n{'case':<{width}}  {'min':>10}  {'baseline':>10}  {'delta':>8}  status")
+    for r in rows:
+        base = f"{r['baseline'] * 1000:8.1f}ms" if r["baseline"] is not None else f"{'-':>10}"
+        delta = f"{r['delta']:+7.1%}" if r["delta"] is not None else f"{'-':>8}"
+        print(f"{r['name']:<{width}}  {r['min'] * 1000:8.1f}ms  {base}  {delta}  {r['status']}")
+
+
+def _metadata() -> dict[str, Any]:
+    from jvis.utils.config import read_version
+
+    return {
+        "jvis_version": read_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JVIS scaffold benchmarks")
+    parser.add_argument("--filter", "-k", action="append", default=[], help="Only run cases containing this substring")
+    parser.add_argument("--repeat", "-r", type=int, default=5, help="Timed iterations per case (default: 5)")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed iterations per case (default: 1)")
+    parser.add_argument("--output", "-o", type=Path, default=DEFAULT_OUTPUT, help="Where to write JSON results")
+    parser.add_argument("--baseline", "-b", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON to compare to")
+    parser.add_argument(
+        "--tolerance",
+        "-t",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Allowed slowdown as a fraction of the baseline (default: $BENCH_TOLERANCE or 0.25)",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=DEFAULT_MIN_DELTA,
+        help="Ignore slowdowns smaller than this many seconds (default: 0.005)",
+    )
+    parser.add_argument("--update-baseline", action="store_true", help="Write this run's results to --baseline")
+    parser.add_argument("--list", action="store_true", help="List case names and exit")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    cases = [c for c in all_cases() if not args.filter or any(f in c.name for f in args.filter)]
+    if args.list:
+        for case in cases:
+            print(case.name)
+        return
+    if not cases:
+        parser.error("no benchmark cases match --filter")
+
+    results: dict[str, dict[str, Any]] = {}
+    skipped: dict[str, str] = {}
+    for case in cases:
+        print(f"  {case.name} ...", end="", flush=True)
+        try:
+            results[case.name] = time_case(case, args.repeat, args.warmup)
+        except SkipCase as exc:
+            skipped[case.name] = str(exc)
+            print(f" skipped ({exc})")
+            continue
+        print(f" {results[case.name]['min'] * 1000:.1f}ms")
+
+    report = {"meta": _metadata(), "results": results, "skipped": skipped}
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"\nResults written to {args.output}")
+
+    if args.update_baseline:
+        previous = json.loads(args.baseline.read_text()).get("results", {}) if args.baseline.is_file() else {}
+        merged = {**previous, **results}
+        # Preserve hand-tuned per-case tolerances across baseline refreshes.
+        for name, entry in merged.items():
+            if name in results and "tolerance" in previous.get(name, {}):
+                entry["tolerance"] = previous[name]["tolerance"]
+        args.baseline.write_text(json.dumps({"meta": report["meta"], "results": merged}, indent=2) + "\n")
+        print(f"Baseline updated: {args.baseline}")
+        return
+
+    if not args.baseline.is_file():
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one.")
+        return
+
+    recorded = json.loads(args.baseline.read_text())
+    baseline = recorded.get("results", {})
+    baseline_cpus = recorded.get("meta", {}).get("cpu_count")
+    if baseline_cpus != os.cpu_count():
+        print(
+            f"\n⚠️  baseline.json was recorded with {baseline_cpus} CPU(s), this machine has {os.cpu_count()}; "
+            "run `make bench-baseline` here before trusting the gate."
+        )
+    rows = compare(results, baseline, args.tolerance, args.min_delta)
+    _print_table(rows)
+    regressed = [r["name"] for r in rows if r["status"] == "regressed"]
+    if regressed:
+        print(f"\n❌ {len(regressed)} case(s) regressed beyond {args.tolerance:.0%}: {', '.join(regressed)}")
+        sys.exit(1)
+    print(f"\n✅ No regressions beyond {args.tolerance:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""Async scaffolding API — ``await jvis.api.scaffold(config)`` for embedding jvis in asyncio services.
+
+The pipeline is the one ``jvis new`` runs (the command is a thin
+``asyncio.run`` wrapper). Each stage does its file-system work on the event
+loop's default executor, so the loop stays responsive; monorepo sub-stacks
+run concurrently. Git setup is in-process file work too, and the ``git init``
+fallback runs through :func:`asyncio.create_subprocess_exec`.
+
+Progress is reported as :class:`ProgressEvent` values passed to a callback
+(plain or ``async``) on the loop thread, never printed.
+
+Cancelling the task stops the pipeline at the next stage boundary: a stage
+already running on a thread is allowed to finish, then the project directory
+is removed if this call created it, and ``CancelledError`` propagates.
+
+Usage::
+
+    report = await jvis.api.scaffold(config, on_progress=lambda e: log.info(e.message))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import shutil
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from jvis.commands.primary import ProjectConfig
+from jvis.utils import perf
+
+if TYPE_CHECKING:
+    from jvis.scaffold.framework import FrameworkSnapshot
+    from jvis.stacks.registry import StackInfo
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["ProgressCallback", "ProgressEvent", "ProjectConfig", "ScaffoldReport", "scaffold"]
+
+# Monorepo sub-stacks, in log order: (stacks key, label, output directory under the project).
+_MONOREPO_PARTS = (
+    ("backend", "backend", "server"),
+    ("frontend", "frontend", "client"),
+    ("mobile", "mobile app", "mobile"),
+)
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """One progress message from :func:`scaffold`."""
+
+    step: str  # pipeline stage: project, scaffold, entity_rename, install_framework, docs_structure, ...
+    message: str
+    elapsed_ms: float  # since the scaffold started
+
+
+type ProgressCallback = Callable[[ProgressEvent], Awaitable[None] | None]
+
+
+@dataclass
+class ScaffoldReport:
+    """Result of :func:`scaffold`: the project directory and per-stage timings."""
+
+    project_dir: Path
+    stages: dict[str, float] = field(default_factory=dict)  # stage -> ms
+    elapsed_ms: float = 0.0
+
+
+async def scaffold(
+    config: ProjectConfig,
+    *,
+    on_progress: ProgressCallback | None = None,
+    snapshot: FrameworkSnapshot | None = None,
+) -> ScaffoldReport:
+    """Create all project files for *config* — stacks, framework, docs, git.
+
+    *on_progress* receives a :class:`ProgressEvent` before each stage; an
+    ``async`` callback is awaited. A long-lived caller passes a prebuilt
+    framework *snapshot* so the framework is not re-hashed per project.
+    Stage errors propagate unchanged.
+    """
+    pipeline = _Pipeline(config, on_progress)
+    created = not config.project_dir.exists()
+    try:
+        await pipeline.run(snapshot)
+    except asyncio.CancelledError:
+        if created:
+            logger.debug("Scaffold of %s cancelled, removing it", config.project_dir)
+            await asyncio.to_thread(shutil.rmtree, config.project_dir, True)
+        raise
+    pipeline.report.elapsed_ms = pipeline.elapsed_ms()
+    return pipeline.report
+
+
+class _Pipeline:
+    """State of one :func:`scaffold` call. Must be created on the running loop."""
+
+    def __init__(self, config: ProjectConfig, on_progress: ProgressCallback | None) -> None:
+        self.config = config
+        self.on_progress = on_progress
+        self.report = ScaffoldReport(project_dir=config.project_dir)
+        self.loop = asyncio.get_running_loop()
+        self.started = time.perf_counter()
+
+    def elapsed_ms(self, since: float | None = None) -> float:
+        return round((time.perf_counter() - (since or self.started)) * 1000, 1)
+
+    async def emit(self, step: str, message: str) -> None:
+        if self.on_progress is None:
+            return
+        result = self.on_progress(ProgressEvent(step=step, message=message, elapsed_ms=self.elapsed_ms()))
+        if inspect.isawaitable(result):
+            await result
+
+    async def blocking[R](self, name: str, fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """Run blocking *fn* on the default executor as stage *name*."""
+        call = partial(fn, *args, **kwargs)
+        return await self.stage(name, lambda: self.loop.run_in_executor(None, perf.bind(call)))
+
+    async def stage[R](self, name: str, start: Callable[[], Awaitable[R]]) -> R:
+        """Await what *start* returns as stage *name*, timed and under a perf span of that name.
+
+        Stages run one after another, so their spans nest on the loop thread
+        and executor work started inside is bound to them. (Spans are only
+        recorded for a CLI run, which scaffolds one project at a time.)
+        """
+        started = time.perf_counter()
+        try:
+            with perf.span(name):
+                return await _settle(start())
+        finally:
+            self.report.stages[name] = self.elapsed_ms(started)
+
+    async def run(self, snapshot: FrameworkSnapshot | None) -> None:
+        from jvis.scaffold.docs_structure import create_context_map, create_docs_structure
+        from jvis.scaffold.entity_rename import apply_entity_name
+        from jvis.scaffold.framework import install_framework
+        from jvis.scaffold.shared_files import create_shared_files
+        from jvis.utils.git import setup_git_async
+
+        config = self.config
+        await self.emit("project", "Creating project...")
+        await asyncio.to_thread(config.project_dir.mkdir, parents=True, exist_ok=True)
+
+        await self.stage("scaffold", self.single_stack if config.project_type == "single" else self.monorepo)
+
+        if config.entity_name != "item":
+            await self.emit("entity_rename", f"Applying entity name '{config.entity_name}'...")
+            await self.blocking("entity_rename", apply_entity_name, config.project_dir, config.entity_name)
+
+        await self.emit("install_framework", "Installing JVIS framework...")
+        installed = await self.blocking("install_framework", install_framework, config.project_dir, config.platforms)
+        await self.blocking("stamp_version", _stamp_version, config.project_dir, installed, snapshot)
+
+        await self.emit("docs_structure", "Creating documentation structure...")
+        await self.blocking("docs_structure", create_docs_structure, config.project_dir)
+
+        primary_stack = config.stacks.get("stack") or config.stacks.get("backend")
+
+        await self.emit("context_map", "Generating context map...")
+        await self.blocking(
+            "context_map",
+            create_context_map,
+            project_path=config.project_dir,
+            stack=primary_stack.id if primary_stack else "custom",
+            database=config.database or "none",
+            language=primary_stack.language if primary_stack else "unknown",
+        )
+
+        await self.emit("shared_files", "Creating shared files...")
+        await self.blocking(
+            "shared_files",
+            create_shared_files,
+            config.project_dir,
+            config.project_name,
+            config.project_description,
+            primary_stack,
+        )
+
+        await self.emit("git", "Initializing git...")
+        await self.stage("git", lambda: setup_git_async(config.project_dir, primary_stack.id if primary_stack else ""))
+
+    async def single_stack(self) -> None:
+        from jvis.scaffold.stack_runner import run_stack
+
+        config = self.config
+        stack = config.stacks.get("stack")
+        if stack and stack.directory:
+            await self.emit("scaffold", f"Creating {stack.name} structure...")
+            await self.blocking(
+                f"run_stack[{stack.id}]",
+                run_stack,
+                stack,
+                config.project_dir,
+                config.project_name,
+                config.project_description,
+                config.database,
+                config.options,
+            )
+
+    async def monorepo(self) -> None:
+        """Create the monorepo root, then render backend/frontend/mobile concurrently.
+
+        Each sub-stack's log records are held back and replayed on the loop
+        thread in a fixed order, right after its progress event, so output
+        is identical to a sequential run. The first failure is raised once
+        every sub-stack has finished.
+        """
+        from jvis.log_config import ThreadLogCapture, replay_records
+        from jvis.scaffold.monorepo import create_monorepo_root
+        from jvis.scaffold.stack_runner import run_stack
+
+        config = self.config
+        await self.emit("scaffold", "Creating monorepo structure...")
+        await self.blocking(
+            "monorepo_root",
+            create_monorepo_root,
+            config.project_dir,
+            config.project_name,
+            config.stacks.get("backend"),
+            config.stacks.get("frontend"),
+            config.database,
+            config.stacks.get("mobile"),
+        )
+
+        parts = [(label, stack, subdir) for key, label, subdir in _MONOREPO_PARTS if (stack := config.stacks.get(key))]
+        records: dict[str, list[logging.LogRecord]] = {subdir: [] for _, _, subdir in parts}
+
+        def render(stack: StackInfo, subdir: str) -> None:
+            name = f"run_stack[{stack.id}]"
+            started = time.perf_counter()
+            with capture.capture(records[subdir]), perf.span(name):
+                run_stack(
+                    stack,
+                    config.project_dir / subdir,
+                    config.project_name,
+                    config.project_description,
+                    config.database,
+                    config.options,
+                )
+            self.report.stages[name] = self.elapsed_ms(started)
+
+        # Sub-stacks overlap, so each opens its span on its own thread.
+        rendered = [(stack, subdir) for _, stack, subdir in parts if stack.directory]
+        with ThreadLogCapture() as capture:
+            jobs = [self.loop.run_in_executor(None, perf.bind(render), stack, subdir) for stack, subdir in rendered]
+            outcomes = await _settle(asyncio.gather(*jobs, return_exceptions=True))
+        errors = dict(zip((subdir for _, subdir in rendered), outcomes, strict=True))
+
+        for label, stack, subdir in parts:
+            if not stack.directory:
+                await self.emit(
+                    "scaffold", f"{label.capitalize()} ({stack.name}): no templates yet, {subdir}/ left empty."
+                )
+                continue
+            await self.emit("scaffold", f"Creating {label} ({stack.name})...")
+            replay_records(records[subdir])
+        # Surface failures after all logs, first sub-stack first.
+        for error in errors.values():
+            if isinstance(error, BaseException):
+                raise error
+
+
+async def _settle[R](work: Awaitable[R]) -> R:
+    """Await *work*; if the caller is cancelled, let it finish first, then re-raise.
+
+    Executor threads cannot be interrupted, so this keeps a cancelled
+    pipeline's cleanup from racing a stage that is still writing files.
+    """
+    future = asyncio.ensure_future(work)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        await asyncio.wait([future])
+        raise
+
+
+def _stamp_version(project_dir: Path, installed: tuple[str, ...], snapshot: FrameworkSnapshot | None) -> None:
+    from jvis.scaffold.framework import snapshot_framework
+    from jvis.utils.config import read_version
+    from jvis.version_tracking import detect_source_mode, stamp_version
+
+    digest = (snapshot or snapshot_framework()).select(installed).digest
+    stamp_version(project_dir, read_version(), detect_source_mode(), digest)
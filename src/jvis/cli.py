@@ -5,38 +5,107 @@ All commands are implemented in pure Python.
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import click
 
 from jvis.commands.add_cmd import add
 from jvis.commands.bump_cmd import bump
+from jvis.commands.codemap_cmd import codemap
+from jvis.commands.context_cmd import context
+from jvis.commands.journey_cmd import journey
+from jvis.commands.notes_cmd import notes
+from jvis.commands.plan_cmd import plan
 from jvis.commands.primary import new
+from jvis.commands.search_cmd import search
+from jvis.commands.serve_cmd import serve
+from jvis.commands.shard_cmd import shard
 from jvis.commands.update_cmd import update
 from jvis.commands.utility import (
     hooks,
     pipeline,
     version_cmd,
 )
+from jvis.commands.workflow_cmd import workflow
 from jvis.utils.config import read_version
 
 
 @click.group(invoke_without_command=True)
 @click.option("--verbose", "-v", is_flag=True, help="Enable debug logging.")
+@click.option("--timings", is_flag=True, help="Print per-stage timings and files/bytes written.")
+@click.option(
+    "--profile",
+    "profile_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write cProfile stats for the command to this file (e.g. out.prof).",
+)
 @click.version_option(version=read_version(), prog_name="JVIS Manager")
 @click.pass_context
-def cli(ctx: click.Context, *, verbose: bool) -> None:
-    """JVIS — Journey Virtual Intelligent System."""
+def cli(ctx: click.Context, *, verbose: bool, timings: bool, profile_path: Path | None) -> None:
+    """JVIS — Journey Virtual Intelligent System.
+
+    Set JVIS_TRACE=file.json to write stage timings as Chrome trace events.
+    """
     from jvis.log_config import setup_logging
 
     setup_logging(verbose=verbose)
+    _setup_instrumentation(ctx, timings, profile_path)
     if ctx.invoked_subcommand is None:
         click.echo(ctx.get_help())
 
 
+def _setup_instrumentation(ctx: click.Context, timings: bool, profile_path: Path | None) -> None:
+    """Start span recording/profiling when requested and report on context close."""
+    import os
+
+    from jvis.utils import perf
+
+    trace_path = os.environ.get(perf.TRACE_ENV)
+    if not (timings or profile_path or trace_path):
+        return
+
+    profiler = None
+    if profile_path:
+        import cProfile
+
+        profiler = cProfile.Profile()
+    perf.start()
+    if profiler is not None:
+        profiler.enable()
+
+    def _finish() -> None:
+        if profiler is not None and profile_path is not None:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+            click.echo(f"  Profile written to {profile_path}", err=True)
+        recorder = perf.stop()
+        if recorder is None:
+            return
+        if trace_path:
+            recorder.write_chrome_trace(Path(trace_path))
+            click.echo(f"  Trace written to {trace_path}", err=True)
+        if timings:
+            click.echo("", err=True)
+            click.echo(recorder.format_table(), err=True)
+
+    ctx.call_on_close(_finish)
+
+
 # Primary commands
 cli.add_command(new)
 cli.add_command(add)
 cli.add_command(update)
 cli.add_command(bump)
+cli.add_command(journey)
+cli.add_command(workflow)
+cli.add_command(notes)
+cli.add_command(shard)
+cli.add_command(context)
+cli.add_command(search)
+cli.add_command(codemap)
+cli.add_command(plan)
+cli.add_command(serve)
 
 # Utility commands
 cli.add_command(version_cmd)
@@ -0,0 +1,352 @@
+"""Code map — a compact symbol outline of a project's source tree.
+
+The context map only names top-level directories, so agents working on an
+existing codebase spend many tool calls exploring it. ``jvis codemap``
+(also run by ``jvis add`` on a project that already has code) writes
+``docs/notes/code-map.md`` instead:
+
+  - per-directory file counts and lines of code
+  - per file, its module/class/function symbols — from the ``ast`` for
+    Python, from line-anchored regexes for TypeScript/JavaScript, Rust and
+    PHP (an outline, not a parser)
+
+The walk prunes VCS metadata, dependency and build directories and dot
+directories. Files are outlined concurrently, and only those whose mtime or
+size changed since the last run (recorded in ``.jvis/cache/code-map.json``)
+are read again. The rendered map is capped in size; files beyond the cap are
+counted but not listed.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from jvis.utils import perf
+from jvis.utils.fs import write_file_atomic
+
+logger = logging.getLogger(__name__)
+
+CODE_MAP_FILE = Path("docs") / "notes" / "code-map.md"
+CACHE_PATH = Path(".jvis") / "cache" / "code-map.json"
+DEFAULT_MAX_BYTES = 24_000
+_CACHE_VERSION = 1
+_MAX_FILE_BYTES = 1_000_000  # larger files are generated or vendored; count them, don't outline them
+_MAX_SYMBOLS = 12  # per file
+
+LANGUAGES = {
+    ".py": "python",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".mts": "typescript",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+    ".rs": "rust",
+    ".php": "php",
+}
+
+# Never descended into (besides dot directories): dependencies, build output, caches.
+SKIP_DIRS = frozenset(
+    {
+        "node_modules",
+        "vendor",
+        "venv",
+        "env",
+        "__pycache__",
+        "site-packages",
+        "dist",
+        "build",
+        "target",
+        "coverage",
+        "htmlcov",
+        "out",
+        "storage",
+    }
+)
+
+_ES_PATTERNS = [
+    re.compile(r"^export\s+(?:default\s+)?(?:abstract\s+)?class\s+(?P<name>[A-Za-z_$][\w$]*)", re.M),
+    re.compile(r"^(?:export\s+(?:default\s+)?)?(?:async\s+)?function\*?\s+(?P<name>[A-Za-z_$][\w$]*)", re.M),
+    re.compile(r"^(?:export\s+)?(?:interface|type|enum)\s+(?P<name>[A-Za-z_$][\w$]*)", re.M),
+    re.compile(r"^(?:abstract\s+)?class\s+(?P<name>[A-Za-z_$][\w$]*)", re.M),
+    re.compile(r"^export\s+const\s+(?P<name>[A-Za-z_$][\w$]*)", re.M),
+]
+_RUST_PATTERNS = [
+    re.compile(r"^pub(?:\([\w:]+\))?\s+(?:async\s+)?(?:const\s+)?(?:unsafe\s+)?fn\s+(?P<name>\w+)", re.M),
+    re.compile(r"^(?:pub(?:\([\w:]+\))?\s+)?(?:struct|enum|trait|mod)\s+(?P<name>\w+)", re.M),
+    re.compile(r"^impl(?:<[^>]*>)?\s+(?P<name>[\w:]+(?:<[^>{]*>)?(?:\s+for\s+[\w:]+)?)", re.M),
+]
+_PHP_PATTERNS = [
+    re.compile(r"^namespace\s+(?P<name>[\w\\]+)", re.M),
+    re.compile(r"^(?:(?:abstract|final|readonly)\s+)*(?:class|interface|trait|enum)\s+(?P<name>\w+)", re.M),
+    re.compile(r"^\s{0,4}(?:(?:public|protected|static|final|abstract)\s+)*function\s+(?P<name>\w+)", re.M),
+]
+_PATTERNS = {"typescript": _ES_PATTERNS, "javascript": _ES_PATTERNS, "rust": _RUST_PATTERNS, "php": _PHP_PATTERNS}
+_KIND_RE = re.compile(r"\b(class|interface|trait|struct|enum|type|impl|mod|namespace|const|fn|function|def)\b")
+
+
+@dataclass
+class FileOutline:
+    path: str  # project-relative, POSIX separators
+    language: str
+    mtime_ns: int
+    size: int
+    loc: int = 0  # non-blank lines
+    symbols: list[str] = field(default_factory=list)
+
+
+@dataclass
+class CodeMapResult:
+    path: str  # project-relative code map file
+    files: int
+    loc: int
+    parsed: int  # outlined in this run
+    reused: int  # taken from the cache unchanged
+    listed: int  # files whose symbols made it under the size cap
+    written: bool
+    truncated: bool = False  # some files with symbols did not fit under the size cap
+    elapsed: float = 0.0
+
+
+def walk_sources(project: Path) -> dict[str, tuple[str, int, int]]:
+    """Return ``{relative path: (language, mtime_ns, size)}`` for the source files of *project*."""
+    found: dict[str, tuple[str, int, int]] = {}
+    stack = [(str(project), "")]
+    while stack:
+        directory, rel_dir = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            rel = f"{rel_dir}{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    stack.append((entry.path, rel + "/"))
+                continue
+            language = LANGUAGES.get(os.path.splitext(entry.name)[1].lower())
+            if language and entry.is_file(follow_symlinks=False):
+                st = entry.stat()
+                found[rel] = (language, st.st_mtime_ns, st.st_size)
+    return found
+
+
+def outline_source(text: str, language: str) -> list[str]:
+    """Return the symbol outline of *text* (capped at a dozen entries)."""
+    if language == "python":
+        try:
+            symbols = _python_symbols(ast.parse(text))
+        except (SyntaxError, ValueError):
+            symbols = _regex_symbols(text, [re.compile(r"^(?:async\s+)?(?:def|class)\s+(?P<name>\w+)", re.M)])
+    else:
+        symbols = _regex_symbols(text, _PATTERNS.get(language, []))
+    if len(symbols) > _MAX_SYMBOLS:
+        symbols = [*symbols[:_MAX_SYMBOLS], f"… {len(symbols) - _MAX_SYMBOLS} more"]
+    return symbols
+
+
+def _python_symbols(tree: ast.Module) -> list[str]:
+    symbols: list[str] = []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            methods = [
+                n.name
+                for n in node.body
+                if isinstance(n, ast.FunctionDef | ast.AsyncFunctionDef)
+                and (not n.name.startswith("_") or n.name == "__init__")
+            ]
+            bases = ", ".join(ast.unparse(b) for b in node.bases)
+            label = f"class {node.name}({bases})" if bases else f"class {node.name}"
+            symbols.append(f"{label}: {', '.join(methods)}" if methods else label)
+        elif isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef) and not node.name.startswith("_"):
+            args = [a.arg for a in node.args.posonlyargs + node.args.args + node.args.kwonlyargs]
+            symbols.append(f"def {node.name}({', '.join(args)})")
+    return symbols
+
+
+def _regex_symbols(text: str, patterns: list[re.Pattern[str]]) -> list[str]:
+    found: dict[int, str] = {}
+    for pattern in patterns:
+        for match in pattern.finditer(text):
+            kinds = _KIND_RE.findall(match[0])  # the keyword nearest the name: "pub const fn" is a fn
+            label = "fn" if kinds and kinds[-1] == "function" else (kinds[-1] if kinds else "")
+            found.setdefault(match.start(), f"{label} {match['name']}".strip())
+    return [found[pos] for pos in sorted(found)]
+
+
+def _outline_file(project: Path, rel: str, language: str, mtime_ns: int, size: int) -> FileOutline:
+    outline = FileOutline(path=rel, language=language, mtime_ns=mtime_ns, size=size)
+    try:
+        data = (project / rel).read_bytes()
+    except OSError as exc:
+        logger.debug("Cannot read %s: %s", rel, exc)
+        return outline
+    text = data.decode("utf-8", errors="replace")
+    outline.loc = sum(1 for line in text.splitlines() if line.strip())
+    if size <= _MAX_FILE_BYTES:
+        outline.symbols = outline_source(text, language)
+    return outline
+
+
+def build_code_map(
+    project: Path,
+    *,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    jobs: int | None = None,
+    force: bool = False,
+) -> CodeMapResult:
+    """Refresh the cached outlines of *project* and write :data:`CODE_MAP_FILE`.
+
+    Only files whose mtime or size changed are outlined again (all files with
+    *force*). The map is rewritten only when its content changes.
+    """
+    started = time.perf_counter()
+    cache_file = project / CACHE_PATH
+    cached = {} if force else _read_cache(cache_file)
+    with perf.span("codemap_walk"):
+        on_disk = walk_sources(project)
+
+    outlines: dict[str, FileOutline] = {}
+    stale: list[tuple[str, str, int, int]] = []
+    for rel, (language, mtime_ns, size) in on_disk.items():
+        previous = cached.get(rel)
+        if previous and (previous.language, previous.mtime_ns, previous.size) == (language, mtime_ns, size):
+            outlines[rel] = previous
+        else:
+            stale.append((rel, language, mtime_ns, size))
+    reused = len(outlines)
+
+    if stale:
+        with (
+            perf.span("codemap_outline"),
+            ThreadPoolExecutor(max_workers=jobs or min(32, (os.cpu_count() or 1) + 4)) as pool,
+        ):
+            work = perf.bind(lambda item: _outline_file(project, *item))
+            for outline in pool.map(work, stale):
+                outlines[outline.path] = outline
+    if stale or len(cached) != len(outlines):
+        _write_cache(cache_file, outlines)
+
+    ordered = [outlines[rel] for rel in sorted(outlines)]
+    content, listed = render_code_map(ordered, max_bytes=max_bytes)
+    dest = project / CODE_MAP_FILE
+    try:
+        current = dest.read_text(encoding="utf-8")
+    except OSError:
+        current = None
+    written = current != content
+    if written:
+        write_file_atomic(dest, content)
+
+    return CodeMapResult(
+        path=CODE_MAP_FILE.as_posix(),
+        files=len(ordered),
+        loc=sum(o.loc for o in ordered),
+        parsed=len(stale),
+        reused=reused,
+        listed=listed,
+        written=written,
+        truncated=listed < sum(1 for o in ordered if o.symbols),
+        elapsed=time.perf_counter() - started,
+    )
+
+
+def directory_stats(outlines: list[FileOutline], depth: int | None = None) -> dict[str, tuple[int, int]]:
+    """Return ``{directory: (files, loc)}``.
+
+    Without *depth*, each file counts toward its own directory only; with it,
+    toward its ancestor *depth* levels deep (deeper directories are rolled up).
+    """
+    stats: dict[str, tuple[int, int]] = {}
+    for outline in outlines:
+        parts = outline.path.split("/")[:-1]
+        directory = "/".join(parts if depth is None else parts[:depth]) or "."
+        files, loc = stats.get(directory, (0, 0))
+        stats[directory] = (files + 1, loc + outline.loc)
+    return dict(sorted(stats.items()))
+
+
+def _directory_table(outlines: list[FileOutline], max_bytes: int) -> list[str]:
+    """The directory rows, rolled up a level at a time until they fit in *max_bytes*."""
+    for depth in (None, 3, 2):
+        rows = [f"| `{d}/` | {files} | {loc:,} |" for d, (files, loc) in directory_stats(outlines, depth).items()]
+        if sum(len(row) + 1 for row in rows) <= max_bytes:
+            return rows
+    return [f"| `{d}/` | {files} | {loc:,} |" for d, (files, loc) in directory_stats(outlines, 1).items()]
+
+
+def render_code_map(outlines: list[FileOutline], *, max_bytes: int = DEFAULT_MAX_BYTES) -> tuple[str, int]:
+    """Render the Markdown code map; return it and how many files' symbols fit in *max_bytes*."""
+    languages: dict[str, int] = {}
+    for outline in outlines:
+        languages[outline.language] = languages.get(outline.language, 0) + 1
+    summary = ", ".join(f"{lang} {count}" for lang, count in sorted(languages.items(), key=lambda kv: -kv[1]))
+    lines = [
+        "# Code Map",
+        "",
+        "Source outline for agent context loading. Generated by `jvis codemap` — do not edit.",
+        "",
+        f"**Files:** {len(outlines)} ({summary or 'none'}) · **LOC:** {sum(o.loc for o in outlines):,}",
+        "",
+        "## Directories",
+        "",
+        "| Directory | Files | LOC |",
+        "|-----------|------:|----:|",
+    ]
+    lines.extend(_directory_table(outlines, max_bytes // 2))
+    lines += ["", "## Symbols", ""]
+
+    size = sum(len(line) + 1 for line in lines)
+    listed = 0
+    for outline in outlines:
+        if not outline.symbols:
+            continue
+        block = [f"- `{outline.path}` ({outline.loc} LOC)", *(f"  - {symbol}" for symbol in outline.symbols)]
+        block_size = sum(len(line) + 1 for line in block)
+        if size + block_size > max_bytes:
+            remaining = sum(1 for o in outlines if o.symbols) - listed
+            lines.append(f"- _[{remaining} more files not listed — size cap reached; open the directories above]_")
+            break
+        lines.extend(block)
+        size += block_size
+        listed += 1
+    if not listed and not any(o.symbols for o in outlines):
+        lines.append("_No symbols found._")
+    lines.append("")
+    return "\n".join(lines), listed
+
+
+def _read_cache(path: Path) -> dict[str, FileOutline]:
+    try:
+        data: Any = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+        return {}
+    outlines: dict[str, FileOutline] = {}
+    for rel, entry in (data.get("files") or {}).items():
+        try:
+            outlines[rel] = FileOutline(path=rel, **entry)
+        except TypeError:
+            continue
+    return outlines
+
+
+def _write_cache(path: Path, outlines: dict[str, FileOutline]) -> None:
+    files = {
+        rel: {"language": o.language, "mtime_ns": o.mtime_ns, "size": o.size, "loc": o.loc, "symbols": o.symbols}
+        for rel, o in sorted(outlines.items())
+    }
+    write_file_atomic(path, json.dumps({"version": _CACHE_VERSION, "files": files}, separators=(",", ":")))
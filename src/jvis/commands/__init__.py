@@ -1 +1,31 @@
 """JVIS CLI command groups."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import click
+
+
+def _parse_platforms(_ctx: click.Context, _param: click.Parameter, value: str | None) -> tuple[str, ...] | None:
+    if value is None:
+        return None
+    from jvis.scaffold.framework import parse_platforms
+
+    try:
+        return parse_platforms(value)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc)) from exc
+
+
+def platforms_option[F: Callable[..., Any]](func: F) -> F:
+    """``--platforms claude,cursor,kiro|all`` — which AI assistants get framework files."""
+    return click.option(
+        "--platforms",
+        default=None,
+        callback=_parse_platforms,
+        metavar="LIST",
+        help="Comma-separated AI assistants to install for: claude, cursor, kiro or all. "
+        "Defaults to the project's core-config.yaml 'platforms' setting, else all.",
+    )(func)
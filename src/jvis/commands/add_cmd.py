@@ -11,7 +11,8 @@ import click
 if TYPE_CHECKING:
     from jvis.detection.tech_stack import StackDetection
 
-from jvis.utils import ui
+from jvis.commands import platforms_option
+from jvis.utils import perf, ui
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +21,8 @@ logger = logging.getLogger(__name__)
 @click.argument("path")
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompts.")
 @click.option("--entity", "-e", default="item", help="Domain entity name (singular, e.g. product, task, user).")
-def add(path: str, yes: bool, entity: str) -> None:
+@platforms_option
+def add(path: str, yes: bool, entity: str, platforms: tuple[str, ...] | None) -> None:
     """Add JVIS to an existing project at PATH."""
     from jvis.detection.project_state import detect_project_state
     from jvis.detection.tech_stack import detect_project_type, detect_tech_stack
@@ -43,9 +45,10 @@ def add(path: str, yes: bool, entity: str) -> None:
     click.echo("")
     click.echo(ui.cyan("  Analyzing project..."))
 
-    state = detect_project_state(target)
-    detection = detect_tech_stack(target)
-    project_type = detect_project_type(target)
+    with perf.span("detect"):
+        state = detect_project_state(target)
+        detection = detect_tech_stack(target)
+        project_type = detect_project_type(target)
 
     click.echo(f"  State:   {state}")
     click.echo(f"  Type:    {project_type}")
@@ -66,7 +69,7 @@ def add(path: str, yes: bool, entity: str) -> None:
             raise click.exceptions.Exit(0)
 
     # Install
-    _install_jvis(target, state, detection)
+    _install_jvis(target, state, detection, platforms)
 
 
 def _confirm_existing_install(state: str, yes: bool) -> bool:
@@ -88,7 +91,12 @@ def _confirm_existing_install(state: str, yes: bool) -> bool:
     return True
 
 
-def _install_jvis(target: Path, state: str, detection: StackDetection) -> None:
+def _install_jvis(
+    target: Path,
+    state: str,
+    detection: StackDetection,
+    platforms: tuple[str, ...] | None = None,
+) -> None:
     """Run the actual JVIS installation into target directory."""
     from jvis.scaffold.docs_structure import create_context_map, create_docs_structure
     from jvis.scaffold.framework import install_framework
@@ -101,34 +109,49 @@ def _install_jvis(target: Path, state: str, detection: StackDetection) -> None:
     project_name = target.name
 
     click.echo("  Installing JVIS framework...")
-    install_framework(target)
+    with perf.span("install_framework"):
+        installed = install_framework(target, platforms)
 
+    from jvis.scaffold.framework import snapshot_framework
     from jvis.utils.config import read_version
     from jvis.version_tracking import detect_source_mode, stamp_version
 
-    stamp_version(target, read_version(), detect_source_mode())
+    with perf.span("stamp_version"):
+        digest = snapshot_framework().select(installed).digest
+        stamp_version(target, read_version(), detect_source_mode(), digest)
 
     click.echo("  Creating documentation structure...")
-    create_docs_structure(target)
+    with perf.span("docs_structure"):
+        create_docs_structure(target)
+
+    if state != "empty":
+        from jvis.codemap import build_code_map
+
+        click.echo("  Mapping existing code...")
+        with perf.span("code_map"):
+            build_code_map(target)
 
     click.echo("  Generating context map...")
     primary_lang = detection.languages[0] if detection.languages else "unknown"
     primary_fw = detection.frameworks[0] if detection.frameworks else "custom"
     primary_db = detection.databases[0] if detection.databases else "none"
-    create_context_map(
-        project_path=target,
-        stack=primary_fw,
-        database=primary_db,
-        language=primary_lang,
-    )
+    with perf.span("context_map"):
+        create_context_map(
+            project_path=target,
+            stack=primary_fw,
+            database=primary_db,
+            language=primary_lang,
+        )
 
     if not (target / "README.md").exists():
         click.echo("  Creating shared files...")
-        create_shared_files(target, project_name)
+        with perf.span("shared_files"):
+            create_shared_files(target, project_name)
 
     click.echo("  Configuring git...")
     primary_stack = detection.frameworks[0] if detection.frameworks else ""
-    setup_git(target, primary_stack)
+    with perf.span("git"):
+        setup_git(target, primary_stack)
 
     # Summary
     click.echo("")
@@ -0,0 +1,54 @@
+"""``jvis codemap`` command — outline the project's source symbols for agents."""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict
+from pathlib import Path
+
+import click
+
+from jvis.utils import perf, ui
+
+logger = logging.getLogger(__name__)
+
+
+@click.command()
+@click.argument("path", default=".")
+@click.option(
+    "--max-kb",
+    type=click.IntRange(min=1),
+    default=24,
+    show_default=True,
+    help="Size cap of the written map in KB.",
+)
+@click.option("--jobs", "-j", type=click.IntRange(min=1), default=None, help="Files outlined in parallel.")
+@click.option("--force", is_flag=True, help="Outline every file, ignoring the cache.")
+@click.option("--json", "as_json", is_flag=True, help="Emit machine-readable JSON.")
+def codemap(path: str, max_kb: int, jobs: int | None, force: bool, as_json: bool) -> None:
+    """Write PATH/docs/notes/code-map.md: directories, file counts, LOC and symbols.
+
+    Python is outlined from its AST; TypeScript/JavaScript, Rust and PHP
+    with lightweight patterns. Only files changed since the last run are
+    read again.
+    """
+    from jvis.codemap import build_code_map
+
+    project = Path(path).resolve()
+    if not project.is_dir():
+        raise click.ClickException(f"{project} is not a directory.")
+    with perf.span("codemap"):
+        result = build_code_map(project, max_bytes=max_kb * 1000, jobs=jobs, force=force)
+
+    if as_json:
+        click.echo(json.dumps(asdict(result), indent=2))
+        return
+
+    click.echo(ui.header("JVIS Code Map"))
+    click.echo(f"  {result.files:,} files, {result.loc:,} LOC")
+    click.echo(f"  Outlined {result.parsed:,}, reused {result.reused:,} in {result.elapsed * 1000:.0f} ms")
+    state = ui.green("written") if result.written else "unchanged"
+    click.echo(f"  {result.path}: {state}")
+    if result.truncated:
+        click.echo(f"  {ui.yellow(f'Size cap reached: symbols listed for {result.listed:,} files (raise --max-kb).')}")
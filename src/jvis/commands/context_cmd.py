@@ -0,0 +1,68 @@
+"""``jvis context`` commands — precomputed context packs for agent sessions."""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+
+import click
+
+from jvis.utils import perf, ui
+
+logger = logging.getLogger(__name__)
+
+_STATUS_COLORS = {"included": ui.green, "partial": ui.yellow, "omitted": ui.red}
+
+
+@click.group()
+def context() -> None:
+    """Build token-budgeted context packs for agents."""
+
+
+@context.command("build")
+@click.argument("path", default=".")
+@click.option("--role", "-r", default="dev", show_default=True, help="Agent id the pack is built for.")
+@click.option(
+    "--budget",
+    type=click.IntRange(min=256),
+    default=None,
+    help="Token budget (default: contextPack.budget in core-config.yaml, else 8000).",
+)
+@click.option("--force", is_flag=True, help="Rebuild even if the cached pack is current.")
+@click.option("--json", "as_json", is_flag=True, help="Emit machine-readable JSON.")
+@click.option("--print", "print_pack", is_flag=True, help="Print the pack itself instead of a summary.")
+def build(role: str, budget: int | None, path: str, force: bool, as_json: bool, print_pack: bool) -> None:
+    """Assemble the notes, context map and devLoadAlwaysFiles of PATH into one pack.
+
+    The pack is written to .jvis/cache/context/<role>.md and reused until
+    one of its sources changes.
+    """
+    from jvis.context.pack import build_context_pack
+
+    project = Path(path).resolve()
+    with perf.span("context_build"):
+        try:
+            pack = build_context_pack(project, role, budget, force=force)
+        except ValueError as exc:
+            raise click.ClickException(str(exc)) from exc
+
+    if print_pack:
+        click.echo((project / pack.path).read_text(encoding="utf-8"), nl=False)
+        return
+    if as_json:
+        click.echo(json.dumps(pack.to_dict(), indent=2))
+        return
+
+    click.echo(ui.header(f"JVIS Context Pack — {role}"))
+    width = max([len("source"), *(len(s.path) for s in pack.sources)])
+    click.echo(f"  {'source':<{width}}  tier  {'status':<9} {'packed':>7} {'total':>7}")
+    for source in pack.sources:
+        if source.status == "missing":
+            continue
+        status = _STATUS_COLORS.get(source.status, str)(f"{source.status:<9}")
+        click.echo(f"  {source.path:<{width}}  {source.tier:>4}  {status} {source.packed:>7,} {source.tokens:>7,}")
+    click.echo("")
+    state = ui.green("cached") if pack.cached else "built"
+    summary = f"  {pack.path}: ~{pack.tokens:,} / {pack.budget:,} tokens ({state}"
+    click.echo(summary + (f", {pack.deduplicated:,} duplicate tokens skipped)" if pack.deduplicated else ")"))
@@ -0,0 +1,85 @@
+"""``jvis journey`` commands — project lifecycle progress from ``.jvis/journey/phases.yaml``."""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+
+import click
+
+from jvis.utils import ui
+
+logger = logging.getLogger(__name__)
+
+_STATUS_COLORS = {
+    "completed": ui.green,
+    "skipped": ui.green,
+    "in_progress": ui.yellow,
+    "manual": ui.cyan,
+}
+
+
+@click.group()
+def journey() -> None:
+    """Track project progress through the journey phases."""
+
+
+@journey.command("status")
+@click.argument("path", default=".")
+@click.option("--json", "as_json", is_flag=True, help="Emit machine-readable JSON.")
+@click.option("--all", "show_all", is_flag=True, help="List checkpoints of every phase, not just the current one.")
+@click.option("--rebuild", is_flag=True, help="Discard the artifact index and rescan docs/.")
+def status(path: str, as_json: bool, show_all: bool, rebuild: bool) -> None:
+    """Show journey progress for the project at PATH (default: current directory).
+
+    Checkpoints are evaluated against the artifact index in
+    .jvis/cache/artifact-index.json, refreshed incrementally on each run.
+    """
+    from jvis.journey.progress import journey_status
+
+    target = Path(path).resolve()
+    try:
+        result = journey_status(target, rebuild=rebuild)
+    except FileNotFoundError as exc:
+        raise click.ClickException(str(exc)) from exc
+
+    if as_json:
+        click.echo(json.dumps(result.to_dict(), indent=2, ensure_ascii=False))
+        return
+
+    icons = result.status_icons
+    click.echo(ui.header("JVIS Journey"))
+    for phase in result.phases:
+        marker = ui.bold(" <- current") if phase.id == result.current_phase else ""
+        icon = icons.get(phase.status, "")
+        click.echo(f"  {icon} {phase.icon} {phase.name:<12} {phase.completed}/{len(phase.checkpoints)}{marker}")
+        if not show_all and phase.id != result.current_phase:
+            continue
+        for cp in phase.checkpoints:
+            color = _STATUS_COLORS.get(cp.status, str)
+            click.echo(f"      {icons.get(cp.status, ' ')} {cp.name:<32} {color(cp.status)}")
+        if phase.gate is not None:
+            gate_state = ui.green("ready") if phase.gate.ready else ui.yellow("not ready")
+            click.echo(f"      {phase.gate.name}: {gate_state}")
+            for req in phase.gate.requirements:
+                mark = "x" if req["met"] else " "
+                click.echo(f"        [{mark}] {req['checkpoint']} ({req['condition']})")
+
+    if result.next_checkpoints:
+        click.echo("")
+        click.echo("  Next:")
+        for cp in result.next_checkpoints:
+            hint = " ".join(part for part in (cp.agent, cp.command) if part)
+            missing = [a.spec for a in cp.artifacts if not a.present]
+            suffix = f" -> {', '.join(missing)}" if missing else ""
+            click.echo(f"    - {cp.name}{f' [{hint}]' if hint else ''}{suffix}")
+
+    scan = result.scan
+    logger.debug(
+        "Artifact index: %d files, %d dirs scanned, %d reused in %.1f ms",
+        scan.files,
+        scan.dirs_scanned,
+        scan.dirs_reused,
+        scan.elapsed * 1000,
+    )
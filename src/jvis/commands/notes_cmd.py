@@ -0,0 +1,63 @@
+"""``jvis notes`` commands — maintenance of agent notes in ``docs/notes/``."""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict
+from pathlib import Path
+
+import click
+
+from jvis.utils import perf, ui
+
+logger = logging.getLogger(__name__)
+
+
+@click.group()
+def notes() -> None:
+    """Maintain agent notes (docs/notes/)."""
+
+
+@notes.command("compact")
+@click.argument("path", default=".")
+@click.option("--days", type=click.IntRange(min=0), help="Override the retention stated in each file's header.")
+@click.option("--dry-run", is_flag=True, help="Show what would be archived without modifying files.")
+@click.option("--json", "as_json", is_flag=True, help="Emit machine-readable JSON.")
+def compact(path: str, days: int | None, dry_run: bool, as_json: bool) -> None:
+    """Archive expired note entries into docs/notes/archive/YYYY-MM.md.gz.
+
+    project-log.md keeps 7 days and from-<agent>.md 14 days unless the file
+    header says otherwise. lessons-learned.md is never touched.
+    PATH defaults to the current directory.
+    """
+    from jvis.notes.compaction import compact_notes
+
+    notes_dir = Path(path).resolve() / "docs" / "notes"
+    if not notes_dir.is_dir():
+        raise click.ClickException(f"No notes directory at {notes_dir}.")
+
+    with perf.span("notes_compact"):
+        result = compact_notes(notes_dir, days=days, dry_run=dry_run)
+
+    if as_json:
+        click.echo(json.dumps({**asdict(result), "dry_run": dry_run}, indent=2))
+        return
+
+    click.echo(ui.header("JVIS Notes Compaction"))
+    for name in sorted(result.kept):
+        archived = result.archived.get(name, 0)
+        line = f"  {name:<24} kept {result.kept[name]:>4}"
+        click.echo(line + (f"  archived {archived}" if archived else ""))
+    for month, count in sorted(result.months.items()):
+        click.echo(f"  -> archive/{month}.md.gz  +{count} entries")
+
+    if not result.total_archived:
+        click.echo(f"\n  {ui.green('Nothing to archive.')}")
+    elif dry_run:
+        click.echo(f"\n  {ui.yellow('Dry run — no changes made.')}")
+    else:
+        saved = result.bytes_before - result.bytes_after
+        click.echo(
+            f"\n  {ui.green('Archived')} {result.total_archived} entries ({saved:,} bytes moved out of docs/notes/)"
+        )
@@ -0,0 +1,110 @@
+"""``jvis plan`` commands — status of the active execution plan (``docs/plans/active-plan.yaml``)."""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+
+import click
+
+from jvis.utils import perf, ui
+
+logger = logging.getLogger(__name__)
+
+_STATE_COLORS = {
+    "complete": ui.green,
+    "ready": ui.cyan,
+    "in_progress": ui.yellow,
+    "in_review": ui.yellow,
+    "blocked": ui.red,
+    "rework": ui.red,
+}
+
+
+@click.group()
+def plan() -> None:
+    """Track the active execution plan and its review gates."""
+
+
+@plan.command("status")
+@click.argument("path", default=".")
+@click.option("--json", "as_json", is_flag=True, help="Emit machine-readable JSON.")
+@click.option("--brief", is_flag=True, help="Print one summary line (for hooks); silent when there is no plan.")
+@click.option("--no-cache", is_flag=True, help="Re-read the plan and every gate file.")
+def status(path: str, as_json: bool, brief: bool, no_cache: bool) -> None:
+    """Show plan progress, blocked steps and required reviews for the project at PATH.
+
+    Gate requirements come from each step's gate (or plans.gateMatrix by
+    risk) and are resolved against the QA gate files in docs/qa/gates/.
+    Parsed files are cached by mtime, so running this on every turn is cheap.
+    """
+    from jvis.plans.status import plan_status
+
+    project = Path(path).resolve()
+    with perf.span("plan_status"):
+        try:
+            result = plan_status(project, use_cache=not no_cache)
+        except FileNotFoundError as exc:
+            if brief:
+                return
+            raise click.ClickException(str(exc)) from exc
+        except ValueError as exc:
+            raise click.ClickException(str(exc)) from exc
+
+    if as_json:
+        click.echo(json.dumps(result.to_dict(), indent=2, ensure_ascii=False))
+        return
+
+    total = len(result.steps)
+    blocked = [s for s in result.steps if s.state in ("blocked", "rework")]
+    awaiting = result.awaiting_review()
+    if brief:
+        parts = [f"Plan: {result.done}/{total} done"]
+        if result.next_step:
+            parts.append(f"next {result.next_step.id}")
+        if blocked:
+            parts.append(f"{len(blocked)} blocked")
+        parts.extend(f"{reviewer} review: {', '.join(ids)}" for reviewer, ids in awaiting.items())
+        if result.checkpoint_due:
+            parts.append("checkpoint due")
+        click.echo(" · ".join(parts))
+        return
+
+    click.echo(ui.header(f"JVIS Plan — {result.plan or result.path}"))
+    click.echo(f"  {result.done}/{total} steps done ({result.status or 'no status'})")
+    click.echo("")
+    width = max((len(s.id) for s in result.steps), default=2)
+    for step in result.steps:
+        color = _STATE_COLORS.get(step.state, str)
+        detail = ""
+        if step.blocked_by:
+            detail = f"after {', '.join(step.blocked_by)}"
+        elif step.state == "rework":
+            detail = "gate FAIL: " + ", ".join(g.reviewer for g in step.gates if g.decision == "FAIL")
+        elif step.state == "in_review":
+            missing = [*step.awaiting, *(["report"] if step.report_missing else [])]
+            detail = f"needs {', '.join(missing)}"
+        agent = f"[{step.agent}]" if step.agent else ""
+        click.echo(f"  {step.id:<{width}}  {color(f'{step.state:<11}')} {agent:<12} {step.title}")
+        if detail:
+            click.echo(f"  {'':<{width}}  {'':<11} {ui.yellow(detail)}")
+
+    if result.checkpoints:
+        click.echo("")
+        click.echo("  Checkpoints:")
+        for cp in result.checkpoints:
+            state = {"complete": ui.green, "ready": ui.cyan}.get(cp.state, ui.yellow)(cp.state)
+            waiting = f" (waiting on {', '.join(cp.waiting_on)})" if cp.waiting_on else ""
+            click.echo(f"    {cp.id}: {state} — {', '.join(cp.reviewers) or 'no reviewers'}{waiting}")
+
+    click.echo("")
+    if result.next_step:
+        step = result.next_step
+        click.echo(f"  Next: {ui.bold(step.id)} {step.title}" + (f" [/{step.agent}]" if step.agent else ""))
+    elif result.done < total:
+        click.echo(f"  {ui.yellow('No executable steps — every pending step is blocked.')}")
+    for reviewer, ids in awaiting.items():
+        click.echo(f"  Review required: /{reviewer} for {', '.join(ids)}")
+    if result.checkpoint_due:
+        click.echo(f"  {ui.yellow('Checkpoint due: finished steps are not covered by any checkpoint.')}")
@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import click
 
 if TYPE_CHECKING:
+    from jvis.scaffold.framework import FrameworkSnapshot
     from jvis.stacks.registry import StackInfo
 
+from jvis.commands import platforms_option
+from jvis.scaffold.options import DOCKERFILE_MODES, SERVER_PROFILES, ScaffoldOptions
 from jvis.utils import ui
 
 logger = logging.getLogger(__name__)
@@ -28,6 +32,8 @@ class ProjectConfig:
     stacks: dict[str, StackInfo | None]
     database: str
     entity_name: str = "item"
+    options: ScaffoldOptions = field(default_factory=ScaffoldOptions)
+    platforms: tuple[str, ...] | None = None  # None = every platform
 
 
 @click.command()
@@ -42,7 +48,44 @@ class ProjectConfig:
 @click.option("--database", "-d", "db", default=None, help="Database: postgresql, mysql, dynamodb.")
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt.")
 @click.option("--entity", "-e", default="item", help="Domain entity name (singular, e.g. product, task, user).")
-def new(name: str | None, stack: str | None, dest_path: str | None, db: str | None, yes: bool, entity: str) -> None:
+@click.option(
+    "--dockerfile",
+    type=click.Choice(DOCKERFILE_MODES),
+    default="static",
+    show_default=True,
+    help="Dockerfile mode: copy the stack's static file, or generate a cache-friendly multi-stage build.",
+)
+@click.option(
+    "--server-profile",
+    type=click.Choice(SERVER_PROFILES),
+    default="dev",
+    show_default=True,
+    help="Python backends: dev server only, or add a tuned gunicorn config, health check and `make serve`.",
+)
+@click.option(
+    "--bulk-endpoints",
+    is_flag=True,
+    help="Add POST/DELETE /items:batch endpoints (one transaction, chunked) to fastapi, flask, django and express.",
+)
+@click.option(
+    "--metrics",
+    is_flag=True,
+    help="Serve Prometheus /metrics (latency, in-flight requests, DB pool) from fastapi, flask, django, express, axum.",
+)
+@platforms_option
+def new(
+    name: str | None,
+    stack: str | None,
+    dest_path: str | None,
+    db: str | None,
+    yes: bool,
+    entity: str,
+    dockerfile: str,
+    server_profile: str,
+    bulk_endpoints: bool,
+    metrics: bool,
+    platforms: tuple[str, ...] | None,
+) -> None:
     """Create a new JVIS project.
 
     Interactive by default. Use flags for scripted usage:
@@ -57,6 +100,13 @@ def new(name: str | None, stack: str | None, dest_path: str | None, db: str | No
         config = _collect_config_scripted(name, stack, dest_path, db, entity)
     else:
         config = _collect_config_interactive(entity)
+    config.options = ScaffoldOptions(
+        dockerfile=dockerfile,
+        server_profile=server_profile,
+        bulk_endpoints=bulk_endpoints,
+        metrics=metrics,
+    )
+    config.platforms = platforms
 
     if not yes and not show_summary_and_confirm(
         config.project_name,
@@ -167,88 +217,30 @@ def _validate_entity(entity: str) -> str:
     return entity
 
 
-def _scaffold_project(config: ProjectConfig) -> None:
-    """Create all project files — stacks, framework, docs, git."""
-    from jvis.scaffold.docs_structure import create_context_map, create_docs_structure
-    from jvis.scaffold.entity_rename import apply_entity_name
-    from jvis.scaffold.framework import install_framework
-    from jvis.scaffold.shared_files import create_shared_files
-    from jvis.utils.git import setup_git
-
-    click.echo("")
-    click.echo(ui.cyan("  Creating project..."))
-    config.project_dir.mkdir(parents=True, exist_ok=True)
-
-    if config.project_type == "single":
-        _scaffold_single_stack(config)
-    else:
-        _scaffold_monorepo(config)
-
-    if config.entity_name != "item":
-        click.echo(f"  Applying entity name '{config.entity_name}'...")
-        apply_entity_name(config.project_dir, config.entity_name)
-
-    click.echo("  Installing JVIS framework...")
-    install_framework(config.project_dir)
+def _scaffold_project(
+    config: ProjectConfig,
+    *,
+    echo: Callable[[str], None] = click.echo,
+    snapshot: FrameworkSnapshot | None = None,
+) -> None:
+    """Create all project files — stacks, framework, docs, git.
 
-    from jvis.utils.config import read_version
-    from jvis.version_tracking import detect_source_mode, stamp_version
-
-    stamp_version(config.project_dir, read_version(), detect_source_mode())
-
-    click.echo("  Creating documentation structure...")
-    create_docs_structure(config.project_dir)
-
-    primary_stack = config.stacks.get("stack") or config.stacks.get("backend")
-
-    click.echo("  Generating context map...")
-    create_context_map(
-        project_path=config.project_dir,
-        stack=primary_stack.id if primary_stack else "custom",
-        database=config.database or "none",
-        language=primary_stack.language if primary_stack else "unknown",
-    )
-
-    click.echo("  Creating shared files...")
-    create_shared_files(config.project_dir, config.project_name, config.project_description, primary_stack)
-
-    click.echo("  Initializing git...")
-    setup_git(config.project_dir, primary_stack.id if primary_stack else "")
-
-
-def _scaffold_single_stack(config: ProjectConfig) -> None:
-    """Create a single-stack project structure."""
-    from jvis.scaffold.stack_runner import run_stack
-
-    stack = config.stacks.get("stack")
-    if stack and stack.directory:
-        click.echo(f"  Creating {stack.name} structure...")
-        run_stack(stack, config.project_dir, config.project_name, config.project_description, config.database)
-
-
-def _scaffold_monorepo(config: ProjectConfig) -> None:
-    """Create a monorepo project structure with backend/frontend/mobile."""
-    from jvis.scaffold.monorepo import create_monorepo_root
-    from jvis.scaffold.stack_runner import run_stack
-
-    backend = config.stacks.get("backend")
-    frontend = config.stacks.get("frontend")
-    mobile = config.stacks.get("mobile")
+    Runs :func:`jvis.api.scaffold` to completion and prints its progress
+    events through *echo*. A long-lived caller passes a prebuilt framework
+    *snapshot* so the framework is not re-hashed per project.
+    """
+    import asyncio
 
-    click.echo("  Creating monorepo structure...")
-    create_monorepo_root(config.project_dir, config.project_name, backend, frontend, config.database, mobile)
+    from jvis.api import ProgressEvent, scaffold
 
-    if backend and backend.directory:
-        click.echo(f"  Creating backend ({backend.name})...")
-        run_stack(
-            backend, config.project_dir / "server", config.project_name, config.project_description, config.database
-        )
+    def show(event: ProgressEvent) -> None:
+        if event.step == "project":
+            echo("")
+            echo(ui.cyan(f"  {event.message}"))
+        else:
+            echo(f"  {event.message}")
 
-    if frontend and frontend.directory:
-        click.echo(f"  Creating frontend ({frontend.name})...")
-        run_stack(
-            frontend, config.project_dir / "client", config.project_name, config.project_description, config.database
-        )
+    asyncio.run(scaffold(config, on_progress=show, snapshot=snapshot))
 
 
 def _print_post_install(config: ProjectConfig) -> None:
@@ -0,0 +1,68 @@
+"""``jvis search`` command — ranked full-text search over project docs and agents."""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict
+from pathlib import Path
+
+import click
+
+from jvis.utils import perf, ui
+
+logger = logging.getLogger(__name__)
+
+
+@click.command()
+@click.argument("query")
+@click.argument("path", default=".")
+@click.option("--limit", "-n", type=click.IntRange(min=1), default=10, show_default=True, help="Maximum results.")
+@click.option("--in", "within", default="", help="Only return files under this path (e.g. docs/stories).")
+@click.option("--no-refresh", is_flag=True, help="Query the index as is, without checking for changed files.")
+@click.option("--rebuild", is_flag=True, help="Re-index every file.")
+@click.option("--json", "as_json", is_flag=True, help="Emit machine-readable JSON.")
+def search(
+    query: str,
+    path: str,
+    limit: int,
+    within: str,
+    no_refresh: bool,
+    rebuild: bool,
+    as_json: bool,
+) -> None:
+    """Search the stories, QA gates, notes and agent definitions of PATH for QUERY.
+
+    Indexes docs/ and .jvis/agents/ into .jvis/cache/search.sqlite3 and
+    ranks results with BM25. Only files changed since the last search are
+    re-indexed. Quote a multi-word QUERY; end a word with * to match by
+    prefix (e.g. auth*).
+    """
+    from jvis.search.index import RefreshStats, SearchIndex
+
+    project = Path(path).resolve()
+    with SearchIndex(project) as index:
+        if rebuild:
+            index.clear()
+        stats = RefreshStats()
+        if not no_refresh or rebuild:
+            with perf.span("search_refresh"):
+                stats = index.refresh()
+        with perf.span("search_query"):
+            hits = index.search(query, limit=limit, within=within.removeprefix("./").rstrip("/"))
+        documents = index.document_count
+
+    if as_json:
+        payload = {"query": query, "documents": documents, "refresh": asdict(stats), "hits": [asdict(h) for h in hits]}
+        click.echo(json.dumps(payload, indent=2))
+        return
+
+    if not hits:
+        click.echo(f"  No matches for {ui.bold(query)} in {documents} documents.")
+        raise click.exceptions.Exit(1)
+    for hit in hits:
+        click.echo(f"  {ui.cyan(hit.path)}  {ui.bold(hit.title)}  ({hit.score:.2f})")
+        if hit.snippet:
+            click.echo(f"      {hit.snippet}")
+    note = f", re-indexed {stats.changed}" if stats.changed else ""
+    click.echo(f"\n  {len(hits)} of {documents} documents{note} in {stats.elapsed * 1000:.0f} ms refresh")
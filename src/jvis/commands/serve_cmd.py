@@ -0,0 +1,79 @@
+"""``jvis serve`` command — run the scaffold service (``jvis new`` over HTTP/JSON)."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import click
+
+from jvis.utils import ui
+
+logger = logging.getLogger(__name__)
+
+
+@click.command()
+@click.option("--host", default="127.0.0.1", show_default=True, help="Interface to bind.")
+@click.option("--port", type=click.IntRange(0, 65535), default=8765, show_default=True, help="Port (0 = any free).")
+@click.option(
+    "--output-root",
+    default="jvis-projects",
+    show_default=True,
+    help="Directory that receives one <request-id>/<name>/ project per request.",
+)
+@click.option("--workers", "-j", type=click.IntRange(min=1), default=4, show_default=True, help="Parallel scaffolds.")
+@click.option(
+    "--queue",
+    type=click.IntRange(min=0),
+    default=16,
+    show_default=True,
+    help="Requests that may wait for a worker before new ones get 503.",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=1),
+    default=120.0,
+    show_default=True,
+    help="Seconds a request may take before it gets 504.",
+)
+def serve(host: str, port: int, output_root: str, workers: int, queue: int, timeout: float) -> None:
+    """Serve project scaffolding over a local HTTP/JSON API.
+
+    POST /scaffold takes the same settings as `jvis new` as JSON and answers
+    with the created project (or a zip / tar.gz archive of it). GET /health,
+    /metrics and /stacks report on the service. Stacks, templates and the
+    framework snapshot are loaded once at startup.
+    """
+    from jvis.serve import ScaffoldService, ServiceSettings, make_server
+    from jvis.utils.validation import validate_safe_path
+
+    root = Path(output_root).expanduser().resolve()
+    err = validate_safe_path(root)
+    if err:
+        raise click.ClickException(err)
+    root.mkdir(parents=True, exist_ok=True)
+
+    service = ScaffoldService(ServiceSettings(output_root=root, workers=workers, queue=queue, timeout=timeout))
+    warmup = service.warm()
+    try:
+        server = make_server(service, host, port)
+    except OSError as exc:
+        service.close()
+        raise click.ClickException(f"Cannot listen on {host}:{port}: {exc}") from exc
+
+    click.echo(ui.header("JVIS Scaffold Service"))
+    click.echo(f"  Listening on {ui.bold(f'http://{host}:{server.server_port}')}")
+    click.echo(f"  Output root: {root}")
+    click.echo(f"  Workers: {workers}, queue: {queue}, timeout: {timeout:g}s")
+    click.echo(
+        f"  Warm: {warmup['stacks']} stacks, {warmup['templates']} templates, "
+        f"{warmup['framework_files']} framework files in {warmup['elapsed_ms']:.0f} ms"
+    )
+    click.echo("  Press Ctrl+C to stop.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        click.echo("\n  Stopping...")
+    finally:
+        server.server_close()
+        service.close()
@@ -0,0 +1,83 @@
+"""``jvis shard`` command — split the PRD and architecture into per-section files."""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict
+from pathlib import Path
+
+import click
+
+from jvis.sharding import DOCUMENTS
+from jvis.utils import perf, ui
+
+logger = logging.getLogger(__name__)
+
+
+@click.command()
+@click.argument("path", default=".")
+@click.option(
+    "--doc",
+    "-d",
+    "documents",
+    multiple=True,
+    type=click.Choice(DOCUMENTS),
+    help="Document to shard (repeatable; default: those enabled in core-config.yaml).",
+)
+@click.option("--dry-run", is_flag=True, help="Show which shards would change without writing.")
+@click.option("--json", "as_json", is_flag=True, help="Emit machine-readable JSON.")
+def shard(path: str, documents: tuple[str, ...], dry_run: bool, as_json: bool) -> None:
+    """Shard the PRD and architecture of the project at PATH by ## heading.
+
+    Without --doc, shards those enabled in .jvis/core-config.yaml
+    (prdSharded / architectureSharded). Shards go to the configured
+    *ShardedLocation with an index.md listing token estimates; only
+    sections that changed are rewritten.
+    """
+    from jvis.sharding import shard_document, shard_targets
+
+    project = Path(path).resolve()
+    targets = shard_targets(project)
+    selected = [targets[name] for name in documents] or [t for t in targets.values() if t.enabled]
+    if not selected:
+        raise click.ClickException(
+            "No documents to shard. Set prdSharded / architectureSharded: true in "
+            ".jvis/core-config.yaml or name them: jvis shard -d prd -d architecture"
+        )
+
+    results = []
+    for target in selected:
+        if not target.source.is_file():
+            if documents:
+                raise click.ClickException(f"{target.name}: {target.source} not found.")
+            logger.info("Skipping %s: %s not found", target.name, target.source)
+            continue
+        with perf.span(f"shard[{target.name}]"):
+            results.append(shard_document(target, project, dry_run=dry_run))
+
+    if as_json:
+        payload = [{**asdict(r), "tokens": r.tokens, "dry_run": dry_run} for r in results]
+        click.echo(json.dumps(payload, indent=2))
+        return
+
+    click.echo(ui.header("JVIS Shard"))
+    if not results:
+        click.echo(f"  {ui.yellow('No configured documents exist yet.')}")
+    for result in results:
+        click.echo(f"  {ui.bold(result.name)}  {result.source} -> {result.location}/")
+        if not result.shards:
+            click.echo(f"    {ui.yellow('No ## headings — nothing to shard.')}")
+            continue
+        for entry in result.shards:
+            mark = ui.green("*") if entry.file in result.written else " "
+            click.echo(f"    {mark} {entry.file:<40} ~{entry.tokens:>6,} tokens")
+        for name in result.removed:
+            click.echo(f"    {ui.red('-')} {name}")
+        changed = len(result.written) + len(result.removed)
+        click.echo(f"    {len(result.shards)} shards, ~{result.tokens:,} tokens, {changed} changed")
+        if not targets[result.name].enabled:
+            flag = "prdSharded" if result.name == "prd" else "architectureSharded"
+            click.echo(f"    {ui.yellow(f'Set {flag}: true in core-config.yaml so agents load the shards.')}")
+    if dry_run:
+        click.echo(f"\n  {ui.yellow('Dry run — no changes made.')}")
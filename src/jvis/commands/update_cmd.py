@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import os
+from dataclasses import asdict
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
-from jvis.utils import ui
+from jvis.commands import platforms_option
+from jvis.utils import perf, ui
+
+if TYPE_CHECKING:
+    from jvis.fleet import FleetReport
 
 logger = logging.getLogger(__name__)
 
@@ -16,12 +24,39 @@ logger = logging.getLogger(__name__)
 @click.argument("path", default=".")
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt.")
 @click.option("--dry-run", is_flag=True, help="Show what would change without modifying files.")
-def update(path: str, yes: bool, dry_run: bool) -> None:
+@click.option("--all", "all_projects", is_flag=True, help="Update every JVIS project found under PATH.")
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=lambda: min(8, os.cpu_count() or 1),
+    show_default="min(8, CPUs)",
+    help="Projects updated in parallel (with --all).",
+)
+@click.option("--json", "as_json", is_flag=True, help="Print a JSON report (with --all).")
+@platforms_option
+def update(
+    path: str,
+    yes: bool,
+    dry_run: bool,
+    all_projects: bool,
+    jobs: int,
+    as_json: bool,
+    platforms: tuple[str, ...] | None,
+) -> None:
     """Update JVIS framework in an existing project.
 
-    PATH defaults to the current directory.
+    PATH defaults to the current directory. With --all, PATH is a workspace
+    root searched for projects (directories containing .jvis/version).
+    --platforms changes the project's platform selection; files of dropped
+    platforms are left in place.
     """
+    if all_projects:
+        _update_all(Path(path).resolve(), yes=yes, dry_run=dry_run, jobs=jobs, as_json=as_json, platforms=platforms)
+        return
+
     from jvis.detection.project_state import detect_project_state, get_jvis_version
+    from jvis.scaffold.framework import resolve_platforms
     from jvis.utils.config import read_version
     from jvis.version_tracking import detect_source_mode, read_provenance
 
@@ -30,7 +65,8 @@ def update(path: str, yes: bool, dry_run: bool) -> None:
     click.echo(ui.header("JVIS Update"))
 
     # 1. Validate target
-    state = detect_project_state(target)
+    with perf.span("detect"):
+        state = detect_project_state(target)
     if state not in ("has_context", "has_aicore"):
         raise click.ClickException(f"No JVIS installation found at {target}. Use 'jvis new' or 'jvis add' first.")
 
@@ -43,10 +79,14 @@ def update(path: str, yes: bool, dry_run: bool) -> None:
     click.echo(f"  Installed: {installed_display}")
     click.echo(f"  Available: {source_version}")
 
-    if installed_display == source_version:
+    if installed_display == source_version and platforms is None:
         click.echo(f"\n  {ui.green('Already up to date.')} (v{source_version})")
         return
 
+    # Resolve before the update replaces core-config.yaml.
+    selected = resolve_platforms(target, platforms)
+    click.echo(f"  Platforms: {', '.join(selected)}")
+
     # 3. Show what will be updated
     click.echo("")
     click.echo("  Will update:")
@@ -54,8 +94,8 @@ def update(path: str, yes: bool, dry_run: bool) -> None:
     click.echo("    .jvis/tasks/           (task workflows)")
     click.echo("    .jvis/templates/       (document templates)")
     click.echo("    .jvis/agent-engine/    (generator)")
-    click.echo("    .claude/commands/      (slash commands)")
-    click.echo("    .claude/skills/        (domain knowledge)")
+    for platform in selected:
+        click.echo(f"    {_PLATFORM_UPDATE_LINES[platform]}")
     click.echo("")
     click.echo("  Will preserve:")
     click.echo("    docs/notes/            (agent handoff notes)")
@@ -73,16 +113,99 @@ def update(path: str, yes: bool, dry_run: bool) -> None:
             click.echo(f"  {ui.yellow('Cancelled.')}")
             raise click.exceptions.Exit(0)
 
-    # 5. Run update
-    from jvis.scaffold.framework import install_framework
+    # 5. Run update (copy only framework files whose content changed)
+    from jvis.scaffold.framework import snapshot_framework, sync_framework
     from jvis.version_tracking import stamp_version
 
     click.echo("")
     click.echo(ui.cyan("  Updating JVIS framework..."))
-    install_framework(target)
+    with perf.span("snapshot_framework"):
+        try:
+            snapshot = snapshot_framework()
+        except RuntimeError as exc:
+            raise click.ClickException(str(exc)) from exc
+    with perf.span("sync_framework"):
+        sync = sync_framework(target, snapshot, platforms=selected)
 
     source = detect_source_mode()
-    stamp_version(target, source_version, source)
+    with perf.span("stamp_version"):
+        stamp_version(target, source_version, source, sync.digest)
 
     click.echo("")
     click.echo(f"  {ui.green('Updated successfully.')} v{installed_display} -> v{source_version}")
+
+
+_PLATFORM_UPDATE_LINES = {
+    "claude": ".claude/commands/      (slash commands, skills, hooks)",
+    "cursor": ".cursor/rules/         (Cursor rules)",
+    "kiro": ".kiro/steering/        (Kiro steering docs)",
+}
+
+
+def _update_all(
+    root: Path,
+    *,
+    yes: bool,
+    dry_run: bool,
+    jobs: int,
+    as_json: bool,
+    platforms: tuple[str, ...] | None = None,
+) -> None:
+    """Fleet mode: update every project under *root* against one framework snapshot."""
+    from jvis.fleet import discover_projects, update_fleet
+    from jvis.scaffold.framework import snapshot_framework
+    from jvis.utils.config import read_version
+
+    with perf.span("discover"):
+        projects = discover_projects(root)
+    if not projects:
+        raise click.ClickException(f"No JVIS projects (.jvis/version) found under {root}.")
+
+    with perf.span("snapshot_framework"):
+        try:
+            snapshot = snapshot_framework()
+        except RuntimeError as exc:
+            raise click.ClickException(str(exc)) from exc
+    source_version = read_version()
+
+    if not as_json:
+        click.echo(ui.header("JVIS Fleet Update"))
+        click.echo(f"  Root:      {root}")
+        click.echo(f"  Projects:  {len(projects)}")
+        click.echo(f"  Available: {source_version} ({len(snapshot.files)} framework files)")
+
+    if not (yes or dry_run or as_json):
+        click.echo("")
+        if not click.confirm(f"  Update {len(projects)} projects to {source_version}?", default=True):
+            click.echo(f"  {ui.yellow('Cancelled.')}")
+            raise click.exceptions.Exit(0)
+
+    report = update_fleet(root, projects, snapshot, source_version, jobs=jobs, dry_run=dry_run, platforms=platforms)
+
+    if as_json:
+        click.echo(json.dumps(asdict(report), indent=2))
+    else:
+        _print_fleet_table(report)
+    if report.counts().get("failed"):
+        raise click.exceptions.Exit(1)
+
+
+_FLEET_STATUS_COLORS = {"updated": ui.green, "would-update": ui.yellow, "failed": ui.red}
+
+
+def _print_fleet_table(report: FleetReport) -> None:
+    width = max([len("project"), *(len(p.path) for p in report.projects)])
+    click.echo("")
+    click.echo(f"  {'project':<{width}}  {'before':<10} {'after':<10} {'status':<12} {'files':>5} {'ms':>8}")
+    for p in report.projects:
+        color = _FLEET_STATUS_COLORS.get(p.status, str)
+        status = color(f"{p.status:<12}")
+        line = f"  {p.path:<{width}}  {p.before:<10} {p.after:<10} {status} {p.files_changed:>5} {p.elapsed_ms:>8.1f}"
+        click.echo(line)
+        if p.error:
+            click.echo(f"  {'':<{width}}  {ui.red(p.error)}")
+    summary = ", ".join(f"{count} {status}" for status, count in sorted(report.counts().items()))
+    click.echo("")
+    click.echo(f"  {summary} in {report.elapsed_ms / 1000:.2f}s")
+    if report.dry_run:
+        click.echo(f"  {ui.yellow('Dry run — no changes made.')}")
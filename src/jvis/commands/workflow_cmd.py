@@ -0,0 +1,109 @@
+"""``jvis workflow`` commands — compiled views of ``.jvis/workflows/*.yaml``."""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import click
+
+from jvis.utils import ui
+
+if TYPE_CHECKING:
+    from jvis.workflow.graph import WorkflowGraph
+
+logger = logging.getLogger(__name__)
+
+
+@click.group()
+def workflow() -> None:
+    """Inspect agent workflows: validate their graphs and show what runs next."""
+
+
+def _load(path: str) -> tuple[Path, list[WorkflowGraph]]:
+    from jvis.workflow.graph import load_workflows
+
+    target = Path(path).resolve()
+    graphs = load_workflows(target)
+    if not graphs:
+        raise click.ClickException(f"No workflows found for {target}.")
+    return target, graphs
+
+
+@workflow.command("list")
+@click.argument("path", default=".")
+@click.option("--json", "as_json", is_flag=True, help="Emit machine-readable JSON.")
+def list_cmd(path: str, as_json: bool) -> None:
+    """List the workflows available to the project at PATH (default: current directory)."""
+    _, graphs = _load(path)
+    if as_json:
+        rows = [{"id": g.id, "name": g.name, "type": g.type, "steps": len(g.steps), "valid": g.valid} for g in graphs]
+        click.echo(json.dumps(rows, indent=2))
+        return
+    click.echo(ui.header("JVIS Workflows"))
+    for g in graphs:
+        state = ui.green("ok") if g.valid else ui.red("invalid")
+        click.echo(f"  {g.id:<24} {g.type:<11} {len(g.steps):>3} steps  {state}")
+
+
+@workflow.command("validate")
+@click.argument("path", default=".")
+@click.option("--json", "as_json", is_flag=True, help="Emit machine-readable JSON.")
+def validate_cmd(path: str, as_json: bool) -> None:
+    """Check every workflow of PATH (default: current directory) for missing producers and cycles.
+
+    Exits with status 1 when any workflow is invalid.
+    """
+    _, graphs = _load(path)
+    if as_json:
+        click.echo(json.dumps([g.to_dict() for g in graphs], indent=2))
+    else:
+        for g in graphs:
+            click.echo(
+                f"  {ui.green('✓') if g.valid else ui.red('✗')} {g.id} ({len(g.steps)} steps, {len(g.edges)} edges)"
+            )
+            for item in g.missing:
+                click.echo(f"      missing producer: {item['artifact']} (required by {item['step']})")
+            for cycle in g.cycles:
+                click.echo(f"      cycle: {' -> '.join([*cycle, cycle[0]])}")
+    if not all(g.valid for g in graphs):
+        raise click.exceptions.Exit(1)
+
+
+@workflow.command("next")
+@click.argument("workflow_id")
+@click.argument("path", default=".")
+@click.option("--json", "as_json", is_flag=True, help="Emit machine-readable JSON.")
+def next_cmd(workflow_id: str, path: str, as_json: bool) -> None:
+    """Show the next runnable steps of WORKFLOW_ID given the artifacts in PATH/docs/."""
+    from jvis.workflow.graph import workflow_next
+
+    target, graphs = _load(path)
+    graph = next((g for g in graphs if g.id == workflow_id), None)
+    if graph is None:
+        available = ", ".join(g.id for g in graphs)
+        raise click.ClickException(f"Unknown workflow '{workflow_id}'. Available: {available}")
+
+    result = workflow_next(target, graph)
+    if as_json:
+        click.echo(json.dumps(asdict(result), indent=2))
+        return
+
+    click.echo(ui.header(f"Workflow: {graph.name or graph.id}"))
+    click.echo(f"  Done: {len(result.done)}/{len(graph.steps)} steps")
+    if not result.runnable:
+        click.echo(f"  {ui.green('Nothing left to run.')}")
+        return
+    click.echo("  Next:")
+    for step in result.runnable:
+        notes = []
+        if step.condition:
+            notes.append(f"if {step.condition}")
+        if step.optional:
+            notes.append("optional")
+        suffix = f" ({', '.join(notes)})" if notes else ""
+        outputs = f" -> {', '.join(step.creates)}" if step.creates else ""
+        click.echo(f"    - {step.id}{outputs}{suffix}")
@@ -0,0 +1 @@
+"""Agent context — precomputed, token-budgeted context packs for ``*load-context``."""
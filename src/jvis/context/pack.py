@@ -0,0 +1,299 @@
+"""Context packs — one precomputed, token-budgeted payload per agent role.
+
+Instead of every ``*load-context`` reading devLoadAlwaysFiles, notes and the
+context map one by one, ``jvis context build`` assembles them into
+``.jvis/cache/context/<role>.md``:
+
+  - sources are packed in priority tiers: the next action and context map
+    first, then the notes the role reads and writes (``inter_agent`` in its
+    agent YAML), devLoadAlwaysFiles (same tier for ``dev``, one lower for
+    everyone else) and the code map, the project log, lessons learned and
+    shard indexes
+  - note files contribute their dated entries, newest first across the
+    tier; their boilerplate headers are dropped
+  - paragraphs already packed from another source are skipped
+  - the pack never exceeds the token budget: a file that no longer fits is
+    cut at a paragraph boundary (or left out) and reported as such
+
+A manifest next to the pack records each source's size, mtime and hash.
+Rebuilding with unchanged sources returns the cached pack without reading
+them again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from jvis.notes.compaction import entry_date, parse_notes
+from jvis.utils.fs import write_file_atomic
+from jvis.utils.tokens import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(".jvis") / "cache" / "context"
+DEFAULT_BUDGET = 8000
+_PACK_VERSION = 1
+_MIN_PARTIAL_TOKENS = 64  # cutting a file below this leaves nothing useful
+_MIN_DEDUP_CHARS = 40  # shorter paragraphs (headings, "None yet") may repeat legitimately
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+_ROLE_RE = re.compile(r"[A-Za-z0-9_-]+")
+
+
+@dataclass
+class PackSource:
+    """One candidate source of a pack and what made it in."""
+
+    path: str  # project-relative
+    tier: int
+    kind: str  # file | notes
+    size: int = 0
+    mtime_ns: int = 0
+    sha256: str = ""  # empty when the file does not exist
+    tokens: int = 0  # estimated tokens of the whole source
+    packed: int = 0  # tokens included in the pack
+    status: str = "missing"  # included | partial | omitted | empty | missing
+
+
+@dataclass
+class ContextPack:
+    role: str
+    budget: int
+    key: str
+    tokens: int
+    path: str  # project-relative pack file
+    sources: list[PackSource] = field(default_factory=list)
+    deduplicated: int = 0  # tokens skipped as repeated paragraphs
+    cached: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def available_roles(project: Path) -> list[str]:
+    """Return the agent ids defined under ``.jvis/agents/``."""
+    return sorted(p.stem for p in (project / ".jvis" / "agents").rglob("*.yaml"))
+
+
+def pack_sources(project: Path, role: str) -> list[PackSource]:
+    """Return the candidate sources for *role*'s pack, highest priority first.
+
+    Raises ``ValueError`` for a role with no agent definition.
+    """
+    if not _ROLE_RE.fullmatch(role):
+        raise ValueError(f"Invalid role '{role}'.")
+    config = _load_yaml(project / ".jvis" / "core-config.yaml")
+    roles = available_roles(project)
+    if roles and role not in roles:
+        raise ValueError(f"Unknown role '{role}'. Available: {', '.join(roles)}.")
+    agent = next((_load_yaml(p) for p in (project / ".jvis" / "agents").rglob(f"{role}.yaml")), {})
+    raw_inter, raw_notes = agent.get("inter_agent"), config.get("notes")
+    inter: dict[str, Any] = raw_inter if isinstance(raw_inter, dict) else {}
+    notes: dict[str, Any] = raw_notes if isinstance(raw_notes, dict) else {}
+    notes_dir = str(notes.get("notesLocation") or "docs/notes")
+
+    role_notes = [*(inter.get("reads_from") or []), *([inter["writes_to"]] if inter.get("writes_to") else [])]
+    candidates: list[tuple[int, str, str]] = [
+        (0, str(notes.get("nextAction") or f"{notes_dir}/next-action.md"), "file"),
+        (0, f"{notes_dir}/context-map.md", "file"),
+        *((1, str(p), "notes") for p in role_notes),
+        *((1 if role == "dev" else 2, str(p), "file") for p in config.get("devLoadAlwaysFiles") or []),
+        (2, f"{notes_dir}/code-map.md", "file"),
+        (3, str(notes.get("projectLog") or f"{notes_dir}/project-log.md"), "notes"),
+        (4, str(notes.get("lessonsLearned") or f"{notes_dir}/lessons-learned.md"), "file"),
+    ]
+    from jvis.sharding import INDEX_FILE, shard_targets
+
+    for target in shard_targets(project).values():
+        candidates.append((5, (target.location / INDEX_FILE).relative_to(project).as_posix(), "file"))
+
+    sources: dict[str, PackSource] = {}
+    for tier, path, kind in candidates:
+        sources.setdefault(path, PackSource(path=path, tier=tier, kind=kind))
+    return list(sources.values())
+
+
+def build_context_pack(
+    project: Path,
+    role: str = "dev",
+    budget: int | None = None,
+    *,
+    force: bool = False,
+) -> ContextPack:
+    """Build (or reuse) *role*'s context pack for *project* and return its summary.
+
+    *budget* defaults to ``contextPack.budget`` in core-config.yaml, else
+    :data:`DEFAULT_BUDGET` tokens. With *force*, the cache is ignored.
+    """
+    if budget is None:
+        settings = _load_yaml(project / ".jvis" / "core-config.yaml").get("contextPack")
+        budget = int(settings.get("budget") or DEFAULT_BUDGET) if isinstance(settings, dict) else DEFAULT_BUDGET
+    sources = pack_sources(project, role)
+    pack_file = project / CACHE_DIR / f"{role}.md"
+    manifest_file = pack_file.with_suffix(".json")
+    manifest = _read_manifest(manifest_file)
+    recorded = {s["path"]: s for s in manifest.get("sources", []) if isinstance(s, dict)}
+
+    texts: dict[str, str] = {}
+    for source in sources:
+        try:
+            st = (project / source.path).stat()
+        except OSError:
+            continue
+        source.size, source.mtime_ns = st.st_size, st.st_mtime_ns
+        previous = recorded.get(source.path, {})
+        if (previous.get("size"), previous.get("mtime_ns")) == (source.size, source.mtime_ns) and previous.get(
+            "sha256"
+        ):
+            source.sha256 = previous["sha256"]
+        else:
+            texts[source.path] = (project / source.path).read_text(encoding="utf-8", errors="replace")
+            source.sha256 = _sha256(texts[source.path])
+
+    key = _sha256(json.dumps([_PACK_VERSION, role, budget, [(s.path, s.tier, s.sha256) for s in sources]]))
+    rel_pack = pack_file.relative_to(project).as_posix()
+    if not force and manifest.get("key") == key and pack_file.is_file():
+        for source in sources:  # keep the recorded outcome, refresh stat data
+            previous = recorded.get(source.path, {})
+            source.tokens, source.packed = previous.get("tokens", 0), previous.get("packed", 0)
+            source.status = previous.get("status", source.status)
+        pack = ContextPack(
+            role, budget, key, manifest.get("tokens", 0), rel_pack, sources, manifest.get("deduplicated", 0)
+        )
+        if texts:  # touched but unchanged sources: record their new mtimes
+            _write_manifest(manifest_file, pack)
+        pack.cached = True
+        return pack
+
+    for source in sources:
+        if source.sha256 and source.path not in texts:
+            texts[source.path] = (project / source.path).read_text(encoding="utf-8", errors="replace")
+    text, deduplicated = _assemble(role, budget, sources, texts)
+    pack = ContextPack(role, budget, key, estimate_tokens(text), rel_pack, sources, deduplicated)
+    write_file_atomic(pack_file, text)
+    _write_manifest(manifest_file, pack)
+    return pack
+
+
+def _assemble(role: str, budget: int, sources: list[PackSource], texts: dict[str, str]) -> tuple[str, int]:
+    """Pack *sources* into Markdown within *budget* tokens; returns (text, deduplicated tokens)."""
+    header = f"# Context pack: {role}\n\n<!-- generated by `jvis context build`; budget {budget} tokens -->\n"
+    remaining = budget - estimate_tokens(header)
+    seen: set[str] = set()
+    blocks: dict[str, list[str]] = {}  # path -> heading + pieces, in first-packed order
+    chunks_total: dict[str, int] = {}
+    chunks_packed: dict[str, int] = {}
+    deduplicated = 0
+
+    for tier in sorted({s.tier for s in sources}):
+        candidates: list[tuple[int, int, PackSource, str]] = []
+        for order, source in enumerate(s for s in sources if s.tier == tier and s.sha256):
+            text = texts[source.path]
+            source.tokens = estimate_tokens(text)
+            if source.kind == "notes":
+                for entry in parse_notes(text).entries:
+                    when = entry_date(entry) or date.min
+                    candidates.append((1, -when.toordinal(), source, entry))
+            elif text.strip():
+                candidates.append((0, order, source, text))
+        # Whole files in listed order, then note entries newest first.
+        candidates.sort(key=lambda c: (c[0], c[1]))
+
+        for _, _, source, chunk in candidates:
+            chunks_total[source.path] = chunks_total.get(source.path, 0) + 1
+            paragraphs, skipped = _dedupe(chunk, seen)
+            deduplicated += skipped
+            if not paragraphs:
+                continue
+            heading = "" if source.path in blocks else f"\n## {source.path}\n\n"
+            room = remaining - estimate_tokens(heading)
+            piece = "\n\n".join(paragraphs) + "\n\n"
+            if estimate_tokens(piece) > room:
+                if source.kind != "file" or room < _MIN_PARTIAL_TOKENS:
+                    continue
+                piece = _truncate(paragraphs, room, source.path)
+                if not piece:
+                    continue
+            else:
+                chunks_packed[source.path] = chunks_packed.get(source.path, 0) + 1
+            blocks.setdefault(source.path, [heading]).append(piece)
+            source.packed += estimate_tokens(piece)
+            remaining -= estimate_tokens(piece) + estimate_tokens(heading)
+            seen.update(_normalize(p) for p in paragraphs)
+
+    for source in sources:
+        if not source.sha256:
+            continue
+        if not chunks_total.get(source.path):
+            source.status = "empty"
+        elif not source.packed:
+            source.status = "omitted"
+        elif chunks_packed.get(source.path, 0) < chunks_total[source.path]:
+            source.status = "partial"
+        else:
+            source.status = "included"
+    return header + "".join("".join(parts) for parts in blocks.values()), deduplicated
+
+
+def _dedupe(chunk: str, seen: set[str]) -> tuple[list[str], int]:
+    """Drop paragraphs of *chunk* already packed; returns (kept paragraphs, tokens skipped)."""
+    kept: list[str] = []
+    skipped = 0
+    for paragraph in _PARAGRAPH_RE.split(chunk.strip()):
+        if not paragraph.strip():
+            continue
+        norm = _normalize(paragraph)
+        if len(norm) >= _MIN_DEDUP_CHARS and not norm.startswith("#") and norm in seen:
+            skipped += estimate_tokens(paragraph)
+            continue
+        kept.append(paragraph.rstrip())
+    return kept, skipped
+
+
+def _truncate(paragraphs: list[str], room: int, path: str) -> str:
+    """Return the leading paragraphs that fit in *room* tokens plus a pointer to the full file."""
+    marker = f"_[truncated: read `{path}` for the rest]_\n\n"
+    room -= estimate_tokens(marker)
+    kept: list[str] = []
+    for paragraph in paragraphs:
+        if estimate_tokens("\n\n".join([*kept, paragraph]) + "\n\n") > room:
+            break
+        kept.append(paragraph)
+    return "\n\n".join(kept) + "\n\n" + marker if kept else ""
+
+
+def _normalize(paragraph: str) -> str:
+    return " ".join(paragraph.split()).lower()
+
+
+def _load_yaml(path: Path) -> dict[str, Any]:
+    try:
+        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    except (OSError, yaml.YAMLError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _read_manifest(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) and data.get("version") == _PACK_VERSION else {}
+
+
+def _write_manifest(path: Path, pack: ContextPack) -> None:
+    data = {"version": _PACK_VERSION, **{k: v for k, v in pack.to_dict().items() if k != "cached"}}
+    write_file_atomic(path, json.dumps(data, indent=2) + "\n")
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -0,0 +1,16 @@
+import { z } from 'zod';
+import { CreateItemSchema } from './item.dto.js';
+
+/** Largest accepted batch request (POST/DELETE /api/items:batch). */
+export const BATCH_MAX_ITEMS = 5000;
+
+export const BatchCreateItemsSchema = z.object({
+  items: z.array(CreateItemSchema).min(1).max(BATCH_MAX_ITEMS),
+});
+
+export const BatchDeleteItemsSchema = z.object({
+  ids: z.array(z.string().min(1)).min(1).max(BATCH_MAX_ITEMS),
+});
+
+export type BatchCreateItemsDto = z.infer<typeof BatchCreateItemsSchema>;
+export type BatchDeleteItemsDto = z.infer<typeof BatchDeleteItemsSchema>;
@@ -0,0 +1,34 @@
+import type { Request, Response, NextFunction } from 'express';
+import { BatchCreateItemsSchema, BatchDeleteItemsSchema } from '../../application/dto/item-batch.dto.js';
+import { ValidationError } from '../../domain/errors/app-error.js';
+import type { ItemBatchRepository } from '../../infrastructure/repositories/item-batch.repository.js';
+
+export class ItemBatchController {
+  constructor(private readonly repository: ItemBatchRepository) {}
+
+  create = async (req: Request, res: Response, next: NextFunction): Promise<void> => {
+    try {
+      const parsed = BatchCreateItemsSchema.safeParse(req.body);
+      if (!parsed.success) {
+        throw new ValidationError(parsed.error.issues.map((i) => i.message).join(', '));
+      }
+      const items = await this.repository.createMany(parsed.data.items);
+      res.status(201).json(items);
+    } catch (err) {
+      next(err);
+    }
+  };
+
+  delete = async (req: Request, res: Response, next: NextFunction): Promise<void> => {
+    try {
+      const parsed = BatchDeleteItemsSchema.safeParse(req.body);
+      if (!parsed.success) {
+        throw new ValidationError(parsed.error.issues.map((i) => i.message).join(', '));
+      }
+      const deleted = await this.repository.deleteMany(parsed.data.ids);
+      res.json({ deleted });
+    } catch (err) {
+      next(err);
+    }
+  };
+}
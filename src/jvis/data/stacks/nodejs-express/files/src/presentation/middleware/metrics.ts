@@ -0,0 +1,50 @@
+import type { Request, Response, NextFunction } from 'express';
+import { Gauge, Histogram, Registry, collectDefaultMetrics } from 'prom-client';
+import { prisma } from '../../infrastructure/database/prisma-client.js';
+
+// Prometheus metrics (generated with --metrics), served on /metrics:
+// - http_request_duration_seconds: latency histogram per method, route pattern and status
+// - http_requests_in_flight: requests currently being handled
+// - prisma_*: connection pool and query metrics from the Prisma "metrics" preview feature
+// Routes are labelled with their pattern (/api/items/:id), never the raw path, so label
+// cardinality stays bounded; unmatched requests share the "unmatched" label.
+
+export const registry = new Registry();
+collectDefaultMetrics({ register: registry });
+
+const requestDuration = new Histogram({
+  name: 'http_request_duration_seconds',
+  help: 'HTTP request latency in seconds.',
+  labelNames: ['method', 'route', 'status'] as const,
+  buckets: [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10],
+  registers: [registry],
+});
+
+const inFlight = new Gauge({
+  name: 'http_requests_in_flight',
+  help: 'HTTP requests currently being handled.',
+  labelNames: ['method'] as const,
+  registers: [registry],
+});
+
+export function metricsMiddleware(req: Request, res: Response, next: NextFunction): void {
+  const { method } = req;
+  inFlight.inc({ method });
+  const stopTimer = requestDuration.startTimer({ method });
+  // 'close' fires for completed and aborted responses alike, so the gauge never drifts.
+  res.once('close', () => {
+    inFlight.dec({ method });
+    const route = req.route ? `${req.baseUrl}${String(req.route.path)}` : 'unmatched';
+    stopTimer({ route, status: String(res.statusCode) });
+  });
+  next();
+}
+
+export async function metricsHandler(_req: Request, res: Response, next: NextFunction): Promise<void> {
+  try {
+    const [appMetrics, prismaMetrics] = await Promise.all([registry.metrics(), prisma.$metrics.prometheus()]);
+    res.set('Content-Type', registry.contentType).send(`${appMetrics}\n${prismaMetrics}`);
+  } catch (err) {
+    next(err);
+  }
+}
@@ -0,0 +1,13 @@
+import { Router } from 'express';
+import { ItemBatchController } from '../controllers/item-batch.controller.js';
+import { ItemBatchRepository } from '../../infrastructure/repositories/item-batch.repository.js';
+
+const controller = new ItemBatchController(new ItemBatchRepository());
+
+// Express reads ":batch" as a route parameter, so the literal path is matched with a regex.
+const BATCH_PATH = /^\/items:batch$/;
+
+export const itemsBatchRouter = Router();
+
+itemsBatchRouter.post(BATCH_PATH, controller.create);
+itemsBatchRouter.delete(BATCH_PATH, controller.delete);
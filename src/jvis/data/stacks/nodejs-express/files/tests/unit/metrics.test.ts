@@ -0,0 +1,48 @@
+import { describe, it, expect, vi } from 'vitest';
+import request from 'supertest';
+import { app } from '../../src/app.js';
+
+vi.mock('../../src/infrastructure/database/prisma-client.js', () => ({
+  prisma: {
+    $metrics: {
+      prometheus: vi.fn(async () => '# TYPE prisma_pool_connections_open gauge\nprisma_pool_connections_open 2\n'),
+    },
+  },
+}));
+
+function sample(body: string, name: string, labels: string): number {
+  const line = body.split('\n').find((l) => l.startsWith(`${name}{${labels}}`));
+  return line ? Number(line.split(' ').pop()) : 0;
+}
+
+describe('GET /metrics', () => {
+  it('labels request durations with the route pattern', async () => {
+    await request(app).get('/api/health').expect(200);
+    await request(app).get('/api/health').expect(200);
+
+    const res = await request(app).get('/metrics').expect(200);
+
+    expect(res.headers['content-type']).toMatch(/^text\/plain/);
+    const labels = 'method="GET",route="/api/health",status="200"';
+    expect(sample(res.text, 'http_request_duration_seconds_count', labels)).toBe(2);
+  });
+
+  it('groups unknown paths under one label', async () => {
+    await request(app).get('/no/such/path/1').expect(404);
+    await request(app).get('/no/such/path/2').expect(404);
+
+    const res = await request(app).get('/metrics').expect(200);
+
+    const labels = 'method="GET",route="unmatched",status="404"';
+    expect(sample(res.text, 'http_request_duration_seconds_count', labels)).toBe(2);
+    expect(res.text).not.toContain('/no/such/path');
+  });
+
+  it('reports in-flight requests and Prisma pool metrics', async () => {
+    const res = await request(app).get('/metrics').expect(200);
+
+    // The scrape itself is the only request in flight while metrics are rendered.
+    expect(sample(res.text, 'http_requests_in_flight', 'method="GET"')).toBe(1);
+    expect(res.text).toContain('prisma_pool_connections_open 2');
+  });
+});
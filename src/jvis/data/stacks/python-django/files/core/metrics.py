@@ -0,0 +1,125 @@
+"""Prometheus metrics (generated with --metrics), served on ``/metrics``.
+
+- ``http_request_duration_seconds`` — latency histogram per method, URL pattern and status
+- ``http_requests_in_flight`` — requests currently being handled
+- ``db_queries_total`` / ``db_queries_per_request`` — SQL statements executed
+- ``db_pool_*`` — connection pool statistics, for databases configured with
+  ``OPTIONS: {"pool": ...}`` (PostgreSQL with psycopg, Django 5.1+)
+
+Routes are labelled with their URL pattern (``/api/health/``), never the raw path, so
+label cardinality stays bounded; unresolved requests share the ``unmatched`` label.
+Under gunicorn with ``PROMETHEUS_MULTIPROC_DIR`` set, a scrape aggregates every worker.
+"""
+
+import os
+import time
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack
+from typing import Any
+
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.multiprocess import MultiProcessCollector
+from prometheus_client.registry import Collector
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency in seconds.",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being handled.",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+DB_QUERIES = Counter("db_queries_total", "SQL statements executed.")
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "SQL statements executed per HTTP request.",
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100),
+)
+
+
+class MetricsMiddleware:
+    """Times each request, tracks in-flight requests and counts the SQL it runs.
+
+    Listed first in ``MIDDLEWARE`` so the timing covers every other middleware.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        method = request.method or ""
+        queries = 0
+
+        def count_query(execute: Callable[..., Any], *args: Any) -> Any:
+            nonlocal queries
+            queries += 1
+            return execute(*args)
+
+        in_flight = IN_FLIGHT.labels(method)
+        in_flight.inc()
+        start = time.perf_counter()
+        status = 500
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(count_query))
+                response = self.get_response(request)
+            status = response.status_code
+            return response
+        finally:
+            in_flight.dec()
+            match = request.resolver_match
+            route = f"/{match.route}" if match else "unmatched"
+            REQUEST_DURATION.labels(method, route, str(status)).observe(time.perf_counter() - start)
+            DB_QUERIES.inc(queries)
+            DB_QUERIES_PER_REQUEST.observe(queries)
+
+
+class PoolCollector(Collector):
+    """Reads connection pool statistics at scrape time (psycopg pools only)."""
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        families = {
+            "pool_size": GaugeMetricFamily("db_pool_size", "Connections in the pool.", labels=["alias"]),
+            "pool_available": GaugeMetricFamily("db_pool_available", "Idle connections in the pool.", labels=["alias"]),
+            "requests_waiting": GaugeMetricFamily(
+                "db_pool_requests_waiting", "Requests waiting for a connection.", labels=["alias"]
+            ),
+        }
+        for connection in connections.all(initialized_only=True):
+            pool = getattr(connection, "pool", None)
+            if pool is None:
+                continue
+            stats = pool.get_stats()
+            for key, family in families.items():
+                family.add_metric([connection.alias], stats.get(key, 0))
+        yield from (family for family in families.values() if family.samples)
+
+
+pool_collector = PoolCollector()
+REGISTRY.register(pool_collector)
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """Render all metrics in the Prometheus text format: GET /metrics."""
+    registry = REGISTRY
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+        registry.register(pool_collector)
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
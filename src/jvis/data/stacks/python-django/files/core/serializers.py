@@ -1,14 +0,0 @@
-"""Core serializers for Django REST Framework."""
-
-from rest_framework import serializers
-
-from core.models import Item
-
-
-class ItemSerializer(serializers.ModelSerializer):
-    """Serializer for the Item model."""
-
-    class Meta:
-        model = Item
-        fields = ["id", "name", "description", "created_at", "updated_at"]
-        read_only_fields = ["id", "created_at", "updated_at"]
@@ -0,0 +1,76 @@
+"""Scrape /metrics locally and check the request, in-flight and database metrics."""
+
+import pytest
+from django.db import connections
+from django.test import Client
+from prometheus_client.parser import text_string_to_metric_families
+
+
+@pytest.fixture
+def client() -> Client:
+    return Client()
+
+
+def _scrape(client: Client) -> dict[tuple[str, frozenset], float]:
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain")
+    return {
+        (sample.name, frozenset(sample.labels.items())): sample.value
+        for family in text_string_to_metric_families(response.content.decode())
+        for sample in family.samples
+    }
+
+
+def _value(samples: dict, name: str, **labels: str) -> float:
+    return samples.get((name, frozenset(labels.items())), 0.0)
+
+
+@pytest.mark.django_db
+class TestMetrics:
+    def test_request_duration_is_labelled_by_url_pattern(self, client: Client) -> None:
+        labels = {"method": "GET", "route": "/api/health/", "status": "200"}
+        before = _value(_scrape(client), "http_request_duration_seconds_count", **labels)
+
+        client.get("/api/health/")
+        client.get("/api/health/")
+
+        samples = _scrape(client)
+        assert _value(samples, "http_request_duration_seconds_count", **labels) == before + 2
+        assert _value(samples, "http_request_duration_seconds_bucket", le="+Inf", **labels) == before + 2
+
+    def test_unknown_paths_share_one_label(self, client: Client) -> None:
+        client.get("/no/such/path/1")
+        client.get("/no/such/path/2")
+
+        samples = _scrape(client)
+        labels = {"method": "GET", "route": "unmatched", "status": "404"}
+        assert _value(samples, "http_request_duration_seconds_count", **labels) >= 2
+        assert not any("/no/such/path" in str(labels) for _, labels in samples)
+
+    def test_nothing_in_flight_between_requests(self, client: Client) -> None:
+        client.get("/api/health/")
+        # The scrape itself is the only request in flight while metrics are rendered.
+        assert _value(_scrape(client), "http_requests_in_flight", method="GET") == 1.0
+
+    def test_database_queries_are_counted(self, client: Client) -> None:
+        before = _scrape(client)
+
+        client.post("/api/items/", {"name": "Counted"}, content_type="application/json")
+
+        samples = _scrape(client)
+        assert _value(samples, "db_queries_total") > _value(before, "db_queries_total")
+        assert _value(samples, "db_queries_per_request_count") > _value(before, "db_queries_per_request_count")
+
+    def test_pool_stats_are_read_at_scrape_time(self, client: Client, monkeypatch: pytest.MonkeyPatch) -> None:
+        class FakePool:
+            def get_stats(self) -> dict[str, int]:
+                return {"pool_size": 4, "pool_available": 3, "requests_waiting": 0}
+
+        connection = connections["default"]
+        connection.ensure_connection()
+        monkeypatch.setattr(connection, "pool", FakePool(), raising=False)
+
+        samples = _scrape(client)
+        assert _value(samples, "db_pool_size", alias="default") == 4
+        assert _value(samples, "db_pool_available", alias="default") == 3
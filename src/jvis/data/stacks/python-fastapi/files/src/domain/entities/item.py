@@ -12,6 +12,9 @@ from src.domain.entities.base import Base
 
 class Item(Base):
     __tablename__ = "items"
+    # Fetch server-generated columns (created_at/updated_at) in the INSERT/UPDATE itself
+    # via RETURNING instead of a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
@@ -0,0 +1,113 @@
+"""Prometheus metrics (generated with --metrics), served on ``/metrics``.
+
+- ``http_request_duration_seconds`` — latency histogram per method, route rule and status
+- ``http_requests_in_flight`` — requests currently being handled
+- ``db_queries_total`` — SQL statements executed
+- ``db_pool_*`` — connection pool size, checked-out and idle connections
+
+Routes are labelled with their URL rule (``/api/items/<item_id>``), never the raw
+path, so label cardinality stays bounded; unmatched requests share the ``unmatched``
+label. Under gunicorn with ``PROMETHEUS_MULTIPROC_DIR`` set, a scrape aggregates every
+worker.
+"""
+
+import os
+import time
+from collections.abc import Iterator
+
+from flask import Flask, Response, g, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.multiprocess import MultiProcessCollector
+from prometheus_client.registry import Collector
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.app import db
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency in seconds.",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being handled.",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+DB_QUERIES = Counter("db_queries_total", "SQL statements executed.")
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_query(*_: object) -> None:
+    DB_QUERIES.inc()
+
+
+class PoolCollector(Collector):
+    """Reads connection pool statistics from the app's engine at scrape time."""
+
+    def describe(self) -> list[GaugeMetricFamily]:
+        # Registration would otherwise call collect() outside an app context.
+        return []
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        pool = db.engine.pool  # scrapes run inside the /metrics request's app context
+        for name, documentation in (
+            ("size", "Configured connection pool size."),
+            ("checkedout", "Connections currently checked out of the pool."),
+            ("checkedin", "Idle connections held in the pool."),
+        ):
+            read = getattr(pool, name, None)  # not every pool class keeps statistics
+            if callable(read):
+                yield GaugeMetricFamily(f"db_pool_{name}", documentation, value=read())
+
+
+pool_collector = PoolCollector()
+REGISTRY.register(pool_collector)
+
+
+def init_metrics(app: Flask) -> None:
+    """Register the timing hooks and the ``/metrics`` endpoint on *app*."""
+
+    @app.before_request
+    def _start_timer() -> None:
+        g.metrics_start = time.perf_counter()
+        IN_FLIGHT.labels(request.method).inc()
+
+    @app.after_request
+    def _record_status(response: Response) -> Response:
+        g.metrics_status = response.status_code
+        return response
+
+    @app.teardown_request
+    def _record_duration(_: BaseException | None) -> None:
+        # Teardown also runs when a handler raises, so failed requests are counted
+        # (as 500) and the in-flight gauge never drifts.
+        if "metrics_start" not in g:
+            return
+        IN_FLIGHT.labels(request.method).dec()
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        status = str(g.get("metrics_status", 500))
+        REQUEST_DURATION.labels(request.method, route, status).observe(time.perf_counter() - g.metrics_start)
+
+    app.add_url_rule("/metrics", "metrics", _metrics)
+
+
+def _metrics() -> Response:
+    """Render all metrics in the Prometheus text format."""
+    registry = REGISTRY
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+        registry.register(pool_collector)
+    return Response(generate_latest(registry), mimetype=CONTENT_TYPE_LATEST)
@@ -0,0 +1,65 @@
+"""Scrape /metrics locally and check the request, in-flight and database metrics."""
+
+from prometheus_client.parser import text_string_to_metric_families
+from src.app import create_app
+from src.config import TestConfig
+
+
+def _scrape(client) -> dict[tuple[str, frozenset], float]:
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain")
+    return {
+        (sample.name, frozenset(sample.labels.items())): sample.value
+        for family in text_string_to_metric_families(response.get_data(as_text=True))
+        for sample in family.samples
+    }
+
+
+def _value(samples, name: str, **labels: str) -> float:
+    return samples.get((name, frozenset(labels.items())), 0.0)
+
+
+def test_request_duration_is_labelled_by_route_rule(client):
+    labels = {"method": "GET", "route": "/api/items/<item_id>", "status": "404"}
+    before = _value(_scrape(client), "http_request_duration_seconds_count", **labels)
+
+    client.get("/api/items/1")
+    client.get("/api/items/2")
+
+    samples = _scrape(client)
+    assert _value(samples, "http_request_duration_seconds_count", **labels) == before + 2
+    assert _value(samples, "http_request_duration_seconds_bucket", le="+Inf", **labels) == before + 2
+
+
+def test_unknown_paths_share_one_label(client):
+    client.get("/no/such/path/1")
+    client.get("/no/such/path/2")
+
+    samples = _scrape(client)
+    assert _value(samples, "http_request_duration_seconds_count", method="GET", route="unmatched", status="404") >= 2
+    assert not any("/no/such/path" in str(labels) for _, labels in samples)
+
+
+def test_nothing_in_flight_between_requests(client):
+    client.get("/api/health")
+    # The scrape itself is the only request in flight while metrics are rendered.
+    assert _value(_scrape(client), "http_requests_in_flight", method="GET") == 1.0
+
+
+def test_database_queries_are_counted(client):
+    before = _value(_scrape(client), "db_queries_total")
+
+    client.post("/api/items", json={"name": "Counted"})
+
+    assert _value(_scrape(client), "db_queries_total") > before
+
+
+def test_pool_stats_are_read_at_scrape_time(tmp_path):
+    # In-memory SQLite has no real pool; a database file gets a QueuePool like a server database.
+    class FileConfig(TestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'pool.db'}"
+
+    samples = _scrape(create_app(config_class=FileConfig).test_client())
+    assert _value(samples, "db_pool_size") == 5
+    assert _value(samples, "db_pool_checkedout") == 0
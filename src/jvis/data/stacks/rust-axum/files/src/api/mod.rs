@@ -1 +0,0 @@
-pub mod routes;
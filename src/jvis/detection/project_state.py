@@ -13,8 +13,16 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
+from jvis.utils.fs import count_marker
+
 logger = logging.getLogger(__name__)
 
+# Bytes of note files _has_context may read per docs/notes/ directory.
+_CONTEXT_SCAN_BUDGET = 1024 * 1024
+
+# (path, mtime_ns, size, markers needed) -> verdict, for repeated detection in one process.
+_marker_verdicts: dict[tuple[str, int, int, int], bool] = {}
+
 # Source-code indicators: file extensions for mainstream programming languages.
 # Used for a quick "does this directory have code?" check. Not exhaustive —
 # covers the languages JVIS generates stacks for plus common adjacent languages.
@@ -114,34 +122,66 @@ def _has_context(target: Path) -> bool:
     if not notes_dir.is_dir():
         return False
 
-    # Check for project-log with actual entries (not just the empty template).
-    # Template has exactly 2 "---" markers (YAML frontmatter delimiters).
-    # More than 2 means an agent has written session entries (each separated by "---").
-    project_log = notes_dir / "project-log.md"
-    if project_log.is_file():
-        try:
-            content = project_log.read_text()
-            if content.count("---") > 2:
+    # docs/notes/archive/index.json (written by `jvis notes compact`) records
+    # live + archived entry counts per note file; use it while the file's
+    # size/mtime still match, and stream the file otherwise.
+    from jvis.notes.compaction import indexed_entry_count, load_index
+
+    index = load_index(notes_dir)
+
+    # project-log.md: the template has exactly 2 "---" markers (one entry,
+    # "Project Initialized"); more means an agent has written session entries.
+    # from-<agent>.md: the template has 1 "---"; more means a handoff note.
+    # Hence "more than N entries" == "more than N + 1 markers".
+    checks = [(notes_dir / "project-log.md", 1)]
+    checks += [(f, 0) for f in sorted(notes_dir.glob("from-*"))]
+
+    budget = _CONTEXT_SCAN_BUDGET
+    for path, min_entries in checks:
+        if not path.is_file():
+            continue
+        count = indexed_entry_count(index, path) if index else None
+        if count is not None:
+            if count > min_entries:
                 return True
-        except (PermissionError, OSError) as exc:
-            logger.debug("Cannot read project log %s: %s", project_log, exc)
-
-    # Check for agent notes with content.
-    # Agent note files (from-dev.md, from-qa.md, etc.) have 1 "---" from
-    # their template header. More than 1 means an agent wrote a handoff note.
-    for f in notes_dir.iterdir():
-        if f.name.startswith("from-") and f.is_file():
-            try:
-                content = f.read_text()
-                if content.count("---") > 1:
-                    return True
-            except (PermissionError, OSError) as exc:
-                logger.debug("Cannot read agent note %s: %s", f, exc)
-                continue
+            continue
+        if budget <= 0:
+            logger.debug("Context scan budget exhausted in %s; skipping remaining notes", notes_dir)
+            break
+        found, used = _has_markers(path, min_entries + 2, budget)
+        budget -= used
+        if found:
+            return True
 
     return False
 
 
+def _has_markers(path: Path, needed: int, max_bytes: int) -> tuple[bool, int]:
+    """Return whether *path* holds at least *needed* ``---`` markers, and the bytes read.
+
+    Verdicts are cached by (path, mtime, size); a file larger than *max_bytes*
+    only counts the markers in its first *max_bytes*.
+    """
+    try:
+        st = path.stat()
+    except OSError as exc:
+        logger.debug("Cannot stat note %s: %s", path, exc)
+        return False, 0
+    key = (str(path), st.st_mtime_ns, st.st_size, needed)
+    cached = _marker_verdicts.get(key)
+    if cached is not None:
+        return cached, 0
+    try:
+        count, used = count_marker(path, b"---", stop_at=needed, max_bytes=max_bytes)
+    except OSError as exc:
+        logger.debug("Cannot read note %s: %s", path, exc)
+        return False, 0
+    verdict = count >= needed
+    if used < max_bytes or verdict:
+        _marker_verdicts[key] = verdict
+    return verdict, used
+
+
 def _has_source_code(target: Path) -> bool:
     """Return True if the directory contains source code."""
     # Check config files first (fast)
@@ -0,0 +1,148 @@
+"""Fleet updates — update every JVIS project under a workspace root.
+
+Projects are discovered by their ``.jvis/version`` file. The framework source
+is resolved and hashed once (:func:`jvis.scaffold.framework.snapshot_framework`);
+each project then only receives the files whose content differs, and the
+projects are processed concurrently by a thread pool.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from jvis.scaffold.framework import FrameworkSnapshot
+from jvis.utils import perf
+
+logger = logging.getLogger(__name__)
+
+# Directories never searched for projects (dependency caches, VCS metadata).
+_SKIP_DIRS = frozenset({".git", ".hg", ".svn", "node_modules", ".venv", "venv", "__pycache__", ".tox", "dist", "build"})
+
+
+@dataclass
+class ProjectUpdate:
+    """Outcome of updating one project."""
+
+    path: str
+    before: str
+    after: str
+    status: str  # updated | would-update | up-to-date | failed
+    files_changed: int = 0
+    elapsed_ms: float = 0.0
+    error: str = ""
+
+
+@dataclass
+class FleetReport:
+    root: str
+    source_version: str
+    framework_digest: str
+    dry_run: bool
+    projects: list[ProjectUpdate] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+    def counts(self) -> dict[str, int]:
+        result: dict[str, int] = {}
+        for project in self.projects:
+            result[project.status] = result.get(project.status, 0) + 1
+        return result
+
+
+def discover_projects(root: Path) -> list[Path]:
+    """Return JVIS projects (directories holding ``.jvis/version``) under *root*, sorted.
+
+    A project's own subdirectories are not searched further.
+    """
+    found: list[Path] = []
+    for dirpath, dirnames, _ in os.walk(root):
+        current = Path(dirpath)
+        if (current / ".jvis" / "version").is_file():
+            found.append(current)
+            dirnames.clear()
+            continue
+        dirnames[:] = sorted(d for d in dirnames if d not in _SKIP_DIRS and not d.startswith("."))
+    return sorted(found)
+
+
+def update_fleet(
+    root: Path,
+    projects: list[Path],
+    snapshot: FrameworkSnapshot,
+    source_version: str,
+    *,
+    jobs: int,
+    dry_run: bool = False,
+    platforms: tuple[str, ...] | None = None,
+) -> FleetReport:
+    """Update *projects* to *snapshot* with a pool of *jobs* workers.
+
+    Each project keeps its own platform selection unless *platforms*
+    overrides it. Failures are recorded per project and never abort the run.
+    """
+    from jvis.version_tracking import detect_source_mode
+
+    source = detect_source_mode()
+    started = time.perf_counter()
+
+    def work(project: Path) -> ProjectUpdate:
+        return _update_one(root, project, snapshot, source_version, source, dry_run, platforms)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs), thread_name_prefix="jvis-fleet") as pool:
+        results = list(pool.map(perf.bind(work), projects))
+
+    return FleetReport(
+        root=str(root),
+        source_version=source_version,
+        framework_digest=snapshot.digest,
+        dry_run=dry_run,
+        projects=results,
+        elapsed_ms=(time.perf_counter() - started) * 1000,
+    )
+
+
+def _update_one(
+    root: Path,
+    project: Path,
+    snapshot: FrameworkSnapshot,
+    source_version: str,
+    source: str,
+    dry_run: bool,
+    platforms: tuple[str, ...] | None,
+) -> ProjectUpdate:
+    from jvis.detection.project_state import get_jvis_version
+    from jvis.scaffold.framework import resolve_platforms, sync_framework
+    from jvis.version_tracking import read_provenance, stamp_version
+
+    started = time.perf_counter()
+    rel = project.relative_to(root).as_posix() if project != root else "."
+    provenance = read_provenance(project)
+    before = provenance.get("jvis_installed_version") or get_jvis_version(project)
+    recorded_hash = provenance.get("jvis_framework_hash")
+    result = ProjectUpdate(path=rel, before=before, after=before, status="up-to-date")
+    try:
+        selected = resolve_platforms(project, platforms)
+        expected_hash = snapshot.select(selected).digest
+        # Same version but a different framework hash means drift (e.g. a dev
+        # checkout moved on, or the platform selection changed).
+        drifted = bool(recorded_hash or platforms is not None) and recorded_hash != expected_hash
+        if before != source_version or drifted:
+            with perf.span(f"update[{rel}]"):
+                sync = sync_framework(project, snapshot, platforms=selected, dry_run=dry_run)
+                result.files_changed = len(sync.copied)
+                if dry_run:
+                    result.status = "would-update"
+                else:
+                    stamp_version(project, source_version, source, sync.digest)
+                    result.status = "updated"
+                    result.after = source_version
+    except Exception as exc:  # one broken project must not stop the fleet
+        logger.debug("Update failed for %s", project, exc_info=True)
+        result.status = "failed"
+        result.error = str(exc) or type(exc).__name__
+    result.elapsed_ms = (time.perf_counter() - started) * 1000
+    return result
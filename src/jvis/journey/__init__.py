@@ -0,0 +1 @@
+"""Journey tracking — evaluate ``.jvis/journey/phases.yaml`` checkpoints against project artifacts."""
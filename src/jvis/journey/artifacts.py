@@ -0,0 +1,183 @@
+"""Artifact index — a persisted, incrementally refreshed listing of a project's docs/ tree.
+
+The index records every file under the indexed roots with its mtime and
+size, plus each directory's mtime and child names. A refresh re-lists only
+directories whose mtime changed since the last scan (creating, deleting or
+renaming an entry bumps the parent directory's mtime); unchanged
+directories reuse their recorded children, which are re-stat'ed so files
+edited in place (which leaves the directory's mtime alone) are picked up.
+
+Directories modified within a second of the previous scan are always
+re-listed, so changes made in the same timestamp tick as a scan are not
+missed (the same "racy timestamp" rule git applies to its index).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import stat
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from jvis.utils.fs import write_file_atomic
+
+logger = logging.getLogger(__name__)
+
+INDEX_PATH = Path(".jvis") / "cache" / "artifact-index.json"
+_INDEX_VERSION = 1
+_RACY_WINDOW_NS = 1_000_000_000
+
+
+@dataclass
+class ScanStats:
+    """What a refresh did: directories re-listed vs reused from the index."""
+
+    dirs_scanned: int = 0
+    dirs_reused: int = 0
+    files: int = 0
+    elapsed: float = 0.0
+
+
+@dataclass
+class ArtifactIndex:
+    """File listing for ``roots`` (project-relative) keyed by POSIX relative path."""
+
+    project: Path
+    roots: tuple[str, ...] = ("docs",)
+    files: dict[str, tuple[int, int]] = field(default_factory=dict)  # path -> (mtime_ns, size)
+    dirs: dict[str, dict[str, Any]] = field(default_factory=dict)  # path -> {mtime, files, subdirs}
+    scanned_at: int = 0  # wall-clock ns at the start of the last refresh
+    extra: dict[str, Any] = field(default_factory=dict)  # cached derived data (e.g. parsed phases)
+
+    @classmethod
+    def load(cls, project: Path, roots: tuple[str, ...] = ("docs",)) -> ArtifactIndex:
+        """Load the saved index for *project*, or return an empty one if missing/stale/corrupt."""
+        index = cls(project=project, roots=roots)
+        path = project / INDEX_PATH
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return index
+        if raw.get("version") != _INDEX_VERSION or tuple(raw.get("roots", ())) != roots:
+            return index
+        index.files = {k: (v[0], v[1]) for k, v in raw.get("files", {}).items()}
+        index.dirs = raw.get("dirs", {})
+        index.scanned_at = raw.get("scanned_at", 0)
+        index.extra = raw.get("extra", {})
+        return index
+
+    def save(self) -> None:
+        """Write the index atomically. Skipped when the project has no ``.jvis/`` directory."""
+        if not (self.project / ".jvis").is_dir():
+            return
+        path = self.project / INDEX_PATH
+        payload = {
+            "version": _INDEX_VERSION,
+            "roots": list(self.roots),
+            "scanned_at": self.scanned_at,
+            "files": {k: list(v) for k, v in self.files.items()},
+            "dirs": self.dirs,
+            "extra": self.extra,
+        }
+        try:
+            write_file_atomic(path, json.dumps(payload, separators=(",", ":")))
+        except OSError as exc:
+            logger.debug("Cannot write artifact index %s: %s", path, exc)
+
+    def refresh(self) -> ScanStats:
+        """Bring the index up to date with the filesystem, re-listing only changed directories.
+
+        Files in reused directories are still stat'ed (one ``stat`` each, no listing).
+        """
+        started = time.perf_counter()
+        stats = ScanStats()
+        reuse_before = self.scanned_at - _RACY_WINDOW_NS
+        self.scanned_at = time.time_ns()
+        files: dict[str, tuple[int, int]] = {}
+        dirs: dict[str, dict[str, Any]] = {}
+        for root in self.roots:
+            self._walk(root, reuse_before, files, dirs, stats)
+        self.files, self.dirs = files, dirs
+        stats.files = len(files)
+        stats.elapsed = time.perf_counter() - started
+        return stats
+
+    def _walk(
+        self,
+        rel: str,
+        reuse_before: int,
+        files: dict[str, tuple[int, int]],
+        dirs: dict[str, dict[str, Any]],
+        stats: ScanStats,
+    ) -> None:
+        try:
+            st = os.stat(self.project / rel)
+        except OSError:
+            return
+        if not stat.S_ISDIR(st.st_mode):
+            return
+
+        cached = self.dirs.get(rel)
+        if cached is not None and cached["mtime"] == st.st_mtime_ns and st.st_mtime_ns < reuse_before:
+            stats.dirs_reused += 1
+            for name in cached["files"]:
+                key = f"{rel}/{name}"
+                try:
+                    file_stat = os.stat(self.project / key)
+                except OSError:
+                    continue
+                files[key] = (file_stat.st_mtime_ns, file_stat.st_size)
+            dirs[rel] = cached
+            subdirs: list[str] = cached["subdirs"]
+        else:
+            stats.dirs_scanned += 1
+            names: list[str] = []
+            subdirs = []
+            try:
+                with os.scandir(self.project / rel) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.name)
+                            elif entry.is_file():
+                                entry_stat = entry.stat()
+                                files[f"{rel}/{entry.name}"] = (entry_stat.st_mtime_ns, entry_stat.st_size)
+                                names.append(entry.name)
+                        except OSError:
+                            continue
+            except OSError as exc:
+                logger.debug("Cannot list %s: %s", rel, exc)
+            dirs[rel] = {"mtime": st.st_mtime_ns, "files": sorted(names), "subdirs": sorted(subdirs)}
+
+        for name in subdirs:
+            self._walk(f"{rel}/{name}", reuse_before, files, dirs, stats)
+
+    # -- queries -------------------------------------------------------------
+
+    def covers(self, rel: str) -> bool:
+        """Return True if *rel* lies under one of the indexed roots."""
+        rel = rel.rstrip("/")
+        return any(rel == root or rel.startswith(f"{root}/") for root in self.roots)
+
+    def file(self, rel: str) -> tuple[int, int] | None:
+        """Return ``(mtime_ns, size)`` for an indexed file, or None."""
+        return self.files.get(rel)
+
+    def is_dir(self, rel: str) -> bool:
+        """Return True if *rel* is an indexed directory."""
+        return rel.rstrip("/") in self.dirs
+
+    def files_under(self, rel_dir: str) -> list[str]:
+        """Return indexed file paths below *rel_dir* (recursively), sorted."""
+        rel_dir = rel_dir.rstrip("/")
+        entry = self.dirs.get(rel_dir)
+        if entry is None:
+            return []
+        found = [f"{rel_dir}/{name}" for name in entry["files"]]
+        for name in entry["subdirs"]:
+            found.extend(self.files_under(f"{rel_dir}/{name}"))
+        return sorted(found)
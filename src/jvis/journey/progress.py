@@ -0,0 +1,297 @@
+"""Journey progress — evaluate every phase checkpoint in one pass over the artifact index.
+
+A checkpoint's ``artifacts`` are project-relative paths (``docs/prd.md``),
+directories (``docs/stories/``, satisfied by at least one file inside) or
+alternatives (``package.json or requirements.txt``). Entries that are not
+paths (``deployment logs``) are descriptive and not checked. Paths under
+``docs/`` are answered from the index; anything else is a direct stat.
+
+Status per checkpoint:
+  - ``completed``   — every checked artifact is present (or marked completed in journey-state.yaml)
+  - ``in_progress`` — some artifacts are present
+  - ``manual``      — nothing to check on disk; needs to be marked in journey-state.yaml
+  - ``skipped``     — marked skipped in journey-state.yaml
+  - ``not_started`` — no artifacts present
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from jvis.journey.artifacts import ArtifactIndex, ScanStats
+
+logger = logging.getLogger(__name__)
+
+PHASES_FILE = Path(".jvis") / "journey" / "phases.yaml"
+STATE_FILE = Path("docs") / "journey" / "journey-state.yaml"
+
+_DONE = ("completed", "skipped")
+
+
+@dataclass
+class ArtifactStatus:
+    """One artifact spec and the files found for it."""
+
+    spec: str
+    present: bool
+    files: list[str] = field(default_factory=list)
+    size: int = 0
+    mtime_ns: int = 0
+
+
+@dataclass
+class CheckpointStatus:
+    id: str
+    name: str
+    status: str
+    artifacts: list[ArtifactStatus] = field(default_factory=list)
+    agent: str = ""
+    command: str = ""
+    manual: bool = False
+    gate_blocker: bool = False
+
+
+@dataclass
+class GateStatus:
+    name: str
+    ready: bool
+    requirements: list[dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class PhaseStatus:
+    id: str
+    name: str
+    order: int
+    icon: str
+    status: str
+    checkpoints: list[CheckpointStatus] = field(default_factory=list)
+    gate: GateStatus | None = None
+
+    @property
+    def completed(self) -> int:
+        return sum(1 for cp in self.checkpoints if cp.status in _DONE)
+
+
+@dataclass
+class JourneyStatus:
+    current_phase: str
+    phases: list[PhaseStatus]
+    next_checkpoints: list[CheckpointStatus]
+    scan: ScanStats
+    status_icons: dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable view (phase ``completed``/``total`` counts included)."""
+        data = asdict(self)
+        for phase, raw in zip(self.phases, data["phases"], strict=True):
+            raw["completed"] = phase.completed
+            raw["total"] = len(phase.checkpoints)
+        data["next_checkpoints"] = [cp.id for cp in self.next_checkpoints]
+        data.pop("status_icons")
+        return data
+
+
+def journey_status(project: Path, rebuild: bool = False) -> JourneyStatus:
+    """Refresh the artifact index for *project*, evaluate all checkpoints and save the index.
+
+    Raises ``FileNotFoundError`` when no phases.yaml can be found.
+    """
+    index = ArtifactIndex(project) if rebuild else ArtifactIndex.load(project)
+    scan = index.refresh()
+    phases = _load_phases(project, index)
+    state = _load_state(project)
+    result = evaluate(project, phases, index, state, scan)
+    index.save()
+    return result
+
+
+def evaluate(
+    project: Path,
+    phases_doc: dict[str, Any],
+    index: ArtifactIndex,
+    state: dict[str, Any],
+    scan: ScanStats | None = None,
+) -> JourneyStatus:
+    """Evaluate every checkpoint of *phases_doc* against *index* and the journey *state*."""
+    state_phases = state.get("phases") or {}
+    phases: list[PhaseStatus] = []
+    for phase_id, phase in sorted((phases_doc.get("phases") or {}).items(), key=lambda kv: kv[1].get("order", 0)):
+        phase_state = (state_phases.get(phase_id) or {}).get("checkpoints") or {}
+        checkpoints = [
+            _evaluate_checkpoint(project, index, cp_id, cp, phase_state.get(cp_id) or {})
+            for cp_id, cp in (phase.get("checkpoints") or {}).items()
+        ]
+        phases.append(
+            PhaseStatus(
+                id=phase_id,
+                name=phase.get("name", phase_id),
+                order=phase.get("order", 0),
+                icon=phase.get("icon", ""),
+                status=_phase_status(checkpoints),
+                checkpoints=checkpoints,
+                gate=_evaluate_gate(phase.get("gate"), checkpoints),
+            )
+        )
+
+    current = next((p for p in phases if p.status != "completed"), phases[-1] if phases else None)
+    pending = [cp for cp in current.checkpoints if cp.status not in _DONE] if current else []
+    icons = (phases_doc.get("meta") or {}).get("status_icons") or {}
+    return JourneyStatus(
+        current_phase=current.id if current else "",
+        phases=phases,
+        next_checkpoints=pending[:3],
+        scan=scan or ScanStats(),
+        status_icons=icons,
+    )
+
+
+def _evaluate_checkpoint(
+    project: Path,
+    index: ArtifactIndex,
+    cp_id: str,
+    cp: dict[str, Any],
+    cp_state: dict[str, Any],
+) -> CheckpointStatus:
+    artifacts = [art for spec in cp.get("artifacts") or [] if (art := _check_artifact(project, index, spec))]
+    present = sum(1 for a in artifacts if a.present)
+
+    marked = cp_state.get("status")
+    if marked in _DONE:
+        status = marked
+    elif artifacts and present == len(artifacts):
+        status = "completed"
+    elif present:
+        status = "in_progress"
+    elif not artifacts and cp.get("manual"):
+        status = "manual"
+    else:
+        status = "not_started"
+
+    return CheckpointStatus(
+        id=cp_id,
+        name=cp.get("name", cp_id),
+        status=status,
+        artifacts=artifacts,
+        agent=cp.get("agent", ""),
+        command=cp.get("command", ""),
+        manual=bool(cp.get("manual", False)),
+        gate_blocker=bool(cp.get("gate_blocker", False)),
+    )
+
+
+def _check_artifact(project: Path, index: ArtifactIndex, spec: str) -> ArtifactStatus | None:
+    """Resolve one artifact spec; None for descriptive (non-path) entries."""
+    alternatives = [part.strip() for part in spec.split(" or ")]
+    if not all("/" in alt or "." in alt for alt in alternatives):
+        return None
+    for alt in alternatives:
+        if alt.endswith("/"):
+            files = index.files_under(alt) if index.covers(alt) else _files_on_disk(project, alt)
+        else:
+            files = [alt] if _file_stat(project, index, alt) else []
+        if files:
+            stats = [s for f in files if (s := _file_stat(project, index, f))]
+            return ArtifactStatus(
+                spec=spec,
+                present=True,
+                files=files,
+                size=sum(size for _, size in stats),
+                mtime_ns=max((mtime for mtime, _ in stats), default=0),
+            )
+    return ArtifactStatus(spec=spec, present=False)
+
+
+def _file_stat(project: Path, index: ArtifactIndex, rel: str) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` for a non-empty file, from the index when it covers *rel*."""
+    if index.covers(rel):
+        found = index.file(rel)
+    else:
+        try:
+            st = os.stat(project / rel)
+        except OSError:
+            return None
+        found = (st.st_mtime_ns, st.st_size) if os.path.isfile(project / rel) else None
+    return found if found and found[1] > 0 else None
+
+
+def _files_on_disk(project: Path, rel_dir: str, limit: int = 50) -> list[str]:
+    """Return up to *limit* project-relative file paths under a non-indexed directory."""
+    found: list[str] = []
+    for root, dirnames, filenames in os.walk(project / rel_dir):
+        dirnames.sort()
+        for name in sorted(filenames):
+            found.append(Path(root, name).relative_to(project).as_posix())
+            if len(found) >= limit:
+                return found
+    return found
+
+
+def _phase_status(checkpoints: list[CheckpointStatus]) -> str:
+    if checkpoints and all(cp.status in _DONE for cp in checkpoints):
+        return "completed"
+    if any(cp.status in ("completed", "in_progress") for cp in checkpoints):
+        return "in_progress"
+    return "not_started"
+
+
+def _evaluate_gate(gate: dict[str, Any] | None, checkpoints: list[CheckpointStatus]) -> GateStatus | None:
+    if not gate:
+        return None
+    by_id = {cp.id: cp for cp in checkpoints}
+    requirements = []
+    for req in gate.get("requirements") or []:
+        cp = by_id.get(req.get("checkpoint", ""))
+        requirements.append(
+            {
+                "checkpoint": req.get("checkpoint", ""),
+                "condition": req.get("condition", "complete"),
+                "met": bool(cp and cp.status in _DONE),
+            }
+        )
+    return GateStatus(
+        name=gate.get("name", ""),
+        ready=bool(requirements) and all(r["met"] for r in requirements),
+        requirements=requirements,
+    )
+
+
+def _load_phases(project: Path, index: ArtifactIndex) -> dict[str, Any]:
+    """Load phases.yaml (project copy first, then the framework's), cached in the index by mtime/size."""
+    from jvis.utils.paths import get_jvis_home
+
+    for path in (project / PHASES_FILE, get_jvis_home() / PHASES_FILE):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        key = [str(path), st.st_mtime_ns, st.st_size]
+        cached = index.extra.get("phases")
+        if cached and cached.get("key") == key:
+            data: dict[str, Any] = cached["data"]
+            return data
+        with open(path, encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+        index.extra["phases"] = {"key": key, "data": data}
+        return data
+    raise FileNotFoundError(f"Journey definition not found: {project / PHASES_FILE}")
+
+
+def _load_state(project: Path) -> dict[str, Any]:
+    """Load docs/journey/journey-state.yaml if present (manual completions, skips)."""
+    path = project / STATE_FILE
+    if not path.is_file():
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+    except (OSError, yaml.YAMLError) as exc:
+        logger.warning("Cannot read journey state %s: %s", path, exc)
+        return {}
+    return data if isinstance(data, dict) else {}
@@ -10,6 +10,10 @@ from __future__ import annotations
 
 import logging
 import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import TracebackType
 
 
 def setup_logging(*, verbose: bool = False) -> None:
@@ -30,3 +34,60 @@ def setup_logging(*, verbose: bool = False) -> None:
     # Avoid duplicate handlers on repeated calls (e.g., in tests)
     if not root.handlers:
         root.addHandler(handler)
+
+
+class ThreadLogCapture(logging.Filter):
+    """Hold back records logged on worker threads so they can be replayed in a fixed order.
+
+    While active, the capture filters every handler on the root and ``jvis``
+    loggers. Records emitted inside :meth:`capture` on a thread are appended
+    to that thread's list instead of being emitted; :func:`replay_records`
+    sends them through the normal handlers afterwards.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._local = threading.local()
+        self._handlers: list[logging.Handler] = []
+
+    def __enter__(self) -> ThreadLogCapture:
+        for name in (None, "jvis"):
+            for handler in logging.getLogger(name).handlers:
+                if handler not in self._handlers:
+                    handler.addFilter(self)
+                    self._handlers.append(handler)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        for handler in self._handlers:
+            handler.removeFilter(self)
+        self._handlers.clear()
+
+    @contextmanager
+    def capture(self, records: list[logging.LogRecord]) -> Iterator[None]:
+        """Divert records logged on the current thread into *records*."""
+        self._local.records = records
+        try:
+            yield
+        finally:
+            del self._local.records
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        records: list[logging.LogRecord] | None = getattr(self._local, "records", None)
+        if records is None:
+            return True
+        # The same record visits each handler in turn; keep one copy.
+        if not records or records[-1] is not record:
+            records.append(record)
+        return False
+
+
+def replay_records(records: list[logging.LogRecord]) -> None:
+    """Emit captured records through their loggers' handlers, in list order."""
+    for record in records:
+        logging.getLogger(record.name).handle(record)
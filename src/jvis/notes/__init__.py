@@ -0,0 +1 @@
+"""Agent notes — maintenance of ``docs/notes/`` (compaction, archive, summary index)."""
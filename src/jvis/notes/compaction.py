@@ -0,0 +1,220 @@
+"""Compact ``docs/notes/`` — move expired entries to compressed monthly archives.
+
+Note files (``project-log.md``, ``from-<agent>.md``) are a header followed by
+entries separated by ``---`` lines, each entry starting with a dated heading
+such as ``## [2026-01-31] - Title``. Their headers state a retention
+("Entries older than 7 days should be cleaned"); compaction honours it:
+
+  - entries older than the retention are appended to
+    ``docs/notes/archive/YYYY-MM.md.gz`` (one gzip member per run, so
+    appending never rewrites earlier data) and removed from the note file
+  - entries without a recognizable date are kept
+  - ``lessons-learned.md`` and every other file are never touched
+
+``docs/notes/archive/index.json`` summarizes the result: per note file its
+size/mtime and live + archived entry counts, per month the archived entry
+counts by source. ``detect_project_state`` reads the index instead of the
+note files when their size/mtime still match.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from jvis.utils.fs import mkdir_p, write_file_atomic
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIR = "archive"
+INDEX_FILE = "index.json"
+KEEP_FILES = frozenset({"lessons-learned.md"})
+
+_DEFAULT_RETENTION = {"project-log.md": 7}
+_DEFAULT_AGENT_RETENTION = 14
+_RETENTION_RE = re.compile(r"older than (\d+) days", re.IGNORECASE)
+_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+_SEPARATOR = "---"
+
+
+@dataclass
+class NoteFile:
+    """A parsed note file: header text and its entries (without separators)."""
+
+    header: str
+    entries: list[str] = field(default_factory=list)
+
+    def render(self) -> str:
+        parts = [self.header.rstrip() + "\n\n" + _SEPARATOR + "\n"]
+        parts.extend(f"\n{entry.strip()}\n\n{_SEPARATOR}\n" for entry in self.entries)
+        return "".join(parts)
+
+
+@dataclass
+class CompactionResult:
+    """What a compaction did, per note file and per archive month."""
+
+    archived: dict[str, int] = field(default_factory=dict)  # file -> entries archived this run
+    kept: dict[str, int] = field(default_factory=dict)  # file -> entries left in place
+    months: dict[str, int] = field(default_factory=dict)  # YYYY-MM -> entries archived this run
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+    @property
+    def total_archived(self) -> int:
+        return sum(self.archived.values())
+
+
+def is_compactable(path: Path) -> bool:
+    """Return True for note files that carry dated, expiring entries."""
+    return path.name not in KEEP_FILES and (path.name == "project-log.md" or path.name.startswith("from-"))
+
+
+def parse_notes(text: str) -> NoteFile:
+    """Split a note file into its header and ``---``-separated entries."""
+    chunks: list[list[str]] = [[]]
+    for line in text.splitlines():
+        if line.strip() == _SEPARATOR:
+            chunks.append([])
+        else:
+            chunks[-1].append(line)
+    header = "\n".join(chunks[0]).strip()
+    entries = [body for chunk in chunks[1:] if (body := "\n".join(chunk).strip())]
+    return NoteFile(header=header, entries=entries)
+
+
+def entry_date(entry: str) -> date | None:
+    """Return the date in the entry's first non-blank line, or None."""
+    first = next((line for line in entry.splitlines() if line.strip()), "")
+    match = _DATE_RE.search(first)
+    if not match:
+        return None
+    try:
+        return date(int(match[1]), int(match[2]), int(match[3]))
+    except ValueError:
+        return None
+
+
+def retention_days(name: str, header: str) -> int:
+    """Return the retention stated in *header*, else the default for file *name*."""
+    match = _RETENTION_RE.search(header)
+    if match:
+        return int(match[1])
+    return _DEFAULT_RETENTION.get(name, _DEFAULT_AGENT_RETENTION)
+
+
+def compact_notes(
+    notes_dir: Path,
+    *,
+    today: date | None = None,
+    days: int | None = None,
+    dry_run: bool = False,
+) -> CompactionResult:
+    """Archive expired entries of every compactable note file in *notes_dir*.
+
+    *days* overrides the per-file retention. With *dry_run* nothing is
+    written; the result reports what would be archived.
+    """
+    today = today or date.today()
+    index = load_index(notes_dir) or {}
+    files_index: dict[str, Any] = index.get("files", {})
+    months_index: dict[str, Any] = index.get("archives", {})
+    result = CompactionResult()
+    pending: dict[str, list[tuple[str, str]]] = {}  # month -> [(source, entry)]
+    rewrites: dict[Path, NoteFile] = {}
+
+    for path in sorted(notes_dir.glob("*.md")):
+        if not is_compactable(path):
+            continue
+        text = path.read_text(encoding="utf-8")
+        note = parse_notes(text)
+        cutoff = today - timedelta(days=days if days is not None else retention_days(path.name, note.header))
+        kept: list[str] = []
+        for entry in note.entries:
+            when = entry_date(entry)
+            if when is not None and when < cutoff:
+                pending.setdefault(f"{when:%Y-%m}", []).append((path.name, entry))
+                result.archived[path.name] = result.archived.get(path.name, 0) + 1
+            else:
+                kept.append(entry)
+        result.kept[path.name] = len(kept)
+        result.bytes_before += len(text.encode("utf-8"))
+        if len(kept) != len(note.entries):
+            note.entries = kept
+            rewrites[path] = note
+            result.bytes_after += len(note.render().encode("utf-8"))
+        else:
+            result.bytes_after += len(text.encode("utf-8"))
+
+    for month, items in pending.items():
+        result.months[month] = len(items)
+
+    if dry_run:
+        return result
+
+    # Archive first, then rewrite: an interruption can duplicate entries in the
+    # archive but never lose them.
+    archive_dir = notes_dir / ARCHIVE_DIR
+    for month, items in sorted(pending.items()):
+        mkdir_p(archive_dir)
+        body = "".join(f"<!-- source: {source} -->\n{entry.strip()}\n\n{_SEPARATOR}\n\n" for source, entry in items)
+        with gzip.open(archive_dir / f"{month}.md.gz", "ab") as f:
+            f.write(body.encode("utf-8"))
+        month_entry = months_index.setdefault(month, {"entries": 0, "sources": {}})
+        month_entry["entries"] += len(items)
+        for source, _ in items:
+            month_entry["sources"][source] = month_entry["sources"].get(source, 0) + 1
+
+    for path, note in rewrites.items():
+        write_file_atomic(path, note.render())
+
+    for name, live in result.kept.items():
+        st = (notes_dir / name).stat()
+        previous = files_index.get(name, {})
+        files_index[name] = {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "entries": live,
+            "archived": previous.get("archived", 0) + result.archived.get(name, 0),
+        }
+
+    if result.kept or months_index:
+        mkdir_p(archive_dir)
+        payload = {"updated": today.isoformat(), "files": files_index, "archives": dict(sorted(months_index.items()))}
+        write_file_atomic(archive_dir / INDEX_FILE, json.dumps(payload, indent=2) + "\n")
+    return result
+
+
+def load_index(notes_dir: Path) -> dict[str, Any] | None:
+    """Load ``archive/index.json`` for *notes_dir*, or None when missing or unreadable."""
+    try:
+        data = json.loads((notes_dir / ARCHIVE_DIR / INDEX_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def indexed_entry_count(index: dict[str, Any], path: Path) -> int | None:
+    """Return live + archived entries for *path* if the index entry is still current, else None."""
+    entry = (index.get("files") or {}).get(path.name)
+    if not entry:
+        return None
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    if entry.get("size") != st.st_size or entry.get("mtime_ns") != st.st_mtime_ns:
+        return None
+    return int(entry.get("entries", 0)) + int(entry.get("archived", 0))
+
+
+def read_archive(path: Path) -> str:
+    """Return the decompressed text of a monthly archive."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return f.read()
@@ -0,0 +1 @@
+"""Execution plans — evaluate ``docs/plans/active-plan.yaml`` (ADR-005) against QA gates and reports."""
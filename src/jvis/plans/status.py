@@ -0,0 +1,426 @@
+"""Plan status — progress, blockers and pending reviews of the active execution plan.
+
+Inputs (locations from the ``plans`` section of core-config.yaml):
+  - the active plan (``plans.activePlan``), in the ADR-005 format
+  - QA gate files under ``{qa.qaLocation}/gates/``
+  - step reports under ``plans.reportsLocation``
+
+A step's required reviewers are its ``gate`` (one reviewer or a list;
+``null`` for none) or, when the step has no ``gate`` key, the
+``plans.gateMatrix`` entry for its ``risk``. ``self-review`` needs no gate
+file. A gate file counts for a step when its ``step`` or ``story_ref``
+matches the step, or its ``gate_id`` starts with the step's number
+(``1.2-login`` for ``S1.2``); the newest file per reviewer wins.
+
+State per step:
+  - ``complete``  — done (or skipped) and every required gate passed
+  - ``in_review`` — done, with gates or a required report still missing
+  - ``rework``    — done or in progress, but a required gate says FAIL
+  - ``ready``     — pending and every dependency is done
+  - ``blocked``   — pending with unfinished dependencies, or marked blocked
+  - ``in_progress``
+
+Evaluation is meant to run on every agent turn: the parsed plan and each
+parsed gate file are cached in ``.jvis/cache/plan-status.json`` by mtime and
+size, so a run with nothing changed reads no file contents.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from jvis.utils.fs import write_file_atomic
+
+logger = logging.getLogger(__name__)
+
+CACHE_PATH = Path(".jvis") / "cache" / "plan-status.json"
+DEFAULT_GATE_MATRIX: dict[str, list[str]] = {
+    "critical": ["qa", "architect", "devsecops"],
+    "high": ["qa", "architect"],
+    "medium": ["qa"],
+    "low": ["self-review"],
+}
+SELF_REVIEW = "self-review"
+_CACHE_VERSION = 1
+_PASSING = ("PASS", "CONCERNS", "WAIVED")
+_REPORT_RISKS = ("medium", "high", "critical")  # ADR-005: reports are mandatory from medium risk up
+_GATE_FIELD_RE = re.compile(r'^(gate_id|story_ref|decision|reviewed_by|reviewer|step|created):[ \t]*"?([^"#\n]*)', re.M)
+_STEP_NUMBER_RE = re.compile(r"[A-Za-z]*(\d+(?:\.\d+)*)")
+_GATE_NUMBER_RE = re.compile(r"(\d+(?:\.\d+)*)(?:[-_.]|$)")
+_REVIEWER_WORDS = ("devsecops", "architect", "qa", "pm", "po", "sm")
+
+
+@dataclass
+class PlanSettings:
+    active_plan: str = "docs/plans/active-plan.yaml"
+    reports: str = "docs/plans/reports"
+    checkpoints: str = "docs/plans/checkpoints"
+    gates: str = "docs/qa/gates"
+    checkpoint_frequency: int = 5
+    gate_matrix: dict[str, list[str]] = field(default_factory=lambda: dict(DEFAULT_GATE_MATRIX))
+
+
+@dataclass
+class GateVerdict:
+    reviewer: str
+    decision: str  # PASS | CONCERNS | FAIL | WAIVED | PENDING
+    file: str
+
+
+@dataclass
+class StepStatus:
+    id: str
+    title: str
+    status: str  # as recorded in the plan
+    state: str  # see module docstring
+    agent: str = ""
+    risk: str = ""
+    type: str = "implementation"
+    reviewers: list[str] = field(default_factory=list)
+    gates: list[GateVerdict] = field(default_factory=list)
+    awaiting: list[str] = field(default_factory=list)  # reviewers whose gate is missing or pending
+    blocked_by: list[str] = field(default_factory=list)
+    report: str = ""
+    report_missing: bool = False
+
+
+@dataclass
+class CheckpointStatus:
+    id: str
+    title: str
+    status: str
+    state: str  # complete | ready | waiting
+    reviewers: list[str] = field(default_factory=list)
+    waiting_on: list[str] = field(default_factory=list)
+    report: str = ""
+
+
+@dataclass
+class PlanStatus:
+    plan: str
+    path: str
+    status: str
+    steps: list[StepStatus] = field(default_factory=list)
+    checkpoints: list[CheckpointStatus] = field(default_factory=list)
+    checkpoint_due: bool = False  # checkpointFrequency finished steps not covered by any checkpoint
+    files_read: int = 0  # plan and gate files parsed in this run (0 when fully cached)
+
+    @property
+    def done(self) -> int:
+        return sum(1 for s in self.steps if s.status in ("done", "skipped"))
+
+    @property
+    def next_step(self) -> StepStatus | None:
+        return next((s for s in self.steps if s.state == "ready"), None)
+
+    def awaiting_review(self) -> dict[str, list[str]]:
+        """Return ``{reviewer: [step ids]}`` for finished steps still waiting on a gate."""
+        result: dict[str, list[str]] = {}
+        for step in self.steps:
+            if step.state != "in_review":
+                continue
+            for reviewer in step.awaiting:
+                result.setdefault(reviewer, []).append(step.id)
+        return result
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["done"] = self.done
+        data["total"] = len(self.steps)
+        data["next_step"] = self.next_step.id if self.next_step else None
+        data["awaiting_review"] = self.awaiting_review()
+        return data
+
+
+def load_settings(project: Path) -> PlanSettings:
+    """Read plan locations and the gate matrix from core-config.yaml (defaults when absent)."""
+    try:
+        config = yaml.safe_load((project / ".jvis" / "core-config.yaml").read_text(encoding="utf-8"))
+    except (OSError, yaml.YAMLError):
+        config = None
+    config = config if isinstance(config, dict) else {}
+    raw_plans, raw_qa = config.get("plans"), config.get("qa")
+    plans: dict[str, Any] = raw_plans if isinstance(raw_plans, dict) else {}
+    qa: dict[str, Any] = raw_qa if isinstance(raw_qa, dict) else {}
+    settings = PlanSettings()
+    settings.active_plan = str(plans.get("activePlan") or settings.active_plan)
+    settings.reports = str(plans.get("reportsLocation") or settings.reports)
+    settings.checkpoints = str(plans.get("checkpointsLocation") or settings.checkpoints)
+    settings.gates = f"{qa.get('qaLocation') or 'docs/qa'}/gates"
+    if isinstance(plans.get("checkpointFrequency"), int):
+        settings.checkpoint_frequency = plans["checkpointFrequency"]
+    if isinstance(plans.get("gateMatrix"), dict):
+        settings.gate_matrix = {str(k): _as_list(v) for k, v in plans["gateMatrix"].items()}
+    return settings
+
+
+def plan_status(project: Path, *, use_cache: bool = True) -> PlanStatus:
+    """Evaluate the active plan of *project*.
+
+    Raises ``FileNotFoundError`` when there is no active plan and
+    ``ValueError`` when it is not a valid plan document.
+    """
+    settings = load_settings(project)
+    cache = _load_cache(project) if use_cache else {}
+    files_read = 0
+
+    plan_path = project / settings.active_plan
+    try:
+        st = plan_path.stat()
+    except OSError:
+        raise FileNotFoundError(f"No active plan: {settings.active_plan}") from None
+    key = [st.st_mtime_ns, st.st_size]
+    cached_plan = cache.get("plan") or {}
+    if cached_plan.get("path") == settings.active_plan and cached_plan.get("key") == key:
+        plan = cached_plan["data"]
+    else:
+        try:
+            plan = yaml.safe_load(plan_path.read_text(encoding="utf-8"))
+        except yaml.YAMLError as exc:
+            raise ValueError(f"{settings.active_plan} is not valid YAML: {exc}") from exc
+        if not isinstance(plan, dict) or not isinstance(plan.get("steps"), list):
+            raise ValueError(f"{settings.active_plan} has no 'steps' list.")
+        files_read += 1
+    gates, parsed = _scan_gates(project, settings.gates, cache.get("gates") or {})
+    files_read += parsed
+
+    if files_read or not use_cache or gates.keys() != (cache.get("gates") or {}).keys():
+        _save_cache(
+            project,
+            {
+                "version": _CACHE_VERSION,
+                "plan": {"path": settings.active_plan, "key": key, "data": plan},
+                "gates": gates,
+            },
+        )
+
+    result = evaluate(
+        plan,
+        [g for g in gates.values() if g["fields"]],
+        settings,
+        reports=_listing(project, settings.reports),
+        checkpoint_reports=_listing(project, settings.checkpoints),
+    )
+    result.path = settings.active_plan
+    result.files_read = files_read
+    return result
+
+
+def evaluate(
+    plan: dict[str, Any],
+    gate_files: list[dict[str, Any]],
+    settings: PlanSettings,
+    *,
+    reports: set[str] | None = None,
+    checkpoint_reports: set[str] | None = None,
+) -> PlanStatus:
+    """Evaluate *plan* against parsed *gate_files* and the file names in the report directories."""
+    reports = reports or set()
+    steps_raw = [s for s in plan.get("steps") or [] if isinstance(s, dict) and s.get("id")]
+    recorded = {str(s["id"]): str(s.get("status") or "pending") for s in steps_raw}
+    verdicts = _verdicts_by_step(steps_raw, gate_files)
+
+    steps: list[StepStatus] = []
+    for raw in steps_raw:
+        step_id = str(raw["id"])
+        status = recorded[step_id]
+        risk = str(raw.get("risk") or "")
+        reviewers = _as_list(raw["gate"]) if "gate" in raw else list(settings.gate_matrix.get(risk, []))
+        gates = [verdicts[step_id][r] for r in reviewers if r in verdicts.get(step_id, {})]
+        passed = {g.reviewer for g in gates if g.decision in _PASSING}
+        failed = any(g.decision == "FAIL" for g in gates)
+        awaiting = [r for r in reviewers if r != SELF_REVIEW and r not in passed]
+        report = str(raw.get("report") or "")
+        if not report and f"{step_id}-report.md" in reports:
+            report = f"{settings.reports}/{step_id}-report.md"
+        step_type = str(raw.get("type") or "implementation")
+        report_missing = status == "done" and risk in _REPORT_RISKS and step_type != "review" and not report
+        blocked_by = [d for d in _as_list(raw.get("depends_on")) if recorded.get(d) not in ("done", "skipped")]
+
+        if status == "skipped" or (status == "done" and not awaiting and not report_missing):
+            state = "complete"
+        elif failed and status in ("done", "in_progress"):
+            state = "rework"
+        elif status == "done":
+            state = "in_review"
+        elif status == "in_progress":
+            state = "in_progress"
+        elif status == "blocked" or blocked_by:
+            state = "blocked"
+        else:
+            state = "ready"
+
+        steps.append(
+            StepStatus(
+                id=step_id,
+                title=str(raw.get("title") or ""),
+                status=status,
+                state=state,
+                agent=str(raw.get("agent") or ""),
+                risk=risk,
+                type=step_type,
+                reviewers=reviewers,
+                gates=gates,
+                awaiting=awaiting if status == "done" else [],
+                blocked_by=blocked_by,
+                report=report,
+                report_missing=report_missing,
+            )
+        )
+
+    complete = {s.id for s in steps if s.state == "complete"}
+    checkpoints: list[CheckpointStatus] = []
+    covered: set[str] = set()
+    for raw in plan.get("checkpoints") or []:
+        if not isinstance(raw, dict) or not raw.get("id"):
+            continue
+        after = _as_list(raw.get("after_steps"))
+        covered.update(after)
+        status = str(raw.get("status") or "pending")
+        waiting = [s for s in after if s not in complete]
+        report = str(raw.get("report") or "")
+        if not report:
+            found = sorted(n for n in checkpoint_reports or () if n.startswith((f"{raw['id']}-", f"{raw['id']}.")))
+            report = f"{settings.checkpoints}/{found[0]}" if found else ""
+        checkpoints.append(
+            CheckpointStatus(
+                id=str(raw["id"]),
+                title=str(raw.get("title") or ""),
+                status=status,
+                state="complete" if status == "done" else ("waiting" if waiting else "ready"),
+                reviewers=_as_list(raw.get("reviewers")),
+                waiting_on=waiting,
+                report=report,
+            )
+        )
+
+    uncovered = [s for s in steps if s.type == "implementation" and s.status == "done" and s.id not in covered]
+    return PlanStatus(
+        plan=str(plan.get("plan") or ""),
+        path="",
+        status=str(plan.get("status") or ""),
+        steps=steps,
+        checkpoints=checkpoints,
+        checkpoint_due=settings.checkpoint_frequency > 0 and len(uncovered) >= settings.checkpoint_frequency,
+    )
+
+
+def parse_gate(text: str) -> dict[str, str]:
+    """Return the top-level metadata fields of a QA gate file (values unquoted)."""
+    fields: dict[str, str] = {}
+    for name, value in _GATE_FIELD_RE.findall(text):
+        fields.setdefault(name, value.strip())
+    return fields
+
+
+def _verdicts_by_step(
+    steps: list[dict[str, Any]], gate_files: list[dict[str, Any]]
+) -> dict[str, dict[str, GateVerdict]]:
+    """Map step id -> reviewer -> newest gate verdict."""
+    by_key: dict[str, str] = {}
+    for step in steps:
+        step_id = str(step["id"])
+        by_key.setdefault(f"step:{step_id}", step_id)
+        if step.get("story_ref"):
+            by_key.setdefault(f"story:{_normalize(str(step['story_ref']))}", step_id)
+        number = _STEP_NUMBER_RE.fullmatch(step_id)
+        if number:
+            by_key.setdefault(f"number:{number[1]}", step_id)
+
+    result: dict[str, dict[str, GateVerdict]] = {}
+    for gate in sorted(gate_files, key=lambda g: (g["fields"].get("created", ""), g["key"][0])):
+        fields = gate["fields"]
+        gate_id: str = fields.get("gate_id") or Path(gate["file"]).stem
+        number = _GATE_NUMBER_RE.match(gate_id)
+        candidates = [
+            f"step:{fields.get('step', '')}",
+            f"story:{_normalize(fields.get('story_ref', ''))}",
+            f"number:{number[1]}" if number else "",
+        ]
+        matched = next((by_key[c] for c in candidates if c in by_key), None)
+        if matched is None:
+            continue
+        reviewer = _reviewer(fields)
+        decision = (fields.get("decision") or "PENDING").upper()
+        result.setdefault(matched, {})[reviewer] = GateVerdict(reviewer=reviewer, decision=decision, file=gate["file"])
+    return result
+
+
+def _reviewer(fields: dict[str, str]) -> str:
+    explicit = fields.get("reviewer", "").strip().lower()
+    if explicit:
+        return explicit
+    words = re.findall(r"[a-z]+", fields.get("reviewed_by", "").lower())
+    return next((w for w in _REVIEWER_WORDS if w in words), "qa")
+
+
+def _scan_gates(project: Path, gates_dir: str, cached: dict[str, Any]) -> tuple[dict[str, Any], int]:
+    """Return ``{file: {key, file, fields}}`` for the gate files, parsing only changed ones."""
+    gates: dict[str, Any] = {}
+    parsed = 0
+    try:
+        entries = list(os.scandir(project / gates_dir))
+    except OSError:
+        return gates, 0
+    for entry in entries:
+        if not entry.name.endswith((".yml", ".yaml")) or not entry.is_file():
+            continue
+        rel = f"{gates_dir}/{entry.name}"
+        st = entry.stat()
+        key = [st.st_mtime_ns, st.st_size]
+        previous = cached.get(rel)
+        if previous and previous.get("key") == key:
+            gates[rel] = previous
+            continue
+        try:
+            with open(entry.path, encoding="utf-8", errors="replace") as f:
+                head = f.read(8192)  # metadata sits at the top; skip the report body
+        except OSError:
+            continue
+        gates[rel] = {"key": key, "file": rel, "fields": parse_gate(head)}
+        parsed += 1
+    return gates, parsed
+
+
+def _listing(project: Path, rel_dir: str) -> set[str]:
+    try:
+        return set(os.listdir(project / rel_dir))
+    except OSError:
+        return set()
+
+
+def _load_cache(project: Path) -> dict[str, Any]:
+    try:
+        data = json.loads((project / CACHE_PATH).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) and data.get("version") == _CACHE_VERSION else {}
+
+
+def _save_cache(project: Path, data: dict[str, Any]) -> None:
+    if not (project / ".jvis").is_dir():
+        return
+    try:
+        write_file_atomic(project / CACHE_PATH, json.dumps(data, separators=(",", ":"), default=str))
+    except OSError as exc:
+        logger.debug("Cannot write plan cache: %s", exc)
+
+
+def _as_list(value: Any) -> list[str]:
+    if value is None:
+        return []
+    if isinstance(value, list | tuple):
+        return [str(v) for v in value if v is not None]
+    return [str(value)]
+
+
+def _normalize(path: str) -> str:
+    return path.strip().removeprefix("./")
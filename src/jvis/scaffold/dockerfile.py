@@ -0,0 +1,256 @@
+"""Dockerfile generator — cache-friendly multi-stage builds from a stack manifest's ``docker:`` section.
+
+Layer ordering decides how long image rebuilds take: dependency manifests are
+copied and installed before the source tree, so editing application code only
+invalidates the layers after ``COPY . .``. Package-manager downloads live in
+BuildKit cache mounts instead of image layers, and the runtime stage starts from
+a slim image and runs as a non-root user.
+
+Generated stages:
+  - ``base``        — toolchain image, workdir, env, one-off setup
+  - ``deps``        — dependency manifests + install (cache-mounted)
+  - ``development`` — dev dependencies + source, used by docker-compose
+  - ``build``       — source + build command (only when the stack has one)
+  - ``prod-deps``   — production-only install (only when it differs from ``deps``)
+  - ``production``  — slim runtime, non-root user, artifacts only
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# BuildKit frontend version that supports RUN --mount=type=cache.
+_SYNTAX_DIRECTIVE = "# syntax=docker/dockerfile:1.7"
+
+
+@dataclass(frozen=True)
+class _PackageManager:
+    """Cache locations and default commands for one package manager."""
+
+    cache_dirs: tuple[str, ...]
+    install: str
+    env: tuple[tuple[str, str], ...] = ()
+    ignore: tuple[str, ...] = ()
+
+
+_PACKAGE_MANAGERS: dict[str, _PackageManager] = {
+    "pip": _PackageManager(
+        cache_dirs=("/root/.cache/pip",),
+        install="pip install -r requirements.txt",
+        env=(("PIP_DISABLE_PIP_VERSION_CHECK", "1"), ("PYTHONDONTWRITEBYTECODE", "1"), ("PYTHONUNBUFFERED", "1")),
+        ignore=("__pycache__/", "*.py[cod]", ".venv/", "venv/", ".pytest_cache/", ".mypy_cache/", ".ruff_cache/"),
+    ),
+    "npm": _PackageManager(
+        cache_dirs=("/root/.npm",),
+        install="npm install --no-audit --no-fund",
+        ignore=("node_modules/", "dist/", "build/", ".next/", ".nuxt/", ".output/", ".svelte-kit/", "coverage/"),
+    ),
+    "cargo": _PackageManager(
+        cache_dirs=("/usr/local/cargo/registry", "/usr/local/cargo/git"),
+        install="cargo fetch",
+        ignore=("target/",),
+    ),
+    "composer": _PackageManager(
+        cache_dirs=("/tmp/composer-cache",),
+        install="composer install --no-scripts --no-autoloader --prefer-dist",
+        env=(("COMPOSER_CACHE_DIR", "/tmp/composer-cache"),),
+        ignore=("vendor/", "var/", "storage/logs/", "storage/framework/cache/"),
+    ),
+}
+
+# Always excluded from the build context: VCS metadata, local env files, JVIS docs.
+_COMMON_IGNORE = (".git/", ".gitignore", ".env", ".env.*", "!.env.example", "Dockerfile", ".dockerignore", "docs/")
+
+
+@dataclass
+class DockerSpec:
+    """Per-stack Dockerfile parameters, parsed from the manifest ``docker:`` section."""
+
+    package_manager: str
+    base_image: str
+    command: list[str]
+    dev_command: list[str] = field(default_factory=list)
+    runtime_image: str = ""  # "" = same image as base_image, "base" = reuse the base stage
+    workdir: str = "/app"
+    port: int = 8000
+    dev_port: int = 0  # 0 = same as port
+    env: dict[str, str] = field(default_factory=dict)
+    setup: list[str] = field(default_factory=list)
+    dependency_files: list[str] = field(default_factory=list)
+    install: str = ""
+    dev_dependency_files: list[str] = field(default_factory=list)
+    install_dev: str = ""
+    dev_setup: list[str] = field(default_factory=list)
+    build: str = ""
+    install_production: str = ""
+    dependency_paths: list[str] = field(default_factory=list)
+    artifacts: list[str | dict[str, str]] = field(default_factory=list)
+    runtime_setup: list[str] = field(default_factory=list)
+    runtime_env: dict[str, str] = field(default_factory=dict)
+    production_setup: list[str] = field(default_factory=list)
+    user: str = "app"
+    create_user: bool = True
+    healthcheck: str = ""  # command for HEALTHCHECK in the production stage
+
+    @property
+    def manager(self) -> _PackageManager:
+        return _PACKAGE_MANAGERS[self.package_manager]
+
+
+def parse_docker_spec(raw: dict[str, Any]) -> DockerSpec:
+    """Build a ``DockerSpec`` from a manifest ``docker:`` mapping.
+
+    Raises ``ValueError`` for unknown package managers or missing required keys.
+    """
+    manager = raw.get("package_manager", "")
+    if manager not in _PACKAGE_MANAGERS:
+        raise ValueError(f"Unknown package manager {manager!r}. Supported: {', '.join(sorted(_PACKAGE_MANAGERS))}.")
+    for key in ("base_image", "command"):
+        if not raw.get(key):
+            raise ValueError(f"docker.{key} is required")
+
+    known = set(DockerSpec.__dataclass_fields__)
+    unknown = set(raw) - known
+    if unknown:
+        logger.warning("Ignoring unknown docker manifest keys: %s", ", ".join(sorted(unknown)))
+    return DockerSpec(**{k: v for k, v in raw.items() if k in known})
+
+
+def render_dockerfile(spec: DockerSpec) -> str:
+    """Render a multi-stage Dockerfile for *spec*."""
+    pm = spec.manager
+    install = spec.install or (pm.install if spec.dependency_files else "")
+    lines: list[str] = [
+        _SYNTAX_DIRECTIVE,
+        "# Generated by JVIS: dependency manifests are installed before the source is copied,",
+        "# so code changes only rebuild the layers after `COPY . .`. Requires BuildKit.",
+        "",
+    ]
+
+    # --- base -------------------------------------------------------------
+    lines.append(f"FROM {spec.base_image} AS base")
+    lines.append(f"WORKDIR {spec.workdir}")
+    lines.extend(_env_lines({**dict(pm.env), **spec.env}))
+    lines.extend(spec.setup)
+    lines.append("")
+
+    # --- deps -------------------------------------------------------------
+    lines.append("FROM base AS deps")
+    if spec.dependency_files:
+        lines.append(f"COPY {' '.join(spec.dependency_files)} ./")
+    if install:
+        lines.append(_cached_run(pm, install))
+    lines.append("")
+
+    # --- development ------------------------------------------------------
+    lines.append("FROM deps AS development")
+    if spec.dev_dependency_files:
+        lines.append(f"COPY {' '.join(spec.dev_dependency_files)} ./")
+    if spec.install_dev:
+        lines.append(_cached_run(pm, spec.install_dev))
+    lines.append("COPY . .")
+    lines.extend(f"RUN {cmd}" for cmd in spec.dev_setup)
+    lines.append(f"EXPOSE {spec.dev_port or spec.port}")
+    lines.append(f"CMD {json.dumps(spec.dev_command or spec.command)}")
+    lines.append("")
+
+    # --- build ------------------------------------------------------------
+    if spec.build:
+        lines.append("FROM deps AS build")
+        lines.append("COPY . .")
+        lines.append(_cached_run(pm, spec.build))
+        lines.append("")
+
+    # --- prod-deps ----------------------------------------------------------
+    if spec.install_production:
+        lines.append("FROM base AS prod-deps")
+        if spec.dependency_files:
+            lines.append(f"COPY {' '.join(spec.dependency_files)} ./")
+        lines.append(_cached_run(pm, spec.install_production))
+        lines.append("")
+
+    lines.extend(_production_stage(spec))
+    return "\n".join(lines) + "\n"
+
+
+def render_dockerignore(spec: DockerSpec) -> str:
+    """Render a ``.dockerignore`` that keeps the build context (and ``COPY . .``) small."""
+    entries = [*_COMMON_IGNORE, *spec.manager.ignore]
+    return "\n".join(entries) + "\n"
+
+
+def _production_stage(spec: DockerSpec) -> list[str]:
+    runtime = spec.runtime_image or spec.base_image
+    from_image = "base" if runtime == "base" else runtime
+    distro_image = spec.base_image if runtime == "base" else runtime
+    owner = f"--chown={spec.user}:{spec.user}"
+
+    lines = [f"FROM {from_image} AS production"]
+    if from_image != "base":
+        lines.append(f"WORKDIR {spec.workdir}")
+    lines.extend(spec.runtime_setup)
+    lines.extend(_env_lines(spec.runtime_env))
+    if spec.create_user:
+        lines.append(_create_user(spec.user, alpine="alpine" in distro_image))
+
+    # Dependencies come from prod-deps (production-only install) or deps, never from the
+    # source tree. Stacks with a build stage ship their dependencies as build artifacts.
+    dep_stage = "prod-deps" if spec.install_production else ("deps" if not spec.build else "")
+    if dep_stage:
+        for path in spec.dependency_paths:
+            src, dst = _resolve_copy(path, spec.workdir)
+            lines.append(f"COPY --from={dep_stage} {owner} {src} {dst}")
+
+    if spec.build and spec.artifacts:
+        for artifact in spec.artifacts:
+            src, dst = _resolve_copy(artifact, spec.workdir)
+            lines.append(f"COPY --from=build {owner} {src} {dst}")
+    else:
+        lines.append(f"COPY {owner} . .")
+
+    if spec.production_setup:
+        lines.append(f"RUN {' && '.join(spec.production_setup)}")
+    lines.append(f"USER {spec.user}")
+    lines.append(f"EXPOSE {spec.port}")
+    if spec.healthcheck:
+        lines.append(f"HEALTHCHECK --interval=30s --timeout=3s --start-period=10s --retries=3 CMD {spec.healthcheck}")
+    lines.append(f"CMD {json.dumps(spec.command)}")
+    return lines
+
+
+def _cached_run(pm: _PackageManager, command: str) -> str:
+    mounts = " ".join(f"--mount=type=cache,target={d}" for d in pm.cache_dirs)
+    return f"RUN {mounts} {command}"
+
+
+def _env_lines(env: dict[str, str]) -> list[str]:
+    return [f"ENV {key}={value}" for key, value in env.items()]
+
+
+def _create_user(user: str, *, alpine: bool) -> str:
+    if alpine:
+        return f"RUN addgroup -S {user} && adduser -S -H -G {user} {user}"
+    return f"RUN groupadd --system {user} && useradd --system --gid {user} --no-create-home {user}"
+
+
+def _resolve_copy(entry: str | dict[str, str], workdir: str) -> tuple[str, str]:
+    """Return (src, dst) for a dependency path or artifact entry.
+
+    Relative paths are resolved against the build stage's workdir and copied
+    to the same relative location in the runtime stage.
+    """
+    if isinstance(entry, dict):
+        src = entry["src"]
+        dst = entry.get("dst", src)
+    else:
+        src = dst = entry
+    if not src.startswith("/"):
+        src = f"{workdir}/{src}"
+    if not dst.startswith("/") and not dst.startswith("."):
+        dst = f"./{dst}"
+    return src, dst
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import logging
-import subprocess
 from datetime import date
 from pathlib import Path
 
 from jvis.utils.fs import mkdir_p, write_file
+from jvis.utils.git import current_branch, remote_url
 
 logger = logging.getLogger(__name__)
 
@@ -144,6 +144,7 @@ def create_context_map(
     main_branch = _detect_git_branch(project_path)
     remote = _detect_git_remote(project_path)
     directories = _detect_directories(project_path)
+    code_map = _code_map_summary(project_path)
     today = date.today().isoformat()
 
     content = _render_context_map(
@@ -155,6 +156,7 @@ def create_context_map(
         database=database,
         last_updated=today,
         directories=directories,
+        code_map=code_map,
     )
 
     dest = project_path / "docs" / "notes" / "context-map.md"
@@ -163,37 +165,13 @@ def create_context_map(
 
 
 def _detect_git_branch(project_path: Path) -> str:
-    """Return the current default branch name, or ``'main'`` as fallback."""
-    try:
-        result = subprocess.run(
-            ["git", "symbolic-ref", "--short", "HEAD"],
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()
-    except (FileNotFoundError, subprocess.TimeoutExpired, OSError) as exc:
-        logger.debug("Cannot detect git branch in %s: %s", project_path, exc)
-    return "main"
+    """Return the current branch name, or ``'main'`` as fallback."""
+    return current_branch(project_path) or "main"
 
 
 def _detect_git_remote(project_path: Path) -> str:
     """Return the origin remote URL, or ``'not configured'`` as fallback."""
-    try:
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()
-    except (FileNotFoundError, subprocess.TimeoutExpired, OSError) as exc:
-        logger.debug("Cannot detect git remote in %s: %s", project_path, exc)
-    return "not configured"
+    return remote_url(project_path, "origin") or "not configured"
 
 
 def _detect_directories(project_path: Path) -> list[str]:
@@ -208,6 +186,17 @@ def _detect_directories(project_path: Path) -> list[str]:
     return dirs
 
 
+def _code_map_summary(project_path: Path) -> str:
+    """Return the file/LOC line of ``docs/notes/code-map.md``, or ``''`` if there is none."""
+    from jvis.codemap import CODE_MAP_FILE
+
+    try:
+        text = (project_path / CODE_MAP_FILE).read_text(encoding="utf-8")
+    except OSError:
+        return ""
+    return next((line for line in text.splitlines() if line.startswith("**Files:**")), "")
+
+
 def _render_context_map(
     *,
     project_root: str,
@@ -218,6 +207,7 @@ def _render_context_map(
     database: str,
     last_updated: str,
     directories: list[str],
+    code_map: str = "",
 ) -> str:
     """Render YAML-front-matter + Markdown body for the context map."""
     lines: list[str] = [
@@ -248,5 +238,15 @@ def _render_context_map(
     else:
         lines.append("_No directories detected yet._")
 
+    if code_map:
+        lines += [
+            "",
+            "## Code Map",
+            "",
+            code_map,
+            "",
+            "Modules, classes and functions per file: `docs/notes/code-map.md` (refresh with `jvis codemap`).",
+        ]
+
     lines.append("")
     return "\n".join(lines)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
+from jvis.utils import perf
 from jvis.utils.naming import entity_replacements
 
 logger = logging.getLogger(__name__)
@@ -76,6 +77,7 @@ def _replace_content(path: Path, replacements: list[tuple[str, str]]) -> None:
 
     if new_text != text:
         path.write_text(new_text, encoding="utf-8")
+        perf.record_write(path)
 
 
 def _rename_path(path: Path, replacements: list[tuple[str, str]]) -> None:
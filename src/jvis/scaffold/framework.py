@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import dataclasses
+import hashlib
 import logging
+import os
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TypedDict
 
-from jvis.utils.fs import copy_file, copy_tree, mkdir_p, write_file
+from jvis.utils.fs import copy_file, copy_file_to_many, copy_tree, mkdir_p, write_file
 from jvis.utils.paths import get_data_dir, get_jvis_home, get_repo_root
 
 logger = logging.getLogger(__name__)
@@ -67,13 +73,27 @@ _PLATFORM_REPO_DIRS = {
 # Bug #3 and #4: skills/ and hooks/ were never copied to target projects
 _CLAUDE_EXTRA_DIRS = ("skills", "hooks")
 
+# Every supported platform, in install order. A project may select a subset
+# with ``platforms:`` in .jvis/core-config.yaml (or ``--platforms`` on the CLI).
+PLATFORMS: tuple[str, ...] = tuple(_PLATFORM_DIRS)
 
-def install_framework(project_dir: Path) -> None:
+# The top-level ``platforms`` key with its value: a flow value on the key's line,
+# or a block list on the following ``- item`` / indented lines.
+_PLATFORMS_LINE_RE = re.compile(r"^platforms:[^\n]*(?:\n(?:[ \t]*\n)*(?:[ \t]+\S|-)[^\n]*)*", re.MULTILINE)
+
+
+def install_framework(project_dir: Path, platforms: Iterable[str] | None = None) -> tuple[str, ...]:
     """Copy JVIS framework files from package data into *project_dir*.
 
+    *platforms* selects the AI assistants to install files for; by default
+    the project's ``platforms`` setting is kept, or every platform when it
+    has none. Returns the platforms installed.
+
     Raises ``RuntimeError`` when the critical ``.jvis/`` source directory
     cannot be found (callers in the CLI layer will surface this to the user).
     """
+    # Resolve before .jvis/core-config.yaml is replaced by the packaged copy.
+    selected = resolve_platforms(project_dir, platforms)
     data = get_data_dir()
     if not _copy_jvis_dir(data, project_dir):
         msg = (
@@ -81,9 +101,245 @@ def install_framework(project_dir: Path) -> None:
             "The package may be incomplete. Reinstall with: pip install --force-reinstall jvis"
         )
         raise RuntimeError(msg)
-    _copy_platform_files(data, project_dir)
-    _copy_claude_extras(data, project_dir)
-    _copy_claude_md(data, project_dir)
+    _copy_platform_files(data, project_dir, selected)
+    if "claude" in selected:
+        _copy_claude_extras(data, project_dir)
+        _copy_claude_md(data, project_dir)
+    save_platforms(project_dir, selected)
+    return selected
+
+
+# ---------------------------------------------------------------------------
+# Platform selection
+# ---------------------------------------------------------------------------
+
+
+def parse_platforms(value: str | Iterable[str]) -> tuple[str, ...]:
+    """Normalize a platform selection (``"claude,cursor"``, ``"all"`` or a list) to :data:`PLATFORMS` order.
+
+    Raises ``ValueError`` for unknown names or an empty selection.
+    """
+    items = value.split(",") if isinstance(value, str) else value
+    names = {str(item).strip().lower() for item in items} - {""}
+    if "all" in names:
+        return PLATFORMS
+    unknown = sorted(names - set(PLATFORMS))
+    if unknown:
+        raise ValueError(f"Unknown platform(s): {', '.join(unknown)}. Choose from: {', '.join(PLATFORMS)}, all.")
+    if not names:
+        raise ValueError("No platforms selected.")
+    return tuple(p for p in PLATFORMS if p in names)
+
+
+def read_platforms(project_dir: Path) -> tuple[str, ...] | None:
+    """Return the ``platforms`` setting of *project_dir*'s core-config.yaml, or None when unset."""
+    import yaml
+
+    try:
+        config = yaml.safe_load((project_dir / ".jvis" / "core-config.yaml").read_text())
+    except (OSError, yaml.YAMLError):
+        return None
+    value = config.get("platforms") if isinstance(config, dict) else None
+    if not value:
+        return None
+    try:
+        return parse_platforms(value)
+    except ValueError as exc:
+        logger.warning("Ignoring platforms setting in %s: %s", project_dir, exc)
+        return None
+
+
+def resolve_platforms(project_dir: Path, platforms: Iterable[str] | None = None) -> tuple[str, ...]:
+    """Return the explicit *platforms*, else the project's setting, else every platform."""
+    if platforms is not None:
+        return parse_platforms(platforms)
+    return read_platforms(project_dir) or PLATFORMS
+
+
+def save_platforms(project_dir: Path, platforms: tuple[str, ...]) -> None:
+    """Record *platforms* as the ``platforms`` setting in core-config.yaml.
+
+    Edits the text in place to keep comments; an existing setting is
+    replaced whole, block lists included. A selection of every platform
+    is only written when the setting already exists (the default needs no
+    entry).
+    """
+    config_path = project_dir / ".jvis" / "core-config.yaml"
+    if not config_path.is_file():
+        return
+    content = config_path.read_text()
+    line = f"platforms: [{', '.join(platforms)}]"
+    if _PLATFORMS_LINE_RE.search(content):
+        content = _PLATFORMS_LINE_RE.sub(line, content, count=1)
+    elif platforms != PLATFORMS:
+        content = content + ("" if content.endswith("\n") else "\n") + line + "\n"
+    else:
+        return
+    write_file(config_path, content)
+
+
+def _platform_paths(platform: str) -> tuple[str, ...]:
+    """Project-relative paths owned by *platform*."""
+    paths: tuple[str, ...] = (_PLATFORM_DIRS[platform]["commands_dir"],)
+    if platform == "claude":
+        paths += tuple(f".claude/{dirname}" for dirname in _CLAUDE_EXTRA_DIRS)
+    return paths
+
+
+# ---------------------------------------------------------------------------
+# Framework snapshot — hash the source once, sync many projects
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class FrameworkSnapshot:
+    """Every file ``install_framework`` copies, with its SHA-256, resolved once.
+
+    Built by :func:`snapshot_framework` and passed to :func:`sync_framework`
+    so that updating many projects resolves and hashes the packaged
+    framework a single time.
+    """
+
+    data: Path
+    files: tuple[tuple[str, Path, int, str], ...]  # (project-relative dest, source, size, sha256)
+    dirs: tuple[str, ...]  # project-relative directories install_framework always creates
+    platforms: tuple[str, ...] = PLATFORMS
+
+    @property
+    def digest(self) -> str:
+        """Combined hash of all destination paths and file hashes."""
+        h = hashlib.sha256()
+        for rel, _, _, sha in self.files:
+            h.update(f"{rel}\0{sha}\n".encode())
+        return h.hexdigest()
+
+    def select(self, platforms: Iterable[str]) -> FrameworkSnapshot:
+        """Return the snapshot restricted to *platforms*; files of other platforms are dropped."""
+        wanted = set(platforms)
+        selected = tuple(p for p in self.platforms if p in wanted)
+        if selected == self.platforms:
+            return self
+        excluded = tuple(path for p in self.platforms if p not in selected for path in _platform_paths(p))
+
+        def kept(rel: str) -> bool:
+            return not any(rel == path or rel.startswith(path + "/") for path in excluded)
+
+        return dataclasses.replace(
+            self,
+            files=tuple(entry for entry in self.files if kept(entry[0])),
+            dirs=tuple(d for d in self.dirs if kept(d)),
+            platforms=selected,
+        )
+
+
+@dataclass
+class SyncResult:
+    copied: list[str]
+    unchanged: int
+    digest: str = ""  # digest of the platform-selected snapshot that was synced
+
+
+def snapshot_framework() -> FrameworkSnapshot:
+    """Resolve the framework sources and hash every file once.
+
+    Raises ``RuntimeError`` when the ``.jvis/`` source cannot be found.
+    """
+    data = get_data_dir()
+    src_jvis = _resolve_jvis_source(data)
+    if src_jvis is None:
+        raise RuntimeError("JVIS framework source (.jvis/) not found.")
+
+    sources: dict[str, Path] = {}
+    dirs = [".jvis"]
+    for dirname in _JVIS_DIRS:
+        _add_tree(sources, src_jvis / dirname, f".jvis/{dirname}")
+    for filename in _JVIS_FILES:
+        if (src_jvis / filename).is_file():
+            sources[f".jvis/{filename}"] = src_jvis / filename
+    for commands_src, dests in _platform_fanout(data, PLATFORMS).items():
+        listing = _platform_sources(commands_src)  # one walk per source, shared by its platforms
+        for dst in dests:
+            dirs.append(dst)
+            sources.update((f"{dst}/{name}", src_file) for name, src_file in listing.items())
+    for dirname in _CLAUDE_EXTRA_DIRS:
+        src = data / dirname
+        if not src.is_dir():
+            src = get_repo_root() / ".claude" / dirname
+        _add_tree(sources, src, f".claude/{dirname}")
+
+    # Platforms often share one source tree: hash each source file once.
+    hashes: dict[Path, tuple[int, str]] = {}
+    for src in sources.values():
+        if src not in hashes:
+            hashes[src] = (src.stat().st_size, _sha256(src))
+    files = tuple((rel, src, *hashes[src]) for rel, src in sources.items())
+    logger.debug("Framework snapshot: %d files (%d sources) from %s", len(files), len(hashes), src_jvis)
+    return FrameworkSnapshot(data=data, files=files, dirs=tuple(dirs))
+
+
+def sync_framework(
+    project_dir: Path,
+    snapshot: FrameworkSnapshot,
+    *,
+    platforms: Iterable[str] | None = None,
+    dry_run: bool = False,
+) -> SyncResult:
+    """Bring *project_dir* in line with *snapshot*, copying only files whose content differs.
+
+    The end state matches :func:`install_framework` with the same
+    *platforms*: files are merged into the project (nothing is deleted) and
+    CLAUDE.md is only created when missing. With *dry_run*, reports what
+    would be copied without writing.
+    """
+    selected = resolve_platforms(project_dir, platforms)
+    snapshot = snapshot.select(selected)
+    copied: list[str] = []
+    unchanged = 0
+    pending: dict[Path, list[Path]] = {}  # source -> destinations
+    for rel, src, size, sha in snapshot.files:
+        dst = project_dir / rel
+        if _matches(dst, size, sha):
+            unchanged += 1
+            continue
+        copied.append(rel)
+        pending.setdefault(src, []).append(dst)
+    if not dry_run:
+        for src, dsts in pending.items():
+            copy_file_to_many(src, dsts)
+        for rel in snapshot.dirs:
+            mkdir_p(project_dir / rel)
+        if "claude" in selected:
+            _copy_claude_md(snapshot.data, project_dir)
+        save_platforms(project_dir, selected)
+    return SyncResult(copied=copied, unchanged=unchanged, digest=snapshot.digest)
+
+
+def _add_tree(sources: dict[str, Path], src: Path, rel: str) -> None:
+    if not src.is_dir():
+        return
+    for root, dirnames, filenames in os.walk(src):
+        dirnames.sort()
+        base = Path(root).relative_to(src).as_posix()
+        prefix = rel if base == "." else f"{rel}/{base}"
+        for name in sorted(filenames):
+            sources[f"{prefix}/{name}"] = Path(root, name)
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _matches(dst: Path, size: int, sha: str) -> bool:
+    try:
+        if dst.stat().st_size != size:
+            return False
+        return _sha256(dst) == sha
+    except OSError:
+        return False
 
 
 def _resolve_jvis_source(data: Path) -> Path | None:
@@ -171,38 +427,45 @@ def _resolve_platform_source(data: Path, platform: str) -> Path | None:
     return None
 
 
-def _copy_platform_files(data: Path, project_dir: Path) -> None:
-    """Copy platform-specific command/rule/steering files for all available platforms."""
-    for platform, cfg in _PLATFORM_DIRS.items():
-        _copy_platform_commands(data, project_dir, platform, cfg["commands_dir"])
+def _platform_fanout(data: Path, platforms: Iterable[str]) -> dict[Path, list[str]]:
+    """Group the commands directories of *platforms* by their resolved source directory.
 
+    In installed mode every platform resolves to ``data/commands``, so the
+    source is walked and read once and fanned out to each destination.
+    """
+    fanout: dict[Path, list[str]] = {}
+    for platform in platforms:
+        commands_src = _resolve_platform_source(data, platform)
+        if commands_src is None:
+            logger.debug("No commands found for platform '%s'", platform)
+            continue
+        fanout.setdefault(commands_src, []).append(_PLATFORM_DIRS[platform]["commands_dir"])
+    return fanout
 
-def _copy_platform_commands(
-    data: Path,
-    project_dir: Path,
-    platform: str,
-    commands_rel: str,
-) -> None:
-    """Copy command files for a single platform if they exist."""
-    commands_src = _resolve_platform_source(data, platform)
-    if commands_src is None:
-        logger.debug("No commands found for platform '%s'", platform)
-        return
-
-    dst = project_dir / commands_rel
-    mkdir_p(dst)
 
-    # Copy command files (*.md or *.mdc depending on platform)
+def _platform_sources(commands_src: Path) -> dict[str, Path]:
+    """List the files of a platform commands source, keyed by path relative to it."""
+    sources: dict[str, Path] = {}
+    # Command files (*.md or *.mdc depending on platform)
     for pattern in ("*.md", "*.mdc"):
         for src_file in sorted(commands_src.glob(pattern)):
-            copy_file(src_file, dst / src_file.name)
-
+            sources[src_file.name] = src_file
     # Bug #5 fix: copy ALL subdirectories (workflows/, journey/, etc.)
     # Previously only workflows/ was copied, missing journey/
     for subdir in sorted(commands_src.iterdir()):
         if subdir.is_dir():
-            copy_tree(subdir, dst / subdir.name)
-            logger.debug("Copied %s/%s/", commands_rel, subdir.name)
+            _add_tree(sources, subdir, subdir.name)
+    return sources
+
+
+def _copy_platform_files(data: Path, project_dir: Path, platforms: Iterable[str] = PLATFORMS) -> None:
+    """Copy platform-specific command/rule/steering files for the selected platforms."""
+    for commands_src, dests in _platform_fanout(data, platforms).items():
+        for rel in dests:
+            mkdir_p(project_dir / rel)
+        for name, src_file in _platform_sources(commands_src).items():
+            copy_file_to_many(src_file, [project_dir / rel / name for rel in dests])
+        logger.debug("Copied %s to %s", commands_src, ", ".join(dests))
 
 
 def _copy_claude_extras(data: Path, project_dir: Path) -> None:
@@ -0,0 +1,34 @@
+"""Scaffold options — optional generation modes threaded from the CLI into stack rendering."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+# Dockerfile generation modes:
+# - static:    use the stack's hand-written files/Dockerfile(.j2)
+# - generated: render a cache-friendly multi-stage Dockerfile from the manifest's ``docker:`` section
+DOCKERFILE_MODES = ("static", "generated")
+
+# Server profiles for generated backends:
+# - dev:  framework dev server with auto-reload (uvicorn --reload, flask run, runserver)
+# - prod: gunicorn config with CPU-derived worker counts, keep-alive, max-requests and a health check
+SERVER_PROFILES = ("dev", "prod")
+
+
+@dataclass
+class ScaffoldOptions:
+    """Optional generation modes applied while rendering a stack."""
+
+    dockerfile: str = "static"
+    server_profile: str = "dev"
+    bulk_endpoints: bool = False  # POST/DELETE /items:batch in CRUD backends
+    metrics: bool = False  # Prometheus /metrics middleware in backends
+
+    def template_vars(self) -> dict[str, str | bool]:
+        """Return the options as Jinja2 context variables for ``.j2`` stack files."""
+        return {
+            "dockerfile_mode": self.dockerfile,
+            "server_profile": self.server_profile,
+            "bulk_endpoints": self.bulk_endpoints,
+            "metrics": self.metrics,
+        }
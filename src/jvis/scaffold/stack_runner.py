@@ -1,20 +1,36 @@
-"""Stack runner — load a stack manifest and render its template files into a project."""
+"""Stack runner — load a stack manifest and render its template files into a project.
+
+Parsed manifests, compiled templates and compiled ``when:`` expressions are
+cached for the life of the process (keyed by file mtime and size), so
+repeated scaffolds — ``jvis serve``, monorepo sub-stacks — parse and compile
+each template once. Compiled Jinja2 templates are safe to render from
+several threads at once.
+"""
 
 from __future__ import annotations
 
 import logging
+import threading
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
+from jinja2 import Template
 from jinja2.sandbox import SandboxedEnvironment
 
+from jvis.scaffold.options import ScaffoldOptions
 from jvis.stacks.registry import StackInfo
 from jvis.utils.fs import copy_file, mkdir_p, write_file
 
 logger = logging.getLogger(__name__)
 
+_ENV = SandboxedEnvironment()
+_cache_lock = threading.Lock()
+_manifests: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+_templates: dict[Path, tuple[tuple[int, int], Template]] = {}
+
 
 def run_stack(
     stack: StackInfo,
@@ -22,18 +38,23 @@ def run_stack(
     project_name: str,
     project_description: str = "",
     database: str = "",
+    options: ScaffoldOptions | None = None,
 ) -> None:
     """Apply a stack manifest: create directories and render template files.
 
     Template variables available in .j2 files:
       - project_name, project_description, database_type, date
+      - the generation modes from :class:`ScaffoldOptions` (e.g. dockerfile_mode)
     """
     if stack.directory is None:
         logger.warning("Stack %s has no directory, skipping scaffold", stack.id)
         return
+    options = options or ScaffoldOptions()
     manifest = _load_full_manifest(stack.directory / "manifest.yaml")
     ctx = _build_context(project_name, project_description, database)
-    env = SandboxedEnvironment()
+    ctx.update(options.template_vars())
+
+    generate_dockerfile = options.dockerfile == "generated" and "docker" in manifest
 
     # Create directories from manifest
     for dirname in manifest.get("directories", []):
@@ -42,15 +63,110 @@ def run_stack(
     # Process files
     files_dir = stack.directory / "files"
     for file_entry in manifest.get("files", []):
-        _process_file(file_entry, files_dir, target_dir, ctx, env)
+        if generate_dockerfile and _entry_dst(file_entry) == "Dockerfile":
+            continue
+        if not _entry_enabled(file_entry, ctx):
+            continue
+        _process_file(file_entry, files_dir, target_dir, ctx)
+
+    if generate_dockerfile:
+        raw_spec = _apply_profile(manifest["docker"], options.server_profile)
+        _write_generated_dockerfile(raw_spec, target_dir, ctx)
+    elif options.dockerfile == "generated":
+        logger.warning("Stack %s has no docker section, keeping its static Dockerfile", stack.id)
+
+
+def warm_templates(stack: StackInfo) -> int:
+    """Parse *stack*'s manifest and compile its templates ahead of use; return the template count."""
+    if stack.directory is None:
+        return 0
+    manifest = _load_full_manifest(stack.directory / "manifest.yaml")
+    count = 0
+    for entry in manifest.get("files", []):
+        src = entry if isinstance(entry, str) else entry["src"]
+        path = stack.directory / "files" / src
+        if src.endswith(".j2") and path.is_file():
+            _compiled_template(path)
+            count += 1
+        if isinstance(entry, dict) and "when" in entry:
+            _compiled_expression(entry["when"])
+    return count
 
 
 def _load_full_manifest(path: Path) -> dict[str, Any]:
+    key = _stat_key(path)
+    cached = _manifests.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
     with open(path) as f:
-        return yaml.safe_load(f) or {}
+        manifest: dict[str, Any] = yaml.safe_load(f) or {}
+    with _cache_lock:
+        _manifests[path] = (key, manifest)
+    return manifest
+
+
+def _compiled_template(path: Path) -> Template:
+    """Return the compiled template at *path*, compiling it on first use or after it changed."""
+    key = _stat_key(path)
+    cached = _templates.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+    template = _ENV.from_string(path.read_text(encoding="utf-8"))
+    with _cache_lock:
+        _templates[path] = (key, template)
+    return template
+
+
+def _stat_key(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=512)
+def _compiled_expression(source: str) -> Any:
+    return _ENV.compile_expression(source)
 
 
-def _build_context(project_name: str, description: str, database: str) -> dict[str, str]:
+def _write_generated_dockerfile(
+    raw_spec: dict[str, Any],
+    target_dir: Path,
+    ctx: dict[str, Any],
+) -> None:
+    """Render the manifest ``docker:`` section into Dockerfile + .dockerignore.
+
+    Manifest values may reference template variables (e.g. ``{{ project_name }}``
+    for a Rust binary name), so the generated text is rendered once more with *ctx*.
+    """
+    from jvis.scaffold.dockerfile import parse_docker_spec, render_dockerfile, render_dockerignore
+
+    spec = parse_docker_spec(raw_spec)
+    write_file(target_dir / "Dockerfile", _ENV.from_string(render_dockerfile(spec)).render(**ctx))
+    dockerignore = target_dir / ".dockerignore"
+    if not dockerignore.exists():
+        write_file(dockerignore, render_dockerignore(spec))
+
+
+def _apply_profile(raw_spec: dict[str, Any], profile: str) -> dict[str, Any]:
+    """Merge ``docker.profiles.<profile>`` overrides into the base docker spec."""
+    merged = {k: v for k, v in raw_spec.items() if k != "profiles"}
+    merged.update(raw_spec.get("profiles", {}).get(profile, {}))
+    return merged
+
+
+def _entry_enabled(entry: dict[str, str] | str, ctx: dict[str, Any]) -> bool:
+    """Evaluate an entry's optional ``when:`` Jinja2 expression (e.g. ``server_profile == 'prod'``)."""
+    if isinstance(entry, str) or "when" not in entry:
+        return True
+    return bool(_compiled_expression(entry["when"])(**ctx))
+
+
+def _entry_dst(entry: dict[str, str] | str) -> str:
+    """Return the output path of a manifest file entry (``.j2`` suffix stripped)."""
+    dst = entry if isinstance(entry, str) else entry.get("dst", entry["src"])
+    return dst[:-3] if dst.endswith(".j2") else dst
+
+
+def _build_context(project_name: str, description: str, database: str) -> dict[str, Any]:
     return {
         "project_name": project_name,
         "project_description": description or f"{project_name} project",
@@ -63,8 +179,7 @@ def _process_file(
     entry: dict[str, str] | str,
     files_dir: Path,
     target_dir: Path,
-    ctx: dict[str, str],
-    env: SandboxedEnvironment | None = None,
+    ctx: dict[str, Any],
 ) -> None:
     """Process a single file entry from the manifest.
 
@@ -72,6 +187,9 @@ def _process_file(
       - a string: "path/to/file" (copy as-is from files/)
       - a dict: {"src": "template.j2", "dst": "output.py"} (render Jinja2)
       - a dict: {"src": "file.txt", "dst": "file.txt"} (copy)
+
+    Dict entries may also carry ``when:`` — a Jinja2 expression over the template
+    context; the entry is skipped when it evaluates false (see ``_entry_enabled``).
     """
     if isinstance(entry, str):
         src_name = entry
@@ -94,11 +212,7 @@ def _process_file(
 
     if src_name.endswith(".j2"):
         # Render Jinja2 template
-        template_text = src_path.read_text(encoding="utf-8")
-        if env is None:
-            env = SandboxedEnvironment()
-        rendered = env.from_string(template_text).render(**ctx)
-        write_file(dst_path, rendered)
+        write_file(dst_path, _compiled_template(src_path).render(**ctx))
     else:
         # Copy as-is
         copy_file(src_path, dst_path)
@@ -0,0 +1 @@
+"""Full-text search — a BM25-ranked inverted index over ``docs/`` and ``.jvis/agents/``."""
@@ -0,0 +1,309 @@
+"""Search index — an on-disk inverted index with BM25 ranking.
+
+The index lives in ``.jvis/cache/search.sqlite3`` (stdlib ``sqlite3``, no
+extra dependency) with one row per document and one posting per
+(term, document). A query reads only the postings of its own terms, so it
+stays fast however many files are indexed; nothing is re-read or
+re-tokenized at query time.
+
+:meth:`SearchIndex.refresh` keeps the index current: it lists the indexed
+roots, compares each file's mtime and size with the recorded ones, and
+re-tokenizes only new or changed files (removed files are dropped).
+Outside a JVIS project (no ``.jvis/`` directory) nothing is written: the
+index is built in memory for the one query.
+
+Ranking is Okapi BM25 (``k1 = 1.2``, ``b = 0.75``). A query term ending in
+``*`` matches every indexed term with that prefix.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from jvis.utils.fs import mkdir_p
+
+logger = logging.getLogger(__name__)
+
+INDEX_PATH = Path(".jvis") / "cache" / "search.sqlite3"
+DEFAULT_ROOTS = ("docs", ".jvis/agents")
+SUFFIXES = frozenset({".md", ".markdown", ".txt", ".yaml", ".yml"})
+_SCHEMA_VERSION = "1"
+
+_K1 = 1.2
+_B = 0.75
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_TITLE_RE = re.compile(r"^(?:#{1,6}\s+|(?:title|name):\s*)(.+)$", re.MULTILINE)
+_STOPWORDS = frozenset(
+    [
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "for",
+        "from",
+        "has",
+        "have",
+        "in",
+        "is",
+        "it",
+        "its",
+        "of",
+        "on",
+        "or",
+        "that",
+        "the",
+        "this",
+        "to",
+        "was",
+        "were",
+        "will",
+        "with",
+    ]
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    title TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc INTEGER NOT NULL,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (term, doc)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc);
+"""
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric terms of *text*, without stopwords and single letters."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if (len(t) > 1 or t.isdigit()) and t not in _STOPWORDS]
+
+
+@dataclass
+class RefreshStats:
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    unchanged: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def changed(self) -> int:
+        return self.added + self.updated + self.removed
+
+
+@dataclass
+class SearchHit:
+    path: str
+    title: str
+    score: float
+    snippet: str = ""
+
+
+class SearchIndex:
+    """The search index of one project. Use as a context manager to close the database."""
+
+    def __init__(self, project: Path, roots: tuple[str, ...] = DEFAULT_ROOTS) -> None:
+        self.project = project
+        self.roots = roots
+        if (project / ".jvis").is_dir():
+            path = project / INDEX_PATH
+            mkdir_p(path.parent)
+            self.db = sqlite3.connect(path)
+        else:
+            self.db = sqlite3.connect(":memory:")
+        # A rebuildable cache: trade crash durability for write speed.
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.execute("PRAGMA synchronous = OFF")
+        self.db.execute("PRAGMA cache_size = -65536")  # 64 MiB: postings arrive per document but are keyed by term
+        self.db.executescript(_SCHEMA)
+        if self._meta("version") != _SCHEMA_VERSION or self._meta("roots") != ",".join(roots):
+            self.clear()
+
+    def __enter__(self) -> SearchIndex:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.db.close()
+
+    def clear(self) -> None:
+        """Drop every indexed document (the next refresh re-indexes all files)."""
+        with self.db:
+            self.db.execute("DELETE FROM postings")
+            self.db.execute("DELETE FROM docs")
+            self._set_meta("version", _SCHEMA_VERSION)
+            self._set_meta("roots", ",".join(self.roots))
+
+    @property
+    def document_count(self) -> int:
+        return int(self.db.execute("SELECT COUNT(*) FROM docs").fetchone()[0])
+
+    # -- indexing -----------------------------------------------------------
+
+    def refresh(self) -> RefreshStats:
+        """Re-index files whose mtime or size changed; drop files that no longer exist."""
+        started = time.perf_counter()
+        stats = RefreshStats()
+        on_disk = self._list_files()
+        recorded = {
+            path: (doc_id, mtime, size)
+            for doc_id, path, mtime, size in self.db.execute("SELECT id, path, mtime_ns, size FROM docs")
+        }
+        with self.db:
+            for path, (doc_id, _, _) in recorded.items():
+                if path not in on_disk:
+                    self._delete(doc_id)
+                    stats.removed += 1
+            for path, (mtime, size) in on_disk.items():
+                previous = recorded.get(path)
+                if previous and previous[1:] == (mtime, size):
+                    stats.unchanged += 1
+                    continue
+                if previous:
+                    self._delete(previous[0])
+                    stats.updated += 1
+                else:
+                    stats.added += 1
+                self._add(path, mtime, size)
+        stats.elapsed = time.perf_counter() - started
+        logger.debug("Search index refresh: %s", stats)
+        return stats
+
+    def _list_files(self) -> dict[str, tuple[int, int]]:
+        found: dict[str, tuple[int, int]] = {}
+        stack = [(str(self.project / root), root) for root in self.roots]
+        while stack:
+            directory, rel_dir = stack.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                rel = f"{rel_dir}/{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel))
+                elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in SUFFIXES:
+                    st = entry.stat()
+                    found[rel] = (st.st_mtime_ns, st.st_size)
+        return found
+
+    def _add(self, path: str, mtime: int, size: int) -> None:
+        try:
+            text = (self.project / path).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return
+        terms = tokenize(text)
+        counts: dict[str, int] = {}
+        for term in terms:
+            counts[term] = counts.get(term, 0) + 1
+        match = _TITLE_RE.search(text)
+        title = match[1].strip().strip("\"'") if match else Path(path).name
+        cursor = self.db.execute(
+            "INSERT INTO docs (path, mtime_ns, size, length, title) VALUES (?, ?, ?, ?, ?)",
+            (path, mtime, size, len(terms), title[:200]),
+        )
+        self.db.executemany(
+            "INSERT INTO postings (term, doc, tf) VALUES (?, ?, ?)",
+            ((term, cursor.lastrowid, tf) for term, tf in counts.items()),
+        )
+
+    def _delete(self, doc_id: int) -> None:
+        self.db.execute("DELETE FROM postings WHERE doc = ?", (doc_id,))
+        self.db.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+
+    # -- querying -----------------------------------------------------------
+
+    def search(self, query: str, *, limit: int = 10, within: str = "") -> list[SearchHit]:
+        """Return the best *limit* documents for *query*, optionally only under path prefix *within*."""
+        n, total_length = self.db.execute("SELECT COUNT(*), COALESCE(SUM(length), 0) FROM docs").fetchone()
+        if not n:
+            return []
+        avgdl = total_length / n or 1.0
+        scores: dict[int, float] = {}
+        for term in _query_terms(query):
+            if term.endswith("*"):
+                prefix = term[:-1]
+                rows = self.db.execute(
+                    "SELECT p.term, p.doc, p.tf, d.length FROM postings p JOIN docs d ON d.id = p.doc "
+                    "WHERE p.term >= ? AND p.term < ?",
+                    (prefix, prefix + "\uffff"),
+                ).fetchall()
+            else:
+                rows = self.db.execute(
+                    "SELECT p.term, p.doc, p.tf, d.length FROM postings p JOIN docs d ON d.id = p.doc WHERE p.term = ?",
+                    (term,),
+                ).fetchall()
+            df: dict[str, int] = {}
+            for matched, _, _, _ in rows:
+                df[matched] = df.get(matched, 0) + 1
+            for matched, doc, tf, length in rows:
+                idf = math.log(1 + (n - df[matched] + 0.5) / (df[matched] + 0.5))
+                norm = tf + _K1 * (1 - _B + _B * length / avgdl)
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (_K1 + 1) / norm
+
+        if not scores:
+            return []
+        ranked = sorted(scores.items(), key=lambda item: -item[1])
+        hits: list[SearchHit] = []
+        terms = [t.rstrip("*") for t in _query_terms(query)]
+        for doc, score in ranked:
+            path, title = self.db.execute("SELECT path, title FROM docs WHERE id = ?", (doc,)).fetchone()
+            if within and not (path == within or path.startswith(within.rstrip("/") + "/")):
+                continue
+            hits.append(SearchHit(path=path, title=title, score=round(score, 4), snippet=self._snippet(path, terms)))
+            if len(hits) >= limit:
+                break
+        return hits
+
+    def _snippet(self, path: str, terms: list[str]) -> str:
+        """First line of *path* containing a query term, trimmed."""
+        try:
+            with open(self.project / path, encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    words = set(_TOKEN_RE.findall(line.lower()))
+                    if any(w.startswith(t) for t in terms for w in words):
+                        return line.strip()[:160]
+        except OSError:
+            pass
+        return ""
+
+    def _meta(self, key: str) -> str | None:
+        row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+
+def _query_terms(query: str) -> list[str]:
+    """Query terms; a trailing ``*`` on a word makes it a prefix term."""
+    terms: list[str] = []
+    for word in query.split():
+        prefix = word.endswith("*")
+        terms.extend(tokenize(word))
+        if prefix and terms and len(terms[-1]) >= 2:
+            terms[-1] += "*"
+    return list(dict.fromkeys(terms))
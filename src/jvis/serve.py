@@ -0,0 +1,479 @@
+"""Scaffold service — ``jvis new`` behind a local HTTP/JSON API.
+
+One process serves many scaffold requests, so what ``jvis new`` pays on every
+run is paid once at startup: the stack registry is discovered, every stack's
+manifest is parsed and its templates compiled (see
+:mod:`jvis.scaffold.stack_runner`), and the framework snapshot is hashed.
+
+Requests are admitted into a bounded worker pool; when every worker is busy
+and the queue is full the service answers 503 instead of piling up work. The
+timeout covers a request end to end, queue wait included: one that has not
+finished by then gets 504 and is dropped — it never starts if it was still
+queued, and a scaffold already running has its output removed once the worker
+is done with it.
+
+Each request writes into its own output root, ``<output root>/<request id>/<name>``;
+client input never names a path.
+
+Endpoints:
+  - ``GET /health``    — liveness, pool state, warm-up summary
+  - ``GET /metrics``   — request counts by status, scaffold outcomes and latency
+  - ``GET /stacks``    — the stacks that can be requested
+  - ``POST /scaffold`` — create a project. JSON body::
+
+        {"name": "my-api", "stack": "python-fastapi", "database": "postgresql",
+         "entity": "item", "description": "", "platforms": ["claude"],
+         "dockerfile": "static", "server_profile": "dev",
+         "bulk_endpoints": false, "metrics": false, "archive": "zip"}
+
+    A monorepo names ``backend``/``frontend`` (and optionally ``mobile``)
+    instead of ``stack``. Without ``archive`` the response is JSON describing
+    the created project; with ``"zip"`` or ``"tar.gz"`` it is the project as an
+    archive and the output is deleted afterwards.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import logging
+import os
+import shutil
+import tarfile
+import threading
+import time
+import uuid
+import zipfile
+from collections import deque
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import click
+
+if TYPE_CHECKING:
+    from jvis.commands.primary import ProjectConfig
+    from jvis.scaffold.framework import FrameworkSnapshot
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FORMATS = {"zip": "application/zip", "tar.gz": "application/gzip"}
+MAX_BODY_BYTES = 64 * 1024
+_MONOREPO_KEYS = ("backend", "frontend", "mobile")
+
+
+class RequestError(Exception):
+    """A request the service rejects; carries the HTTP status to answer with."""
+
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class ServiceSettings:
+    output_root: Path
+    workers: int = 4
+    queue: int = 16  # admitted requests waiting for a worker
+    timeout: float = 120.0  # seconds per scaffold
+
+
+@dataclass
+class ScaffoldResult:
+    id: str
+    name: str
+    project_dir: Path
+    files: int
+    elapsed_ms: float
+    log: list[str] = field(default_factory=list)
+    archive: bytes = b""
+    archive_format: str = ""
+
+
+class ServiceMetrics:
+    """Thread-safe counters and a rolling window of scaffold latencies."""
+
+    def __init__(self, window: int = 1024) -> None:
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self.requests: dict[str, int] = {}  # "POST /scaffold 200" -> count
+        self.scaffolds: dict[str, int] = {"ok": 0, "failed": 0, "invalid": 0, "rejected": 0, "timeout": 0}
+        self._latencies: deque[float] = deque(maxlen=window)
+
+    def record_request(self, method: str, path: str, status: int) -> None:
+        key = f"{method} {path} {status}"
+        with self._lock:
+            self.requests[key] = self.requests.get(key, 0) + 1
+
+    def record_scaffold(self, outcome: str, elapsed_ms: float | None = None) -> None:
+        with self._lock:
+            self.scaffolds[outcome] = self.scaffolds.get(outcome, 0) + 1
+            if elapsed_ms is not None:
+                self._latencies.append(elapsed_ms)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            data: dict[str, Any] = {
+                "uptime_s": round(time.time() - self.started, 1),
+                "requests": dict(sorted(self.requests.items())),
+                "scaffolds": dict(self.scaffolds),
+            }
+        if latencies:
+            data["scaffold_ms"] = {
+                "count": len(latencies),
+                "p50": round(latencies[len(latencies) // 2], 1),
+                "p95": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 1),
+                "max": round(latencies[-1], 1),
+            }
+        return data
+
+
+class ScaffoldService:
+    """Warm scaffold state plus the worker pool that runs requests."""
+
+    def __init__(self, settings: ServiceSettings) -> None:
+        self.settings = settings
+        self.metrics = ServiceMetrics()
+        self.snapshot: FrameworkSnapshot | None = None
+        self.warmup: dict[str, Any] = {}
+        self._pool = ThreadPoolExecutor(max_workers=settings.workers, thread_name_prefix="jvis-serve")
+        self._lock = threading.Lock()
+        self._pending = 0  # admitted and not finished (running or queued)
+
+    # -- lifecycle ----------------------------------------------------------
+
+    def warm(self) -> dict[str, Any]:
+        """Discover stacks, compile their templates and hash the framework once."""
+        from jvis.scaffold.framework import snapshot_framework
+        from jvis.scaffold.stack_runner import warm_templates
+        from jvis.stacks.registry import discover_stacks
+
+        started = time.perf_counter()
+        stacks = discover_stacks()
+        templates = sum(warm_templates(stack) for stack in stacks.values())
+        try:
+            self.snapshot = snapshot_framework()
+        except RuntimeError as exc:
+            logger.warning("Framework snapshot unavailable, hashing per request: %s", exc)
+        self.warmup = {
+            "stacks": len(stacks),
+            "templates": templates,
+            "framework_files": len(self.snapshot.files) if self.snapshot else 0,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+        return self.warmup
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+
+    def health(self) -> dict[str, Any]:
+        with self._lock:
+            pending = self._pending
+        return {
+            "status": "ok",
+            "workers": self.settings.workers,
+            "busy": min(pending, self.settings.workers),
+            "queued": max(0, pending - self.settings.workers),
+            "uptime_s": round(time.time() - self.metrics.started, 1),
+            "warmup": self.warmup,
+        }
+
+    # -- scaffolding --------------------------------------------------------
+
+    def scaffold(self, payload: dict[str, Any]) -> ScaffoldResult:
+        """Validate *payload*, run it on the pool and wait up to the timeout.
+
+        Raises :class:`RequestError` for invalid input (400), a full queue
+        (503), a timeout (504) or a failed scaffold (500).
+        """
+        request_id = uuid.uuid4().hex[:12]
+        request_root = self.settings.output_root / request_id
+        try:
+            archive_format = _str_field(payload, "archive") or ""
+            if archive_format and archive_format not in ARCHIVE_FORMATS:
+                raise ValueError(f"archive must be one of: {', '.join(ARCHIVE_FORMATS)}.")
+            config = build_config(payload, request_root)
+        except (ValueError, click.ClickException) as exc:
+            self.metrics.record_scaffold("invalid")
+            message = exc.message if isinstance(exc, click.ClickException) else str(exc)
+            raise RequestError(HTTPStatus.BAD_REQUEST, message) from exc
+
+        with self._lock:
+            if self._pending >= self.settings.workers + self.settings.queue:
+                self.metrics.record_scaffold("rejected")
+                raise RequestError(HTTPStatus.SERVICE_UNAVAILABLE, "All workers busy and the queue is full.")
+            self._pending += 1
+        expired = threading.Event()
+        future = self._pool.submit(self._run, request_id, config, archive_format, expired)
+        future.add_done_callback(self._finished)
+        try:
+            result = future.result(timeout=self.settings.timeout)
+        except FutureTimeout:
+            # Nobody will receive the result: drop the request if it is still
+            # queued, and keep a worker that races us to it from starting.
+            expired.set()
+            future.cancel()
+            self.metrics.record_scaffold("timeout")
+            future.add_done_callback(lambda _: shutil.rmtree(request_root, ignore_errors=True))
+            raise RequestError(
+                HTTPStatus.GATEWAY_TIMEOUT, f"Scaffold did not finish within {self.settings.timeout:g}s."
+            ) from None
+        except Exception as exc:
+            self.metrics.record_scaffold("failed")
+            shutil.rmtree(request_root, ignore_errors=True)
+            logger.exception("Scaffold %s failed", request_id)
+            raise RequestError(HTTPStatus.INTERNAL_SERVER_ERROR, f"Scaffold failed: {exc}") from exc
+        self.metrics.record_scaffold("ok", result.elapsed_ms)
+        return result
+
+    def _finished(self, _future: Future[ScaffoldResult]) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def _run(
+        self, request_id: str, config: ProjectConfig, archive_format: str, expired: threading.Event
+    ) -> ScaffoldResult:
+        from jvis.api import ProgressEvent, scaffold
+
+        if expired.is_set():
+            raise CancelledError(f"Scaffold {request_id} timed out before it started")
+        started = time.perf_counter()
+        log: list[str] = []
+
+        def record(event: ProgressEvent) -> None:
+            log.append(event.message)
+
+        asyncio.run(scaffold(config, on_progress=record, snapshot=self.snapshot))
+        result = ScaffoldResult(
+            id=request_id,
+            name=config.project_name,
+            project_dir=config.project_dir,
+            files=sum(len(files) for _, _, files in os.walk(config.project_dir)),
+            elapsed_ms=0.0,
+            log=log,
+        )
+        if archive_format:
+            result.archive = make_archive(config.project_dir, archive_format)
+            result.archive_format = archive_format
+            shutil.rmtree(config.project_dir.parent, ignore_errors=True)
+        result.elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        return result
+
+
+def build_config(payload: dict[str, Any], request_root: Path) -> ProjectConfig:
+    """Turn a request body into a :class:`ProjectConfig` under *request_root*.
+
+    Validation matches ``jvis new``; raises ``ValueError`` or
+    ``click.ClickException`` for invalid input, including fields of the
+    wrong JSON type.
+    """
+    from jvis.commands.primary import _collect_config_scripted, _validate_entity
+    from jvis.scaffold.framework import parse_platforms
+    from jvis.scaffold.options import DOCKERFILE_MODES, SERVER_PROFILES, ScaffoldOptions
+    from jvis.utils.validation import sanitize_project_name
+
+    name = payload.get("name")
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError("'name' is required.")
+    entity = _str_field(payload, "entity") or "item"
+    database = _str_field(payload, "database")
+    stack = _str_field(payload, "stack")
+    if stack and any(_str_field(payload, k) for k in _MONOREPO_KEYS):
+        raise ValueError("Give either 'stack' or backend/frontend/mobile, not both.")
+
+    project_dir = request_root / (sanitize_project_name(name) or "project")
+    if stack:
+        config = _collect_config_scripted(name, stack, str(project_dir), database, entity)
+    else:
+        config = _monorepo_config(payload, name, project_dir, database)
+        config.entity_name = _validate_entity(entity)
+
+    dockerfile = _str_field(payload, "dockerfile") or "static"
+    server_profile = _str_field(payload, "server_profile") or "dev"
+    if dockerfile not in DOCKERFILE_MODES:
+        raise ValueError(f"dockerfile must be one of: {', '.join(DOCKERFILE_MODES)}.")
+    if server_profile not in SERVER_PROFILES:
+        raise ValueError(f"server_profile must be one of: {', '.join(SERVER_PROFILES)}.")
+    config.options = ScaffoldOptions(
+        dockerfile=dockerfile,
+        server_profile=server_profile,
+        bulk_endpoints=bool(payload.get("bulk_endpoints")),
+        metrics=bool(payload.get("metrics")),
+    )
+    platforms = payload.get("platforms")
+    if platforms:
+        if not isinstance(platforms, str) and not (
+            isinstance(platforms, list) and all(isinstance(p, str) for p in platforms)
+        ):
+            raise ValueError("'platforms' must be a string or a list of strings.")
+        config.platforms = parse_platforms(platforms)
+    description = payload.get("description")
+    if isinstance(description, str):
+        config.project_description = description.strip()[:500]
+    return config
+
+
+def _str_field(payload: dict[str, Any], key: str) -> str | None:
+    """Return string field *key* of *payload*, None when absent or empty; ``ValueError`` for other types."""
+    value = payload.get(key)
+    if value is None or value == "":
+        return None
+    if not isinstance(value, str):
+        raise ValueError(f"'{key}' must be a string.")
+    return value
+
+
+def _monorepo_config(payload: dict[str, Any], name: str, project_dir: Path, database: str | None) -> ProjectConfig:
+    from jvis.commands.primary import ProjectConfig
+    from jvis.core.database_selector import DATABASES
+    from jvis.stacks.registry import get_stack
+    from jvis.utils.validation import sanitize_project_name, validate_project_name
+
+    project_name = sanitize_project_name(name)
+    err = validate_project_name(project_name)
+    if err:
+        raise ValueError(err)
+    stacks: dict[str, Any] = {"stack": None, "backend": None, "frontend": None, "mobile": None}
+    for key in _MONOREPO_KEYS:
+        stack_id = _str_field(payload, key)
+        if not stack_id:
+            continue
+        info = get_stack(stack_id)
+        if info is None or info.type != key:
+            raise ValueError(f"Unknown {key} stack '{stack_id}'.")
+        stacks[key] = info
+    if not stacks["backend"] or not stacks["frontend"]:
+        raise ValueError("Give 'stack', or both 'backend' and 'frontend'.")
+    valid_dbs = {d[0] for d in DATABASES}
+    if database and database not in valid_dbs:
+        raise ValueError(f"Unknown database '{database}'. Available: {', '.join(sorted(valid_dbs))}.")
+    return ProjectConfig(
+        project_name=project_name,
+        project_description="",
+        project_dir=project_dir,
+        project_type="fullstack-mobile" if stacks["mobile"] else "fullstack",
+        stacks=stacks,
+        database=(database or "postgresql") if stacks["backend"].requires_database else "",
+    )
+
+
+def make_archive(project_dir: Path, archive_format: str) -> bytes:
+    """Return *project_dir* packed as ``zip`` or ``tar.gz``, rooted at the project's name."""
+    buffer = io.BytesIO()
+    if archive_format == "zip":
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=6) as archive:
+            for root, dirnames, filenames in os.walk(project_dir):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    path = Path(root, filename)
+                    archive.write(path, Path(project_dir.name, path.relative_to(project_dir)).as_posix())
+    else:
+        with tarfile.open(fileobj=buffer, mode="w:gz", compresslevel=6) as archive:
+            archive.add(project_dir, arcname=project_dir.name)
+    return buffer.getvalue()
+
+
+# ---------------------------------------------------------------------------
+# HTTP layer
+# ---------------------------------------------------------------------------
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive: a portal can reuse its connection
+    server_version = "jvis-serve"
+    service: ScaffoldService  # set on the subclass made by make_server()
+
+    def do_GET(self) -> None:
+        path = self.path.split("?", 1)[0]
+        if path == "/health":
+            self._json(HTTPStatus.OK, self.service.health())
+        elif path == "/metrics":
+            self._json(HTTPStatus.OK, self.service.metrics.snapshot())
+        elif path == "/stacks":
+            from jvis.stacks.registry import discover_stacks
+
+            stacks = [{"id": s.id, "name": s.name, "type": s.type} for s in discover_stacks().values()]
+            self._json(HTTPStatus.OK, {"stacks": stacks})
+        else:
+            self._json(HTTPStatus.NOT_FOUND, {"error": f"No route for GET {path}."})
+
+    def do_POST(self) -> None:
+        path = self.path.split("?", 1)[0]
+        try:
+            if path != "/scaffold":
+                self.close_connection = True  # the body is left unread
+                raise RequestError(HTTPStatus.NOT_FOUND, f"No route for POST {path}.")
+            payload = self._read_json()
+            result = self.service.scaffold(payload)
+        except RequestError as exc:
+            self._json(exc.status, {"error": str(exc)})
+            return
+        except Exception:
+            logger.exception("Unhandled error in POST %s", path)
+            self.close_connection = True
+            self._json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error."})
+            return
+        headers = {"X-Jvis-Request-Id": result.id, "X-Jvis-Elapsed-Ms": str(result.elapsed_ms)}
+        if result.archive_format:
+            filename = f"{result.name}.{result.archive_format}"
+            headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+            self._send(HTTPStatus.OK, result.archive, ARCHIVE_FORMATS[result.archive_format], headers)
+            return
+        body = {
+            "id": result.id,
+            "name": result.name,
+            "project_dir": str(result.project_dir),
+            "files": result.files,
+            "elapsed_ms": result.elapsed_ms,
+            "log": result.log,
+        }
+        self._json(HTTPStatus.CREATED, body, headers)
+
+    def _read_json(self) -> dict[str, Any]:
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_BODY_BYTES:
+            self.close_connection = True
+            raise RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Body must be at most {MAX_BODY_BYTES} bytes.")
+        raw = self.rfile.read(length) if length else b""
+        try:
+            payload = json.loads(raw or b"{}")
+        except ValueError as exc:
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"Body is not valid JSON: {exc}") from exc
+        if not isinstance(payload, dict):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object.")
+        return payload
+
+    def _json(self, status: HTTPStatus, data: dict[str, Any], headers: dict[str, str] | None = None) -> None:
+        self._send(status, json.dumps(data).encode(), "application/json", headers)
+
+    def _send(self, status: HTTPStatus, body: bytes, content_type: str, headers: dict[str, str] | None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            self.send_header("Retry-After", "5")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        self.service.metrics.record_request(self.command, self.path.split("?", 1)[0], status)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+def make_server(service: ScaffoldService, host: str = "127.0.0.1", port: int = 8765) -> ThreadingHTTPServer:
+    """Bind an HTTP server that dispatches to *service* (``port=0`` picks a free port)."""
+    handler = type("ScaffoldHandler", (_Handler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
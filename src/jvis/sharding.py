@@ -0,0 +1,247 @@
+"""Shard planning documents (PRD, architecture) by heading.
+
+Each level-2 section (``## Title``) of the source becomes its own file in
+the configured sharded location, with its headings promoted one level
+(``## Goals`` -> ``# Goals`` in ``goals.md``). Everything before the first
+section (the document title and introduction) heads ``index.md``, which
+lists the shards with their estimated token counts so agents can load only
+what they need.
+
+Sources and locations come from ``.jvis/core-config.yaml``::
+
+    prd:
+      prdFile: docs/prd.md
+      prdSharded: true
+      prdShardedLocation: docs/prd
+
+Re-sharding is incremental: ``.shard-index.json`` in the sharded location
+records each shard's hash, so only shards whose section changed are
+rewritten, and shards of removed sections are deleted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from jvis.utils.fs import write_file, write_file_atomic
+from jvis.utils.tokens import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "index.md"
+MANIFEST_FILE = ".shard-index.json"
+
+# Shardable documents: name -> (config section, file key, flag key, location key, default file)
+_DOCUMENTS = {
+    "prd": ("prd", "prdFile", "prdSharded", "prdShardedLocation", "docs/prd.md"),
+    "architecture": (
+        "architecture",
+        "architectureFile",
+        "architectureSharded",
+        "architectureShardedLocation",
+        "docs/architecture.md",
+    ),
+}
+DOCUMENTS = tuple(_DOCUMENTS)
+
+_HEADING_RE = re.compile(r"^(#{1,6})(\s+)(.*)$")
+_FENCE_RE = re.compile(r"^\s*(```|~~~)")
+
+
+@dataclass(frozen=True)
+class ShardTarget:
+    """A shardable document as configured in core-config.yaml."""
+
+    name: str
+    source: Path
+    location: Path
+    enabled: bool  # the prdSharded / architectureSharded flag
+
+
+@dataclass
+class Section:
+    title: str
+    slug: str
+    text: str  # shard file content, headings already promoted
+
+
+@dataclass
+class ShardEntry:
+    file: str
+    title: str
+    tokens: int
+    sha256: str
+    bytes: int
+
+
+@dataclass
+class ShardResult:
+    """Outcome of sharding one document."""
+
+    name: str
+    source: str
+    location: str
+    shards: list[ShardEntry] = field(default_factory=list)
+    written: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def tokens(self) -> int:
+        return sum(s.tokens for s in self.shards)
+
+
+def shard_targets(project: Path) -> dict[str, ShardTarget]:
+    """Return the shardable documents of *project*, resolved from core-config.yaml."""
+    import yaml
+
+    try:
+        config = yaml.safe_load((project / ".jvis" / "core-config.yaml").read_text(encoding="utf-8"))
+    except (OSError, yaml.YAMLError):
+        config = None
+    config = config if isinstance(config, dict) else {}
+
+    targets: dict[str, ShardTarget] = {}
+    for name, (section_key, file_key, flag_key, location_key, default) in _DOCUMENTS.items():
+        raw = config.get(section_key)
+        section = raw if isinstance(raw, dict) else {}
+        source = project / str(section.get(file_key) or default)
+        location = project / str(section.get(location_key) or source.with_suffix("").relative_to(project))
+        targets[name] = ShardTarget(name, source, location, bool(section.get(flag_key)))
+    return targets
+
+
+def slugify(title: str) -> str:
+    """Return a file-name slug for a heading (``"3. Tech Stack"`` -> ``"3-tech-stack"``)."""
+    slug = re.sub(r"[^a-z0-9]+", "-", re.sub(r"[`*_\[\]()]", "", title).lower()).strip("-")
+    return slug[:60].rstrip("-") or "section"
+
+
+def split_sections(text: str) -> tuple[str, list[Section]]:
+    """Split Markdown into its preamble and level-2 sections.
+
+    Headings inside fenced code blocks are ignored. Section headings are
+    promoted one level in the returned shard text.
+    """
+    preamble: list[str] = []
+    sections: list[tuple[str, list[str]]] = []
+    in_fence = False
+    for line in text.splitlines():
+        if _FENCE_RE.match(line):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADING_RE.match(line)
+        if match and len(match[1]) == 2:
+            sections.append((match[3].strip(), []))
+        if match and len(match[1]) >= 2 and sections:
+            line = match[1][1:] + match[2] + match[3]
+        (sections[-1][1] if sections else preamble).append(line)
+
+    used = {INDEX_FILE.removesuffix(".md")}
+    result: list[Section] = []
+    for title, lines in sections:
+        slug = base = slugify(title)
+        n = 2
+        while slug in used:
+            slug, n = f"{base}-{n}", n + 1
+        used.add(slug)
+        result.append(Section(title=title, slug=slug, text="\n".join(lines).strip() + "\n"))
+    return "\n".join(preamble).strip(), result
+
+
+def render_index(preamble: str, source: str, shards: list[ShardEntry]) -> str:
+    """Render ``index.md``: the document preamble and a table of shards with token estimates."""
+    total = sum(s.tokens for s in shards)
+    lines = [preamble or f"# {Path(source).stem}", ""]
+    lines.append(f"Sharded from `{source}` by `jvis shard` — {len(shards)} sections, ~{total:,} tokens.")
+    lines += ["", "## Sections", "", "| Section | ~Tokens |", "| --- | ---: |"]
+    lines += [f"| [{s.title}](./{s.file}) | {s.tokens:,} |" for s in shards]
+    return "\n".join(lines) + "\n"
+
+
+def shard_document(target: ShardTarget, project: Path, *, dry_run: bool = False) -> ShardResult:
+    """Shard *target*'s source into its location, rewriting only changed shards.
+
+    Raises ``FileNotFoundError`` when the source document does not exist.
+    """
+    text = target.source.read_text(encoding="utf-8")
+    source_rel = target.source.relative_to(project).as_posix()
+    result = ShardResult(
+        name=target.name,
+        source=source_rel,
+        location=target.location.relative_to(project).as_posix(),
+    )
+    preamble, sections = split_sections(text)
+    if not sections:
+        logger.info("%s has no level-2 headings; nothing to shard", target.source)
+        return result
+
+    previous = _load_manifest(target.location)
+    recorded = {entry["file"]: entry for entry in previous.get("shards", [])}
+    files: list[tuple[str, str]] = []
+    for section in sections:
+        content = section.text
+        entry = ShardEntry(
+            file=f"{section.slug}.md",
+            title=section.title,
+            tokens=estimate_tokens(content),
+            sha256=_sha256(content),
+            bytes=len(content.encode("utf-8")),
+        )
+        result.shards.append(entry)
+        files.append((entry.file, content))
+    index = render_index(preamble, source_rel, result.shards)
+    files.append((INDEX_FILE, index))
+    recorded[INDEX_FILE] = {"file": INDEX_FILE, "sha256": previous.get("index_sha256", "")}
+
+    for name, content in files:
+        if _is_current(target.location / name, recorded.get(name), content):
+            result.unchanged += 1
+            continue
+        result.written.append(name)
+        if not dry_run:
+            write_file(target.location / name, content)
+
+    current = {name for name, _ in files}
+    result.removed = sorted(name for name in recorded if name not in current)
+    if dry_run:
+        return result
+    for name in result.removed:
+        (target.location / name).unlink(missing_ok=True)
+    if result.written or result.removed:
+        manifest = {
+            "source": source_rel,
+            "source_sha256": _sha256(text),
+            "index_sha256": _sha256(index),
+            "shards": [asdict(s) for s in result.shards],
+        }
+        write_file_atomic(target.location / MANIFEST_FILE, json.dumps(manifest, indent=2) + "\n")
+    return result
+
+
+def _load_manifest(location: Path) -> dict[str, Any]:
+    try:
+        data = json.loads((location / MANIFEST_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _is_current(path: Path, recorded: dict[str, Any] | None, content: str) -> bool:
+    """True when *path* still holds *content*, judged by the manifest hash and a size check."""
+    if not recorded or recorded.get("sha256") != _sha256(content):
+        return False
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return False
+    return size == len(content.encode("utf-8"))
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
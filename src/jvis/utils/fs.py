@@ -5,10 +5,15 @@ from __future__ import annotations
 import logging
 import os
 import shutil
+import threading
 from pathlib import Path
 
+from jvis.utils import perf
+
 logger = logging.getLogger(__name__)
 
+READ_CHUNK_SIZE = 64 * 1024
+
 
 def mkdir_p(path: Path) -> None:
     """Create directory and parents (like ``mkdir -p``)."""
@@ -19,19 +24,96 @@ def write_file(path: Path, content: str) -> None:
     """Write *content* to *path*, creating parent directories as needed."""
     mkdir_p(path.parent)
     path.write_text(content, encoding="utf-8")
+    perf.record_write(path)
+
+
+def write_file_atomic(path: Path, content: str) -> None:
+    """Write *content* to *path* via a temporary file and rename.
+
+    Readers see either the old or the new content, never a partial file.
+    """
+    mkdir_p(path.parent)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_text(content, encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+    perf.record_write(path)
 
 
 def copy_tree(src: Path, dst: Path) -> None:
     """Recursively copy *src* directory to *dst*, merging into existing."""
     if not src.is_dir():
         return
-    shutil.copytree(src, dst, dirs_exist_ok=True)
+    shutil.copytree(src, dst, dirs_exist_ok=True, copy_function=_copy2_counted)
 
 
 def copy_file(src: Path, dst: Path) -> None:
     """Copy a single file, creating destination directory if needed."""
     mkdir_p(dst.parent)
     shutil.copy2(src, dst)
+    perf.record_write(dst)
+
+
+def copy_file_to_many(src: Path, dsts: list[Path]) -> None:
+    """Copy *src* to every path in *dsts*, reading the source only once.
+
+    Metadata is preserved as with :func:`copy_file`.
+    """
+    if len(dsts) == 1:
+        copy_file(src, dsts[0])
+        return
+    data = src.read_bytes()
+    for dst in dsts:
+        mkdir_p(dst.parent)
+        dst.write_bytes(data)
+        shutil.copystat(src, dst)
+        perf.record_write(dst)
+
+
+def _copy2_counted(src: str, dst: str) -> str:
+    """``shutil.copy2`` that reports the copy to :mod:`jvis.utils.perf`."""
+    result: str = shutil.copy2(src, dst)
+    perf.record_write(Path(result))
+    return result
+
+
+def count_marker(
+    path: Path,
+    marker: bytes,
+    *,
+    stop_at: int | None = None,
+    max_bytes: int | None = None,
+    chunk_size: int = READ_CHUNK_SIZE,
+) -> tuple[int, int]:
+    """Count non-overlapping occurrences of *marker* in *path*, streaming it in chunks.
+
+    Reading stops as soon as *stop_at* occurrences are found or *max_bytes*
+    have been read, so callers that only need "more than N" never load the
+    whole file. Returns ``(count, bytes_read)``; raises ``OSError``.
+    """
+    count = 0
+    read = 0
+    carry = b""
+    with open(path, "rb") as f:
+        while max_bytes is None or read < max_bytes:
+            size = chunk_size if max_bytes is None else min(chunk_size, max_bytes - read)
+            chunk = f.read(size)
+            if not chunk:
+                break
+            read += len(chunk)
+            buf = carry + chunk
+            pos = 0
+            while (hit := buf.find(marker, pos)) != -1:
+                count += 1
+                pos = hit + len(marker)
+                if stop_at is not None and count >= stop_at:
+                    return count, read
+            # Keep a tail that could start a marker split across chunks.
+            carry = buf[max(pos, len(buf) - len(marker) + 1) :]
+    return count, read
 
 
 def is_empty_dir(path: Path) -> bool:
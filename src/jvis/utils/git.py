@@ -1,18 +1,117 @@
-"""Git helpers — init, detection, .gitignore management."""
+"""Git helpers — init, detection, .gitignore management.
+
+Repository detection, branch/remote lookup and ``git init`` work in-process by
+reading and writing ``.git`` directly: each ``git`` fork costs more than the
+lookup itself, which dominates batch generation and runs on WSL/containers.
+``git`` is only run as a fallback for layouts and configuration the reader does
+not model (include directives, URL rewrites, init templates, SHA-256 and
+reftable repositories, GIT_* environment overrides, non-Linux filesystems), so
+results match what ``git`` reports.
+"""
 
 from __future__ import annotations
 
 import logging
+import os
+import re
+import shutil
 import subprocess
+import sys
+from dataclasses import dataclass
 from pathlib import Path
 
 from jvis.utils.fs import mkdir_p, write_file
 
 logger = logging.getLogger(__name__)
 
+# Environment variables that change repository discovery or configuration.
+_GIT_ENV_OVERRIDES = (
+    "GIT_DIR",
+    "GIT_WORK_TREE",
+    "GIT_COMMON_DIR",
+    "GIT_CEILING_DIRECTORIES",
+    "GIT_DISCOVERY_ACROSS_FILESYSTEM",
+    "GIT_CONFIG",
+    "GIT_CONFIG_COUNT",
+    "GIT_CONFIG_PARAMETERS",
+    "GIT_TEMPLATE_DIR",
+    "GIT_DEFAULT_HASH",
+    "GIT_DEFAULT_REF_FORMAT",
+)
+
+# Repository extensions that change how HEAD, refs and object ids are stored.
+_FORMAT_EXTENSIONS = ("extensions.objectformat", "extensions.refstorage")
+
+# init.* settings that make ``git init`` write a different repository format.
+_INIT_FORMAT_KEYS = ("init.defaultobjectformat", "init.defaultrefformat")
+
+_OBJECT_ID_RE = re.compile(r"[0-9a-f]{40}|[0-9a-f]{64}")
+_SECTION_RE = re.compile(r'\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]')
+_KEY_RE = re.compile(r"[A-Za-z][A-Za-z0-9-]*")
+_ESCAPES = {"n": "\n", "t": "\t", "b": "\b", "\\": "\\", '"': '"'}
+
+# Files written by ``git init`` with the default template (sample hooks omitted).
+_INIT_DIRS = ("branches", "hooks", "info", "objects/info", "objects/pack", "refs/heads", "refs/tags")
+_INIT_DESCRIPTION = "Unnamed repository; edit this file 'description' to name the repository.\n"
+_INIT_EXCLUDE = """\
+# git ls-files --others --exclude-from=.git/info/exclude
+# Lines that start with '#' are comments.
+# For a project mostly in C, the following would be a good set of
+# exclude patterns (uncomment them if you want to use them):
+# *.[oa]
+# *~
+"""
+
+
+class _Unsupported(Exception):
+    """Repository layout or configuration the in-process reader does not handle."""
+
+
+@dataclass(frozen=True)
+class GitRepo:
+    """A repository located by :func:`find_repo`."""
+
+    git_dir: Path  # HEAD lives here (per worktree for linked worktrees)
+    common_dir: Path  # config and refs, shared by all worktrees
+    worktree: Path | None  # None for bare repositories and paths inside the git dir
+
+
+def find_repo(path: Path) -> GitRepo | None:
+    """Return the repository containing *path*, walking up like ``git rev-parse``.
+
+    Understands ``.git`` directories, gitfiles (``gitdir: ...``, used by linked
+    worktrees and submodules) and bare repositories. Discovery stops at
+    filesystem boundaries, as git does. Raises ``_Unsupported`` when git's
+    answer could differ from a plain walk.
+    """
+    if any(name in os.environ for name in _GIT_ENV_OVERRIDES):
+        raise _Unsupported("GIT_* environment overrides are set")
+    if not path.is_dir():
+        return None
+
+    current = path.resolve()
+    device = current.stat().st_dev
+    for directory in (current, *current.parents):
+        if directory.stat().st_dev != device:
+            return None
+        dot_git = directory / ".git"
+        if dot_git.is_file():
+            return _open_repo(_read_gitfile(dot_git), directory)
+        if dot_git.is_dir():
+            if not _is_git_dir(dot_git):
+                raise _Unsupported(f"{dot_git} is not a valid git directory")
+            return _open_repo(dot_git, directory)
+        if _is_git_dir(directory):
+            return _open_repo(directory, None)
+    return None
+
 
 def is_git_repo(path: Path) -> bool:
     """Return True if *path* is inside a git repository."""
+    try:
+        return find_repo(path) is not None
+    except (_Unsupported, OSError) as exc:
+        logger.debug("Falling back to git for repository detection in %s: %s", path, exc)
     try:
         result = subprocess.run(
             ["git", "-C", str(path), "rev-parse", "--is-inside-work-tree"],
@@ -24,9 +123,67 @@ def is_git_repo(path: Path) -> bool:
         return False
 
 
+def current_branch(path: Path) -> str | None:
+    """Return the checked-out branch (``git symbolic-ref --short HEAD``).
+
+    Returns None outside a repository and when HEAD is detached.
+    """
+    try:
+        repo = find_repo(path)
+        if repo is None:
+            return None
+        _check_repo_format(repo)
+        head = (repo.git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if _OBJECT_ID_RE.fullmatch(head):
+            return None
+        if not head.startswith("ref: refs/heads/"):
+            raise _Unsupported(f"unexpected HEAD: {head!r}")
+        branch = head.removeprefix("ref: refs/heads/")
+        if _is_ambiguous(repo, branch):
+            raise _Unsupported(f"{branch!r} is ambiguous; git abbreviates it differently")
+        return branch
+    except (_Unsupported, OSError, UnicodeDecodeError, ValueError) as exc:
+        logger.debug("Falling back to git for the branch in %s: %s", path, exc)
+    return _git_output(path, "symbolic-ref", "--short", "HEAD")
+
+
+def remote_url(path: Path, remote: str = "origin") -> str | None:
+    """Return the URL of *remote* (``git remote get-url``), or None if it is not configured.
+
+    Remotes are read from the repository's own config; repositories that rewrite
+    URLs (``url.<base>.insteadOf``) or include other config files are answered
+    by git.
+    """
+    try:
+        repo = find_repo(path)
+        if repo is None:
+            return None
+        if (repo.common_dir / "remotes" / remote).exists() or (repo.common_dir / "branches" / remote).exists():
+            raise _Unsupported("remote defined in a legacy remotes/ or branches/ file")
+        config = _parse_config((repo.common_dir / "config").read_text(encoding="utf-8"))
+        for key in [*config, *_user_config()]:
+            if key.startswith("url.") and key.endswith("insteadof"):
+                raise _Unsupported("URL rewriting is configured")
+        urls = config.get(f"remote.{remote}.url")
+        return urls[0] if urls else None
+    except (_Unsupported, OSError, UnicodeDecodeError, ValueError) as exc:
+        logger.debug("Falling back to git for remote %r in %s: %s", remote, path, exc)
+    return _git_output(path, "remote", "get-url", remote)
+
+
 def git_init(path: Path) -> bool:
-    """Initialize a git repository at *path*. Returns True on success."""
+    """Initialize a git repository at *path*. Returns True on success.
+
+    Writes the skeleton ``git init`` creates with its default template, minus
+    the sample hooks, probing the filesystem for ``core.filemode``,
+    ``core.symlinks`` and ``core.ignorecase`` the same way git does.
+    """
     mkdir_p(path)
+    try:
+        _init_skeleton(path)
+        return True
+    except (_Unsupported, OSError, UnicodeDecodeError, ValueError) as exc:
+        logger.debug("Falling back to `git init` in %s: %s", path, exc)
     try:
         result = subprocess.run(
             ["git", "init", str(path)],
@@ -38,6 +195,273 @@ def git_init(path: Path) -> bool:
         return False
 
 
+async def git_init_async(path: Path) -> bool:
+    """:func:`git_init` for asyncio callers.
+
+    The in-process skeleton is written on a thread; the ``git init`` fallback
+    runs as a subprocess and is killed if the awaiting task is cancelled.
+    """
+    import asyncio
+
+    await asyncio.to_thread(mkdir_p, path)
+    try:
+        await asyncio.to_thread(_init_skeleton, path)
+        return True
+    except (_Unsupported, OSError, UnicodeDecodeError, ValueError) as exc:
+        logger.debug("Falling back to `git init` in %s: %s", path, exc)
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "git",
+            "init",
+            str(path),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except FileNotFoundError:
+        return False
+    try:
+        return await process.wait() == 0
+    except asyncio.CancelledError:
+        process.kill()
+        await process.wait()
+        raise
+
+
+def _init_skeleton(path: Path) -> None:
+    if not sys.platform.startswith("linux"):
+        raise _Unsupported("git sets platform-specific core.* options outside Linux")
+    if any(name in os.environ for name in _GIT_ENV_OVERRIDES):
+        raise _Unsupported("GIT_* environment overrides are set")
+    git_dir = path / ".git"
+    if git_dir.exists() or git_dir.is_symlink():
+        raise _Unsupported("re-initializing an existing repository")
+    user_config = _user_config()
+    if "init.templatedir" in user_config:
+        raise _Unsupported("init.templateDir is configured")
+    formats = [key for key in _INIT_FORMAT_KEYS if key in user_config]
+    if formats:
+        raise _Unsupported(f"{', '.join(formats)} configured")
+    branch = user_config.get("init.defaultbranch", ["master"])[-1]
+
+    try:
+        for sub in _INIT_DIRS:
+            mkdir_p(git_dir / sub)
+        write_file(git_dir / "HEAD", f"ref: refs/heads/{branch}\n")
+        write_file(git_dir / "description", _INIT_DESCRIPTION)
+        write_file(git_dir / "info" / "exclude", _INIT_EXCLUDE)
+        config = git_dir / "config"
+        config.write_text("", encoding="utf-8")  # probe target; counted once written below
+        core = [
+            "repositoryformatversion = 0",
+            f"filemode = {'true' if _probe_filemode(config) else 'false'}",
+            "bare = false",
+            "logallrefupdates = true",
+        ]
+        if not _probe_symlinks(git_dir):
+            core.append("symlinks = false")
+        if (git_dir / "CoNfIg").exists():
+            core.append("ignorecase = true")
+        write_file(config, "[core]\n" + "".join(f"\t{line}\n" for line in core))
+    except OSError:
+        shutil.rmtree(git_dir, ignore_errors=True)
+        raise
+
+
+def _probe_filemode(path: Path) -> bool:
+    """Return True if the filesystem keeps the executable bit (git's core.filemode probe)."""
+    before = path.lstat().st_mode
+    try:
+        path.chmod(before ^ 0o100)
+        changed = path.lstat().st_mode != before
+    except OSError:
+        return False
+    path.chmod(before)
+    return changed
+
+
+def _probe_symlinks(git_dir: Path) -> bool:
+    probe = git_dir / "tXXXXXX"
+    try:
+        probe.symlink_to("testing")
+    except OSError:
+        return False
+    probe.unlink()
+    return True
+
+
+def _is_git_dir(path: Path) -> bool:
+    """Return True if *path* has the layout git requires of a git directory."""
+    if not (path / "HEAD").is_file():
+        return False
+    return (path / "commondir").is_file() or ((path / "objects").is_dir() and (path / "refs").is_dir())
+
+
+def _read_gitfile(path: Path) -> Path:
+    content = path.read_text(encoding="utf-8").strip()
+    if not content.startswith("gitdir: "):
+        raise _Unsupported(f"{path} is not a gitfile")
+    git_dir = path.parent / content.removeprefix("gitdir: ").strip()
+    if not _is_git_dir(git_dir):
+        raise _Unsupported(f"{path} points to a missing git directory")
+    return git_dir.resolve()
+
+
+def _open_repo(git_dir: Path, worktree: Path | None) -> GitRepo:
+    common_dir = git_dir
+    commondir_file = git_dir / "commondir"
+    if commondir_file.is_file():
+        common_dir = (git_dir / commondir_file.read_text(encoding="utf-8").strip()).resolve()
+    return GitRepo(git_dir=git_dir, common_dir=common_dir, worktree=worktree)
+
+
+def _check_repo_format(repo: GitRepo) -> None:
+    """Raise ``_Unsupported`` for SHA-256 or reftable repositories (``extensions.*`` in the config)."""
+    config_path = repo.common_dir / "config"
+    if not config_path.is_file():
+        return
+    used = [key for key in _FORMAT_EXTENSIONS if key in _parse_config(config_path.read_text(encoding="utf-8"))]
+    if used:
+        raise _Unsupported(f"repository uses {', '.join(used)}")
+
+
+def _is_ambiguous(repo: GitRepo, branch: str) -> bool:
+    """Return True if git would abbreviate ``refs/heads/<branch>`` to more than *branch*."""
+    candidates = [
+        branch,
+        f"refs/{branch}",
+        f"refs/tags/{branch}",
+        f"refs/remotes/{branch}",
+        f"refs/remotes/{branch}/HEAD",
+    ]
+    if any((repo.common_dir / ref).is_file() or (repo.git_dir / ref).is_file() for ref in candidates):
+        return True
+    packed = repo.common_dir / "packed-refs"
+    if packed.is_file():
+        names = {line.split(" ", 1)[1] for line in packed.read_text(encoding="utf-8").splitlines() if " " in line}
+        return any(ref in names for ref in candidates)
+    return False
+
+
+def _user_config() -> dict[str, list[str]]:
+    """Return the system and global git config (what applies outside any repository)."""
+    if any(name in os.environ for name in _GIT_ENV_OVERRIDES):
+        raise _Unsupported("GIT_* environment overrides are set")
+    paths: list[Path] = []
+    if not os.environ.get("GIT_CONFIG_NOSYSTEM"):
+        paths.append(Path(os.environ.get("GIT_CONFIG_SYSTEM", "/etc/gitconfig")))
+    if "GIT_CONFIG_GLOBAL" in os.environ:
+        paths.append(Path(os.environ["GIT_CONFIG_GLOBAL"]))
+    else:
+        xdg = Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config")
+        paths.extend([xdg / "git" / "config", Path.home() / ".gitconfig"])
+
+    merged: dict[str, list[str]] = {}
+    for config_path in paths:
+        if config_path.is_file():
+            for key, values in _parse_config(config_path.read_text(encoding="utf-8")).items():
+                merged.setdefault(key, []).extend(values)
+    return merged
+
+
+def _parse_config(text: str) -> dict[str, list[str]]:
+    """Parse git config syntax into ``{"section.subsection.key": [values...]}``.
+
+    Section and key names are lower-cased, subsection names kept as written,
+    and values unquoted and unescaped. Raises ``ValueError`` on syntax this
+    parser does not accept and ``_Unsupported`` for include directives.
+    """
+    values: dict[str, list[str]] = {}
+    section = ""
+    lines = iter(text.splitlines())
+    for raw in lines:
+        line = raw.strip()
+        if line.startswith("["):
+            match = _SECTION_RE.match(line)
+            if not match:
+                raise ValueError(f"invalid section header: {raw!r}")
+            name, subsection = match.groups()
+            if subsection is not None:
+                section = f"{name.lower()}." + re.sub(r"\\(.)", r"\1", subsection)
+            else:
+                section = name.lower()  # also covers the deprecated [section.subsection] form
+            if section.split(".")[0] in ("include", "includeif"):
+                raise _Unsupported("config includes other files")
+            line = line[match.end() :].strip()
+        if not line or line[0] in "#;":
+            continue
+        if not section:
+            raise ValueError(f"key outside a section: {raw!r}")
+
+        key, has_value, rest = line.partition("=")
+        key = key.strip()
+        if not _KEY_RE.fullmatch(key):
+            raise ValueError(f"invalid key: {raw!r}")
+        value = "true"  # a bare key is boolean true
+        if has_value:
+            while _continues(rest):
+                rest = rest[:-1] + next(lines, "")
+            value = _parse_value(rest)
+        values.setdefault(f"{section}.{key.lower()}", []).append(value)
+    return values
+
+
+def _continues(line: str) -> bool:
+    """Return True if *line* ends with an unescaped backslash (value continues)."""
+    stripped = line.rstrip("\n")
+    return (len(stripped) - len(stripped.rstrip("\\"))) % 2 == 1
+
+
+def _parse_value(raw: str) -> str:
+    """Unquote a config value the way git does (whitespace runs outside quotes kept, ends trimmed)."""
+    out: list[str] = []
+    quoted = False
+    spaces = 0
+    i = 0
+    while i < len(raw):
+        char = raw[i]
+        if not quoted and char in " \t":
+            spaces += 1
+            i += 1
+            continue
+        if not quoted and char in "#;":
+            break
+        if out:
+            out.append(" " * spaces)
+        spaces = 0
+        if char == "\\":
+            escaped = raw[i + 1 : i + 2]
+            if escaped not in _ESCAPES:
+                raise ValueError(f"invalid escape in value: {raw!r}")
+            out.append(_ESCAPES[escaped])
+            i += 2
+            continue
+        if char == '"':
+            quoted = not quoted
+        else:
+            out.append(char)
+        i += 1
+    if quoted:
+        raise ValueError(f"unterminated quote in value: {raw!r}")
+    return "".join(out)
+
+
+def _git_output(path: Path, *args: str) -> str | None:
+    """Run ``git <args>`` in *path*; return its stripped output, or None on failure."""
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=path,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+    except (FileNotFoundError, subprocess.TimeoutExpired, OSError) as exc:
+        logger.debug("git %s failed in %s: %s", " ".join(args), path, exc)
+    return None
+
+
 # Standard .gitignore content for JVIS projects
 _GITIGNORE_SECTIONS: dict[str, str] = {
     "general": """\
@@ -60,6 +484,7 @@ Thumbs.db
     "jvis": """\
 # JVIS internal (optional — track if you want version-controlled agent config)
 # docs/notes/
+.jvis/cache/
 """,
     "python": """\
 # Python
@@ -112,7 +537,19 @@ def setup_git(project_dir: Path, stack_id: str = "") -> None:
     """Initialize git and write a sensible .gitignore for the stack."""
     if not is_git_repo(project_dir):
         git_init(project_dir)
+    write_gitignore(project_dir, _gitignore_sections(stack_id))
 
+
+async def setup_git_async(project_dir: Path, stack_id: str = "") -> None:
+    """:func:`setup_git` for asyncio callers; file work runs on a thread (see :func:`git_init_async`)."""
+    import asyncio
+
+    if not await asyncio.to_thread(is_git_repo, project_dir):
+        await git_init_async(project_dir)
+    await asyncio.to_thread(write_gitignore, project_dir, _gitignore_sections(stack_id))
+
+
+def _gitignore_sections(stack_id: str) -> list[str]:
     sections = ["general", "jvis"]
 
     # Match stack IDs to .gitignore sections using substring checks on the stack ID.
@@ -125,5 +562,4 @@ def setup_git(project_dir: Path, stack_id: str = "") -> None:
         sections.append("node")
     if "rust" in stack_lower or "axum" in stack_lower:
         sections.append("rust")
-
-    write_gitignore(project_dir, sections)
+    return sections
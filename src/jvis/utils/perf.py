@@ -0,0 +1,196 @@
+"""Stage timing — lightweight spans, write counters and exporters.
+
+Instrumentation is off by default: :func:`span` and :func:`record_write` are
+no-ops until :func:`start` installs a :class:`Recorder`. The CLI starts one
+for ``--timings``, ``--profile`` and ``JVIS_TRACE=file.json``.
+
+Usage::
+
+    with perf.span("install_framework"):
+        install_framework(project_dir)
+
+Spans nest per thread; wrap work submitted to a thread pool with :func:`bind`
+to nest it under the submitting thread's span. Files written through
+:mod:`jvis.utils.fs` are counted against every span open on the writing
+thread, so a parent's counters include its children's.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Environment variable naming a file to receive Chrome trace-format events.
+TRACE_ENV = "JVIS_TRACE"
+
+
+@dataclass
+class Span:
+    """One timed stage. ``start`` is seconds since the recorder started."""
+
+    name: str
+    start: float
+    duration: float = 0.0
+    depth: int = 0
+    thread_id: int = 0
+    files: int = 0
+    bytes: int = 0
+
+
+class Recorder:
+    """Collects spans and write counters for a single CLI invocation."""
+
+    def __init__(self) -> None:
+        self.origin = time.perf_counter()
+        self.elapsed = 0.0
+        self.spans: list[Span] = []
+        self.files = 0
+        self.bytes = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self) -> list[Span]:
+        stack: list[Span] | None = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[Span]:
+        """Time the enclosed block as a child of the thread's current span."""
+        stack = self._stack()
+        current = Span(
+            name=name,
+            start=time.perf_counter() - self.origin,
+            depth=len(stack),
+            thread_id=threading.get_ident(),
+        )
+        with self._lock:
+            self.spans.append(current)
+        stack.append(current)
+        try:
+            yield current
+        finally:
+            current.duration = time.perf_counter() - self.origin - current.start
+            stack.pop()
+            logger.debug("%s: %.1fms, %d files, %d bytes", name, current.duration * 1000, current.files, current.bytes)
+
+    def record_write(self, nbytes: int, files: int = 1) -> None:
+        """Attribute a write to every span open on this thread."""
+        with self._lock:
+            self.files += files
+            self.bytes += nbytes
+            for open_span in self._stack():
+                open_span.files += files
+                open_span.bytes += nbytes
+
+    def bind[**P, R](self, fn: Callable[P, R]) -> Callable[P, R]:
+        """Return *fn* wrapped to run under the caller's open spans on another thread."""
+        parents = list(self._stack())
+
+        def run(*args: P.args, **kwargs: P.kwargs) -> R:
+            self._local.stack = list(parents)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                del self._local.stack
+
+        return run
+
+    def stop(self) -> None:
+        """Freeze the total elapsed time."""
+        self.elapsed = time.perf_counter() - self.origin
+
+    def format_table(self) -> str:
+        """Return a plain-text table of spans (indented by depth) with a total row."""
+        total = self.elapsed or (time.perf_counter() - self.origin)
+        rows = [("  " * s.depth + s.name, s.duration, s.files, s.bytes) for s in self.spans]
+        rows.append(("total", total, self.files, self.bytes))
+        width = max(len(r[0]) for r in rows)
+        lines = [f"  {'stage':<{width}}  {'ms':>9}  {'%':>5}  {'files':>6}  {'bytes':>10}"]
+        for label, duration, files, nbytes in rows:
+            share = duration / total * 100 if total else 0.0
+            lines.append(f"  {label:<{width}}  {duration * 1000:9.1f}  {share:5.1f}  {files:6d}  {nbytes:10d}")
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Return spans as Chrome trace-format complete events (``chrome://tracing``, Perfetto)."""
+        pid = os.getpid()
+        events = [
+            {
+                "name": s.name,
+                "cat": "jvis",
+                "ph": "X",
+                "ts": round(s.start * 1_000_000, 3),
+                "dur": round(s.duration * 1_000_000, 3),
+                "pid": pid,
+                "tid": s.thread_id,
+                "args": {"files": s.files, "bytes": s.bytes},
+            }
+            for s in self.spans
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write :meth:`chrome_trace` as JSON to *path*."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.chrome_trace(), indent=1) + "\n", encoding="utf-8")
+
+
+_recorder: Recorder | None = None
+
+
+def start() -> Recorder:
+    """Install a fresh recorder; subsequent spans and writes are recorded."""
+    global _recorder
+    _recorder = Recorder()
+    return _recorder
+
+
+def stop() -> Recorder | None:
+    """Uninstall and return the active recorder (``None`` if none was started)."""
+    global _recorder
+    recorder, _recorder = _recorder, None
+    if recorder is not None:
+        recorder.stop()
+    return recorder
+
+
+def is_recording() -> bool:
+    """Return True while a recorder is installed."""
+    return _recorder is not None
+
+
+def span(name: str) -> AbstractContextManager[Span | None]:
+    """Time the enclosed block when recording; otherwise a no-op."""
+    if _recorder is None:
+        return nullcontext()
+    return _recorder.span(name)
+
+
+def bind[**P, R](fn: Callable[P, R]) -> Callable[P, R]:
+    """Wrap *fn* for a worker thread so its spans nest under the caller's (no-op when not recording)."""
+    if _recorder is None:
+        return fn
+    return _recorder.bind(fn)
+
+
+def record_write(path: Path) -> None:
+    """Count *path* (just written) toward the open spans when recording."""
+    if _recorder is None:
+        return
+    try:
+        nbytes = path.stat().st_size
+    except OSError:
+        nbytes = 0
+    _recorder.record_write(nbytes)
@@ -0,0 +1,15 @@
+"""Token estimates for documents loaded into agent context.
+
+JVIS has no tokenizer dependency. Four characters per token is the usual
+rule of thumb for English prose and Markdown and is close enough for
+budgeting which files an agent should load.
+"""
+
+from __future__ import annotations
+
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Return the estimated token count of *text* (0 for empty text)."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
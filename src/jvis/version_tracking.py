@@ -1,28 +1,41 @@
 """Version provenance tracking for JVIS target projects.
 
-Stamps the JVIS version, install source, and timestamp into target
-project config so ``jvis update`` can detect staleness.
+Stamps the JVIS version, install source, timestamp and framework content
+hash into ``.jvis/provenance.json`` (written atomically) so ``jvis update``
+and fleet tooling can detect staleness with one small JSON read. The same
+keys are mirrored into ``.jvis/core-config.yaml`` for older tooling, and
+read from there when a project predates ``provenance.json``.
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+from jvis.utils.fs import write_file_atomic
+
 logger = logging.getLogger(__name__)
 
+PROVENANCE_FILE = Path(".jvis") / "provenance.json"
+
 _PROVENANCE_SECTION = "# --- JVIS Provenance (auto-managed, do not edit) ---"
 _PROVENANCE_KEYS = ("jvis_installed_version", "jvis_source", "jvis_installed_at")
+_FRAMEWORK_HASH_KEY = "jvis_framework_hash"
 
 
-def stamp_version(target: Path, version: str, source: str) -> None:
-    """Write version provenance into the target project's core-config.yaml.
+def stamp_version(target: Path, version: str, source: str, framework_hash: str = "") -> None:
+    """Write version provenance into the target project's provenance.json and core-config.yaml.
 
-    Uses text manipulation (not yaml.dump) to preserve comments.
-    If provenance keys already exist, replaces them; otherwise appends a
-    marked section at the end of the file.
+    Uses text manipulation (not yaml.dump) on core-config.yaml to preserve
+    comments. If provenance keys already exist, replaces them; otherwise
+    appends a marked section at the end of the file. *framework_hash* is
+    the :attr:`~jvis.scaffold.framework.FrameworkSnapshot.digest` of the
+    installed framework (recorded in provenance.json only).
     """
     config_path = target / ".jvis" / "core-config.yaml"
     if not config_path.is_file():
@@ -54,16 +67,29 @@ def stamp_version(target: Path, version: str, source: str) -> None:
             content += "\n"
         content += f"\n{_PROVENANCE_SECTION}\n" + "\n".join(new_lines) + "\n"
 
-    config_path.write_text(content)
+    record = dict(zip(_PROVENANCE_KEYS, (version, source, timestamp), strict=True))
+    if framework_hash:
+        record[_FRAMEWORK_HASH_KEY] = framework_hash
+    write_file_atomic(target / PROVENANCE_FILE, json.dumps(record, indent=2) + "\n")
+    write_file_atomic(config_path, content)
     logger.info("Stamped version %s (%s) into %s", version, source, config_path)
 
 
 def read_provenance(target: Path) -> dict[str, str]:
-    """Read version provenance from a target project's core-config.yaml.
+    """Read version provenance for a target project.
 
     Returns a dict with keys ``jvis_installed_version``, ``jvis_source``,
-    ``jvis_installed_at``.  Missing keys are omitted.
+    ``jvis_installed_at`` and, when recorded, ``jvis_framework_hash``.
+    Missing keys are omitted. Reads ``.jvis/provenance.json``, falling back
+    to scanning core-config.yaml for projects stamped before it existed.
     """
+    try:
+        data = json.loads((target / PROVENANCE_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        data = None
+    if isinstance(data, dict):
+        return {k: str(v) for k, v in data.items() if k in (*_PROVENANCE_KEYS, _FRAMEWORK_HASH_KEY)}
+
     config_path = target / ".jvis" / "core-config.yaml"
     result: dict[str, str] = {}
     if not config_path.is_file():
@@ -78,6 +104,19 @@ def read_provenance(target: Path) -> dict[str, str]:
     return result
 
 
+def read_provenance_many(targets: list[Path], max_workers: int | None = None) -> dict[Path, dict[str, str]]:
+    """Read provenance for many projects concurrently (I/O bound, so threads).
+
+    Returns ``{target: provenance}`` in the order of *targets*; unreadable
+    projects map to an empty dict, as with :func:`read_provenance`.
+    """
+    if not targets:
+        return {}
+    workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jvis-provenance") as pool:
+        return dict(zip(targets, pool.map(read_provenance, targets), strict=True))
+
+
 def detect_source_mode() -> str:
     """Return ``"dev"`` if running from a git checkout, ``"pip"`` if installed.
 
@@ -0,0 +1 @@
+"""Workflow graphs — compile ``.jvis/workflows/*.yaml`` sequences into validated DAGs."""
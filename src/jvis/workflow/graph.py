@@ -0,0 +1,337 @@
+"""Compile workflow YAMLs into step graphs, validate them and compute the next runnable steps.
+
+Each ``sequence`` entry becomes a step. ``creates`` and ``validates`` make a
+step the producer of an artifact; ``requires`` adds an edge from every
+producer of that artifact to the step. ``updates`` refine an existing
+artifact and add no edge (otherwise "pm updates prd.md after architecture"
+would close a cycle through the architect step).
+
+Artifact names are normalized: parentheticals are dropped
+(``v0_prompt (optional)``), ``a_or_b`` means either, and free text such as
+``multiple documents per the document-project template`` is ignored.
+Requirements named ``existing_*`` describe the existing codebase in
+brownfield workflows and need no producer.
+
+Compiled graphs are cached in ``.jvis/cache/workflow-graphs.json`` keyed by
+the SHA-256 of the workflow file, so unchanged workflows are never re-parsed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from jvis.journey.artifacts import ArtifactIndex
+from jvis.utils.fs import write_file_atomic
+
+logger = logging.getLogger(__name__)
+
+WORKFLOWS_DIR = Path(".jvis") / "workflows"
+CACHE_PATH = Path(".jvis") / "cache" / "workflow-graphs.json"
+_CACHE_VERSION = 1
+
+# Requirement names that refer to another step's product under a different name.
+_ALIASES = {"all_artifacts_in_project": "all_artifacts"}
+
+# Where symbolic artifacts show up under docs/ (directories count when they hold a file).
+_DOC_LOCATIONS: dict[str, tuple[str, ...]] = {
+    "story.md": ("docs/stories/",),
+    "sharded_docs": ("docs/prd/", "docs/architecture/"),
+}
+
+_PARENTHETICAL = re.compile(r"\s*\(.*\)\s*$")
+
+
+@dataclass
+class WorkflowStep:
+    index: int
+    id: str
+    agent: str = ""
+    action: str = ""
+    creates: list[str] = field(default_factory=list)
+    requires: list[list[str]] = field(default_factory=list)  # each entry: alternatives, any one suffices
+    updates: list[str] = field(default_factory=list)
+    condition: str = ""
+    optional: bool = False
+    repeats: str = ""
+
+
+@dataclass
+class WorkflowGraph:
+    id: str
+    name: str
+    type: str
+    source: str
+    sha256: str
+    steps: list[WorkflowStep] = field(default_factory=list)
+    edges: list[tuple[int, int]] = field(default_factory=list)  # (producer index, consumer index)
+    missing: list[dict[str, str]] = field(default_factory=list)  # requirements nothing produces
+    cycles: list[list[str]] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        return not self.missing and not self.cycles
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> WorkflowGraph:
+        steps = [WorkflowStep(**step) for step in data.get("steps", [])]
+        edges = [(a, b) for a, b in data.get("edges", [])]
+        return cls(**{**data, "steps": steps, "edges": edges})
+
+
+@dataclass
+class NextSteps:
+    """Steps whose requirements are met and whose outputs are not in docs/ yet."""
+
+    workflow: str
+    runnable: list[WorkflowStep]
+    done: list[str]
+    present: list[str]
+
+
+# ---------------------------------------------------------------------------
+# Compilation
+# ---------------------------------------------------------------------------
+
+
+def compile_workflow(text: str, source: str = "") -> WorkflowGraph:
+    """Compile one workflow document (YAML text) into a validated graph."""
+    doc = (yaml.safe_load(text) or {}).get("workflow") or {}
+    steps: list[WorkflowStep] = []
+    seen: dict[str, int] = {}
+    for raw in doc.get("sequence") or []:
+        if not isinstance(raw, dict):
+            continue
+        step = _parse_step(len(steps), raw)
+        seen[step.id] = seen.get(step.id, 0) + 1
+        if seen[step.id] > 1:
+            step.id = f"{step.id}#{seen[step.id]}"
+        steps.append(step)
+
+    producers: dict[str, list[int]] = {}
+    refiners: set[str] = set()
+    for step in steps:
+        for name in step.creates:
+            producers.setdefault(name, []).append(step.index)
+        refiners.update(step.updates)
+
+    edges: set[tuple[int, int]] = set()
+    missing: list[dict[str, str]] = []
+    for step in steps:
+        for alternatives in step.requires:
+            found = [p for alt in alternatives for p in producers.get(alt, [])]
+            edges.update((p, step.index) for p in found if p != step.index)
+            if not found and not any(alt.startswith("existing_") or alt in refiners for alt in alternatives):
+                missing.append({"step": step.id, "artifact": " or ".join(alternatives)})
+
+    graph = WorkflowGraph(
+        id=doc.get("id", Path(source).stem),
+        name=doc.get("name", ""),
+        type=doc.get("type", ""),
+        source=source,
+        sha256=hashlib.sha256(text.encode("utf-8")).hexdigest(),
+        steps=steps,
+        edges=sorted(edges),
+        missing=missing,
+    )
+    graph.cycles = _find_cycles(graph)
+    return graph
+
+
+def _parse_step(index: int, raw: dict[str, Any]) -> WorkflowStep:
+    agent = str(raw.get("agent", ""))
+    action = str(raw.get("action", ""))
+    creates = _names(raw.get("creates"))
+    validates = _names(raw.get("validates"))
+    updates = _names(raw.get("updates"))
+    label = raw.get("step") or action or (creates or validates or updates or ["step"])[0]
+    return WorkflowStep(
+        index=index,
+        id=f"{agent}:{label}" if agent and not raw.get("step") else str(label),
+        agent=agent,
+        action=action or (f"validate {' '.join(validates)}" if validates else ""),
+        creates=creates + validates,
+        requires=[_alternatives(name) for name in _names(raw.get("requires"))],
+        updates=updates,
+        condition=str(raw.get("condition", "")),
+        optional=bool(raw.get("optional", False)),
+        repeats=str(raw.get("repeats", "")),
+    )
+
+
+def _names(value: Any) -> list[str]:
+    """Normalize a creates/requires/updates value to artifact names, dropping free text."""
+    items = value if isinstance(value, list) else [value] if value else []
+    names = []
+    for item in items:
+        name = _PARENTHETICAL.sub("", str(item)).strip()
+        if name and not any(ch.isspace() for ch in name):
+            names.append(_ALIASES.get(name, name))
+    return names
+
+
+def _alternatives(name: str) -> list[str]:
+    return [_ALIASES.get(alt, alt) for alt in name.split("_or_")]
+
+
+def _find_cycles(graph: WorkflowGraph) -> list[list[str]]:
+    """Return each dependency cycle once, as a list of step ids."""
+    adjacency: dict[int, list[int]] = {}
+    for a, b in graph.edges:
+        adjacency.setdefault(a, []).append(b)
+
+    white, grey, black = 0, 1, 2
+    color = dict.fromkeys(range(len(graph.steps)), white)
+    stack: list[int] = []
+    cycles: list[list[str]] = []
+
+    def visit(node: int) -> None:
+        color[node] = grey
+        stack.append(node)
+        for nxt in adjacency.get(node, []):
+            if color[nxt] == grey:
+                cycle = stack[stack.index(nxt) :]
+                cycles.append([graph.steps[i].id for i in cycle])
+            elif color[nxt] == white:
+                visit(nxt)
+        stack.pop()
+        color[node] = black
+
+    for node in range(len(graph.steps)):
+        if color[node] == white:
+            visit(node)
+    return cycles
+
+
+# ---------------------------------------------------------------------------
+# Loading (with hash-keyed cache)
+# ---------------------------------------------------------------------------
+
+
+def workflows_dir(project: Path) -> Path:
+    """Return the project's workflows directory, falling back to the framework source."""
+    from jvis.utils.paths import get_jvis_home
+
+    local = project / WORKFLOWS_DIR
+    return local if local.is_dir() else get_jvis_home() / WORKFLOWS_DIR
+
+
+def load_workflows(project: Path) -> list[WorkflowGraph]:
+    """Compile every workflow for *project*, reusing cached graphs for unchanged files."""
+    directory = workflows_dir(project)
+    cache_file = project / CACHE_PATH
+    cached = _read_cache(cache_file)
+    graphs: dict[str, dict[str, Any]] = {}
+    result: list[WorkflowGraph] = []
+    for path in sorted(directory.glob("*.yaml")):
+        text = path.read_text(encoding="utf-8")
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        entry = cached.get(digest)
+        if entry is not None:
+            graph = WorkflowGraph.from_dict(entry)
+        else:
+            graph = compile_workflow(text, source=path.name)
+            logger.debug("Compiled workflow %s (%d steps)", path.name, len(graph.steps))
+        graph.source = path.name
+        graphs[digest] = graph.to_dict()
+        result.append(graph)
+    if graphs != cached:
+        _write_cache(project, cache_file, graphs)
+    return result
+
+
+def _read_cache(path: Path) -> dict[str, dict[str, Any]]:
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if raw.get("version") != _CACHE_VERSION:
+        return {}
+    graphs: dict[str, dict[str, Any]] = raw.get("graphs", {})
+    return graphs
+
+
+def _write_cache(project: Path, path: Path, graphs: dict[str, dict[str, Any]]) -> None:
+    if not (project / ".jvis").is_dir():
+        return
+    try:
+        write_file_atomic(path, json.dumps({"version": _CACHE_VERSION, "graphs": graphs}))
+    except OSError as exc:
+        logger.debug("Cannot write workflow cache %s: %s", path, exc)
+
+
+# ---------------------------------------------------------------------------
+# Next runnable steps
+# ---------------------------------------------------------------------------
+
+
+def present_artifacts(index: ArtifactIndex, names: set[str]) -> set[str]:
+    """Return which artifact *names* exist under docs/ according to *index*."""
+    basenames = {rel.rsplit("/", 1)[-1] for rel, (_, size) in index.files.items() if size > 0}
+    found = set()
+    for name in names:
+        locations = _DOC_LOCATIONS.get(name, ())
+        if any(index.files_under(loc) for loc in locations) or "." in name and name in basenames:
+            found.add(name)
+    return found
+
+
+def next_steps(graph: WorkflowGraph, present: set[str]) -> NextSteps:
+    """Compute the runnable steps of *graph* given the artifacts already *present*.
+
+    A step is done when all its outputs are present, or once any later step
+    is done (the sequence has moved past it). A step is runnable when it is
+    not done and each requirement is present, produced by a done step or
+    external (``existing_*``). Steps without requirements follow the
+    sequence instead: they wait until the step before them is done, or is
+    conditional/optional and itself reachable.
+    """
+    done = [bool(step.creates) and all(name in present for name in step.creates) for step in graph.steps]
+    later_done = False
+    for i in range(len(graph.steps) - 1, -1, -1):
+        later_done = later_done or done[i]
+        done[i] = later_done
+
+    available = set(present)
+    for step, is_done in zip(graph.steps, done, strict=True):
+        if is_done:
+            available.update(step.creates)
+            available.update(step.updates)
+
+    runnable = []
+    settled = True  # whether the sequence has reached the current step
+    for i, step in enumerate(graph.steps):
+        if step.requires:
+            ready = all(any(alt in available or alt.startswith("existing_") for alt in alts) for alts in step.requires)
+        else:
+            ready = settled
+        if not done[i] and ready:
+            runnable.append(step)
+        settled = done[i] or (ready and bool(step.optional or step.condition))
+
+    return NextSteps(
+        workflow=graph.id,
+        runnable=runnable,
+        done=[step.id for step, is_done in zip(graph.steps, done, strict=True) if is_done],
+        present=sorted(present),
+    )
+
+
+def workflow_next(project: Path, graph: WorkflowGraph) -> NextSteps:
+    """Refresh the shared artifact index for *project* and compute *graph*'s next steps."""
+    index = ArtifactIndex.load(project)
+    index.refresh()
+    index.save()
+    names = {name for step in graph.steps for name in step.creates}
+    names |= {alt for step in graph.steps for alts in step.requires for alt in alts}
+    return next_steps(graph, present_artifacts(index, names))
@@ -0,0 +1,105 @@
+"""Agent engine token accounting — size estimates, max_tokens budgets and section growth.
+
+Run with: pytest tests/integration/test_engine_tokens.py -v
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+ENGINE_DIR = PROJECT_ROOT / ".jvis" / "agent-engine"
+
+sys.path.insert(0, str(ENGINE_DIR))
+engine_extras = pytest.importorskip("engine_extras")
+
+from engine import load_agent_config, render_agent  # noqa: E402
+from engine_extras import (  # noqa: E402
+    OutputSize,
+    estimate_tokens,
+    measure_agent,
+    section_growth,
+    section_tokens,
+    token_report,
+    validate_config,
+)
+
+
+@pytest.fixture
+def tokens_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cache = tmp_path / "cache" / "agent-tokens.json"
+    monkeypatch.setattr(engine_extras, "TOKENS_CACHE", cache)
+    return cache
+
+
+class TestEstimate:
+    def test_rounds_up(self) -> None:
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd") == 1
+        assert estimate_tokens("abcde") == 2
+
+    def test_sections(self) -> None:
+        text = "---\ndescription: x\n---\nintro\n# Title\n## Role\nabc\n### Sub\n```\n## not a heading\n```\n## Role\n"
+        sections = section_tokens(text)
+        assert list(sections) == ["(frontmatter)", "(preamble)", "# Title", "## Role", "## Role (2)"]
+        assert sections["## Role"] == estimate_tokens("## Role\nabc\n### Sub\n```\n## not a heading\n```\n")
+
+    def test_render_matches_config(self) -> None:
+        config = load_agent_config("dev")
+        size = measure_agent("dev", config, "cursor")
+        assert size.tokens == estimate_tokens(render_agent("dev", config, "cursor")) > 0
+        assert "## Role" in size.sections
+        assert "platform_meta" in config  # rendering does not modify the config
+
+
+class TestBudget:
+    def test_over_budget_fails_validation(self, monkeypatch: pytest.MonkeyPatch, capsys) -> None:
+        config = load_agent_config("dev")
+        monkeypatch.setattr(engine_extras, "load_agent_config", lambda _agent_id: {**config, "max_tokens": 10})
+        assert not validate_config("dev", check_deps=False)
+        assert "over max_tokens 10" in capsys.readouterr().out
+
+        monkeypatch.setattr(engine_extras, "load_agent_config", lambda _agent_id: {**config, "max_tokens": 100_000})
+        assert validate_config("dev", check_deps=False)
+
+    def test_schema_rejects_non_positive_budget(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        config = load_agent_config("dev")
+        monkeypatch.setattr(engine_extras, "load_agent_config", lambda _agent_id: {**config, "max_tokens": 0})
+        assert not validate_config("dev", check_deps=False)
+
+
+class TestGrowth:
+    def test_grown_sections_only(self) -> None:
+        previous = {"outputs": {"dev/cursor": {"tokens": 30, "sections": {"## Role": 10, "## Focus": 20}}}}
+        sizes = [
+            OutputSize("dev", "core", "cursor", 0, 0, 0, {"## Role": 15, "## Focus": 5, "## New": 3}),
+            OutputSize("qa", "core", "cursor", 0, 0, 0, {"## Role": 1}),
+        ]
+        grown = [(g.output, g.section, g.before, g.after) for g in section_growth(previous, sizes)]
+        assert grown == [
+            ("dev/cursor", "## Role", 10, 15),
+            ("dev/cursor", "## New", 0, 3),
+            ("qa/cursor", "## Role", 0, 1),
+        ]
+
+    def test_report_records_and_diffs_runs(self, tokens_cache: Path, monkeypatch: pytest.MonkeyPatch, capsys) -> None:
+        token_report("json", show_diff=True)
+        first = json.loads(capsys.readouterr().out)
+        assert first["diff"] == {"since": None, "grown": []}
+        assert "dev" in {agent["id"] for agent in first["agents"]}
+        assert tokens_cache.exists()
+
+        real_render = engine_extras.render_agent
+
+        def bigger(agent_id: str, config: dict, platform: str) -> str:
+            return real_render(agent_id, config, platform) + "\n## Extra\n" + "x" * 400
+
+        monkeypatch.setattr(engine_extras, "render_agent", bigger)
+        token_report("text", show_diff=True)
+        out = capsys.readouterr().out
+        assert "SECTIONS THAT GREW SINCE THE LAST RUN" in out
+        assert "## Extra" in out and "Net change: +" in out
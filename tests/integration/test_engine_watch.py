@@ -0,0 +1,148 @@
+"""Agent engine watch mode — change detection, debouncing and output planning.
+
+Run with: pytest tests/integration/test_engine_watch.py -v
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+ENGINE_DIR = PROJECT_ROOT / ".jvis" / "agent-engine"
+
+sys.path.insert(0, str(ENGINE_DIR))
+engine_watch = pytest.importorskip("engine_watch")
+
+from engine import AGENTS_DIR, DEPS_DIRS, PLATFORM_DIR, TEMPLATES_DIR  # noqa: E402
+from engine_watch import (  # noqa: E402
+    AgentIndex,
+    Change,
+    PollingWatcher,
+    affected_outputs,
+    coalesce,
+    collect,
+    plan,
+)
+
+PLATFORMS = ["claude", "cursor"]
+
+
+@pytest.fixture(scope="module")
+def index() -> AgentIndex:
+    return AgentIndex()
+
+
+class TestCoalesce:
+    def test_net_effect_per_path(self, tmp_path: Path) -> None:
+        a, b, c, d = (tmp_path / name for name in "abcd")
+        changes = [
+            Change(a, "added"),
+            Change(a, "modified"),
+            Change(b, "added"),
+            Change(b, "removed"),
+            Change(c, "removed"),
+            Change(c, "added"),
+            Change(d, "modified"),
+            Change(d, "removed"),
+        ]
+        assert coalesce(changes) == [Change(a, "added"), Change(c, "modified"), Change(d, "removed")]
+
+    def test_collect_debounces_a_burst(self, tmp_path: Path) -> None:
+        class FakeWatcher:
+            backend = "fake"
+
+            def __init__(self) -> None:
+                self.batches = [[], [Change(tmp_path / "a", "added")], [Change(tmp_path / "a", "modified")], []]
+
+            def read(self, timeout: float | None) -> list[Change]:
+                return self.batches.pop(0)
+
+            def close(self) -> None:
+                pass
+
+        assert collect(FakeWatcher(), debounce=0.01) == [Change(tmp_path / "a", "added")]
+
+
+class TestAffectedOutputs:
+    def test_agent_config(self, index: AgentIndex) -> None:
+        change = Change(AGENTS_DIR / "core" / "dev.yaml", "modified")
+        assert affected_outputs(change, index, PLATFORMS) == {("dev", "claude"), ("dev", "cursor")}
+        assert affected_outputs(Change(change.path, "removed"), index, PLATFORMS) == set()
+
+    def test_platform_template_only_touches_its_platform(self, index: AgentIndex) -> None:
+        outputs = affected_outputs(Change(TEMPLATES_DIR / "cursor.md", "modified"), index, PLATFORMS)
+        assert {plat for _, plat in outputs} == {"cursor"}
+        assert {agent for agent, _ in outputs} == set(index.configs)
+
+    def test_shared_template_touches_every_platform(self, index: AgentIndex) -> None:
+        outputs = affected_outputs(Change(TEMPLATES_DIR / "_partial.md", "modified"), index, PLATFORMS)
+        assert len(outputs) == len(index.configs) * len(PLATFORMS)
+
+    def test_extras(self, index: AgentIndex) -> None:
+        change = Change(PLATFORM_DIR / "cursor" / "qa-extras.md", "added")
+        assert affected_outputs(change, index, PLATFORMS) == {("qa", "cursor")}
+        assert affected_outputs(change, index, ["claude"]) == set()
+
+    def test_dependency_added_or_removed(self, index: AgentIndex) -> None:
+        dep = DEPS_DIRS["tasks"] / "develop-story.md"  # listed by dev
+        added = affected_outputs(Change(dep, "added"), index, ["claude"])
+        assert ("dev", "claude") in added
+        assert affected_outputs(Change(dep, "modified"), index, ["claude"]) == set()
+
+    def test_plan_skips_drafts(self, index: AgentIndex, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setitem(index.configs, "dev", {**index.configs["dev"], "status": "draft"})
+        monkeypatch.setattr(index, "refresh", lambda _agent_id: None)
+        changes = [
+            Change(AGENTS_DIR / "core" / "dev.yaml", "modified"),
+            Change(AGENTS_DIR / "core" / "qa.yaml", "modified"),
+        ]
+        assert plan(changes, index, PLATFORMS) == [("qa", "claude"), ("qa", "cursor")]
+        assert ("dev", "claude") in plan(changes, index, PLATFORMS, include_drafts=True)
+
+
+def _wait_for(watcher, predicate, timeout: float = 3.0) -> list[Change]:
+    seen: list[Change] = []
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        seen.extend(watcher.read(0.1))
+        if predicate(coalesce(seen)):
+            break
+    return coalesce(seen)
+
+
+class TestWatchers:
+    def _exercise(self, watcher, root: Path) -> None:
+        target = root / "agents" / "x.yaml"
+        target.write_text("id: x\n")
+        assert Change(target, "added") in _wait_for(watcher, lambda c: Change(target, "added") in c)
+
+        target.write_text("id: x\nstatus: active\n")
+        assert Change(target, "modified") in _wait_for(watcher, lambda c: Change(target, "modified") in c)
+
+        nested = root / "agents" / "new-pack"
+        nested.mkdir()
+        (nested / "y.yaml").write_text("id: y\n")
+        assert Change(nested / "y.yaml", "added") in _wait_for(
+            watcher, lambda c: Change(nested / "y.yaml", "added") in c
+        )
+
+        target.unlink()
+        assert Change(target, "removed") in _wait_for(watcher, lambda c: Change(target, "removed") in c)
+
+    def test_polling(self, tmp_path: Path) -> None:
+        (tmp_path / "agents").mkdir()
+        watcher = PollingWatcher([tmp_path / "agents"], interval=0.02)
+        self._exercise(watcher, tmp_path)
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_inotify(self, tmp_path: Path) -> None:
+        watcher = engine_watch.InotifyWatcher([tmp_path / "agents"])  # created after the watch starts
+        try:
+            (tmp_path / "agents").mkdir()
+            self._exercise(watcher, tmp_path)
+        finally:
+            watcher.close()
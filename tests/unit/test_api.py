@@ -0,0 +1,215 @@
+"""Tests for jvis.api — the async scaffold pipeline behind ``jvis new``."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from jvis.api import ProgressEvent, _Pipeline, scaffold
+from jvis.commands.primary import ProjectConfig
+from jvis.stacks.registry import StackInfo, get_stack
+
+
+def _config(tmp_path: Path, stack_id: str = "python-fastapi") -> ProjectConfig:
+    return ProjectConfig(
+        project_name="proj",
+        project_description="",
+        project_dir=tmp_path / "proj",
+        project_type="single",
+        stacks={"stack": get_stack(stack_id), "backend": None, "frontend": None, "mobile": None},
+        database="postgresql",
+    )
+
+
+def _scaffold_monorepo(config: ProjectConfig) -> None:
+    """Run only the monorepo stage, printing progress the way ``jvis new`` does."""
+
+    async def main() -> None:
+        await _Pipeline(config, lambda event: print(f"  {event.message}")).monorepo()
+
+    asyncio.run(main())
+
+
+class TestScaffold:
+    async def test_progress_events_and_report(self, tmp_path: Path) -> None:
+        events: list[ProgressEvent] = []
+
+        async def on_progress(event: ProgressEvent) -> None:
+            events.append(event)
+
+        config = _config(tmp_path)
+        report = await scaffold(config, on_progress=on_progress)
+
+        assert [e.step for e in events] == [
+            "project",
+            "scaffold",
+            "install_framework",
+            "docs_structure",
+            "context_map",
+            "shared_files",
+            "git",
+        ]
+        assert events[1].message == "Creating Python FastAPI + Clean Architecture structure..."
+        assert [e.elapsed_ms for e in events] == sorted(e.elapsed_ms for e in events)
+        assert {"run_stack[python-fastapi]", "install_framework", "stamp_version", "git"} <= report.stages.keys()
+        assert report.elapsed_ms >= max(report.stages.values())
+        assert (config.project_dir / ".git").is_dir()
+        assert (config.project_dir / "docs" / "notes" / "context-map.md").is_file()
+
+    async def test_event_loop_not_blocked(self, tmp_path: Path) -> None:
+        def slow_run_stack(stack, target_dir, *args):
+            time.sleep(0.3)
+
+        ticks = 0
+
+        async def heartbeat() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        beat = asyncio.create_task(heartbeat())
+        with patch("jvis.scaffold.stack_runner.run_stack", slow_run_stack):
+            await scaffold(_config(tmp_path))
+        beat.cancel()
+        assert ticks >= 10
+
+    async def test_cancel_removes_created_project(self, tmp_path: Path) -> None:
+        config = _config(tmp_path)
+
+        def on_progress(event: ProgressEvent) -> None:
+            if event.step == "docs_structure":
+                task.cancel()
+
+        task = asyncio.create_task(scaffold(config, on_progress=on_progress))
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not config.project_dir.exists()
+
+    async def test_cancel_waits_for_running_stage_and_keeps_existing_dir(self, tmp_path: Path) -> None:
+        started, finished = threading.Event(), threading.Event()
+
+        def slow_run_stack(stack, target_dir, *args):
+            started.set()
+            time.sleep(0.2)
+            (target_dir / "rendered").write_text("")
+            finished.set()
+
+        config = _config(tmp_path)
+        config.project_dir.mkdir()
+        with patch("jvis.scaffold.stack_runner.run_stack", slow_run_stack):
+            task = asyncio.create_task(scaffold(config))
+            await asyncio.to_thread(started.wait, 5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        assert finished.is_set()  # the stage ran to completion before the cancellation surfaced
+        assert (config.project_dir / "rendered").is_file()
+        assert not (config.project_dir / ".jvis").exists()  # later stages never started
+
+    async def test_stage_error_propagates(self, tmp_path: Path) -> None:
+        with (
+            patch("jvis.scaffold.stack_runner.run_stack", side_effect=RuntimeError("render failed")),
+            pytest.raises(RuntimeError, match="render failed"),
+        ):
+            await scaffold(_config(tmp_path))
+
+
+class TestScaffoldMonorepo:
+    """The monorepo stage renders sub-stacks concurrently with ordered output."""
+
+    def _make_config(self, tmp_path: Path, mobile: StackInfo | None = None) -> ProjectConfig:
+        config = ProjectConfig(
+            project_name="mono",
+            project_description="",
+            project_dir=tmp_path / "mono",
+            project_type="fullstack-mobile" if mobile else "fullstack",
+            stacks={
+                "stack": None,
+                "backend": get_stack("python-fastapi"),
+                "frontend": get_stack("react-vite"),
+                "mobile": mobile,
+            },
+            database="postgresql",
+        )
+        config.project_dir.mkdir(parents=True)
+        return config
+
+    def _mobile(self, directory: Path | None) -> StackInfo:
+        return StackInfo(
+            id="react-native-expo",
+            name="React Native (Expo)",
+            description="",
+            type="mobile",
+            language="",
+            framework="",
+            directory=directory,
+        )
+
+    def test_renders_each_stack_into_its_root(self, tmp_path: Path):
+        config = self._make_config(tmp_path)
+        _scaffold_monorepo(config)
+        assert (config.project_dir / "server" / "src" / "main.py").is_file()
+        assert (config.project_dir / "client" / "package.json").is_file()
+        assert (config.project_dir / "docker-compose.yaml").is_file()
+
+    def test_stacks_run_concurrently(self, tmp_path: Path):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_run_stack(stack, target_dir, *args):
+            barrier.wait()  # deadlocks (BrokenBarrierError) unless all three run at once
+            target_dir.mkdir(parents=True, exist_ok=True)
+
+        config = self._make_config(tmp_path, mobile=self._mobile(get_stack("react-vite").directory))
+        with patch("jvis.scaffold.stack_runner.run_stack", fake_run_stack):
+            _scaffold_monorepo(config)
+
+    def test_logs_replayed_in_stack_order(self, tmp_path: Path, capsys, caplog):
+        def fake_run_stack(stack, target_dir, *args):
+            # The backend finishes last, but its output must still come first.
+            time.sleep(0.2 if stack.type == "backend" else 0)
+            logging.getLogger("jvis.scaffold.stack_runner").warning("rendered %s", stack.id)
+
+        config = self._make_config(tmp_path)
+        with (
+            caplog.at_level(logging.WARNING, logger="jvis"),
+            patch("jvis.scaffold.stack_runner.run_stack", fake_run_stack),
+        ):
+            _scaffold_monorepo(config)
+
+        assert [r.getMessage() for r in caplog.records] == ["rendered python-fastapi", "rendered react-vite"]
+        out = capsys.readouterr().out
+        assert out.index("Creating backend") < out.index("Creating frontend")
+
+    def test_mobile_stack_rendered(self, tmp_path: Path):
+        config = self._make_config(tmp_path, mobile=self._mobile(get_stack("react-vite").directory))
+        _scaffold_monorepo(config)
+        assert (config.project_dir / "mobile" / "package.json").is_file()
+
+    def test_mobile_without_templates(self, tmp_path: Path, capsys):
+        config = self._make_config(tmp_path, mobile=self._mobile(None))
+        _scaffold_monorepo(config)
+        assert (config.project_dir / "mobile").is_dir()
+        assert not any((config.project_dir / "mobile").iterdir())
+        assert "no templates yet, mobile/ left empty" in capsys.readouterr().out
+
+    def test_failure_raised_after_other_stacks_finish(self, tmp_path: Path):
+        def fake_run_stack(stack, target_dir, *args):
+            if stack.type == "backend":
+                raise RuntimeError("backend broke")
+            time.sleep(0.1)
+            (target_dir / "done").write_text("")
+
+        config = self._make_config(tmp_path)
+        with (
+            patch("jvis.scaffold.stack_runner.run_stack", fake_run_stack),
+            pytest.raises(RuntimeError, match="backend"),
+        ):
+            _scaffold_monorepo(config)
+        assert (config.project_dir / "client" / "done").is_file()
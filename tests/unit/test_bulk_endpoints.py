@@ -0,0 +1,86 @@
+"""Tests for --bulk-endpoints — POST/DELETE /items:batch in generated CRUD backends."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from jvis.scaffold.entity_rename import apply_entity_name
+from jvis.scaffold.options import ScaffoldOptions
+from jvis.scaffold.stack_runner import run_stack
+from jvis.stacks.registry import get_stack
+
+# stack id -> (file holding the batch routes, generated batch test file)
+BULK_STACKS = {
+    "python-fastapi": ("src/controllers/api/items.py", "tests/test_items_batch.py"),
+    "python-flask": ("src/routes/items.py", "tests/test_items_batch.py"),
+    "python-django": ("core/urls.py", "tests/test_items_batch.py"),
+    "nodejs-express": ("src/presentation/routes/items-batch.ts", "tests/unit/item-batch.repository.test.ts"),
+}
+
+
+def _scaffold(tmp_path: Path, stack_id: str, bulk: bool, database: str = "postgresql") -> Path:
+    stack = get_stack(stack_id)
+    assert stack is not None
+    run_stack(stack, tmp_path, "demo-app", "", database, ScaffoldOptions(bulk_endpoints=bulk))
+    return tmp_path
+
+
+def _texts(project: Path) -> dict[str, str]:
+    return {str(p.relative_to(project)): p.read_text() for p in project.rglob("*") if p.is_file()}
+
+
+class TestDisabled:
+    @pytest.mark.parametrize("stack_id", BULK_STACKS)
+    def test_no_batch_code_generated(self, tmp_path: Path, stack_id: str) -> None:
+        project = _scaffold(tmp_path, stack_id, bulk=False)
+        assert not (project / BULK_STACKS[stack_id][1]).exists()
+        for rel, text in _texts(project).items():
+            assert "items:batch" not in text, rel
+            assert "BATCH_CHUNK_SIZE" not in text, rel
+
+
+class TestEnabled:
+    @pytest.mark.parametrize("stack_id", BULK_STACKS)
+    def test_routes_and_tests_generated(self, tmp_path: Path, stack_id: str) -> None:
+        project = _scaffold(tmp_path, stack_id, bulk=True)
+        routes_file, test_file = BULK_STACKS[stack_id]
+        assert "items:batch" in (project / routes_file).read_text()
+        assert (project / test_file).is_file()
+
+    @pytest.mark.parametrize("stack_id", BULK_STACKS)
+    @pytest.mark.parametrize("database", ["postgresql", "mysql"])
+    def test_python_sources_compile(self, tmp_path: Path, stack_id: str, database: str) -> None:
+        project = _scaffold(tmp_path, stack_id, bulk=True, database=database)
+        for path in project.rglob("*.py"):
+            compile(path.read_text(), str(path), "exec")
+
+    @pytest.mark.parametrize("stack_id", BULK_STACKS)
+    def test_generated_tests_check_one_commit_per_batch(self, tmp_path: Path, stack_id: str) -> None:
+        tests = (_scaffold(tmp_path, stack_id, bulk=True) / BULK_STACKS[stack_id][1]).read_text()
+        expected = {
+            "python-django": "commits.call_count == 1",
+            "nodejs-express": "expect(transaction).toHaveBeenCalledTimes(1)",
+        }.get(stack_id, "len(commits) == 1")
+        assert tests.count(expected) == 2
+
+    def test_postgres_uses_insert_returning(self, tmp_path: Path) -> None:
+        repo = _scaffold(tmp_path, "python-fastapi", bulk=True) / "src/infrastructure/repositories/item_repository.py"
+        assert "insert(Item).returning(Item, sort_by_parameter_order=True)" in repo.read_text()
+
+    def test_mysql_reads_chunk_back_without_returning(self, tmp_path: Path) -> None:
+        project = _scaffold(tmp_path, "python-flask", bulk=True, database="mysql")
+        service = (project / "src/services/item_service.py").read_text()
+        assert ".returning(" not in service
+        assert "select(Item).where(Item.id.in_(" in service
+
+    def test_express_mounts_batch_router(self, tmp_path: Path) -> None:
+        app_ts = (_scaffold(tmp_path, "nodejs-express", bulk=True) / "src/app.ts").read_text()
+        assert "app.use('/api', itemsBatchRouter);" in app_ts
+
+    def test_entity_rename_applies_to_batch_paths(self, tmp_path: Path) -> None:
+        project = _scaffold(tmp_path, "python-fastapi", bulk=True)
+        apply_entity_name(project, "product")
+        assert '"/products:batch"' in (project / "src/controllers/api/products.py").read_text()
+        assert (project / "tests/test_products_batch.py").is_file()
@@ -0,0 +1,117 @@
+"""Tests for jvis.codemap and ``jvis codemap``."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from jvis.cli import cli
+from jvis.codemap import CACHE_PATH, CODE_MAP_FILE, build_code_map, outline_source, walk_sources
+from jvis.scaffold.docs_structure import create_context_map
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / "app" / "models").mkdir(parents=True)
+    (tmp_path / "app" / "models" / "user.py").write_text(
+        '"""Users."""\n\nclass User(Base):\n    def __init__(self):\n        pass\n\n    def save(self):\n'
+        "        pass\n\n    def _hidden(self):\n        pass\n\n\ndef load_user(user_id, *, cache):\n    pass\n"
+    )
+    (tmp_path / "web").mkdir()
+    (tmp_path / "web" / "api.ts").write_text("export async function fetchUsers() {}\nexport interface User {}\n")
+    (tmp_path / "node_modules" / "dep").mkdir(parents=True)
+    (tmp_path / "node_modules" / "dep" / "index.js").write_text("function dep() {}\n")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "hook.py").write_text("def hook(): pass\n")
+    (tmp_path / "README.md").write_text("# Readme\n")
+    return tmp_path
+
+
+class TestOutline:
+    def test_python_symbols(self) -> None:
+        symbols = outline_source("class A(B):\n    def run(self): pass\n\nasync def go(x, *, y): pass\n", "python")
+        assert symbols == ["class A(B): run", "def go(x, y)"]
+
+    def test_python_syntax_error_falls_back(self) -> None:
+        assert outline_source("def broken(:\nclass Z:\n", "python") == ["def broken", "class Z"]
+
+    def test_regex_outlines(self) -> None:
+        assert outline_source("export default class App {}\nexport const routes = []\n", "javascript") == [
+            "class App",
+            "const routes",
+        ]
+        assert outline_source("pub const fn new() {}\nimpl<T> Display for Wrapper<T> {}\n", "rust") == [
+            "fn new",
+            "impl Display for Wrapper",
+        ]
+        php = "<?php\nnamespace App;\nfinal class Home {\n    public function index() {}\n}\n"
+        assert outline_source(php, "php") == ["namespace App", "class Home", "fn index"]
+
+    def test_symbol_cap(self) -> None:
+        symbols = outline_source("".join(f"def f{i}(): pass\n" for i in range(20)), "python")
+        assert len(symbols) == 13 and symbols[-1] == "… 8 more"
+
+
+class TestBuildCodeMap:
+    def test_walk_prunes(self, project: Path) -> None:
+        assert sorted(walk_sources(project)) == ["app/models/user.py", "web/api.ts"]
+
+    def test_writes_map(self, project: Path) -> None:
+        result = build_code_map(project)
+        assert (result.files, result.parsed, result.reused) == (2, 2, 0)
+        text = (project / CODE_MAP_FILE).read_text()
+        assert "| `app/models/` | 1 | 10 |" in text
+        assert "  - class User(Base): __init__, save" in text
+        assert "  - def load_user(user_id, cache)" in text
+        assert "  - fn fetchUsers" in text
+        assert "dep" not in text
+
+    def test_incremental(self, project: Path) -> None:
+        build_code_map(project)
+        again = build_code_map(project)
+        assert (again.parsed, again.reused, again.written) == (0, 2, False)
+
+        api = project / "web" / "api.ts"
+        api.write_text("export function listUsers() {}\n")
+        os.utime(api, ns=(0, 1))
+        changed = build_code_map(project)
+        assert (changed.parsed, changed.reused, changed.written) == (1, 1, True)
+        assert "fn listUsers" in (project / CODE_MAP_FILE).read_text()
+        cached = json.loads((project / CACHE_PATH).read_text())
+        assert cached["files"]["web/api.ts"]["symbols"] == ["fn listUsers"]
+
+    def test_size_cap(self, project: Path) -> None:
+        for i in range(50):
+            (project / "app" / f"mod_{i}.py").write_text(f"def handler_{i}(request): pass\n")
+        result = build_code_map(project, max_bytes=1500)
+        text = (project / CODE_MAP_FILE).read_text()
+        assert len(text) <= 1500 + 200
+        assert result.truncated and result.listed < 52
+        assert "more files not listed" in text
+
+    def test_directory_rollup(self, project: Path) -> None:
+        for i in range(40):
+            package = project / "app" / f"feature_{i:02}" / "handlers"
+            package.mkdir(parents=True)
+            (package / "views.py").write_text("def index(): pass\n")
+        build_code_map(project, max_bytes=3000)
+        text = (project / CODE_MAP_FILE).read_text()
+        assert "| `app/feature_00/` | 1 | 1 |" in text
+        assert "handlers/`" not in text
+
+    def test_context_map_links_code_map(self, project: Path) -> None:
+        build_code_map(project)
+        create_context_map(project, stack="fastapi", database="none", language="python")
+        text = (project / "docs" / "notes" / "context-map.md").read_text()
+        assert "## Code Map" in text and "**Files:** 2" in text
+
+
+def test_codemap_command_json(project: Path) -> None:
+    result = CliRunner().invoke(cli, ["codemap", str(project), "--json"])
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.output)
+    assert data["files"] == 2 and data["written"] is True
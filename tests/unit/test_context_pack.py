@@ -0,0 +1,112 @@
+"""Tests for jvis.context.pack and ``jvis context build``."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from jvis.cli import cli
+from jvis.context.pack import CACHE_DIR, build_context_pack, pack_sources
+from jvis.utils.tokens import estimate_tokens
+
+BOILERPLATE = "This paragraph is repeated template boilerplate that every agent note file carries along."
+
+
+def _notes(*entries: tuple[str, str]) -> str:
+    body = "".join(f"\n## [{day}] - {title}\n\n{title} details.\n\n{BOILERPLATE}\n\n---\n" for day, title in entries)
+    return "# Notes\n\nEntries older than 14 days should be cleaned.\n\n---\n" + body
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    agents = tmp_path / ".jvis" / "agents" / "core"
+    agents.mkdir(parents=True)
+    (agents / "dev.yaml").write_text(
+        "id: dev\ninter_agent:\n  writes_to: docs/notes/from-dev.md\n  reads_from:\n    - docs/notes/from-qa.md\n"
+    )
+    (agents / "qa.yaml").write_text("id: qa\n")
+    (tmp_path / ".jvis" / "core-config.yaml").write_text("devLoadAlwaysFiles:\n  - docs/architecture/standards.md\n")
+    notes = tmp_path / "docs" / "notes"
+    notes.mkdir(parents=True)
+    (notes / "next-action.md").write_text("# Next Action\n\nImplement story 1.2.\n")
+    (notes / "from-qa.md").write_text(_notes(("2026-03-01", "Old review"), ("2026-03-10", "New review")))
+    (notes / "project-log.md").write_text(_notes(("2026-03-05", "Session")))
+    (tmp_path / "docs" / "architecture").mkdir()
+    (tmp_path / "docs" / "architecture" / "standards.md").write_text("# Standards\n\nUse ruff.\n")
+    return tmp_path
+
+
+class TestPackSources:
+    def test_role_priorities(self, project: Path) -> None:
+        tiers = {s.path: s.tier for s in pack_sources(project, "dev")}
+        assert tiers["docs/notes/next-action.md"] == 0
+        assert tiers["docs/notes/from-qa.md"] == 1
+        assert tiers["docs/architecture/standards.md"] == 1
+        assert tiers["docs/notes/project-log.md"] == 3
+        qa = {s.path: s.tier for s in pack_sources(project, "qa")}
+        assert "docs/notes/from-qa.md" not in qa
+        assert qa["docs/architecture/standards.md"] == 2
+
+    def test_unknown_role(self, project: Path) -> None:
+        with pytest.raises(ValueError, match="Unknown role"):
+            pack_sources(project, "pilot")
+        with pytest.raises(ValueError, match="Invalid role"):
+            pack_sources(project, "../dev")
+
+
+class TestBuildContextPack:
+    def test_recency_and_dedup(self, project: Path) -> None:
+        pack = build_context_pack(project, "dev")
+        text = (project / pack.path).read_text()
+        assert text.index("Implement story 1.2.") < text.index("New review") < text.index("Old review")
+        assert text.count(BOILERPLATE) == 1
+        assert "should be cleaned" not in text  # note headers are dropped
+        assert pack.deduplicated > 0
+        assert pack.tokens == estimate_tokens(text)
+        statuses = {s.path: s.status for s in pack.sources}
+        assert statuses["docs/notes/from-qa.md"] == "included"
+        assert statuses["docs/notes/lessons-learned.md"] == "missing"
+
+    def test_hard_budget(self, project: Path) -> None:
+        (project / "docs" / "architecture" / "standards.md").write_text("Use ruff everywhere.\n\n" * 400)
+        pack = build_context_pack(project, "dev", budget=300)
+        text = (project / pack.path).read_text()
+        assert estimate_tokens(text) <= 300
+        statuses = {s.path: s.status for s in pack.sources}
+        assert statuses["docs/architecture/standards.md"] == "partial"
+        assert "_[truncated: read `docs/architecture/standards.md`" in text
+        assert statuses["docs/notes/project-log.md"] == "omitted"
+
+    def test_cached_until_a_source_changes(self, project: Path) -> None:
+        first = build_context_pack(project, "dev")
+        assert not first.cached
+        again = build_context_pack(project, "dev")
+        assert again.cached and again.key == first.key
+
+        (project / "docs" / "notes" / "next-action.md").write_text("# Next Action\n\nShip story 1.3.\n")
+        rebuilt = build_context_pack(project, "dev")
+        assert not rebuilt.cached and rebuilt.key != first.key
+        assert "Ship story 1.3." in (project / rebuilt.path).read_text()
+        assert build_context_pack(project, "dev", force=True).cached is False
+
+
+class TestContextCommand:
+    def test_build_json(self, project: Path) -> None:
+        result = CliRunner().invoke(cli, ["context", "build", str(project), "--json", "--budget", "2000"])
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["role"] == "dev" and data["budget"] == 2000
+        assert (project / CACHE_DIR / "dev.json").is_file()
+
+    def test_print_pack(self, project: Path) -> None:
+        result = CliRunner().invoke(cli, ["context", "build", str(project), "--print"])
+        assert result.exit_code == 0, result.output
+        assert result.output.startswith("# Context pack: dev")
+
+    def test_unknown_role(self, project: Path) -> None:
+        result = CliRunner().invoke(cli, ["context", "build", str(project), "--role", "pilot"])
+        assert result.exit_code == 1
+        assert "Unknown role" in result.output
@@ -151,3 +151,55 @@ class TestDetectProjectType:
         (tmp_path / "client").mkdir()
         (tmp_path / "infra").mkdir()
         assert detect_project_type(tmp_path) == "saas-platform"
+
+
+class TestHasContextBoundedReads:
+    def _notes(self, tmp_path):
+        (tmp_path / ".jvis").mkdir()
+        notes = tmp_path / "docs" / "notes"
+        notes.mkdir(parents=True)
+        return notes
+
+    def test_large_log_read_only_until_threshold(self, tmp_path, monkeypatch):
+        from jvis.detection import project_state
+
+        notes = self._notes(tmp_path)
+        (notes / "project-log.md").write_text("# Log\n---\nA\n---\nB\n---\n" + "x" * 2_000_000)
+        reads = []
+        real = project_state.count_marker
+
+        def spy(path, marker, **kwargs):
+            result = real(path, marker, **kwargs)
+            reads.append(result[1])
+            return result
+
+        monkeypatch.setattr(project_state, "count_marker", spy)
+        assert detect_project_state(tmp_path) == "has_context"
+        assert reads and reads[0] <= 64 * 1024
+
+    def test_verdict_cached_by_mtime_and_size(self, tmp_path, monkeypatch):
+        from jvis.detection import project_state
+
+        notes = self._notes(tmp_path)
+        note = notes / "from-dev.md"
+        note.write_text("# Notes\n---\n")
+        calls = []
+        real = project_state.count_marker
+        monkeypatch.setattr(project_state, "count_marker", lambda *a, **k: calls.append(a) or real(*a, **k))
+
+        assert detect_project_state(tmp_path) == "has_aicore"
+        assert detect_project_state(tmp_path) == "has_aicore"
+        assert len(calls) == 1
+
+        note.write_text("# Notes\n---\n## handoff\n---\n")
+        assert detect_project_state(tmp_path) == "has_context"
+        assert len(calls) == 2
+
+    def test_budget_caps_bytes_per_directory(self, tmp_path, monkeypatch):
+        from jvis.detection import project_state
+
+        notes = self._notes(tmp_path)
+        monkeypatch.setattr(project_state, "_CONTEXT_SCAN_BUDGET", 1000)
+        (notes / "from-analyst.md").write_text("x" * 5000)
+        (notes / "from-dev.md").write_text("# Notes\n---\n## handoff\n---\n")
+        assert detect_project_state(tmp_path) == "has_aicore"
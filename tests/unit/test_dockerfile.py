@@ -0,0 +1,156 @@
+"""Tests for jvis.scaffold.dockerfile — generated multi-stage Dockerfiles.
+
+The layer-ordering checks are static: they parse the generated Dockerfile
+into stages and assert that dependency manifests are copied and installed
+before the source tree, so code edits never invalidate the install layer.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from jvis.scaffold.dockerfile import parse_docker_spec, render_dockerfile
+from jvis.scaffold.options import ScaffoldOptions
+from jvis.scaffold.stack_runner import run_stack
+from jvis.stacks.registry import discover_stacks, get_stack
+
+DOCKER_STACKS = sorted(
+    stack_id
+    for stack_id, info in discover_stacks().items()
+    if info.directory and "docker" in yaml.safe_load((info.directory / "manifest.yaml").read_text())
+)
+
+
+def _generate(tmp_path: Path, stack_id: str) -> str:
+    stack = get_stack(stack_id)
+    assert stack is not None
+    run_stack(stack, tmp_path, "demo-app", "", "postgresql", ScaffoldOptions(dockerfile="generated"))
+    return (tmp_path / "Dockerfile").read_text()
+
+
+def _stages(dockerfile: str) -> dict[str, list[str]]:
+    """Split a Dockerfile into {stage_name: [instructions]} (comments and blanks dropped)."""
+    stages: dict[str, list[str]] = {}
+    current: list[str] = []
+    for raw in dockerfile.splitlines():
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("FROM "):
+            name = line.split(" AS ")[-1].strip()
+            current = stages.setdefault(name, [])
+        current.append(line)
+    return stages
+
+
+def _index(lines: list[str], predicate) -> int:
+    for i, line in enumerate(lines):
+        if predicate(line):
+            return i
+    return -1
+
+
+def test_every_stack_has_a_docker_section() -> None:
+    assert set(DOCKER_STACKS) == set(discover_stacks())
+
+
+class TestLayerOrdering:
+    @pytest.mark.parametrize("stack_id", DOCKER_STACKS)
+    def test_syntax_directive_first(self, tmp_path: Path, stack_id: str) -> None:
+        content = _generate(tmp_path, stack_id)
+        assert content.splitlines()[0].startswith("# syntax=docker/dockerfile:")
+
+    @pytest.mark.parametrize("stack_id", DOCKER_STACKS)
+    def test_deps_stage_never_copies_source(self, tmp_path: Path, stack_id: str) -> None:
+        stages = _stages(_generate(tmp_path, stack_id))
+        assert "deps" in stages
+        assert "COPY . ." not in stages["deps"]
+
+    @pytest.mark.parametrize("stack_id", DOCKER_STACKS)
+    def test_manifest_copied_before_install(self, tmp_path: Path, stack_id: str) -> None:
+        stages = _stages(_generate(tmp_path, stack_id))
+        for name in ("deps", "prod-deps"):
+            lines = stages.get(name)
+            if not lines or len(lines) == 1:
+                continue
+            copy_idx = _index(lines, lambda ln: ln.startswith("COPY ") and not ln.startswith("COPY --from"))
+            run_idx = _index(lines, lambda ln: ln.startswith("RUN --mount=type=cache"))
+            assert 0 < copy_idx < run_idx, f"{stack_id}/{name}: install must follow the manifest COPY"
+
+    @pytest.mark.parametrize("stack_id", DOCKER_STACKS)
+    def test_source_copied_after_dependency_install(self, tmp_path: Path, stack_id: str) -> None:
+        stages = _stages(_generate(tmp_path, stack_id))
+        for name in ("development", "build"):
+            lines = stages.get(name)
+            if not lines:
+                continue
+            assert lines[0].startswith("FROM deps "), f"{stack_id}/{name} must build on the deps stage"
+            source_idx = lines.index("COPY . .")
+            for i, line in enumerate(lines):
+                if line.startswith("COPY ") and line != "COPY . ." and "--from" not in line:
+                    assert i < source_idx, f"{stack_id}/{name}: manifest COPY after source: {line}"
+
+    @pytest.mark.parametrize("stack_id", DOCKER_STACKS)
+    def test_installs_use_cache_mounts(self, tmp_path: Path, stack_id: str) -> None:
+        stages = _stages(_generate(tmp_path, stack_id))
+        installs = [
+            line
+            for line in stages["deps"] + stages.get("prod-deps", [])
+            if line.startswith("RUN ") and ("install" in line or "cargo build" in line)
+        ]
+        for line in installs:
+            assert line.startswith("RUN --mount=type=cache,target="), f"{stack_id}: uncached install: {line}"
+
+
+class TestRuntimeStage:
+    @pytest.mark.parametrize("stack_id", DOCKER_STACKS)
+    def test_production_runs_as_non_root(self, tmp_path: Path, stack_id: str) -> None:
+        lines = _stages(_generate(tmp_path, stack_id))["production"]
+        user_idx = _index(lines, lambda ln: ln.startswith("USER "))
+        cmd_idx = _index(lines, lambda ln: ln.startswith("CMD "))
+        assert 0 < user_idx < cmd_idx
+        assert lines[user_idx] not in ("USER root", "USER 0")
+
+    @pytest.mark.parametrize("stack_id", DOCKER_STACKS)
+    def test_production_is_last_stage(self, tmp_path: Path, stack_id: str) -> None:
+        assert list(_stages(_generate(tmp_path, stack_id)))[-1] == "production"
+
+    def test_compiled_stacks_copy_artifacts_only(self, tmp_path: Path) -> None:
+        lines = _stages(_generate(tmp_path, "rust-axum"))["production"]
+        assert lines[0] == "FROM debian:bookworm-slim AS production"
+        assert "COPY . ." not in " ".join(lines)
+        assert any("/app/target/release/demo-app" in ln for ln in lines)
+
+
+class TestRunStackDockerfileMode:
+    def test_static_mode_copies_stack_dockerfile(self, tmp_path: Path) -> None:
+        stack = get_stack("python-fastapi")
+        assert stack is not None and stack.directory is not None
+        run_stack(stack, tmp_path, "demo-app")
+        content = (tmp_path / "Dockerfile").read_text()
+        assert content.startswith("FROM python:3.12-slim AS base")
+        assert "src.main:app" in content
+        assert not (tmp_path / ".dockerignore").exists()
+
+    def test_generated_mode_writes_dockerignore(self, tmp_path: Path) -> None:
+        _generate(tmp_path, "nodejs-express")
+        ignore = (tmp_path / ".dockerignore").read_text().splitlines()
+        assert "node_modules/" in ignore
+        assert ".git/" in ignore
+
+
+class TestParseDockerSpec:
+    def test_unknown_package_manager(self) -> None:
+        with pytest.raises(ValueError, match="Unknown package manager"):
+            parse_docker_spec({"package_manager": "gradle", "base_image": "x", "command": ["x"]})
+
+    def test_missing_command(self) -> None:
+        with pytest.raises(ValueError, match="docker.command"):
+            parse_docker_spec({"package_manager": "pip", "base_image": "python:3.12-slim"})
+
+    def test_zero_dependency_stack_has_no_install(self) -> None:
+        spec = parse_docker_spec({"package_manager": "pip", "base_image": "python:3.12-slim", "command": ["python"]})
+        assert "RUN --mount" not in render_dockerfile(spec)
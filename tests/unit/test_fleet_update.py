@@ -0,0 +1,163 @@
+"""Tests for fleet updates — jvis.fleet, framework snapshots and ``jvis update --all``."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from jvis.cli import cli
+from jvis.fleet import discover_projects, update_fleet
+from jvis.scaffold.framework import install_framework, snapshot_framework, sync_framework
+from jvis.utils.config import read_version
+
+
+def _project(path: Path, version: str = "0.1.0") -> Path:
+    install_framework(path)
+    (path / ".jvis" / "version").write_text(f"{version}\n")
+    return path
+
+
+def _tree(root: Path) -> dict[str, bytes]:
+    return {p.relative_to(root).as_posix(): p.read_bytes() for p in sorted(root.rglob("*")) if p.is_file()}
+
+
+class TestDiscoverProjects:
+    def test_finds_projects_and_prunes(self, tmp_path: Path) -> None:
+        for rel in ("a", "team/b", "team/b/nested", "node_modules/c", ".hidden/d"):
+            (tmp_path / rel / ".jvis").mkdir(parents=True)
+            (tmp_path / rel / ".jvis" / "version").write_text("1.0.0\n")
+        (tmp_path / "no-version" / ".jvis").mkdir(parents=True)
+
+        assert discover_projects(tmp_path) == [tmp_path / "a", tmp_path / "team" / "b"]
+
+
+class TestFrameworkSnapshot:
+    def test_sync_matches_install(self, tmp_path: Path) -> None:
+        installed = tmp_path / "installed" / "p"
+        install_framework(installed)
+        synced = tmp_path / "synced" / "p"
+        result = sync_framework(synced, snapshot_framework())
+        assert result.unchanged == 0
+        assert _tree(synced) == _tree(installed)
+
+    def test_sync_copies_only_changed_files(self, tmp_path: Path) -> None:
+        project = tmp_path / "p"
+        install_framework(project)
+        snapshot = snapshot_framework()
+        readme = project / ".jvis" / "agents" / "README.md"
+        readme.write_text("local edit")
+
+        dry = sync_framework(project, snapshot, dry_run=True)
+        assert dry.copied == [".jvis/agents/README.md"]
+        assert readme.read_text() == "local edit"
+
+        result = sync_framework(project, snapshot)
+        assert result.copied == [".jvis/agents/README.md"]
+        assert result.unchanged == len(snapshot.files) - 1
+        assert readme.read_text() != "local edit"
+
+    def test_digest_stable(self) -> None:
+        assert snapshot_framework().digest == snapshot_framework().digest
+
+
+class TestUpdateFleet:
+    def test_updates_stale_projects(self, tmp_path: Path) -> None:
+        current = read_version()
+        old = _project(tmp_path / "old")
+        _project(tmp_path / "current", version=current)
+        projects = discover_projects(tmp_path)
+
+        report = update_fleet(tmp_path, projects, snapshot_framework(), current, jobs=2)
+
+        by_path = {p.path: p for p in report.projects}
+        assert by_path["old"].status == "updated"
+        assert (by_path["old"].before, by_path["old"].after) == ("0.1.0", current)
+        assert by_path["current"].status == "up-to-date"
+        assert (old / ".jvis" / "version").read_text().strip() == current
+        assert f'jvis_installed_version: "{current}"' in (old / ".jvis" / "core-config.yaml").read_text()
+
+    def test_framework_drift_triggers_update(self, tmp_path: Path) -> None:
+        from jvis.version_tracking import read_provenance, stamp_version
+
+        current = read_version()
+        project = _project(tmp_path / "svc", version=current)
+        snapshot = snapshot_framework()
+        stamp_version(project, current, "dev", "stale-digest")
+
+        report = update_fleet(tmp_path, [project], snapshot, current, jobs=1)
+        assert report.projects[0].status == "updated"
+        assert read_provenance(project)["jvis_framework_hash"] == snapshot.digest
+
+        again = update_fleet(tmp_path, [project], snapshot, current, jobs=1)
+        assert again.projects[0].status == "up-to-date"
+
+    def test_failure_recorded_per_project(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        _project(tmp_path / "a")
+        _project(tmp_path / "b")
+
+        def boom(project, snapshot, **kwargs):
+            if project.name == "a":
+                raise OSError("disk full")
+            return real(project, snapshot, **kwargs)
+
+        import jvis.scaffold.framework as framework
+
+        real = framework.sync_framework
+        monkeypatch.setattr(framework, "sync_framework", boom)
+        report = update_fleet(tmp_path, discover_projects(tmp_path), snapshot_framework(), read_version(), jobs=2)
+        assert [(p.path, p.status, p.error) for p in report.projects] == [
+            ("a", "failed", "disk full"),
+            ("b", "updated", ""),
+        ]
+
+
+class TestUpdateAllCommand:
+    def test_dry_run_table(self, tmp_path: Path) -> None:
+        project = _project(tmp_path / "svc")
+        result = CliRunner().invoke(cli, ["update", "--all", str(tmp_path), "--dry-run"])
+        assert result.exit_code == 0, result.output
+        assert "svc" in result.output
+        assert "would-update" in result.output
+        assert "Dry run" in result.output
+        assert (project / ".jvis" / "version").read_text().strip() == "0.1.0"
+
+    def test_json_report(self, tmp_path: Path) -> None:
+        _project(tmp_path / "svc")
+        result = CliRunner().invoke(cli, ["update", "--all", str(tmp_path), "--json", "-j", "1"])
+        assert result.exit_code == 0, result.output
+        report = json.loads(result.output)
+        assert report["source_version"] == read_version()
+        assert report["framework_digest"]
+        (entry,) = report["projects"]
+        assert entry["path"] == "svc"
+        assert entry["status"] == "updated"
+        assert entry["elapsed_ms"] >= 0
+
+    def test_platforms_override(self, tmp_path: Path) -> None:
+        from jvis.scaffold.framework import read_platforms
+
+        project = _project(tmp_path / "svc", version=read_version())
+        result = CliRunner().invoke(cli, ["update", "--all", str(tmp_path), "--json", "--platforms", "cursor"])
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["projects"][0]["status"] == "updated"
+        assert read_platforms(project) == ("cursor",)
+
+    def test_unknown_platform_rejected(self, tmp_path: Path) -> None:
+        result = CliRunner().invoke(cli, ["update", str(tmp_path), "--platforms", "vim"])
+        assert result.exit_code == 2
+        assert "Unknown platform" in result.output
+
+    def test_no_projects(self, tmp_path: Path) -> None:
+        result = CliRunner().invoke(cli, ["update", "--all", str(tmp_path), "-y"])
+        assert result.exit_code == 1
+        assert "No JVIS projects" in result.output
+
+    def test_confirmation_declined(self, tmp_path: Path) -> None:
+        project = _project(tmp_path / "svc")
+        result = CliRunner().invoke(cli, ["update", "--all", str(tmp_path)], input="n\n")
+        assert result.exit_code == 0
+        assert "Cancelled" in result.output
+        assert (project / ".jvis" / "version").read_text().strip() == "0.1.0"
@@ -10,11 +10,18 @@ import pytest
 from jvis.scaffold.framework import (
     _JVIS_DIRS,
     _JVIS_FILES,
+    PLATFORMS,
     _copy_claude_md,
     _copy_jvis_dir,
     _resolve_jvis_source,
     install_framework,
+    parse_platforms,
+    read_platforms,
+    save_platforms,
+    snapshot_framework,
+    sync_framework,
 )
+from jvis.utils.fs import copy_file_to_many
 
 
 def _create_fake_jvis_source(base: Path) -> Path:
@@ -220,3 +227,98 @@ class TestCopyClaudeMd:
             _copy_claude_md(data, target)
 
         assert (target / "CLAUDE.md").read_text() == "# Repo CLAUDE.md"
+
+
+@pytest.fixture
+def installed_data(tmp_path: Path):
+    """Fake installed-mode package data: every platform resolves to data/commands/."""
+    data = _create_fake_jvis_source(tmp_path / "data")
+    (data / ".jvis" / "core-config.yaml").write_text("# config\nproject: demo\n")
+    commands = data / "commands"
+    (commands / "workflows").mkdir(parents=True)
+    (commands / "dev.md").write_text("# dev")
+    (commands / "workflows" / "flow.md").write_text("# flow")
+    nope = tmp_path / "nope"
+    with (
+        patch("jvis.scaffold.framework.get_data_dir", return_value=data),
+        patch("jvis.scaffold.framework.get_repo_root", return_value=nope),
+        patch("jvis.scaffold.framework.get_jvis_home", return_value=nope),
+    ):
+        yield data
+
+
+class TestPlatforms:
+    """Tests for platform-selective installs."""
+
+    def test_parse_platforms(self):
+        assert parse_platforms("all") == PLATFORMS
+        assert parse_platforms("Kiro, claude") == ("claude", "kiro")
+        assert parse_platforms(["cursor"]) == ("cursor",)
+        with pytest.raises(ValueError, match="Unknown platform"):
+            parse_platforms("claude,vim")
+        with pytest.raises(ValueError, match="No platforms"):
+            parse_platforms(" , ")
+
+    def test_shared_source_read_once(self, tmp_path: Path, installed_data: Path):
+        target = tmp_path / "target"
+        with patch("jvis.scaffold.framework.copy_file_to_many", wraps=copy_file_to_many) as fan:
+            assert install_framework(target) == PLATFORMS
+
+        assert fan.call_count == 2  # dev.md and workflows/flow.md, each fanned out to three destinations
+        for rel in (".claude/commands", ".cursor/rules", ".kiro/steering"):
+            assert (target / rel / "dev.md").read_text() == "# dev"
+            assert (target / rel / "workflows" / "flow.md").is_file()
+        assert "platforms:" not in (target / ".jvis" / "core-config.yaml").read_text()
+
+    def test_selected_platforms_only(self, tmp_path: Path, installed_data: Path):
+        target = tmp_path / "target"
+        assert install_framework(target, ["cursor"]) == ("cursor",)
+
+        assert (target / ".cursor" / "rules" / "dev.md").is_file()
+        assert not (target / ".claude").exists()
+        assert not (target / ".kiro").exists()
+        assert not (target / "CLAUDE.md").exists()
+        config = (target / ".jvis" / "core-config.yaml").read_text()
+        assert config.startswith("# config\n")
+        assert read_platforms(target) == ("cursor",)
+
+    def test_setting_survives_reinstall(self, tmp_path: Path, installed_data: Path):
+        target = tmp_path / "target"
+        install_framework(target, ["kiro"])
+        assert install_framework(target) == ("kiro",)
+        assert read_platforms(target) == ("kiro",)
+        assert not (target / ".claude" / "commands").exists()
+
+    @pytest.mark.parametrize(
+        "setting",
+        [
+            "platforms: [claude, cursor]\n",
+            "platforms:\n  - claude\n\n  - cursor  # editor\n",
+            "platforms:\n- claude\n- cursor\n",
+        ],
+    )
+    def test_save_replaces_whole_setting(self, tmp_path: Path, setting: str):
+        import yaml
+
+        config = tmp_path / ".jvis" / "core-config.yaml"
+        config.parent.mkdir()
+        config.write_text(f"# config\nproject: x\n{setting}\nqa:\n  qaLocation: docs/qa\n")
+        save_platforms(tmp_path, ("kiro",))
+
+        assert yaml.safe_load(config.read_text()) == {
+            "project": "x",
+            "platforms": ["kiro"],
+            "qa": {"qaLocation": "docs/qa"},
+        }
+        assert read_platforms(tmp_path) == ("kiro",)
+
+    def test_sync_matches_selective_install(self, tmp_path: Path, installed_data: Path):
+        installed = tmp_path / "installed" / "p"
+        install_framework(installed, ["claude", "kiro"])
+        synced = tmp_path / "synced" / "p"
+        result = sync_framework(synced, snapshot_framework(), platforms=("claude", "kiro"))
+
+        assert result.digest == snapshot_framework().select(["claude", "kiro"]).digest
+        assert not any(rel.startswith(".cursor/") for rel in result.copied)
+        files = {p.relative_to(synced) for p in synced.rglob("*") if p.is_file()}
+        assert files == {p.relative_to(installed) for p in installed.rglob("*") if p.is_file()}
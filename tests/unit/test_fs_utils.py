@@ -5,7 +5,18 @@ from __future__ import annotations
 import stat
 from pathlib import Path
 
-from jvis.utils.fs import copy_file, copy_tree, is_empty_dir, is_writable, mkdir_p, write_file
+import pytest
+
+from jvis.utils.fs import (
+    copy_file,
+    copy_tree,
+    count_marker,
+    is_empty_dir,
+    is_writable,
+    mkdir_p,
+    write_file,
+    write_file_atomic,
+)
 
 # =============================================================================
 # mkdir_p
@@ -48,6 +59,15 @@ class TestWriteFile:
         assert target.read_text() == "second"
 
 
+class TestWriteFileAtomic:
+    def test_replaces_without_leftovers(self, tmp_path: Path) -> None:
+        target = tmp_path / "sub" / "state.json"
+        write_file_atomic(target, "first")
+        write_file_atomic(target, "second")
+        assert target.read_text() == "second"
+        assert [p.name for p in target.parent.iterdir()] == ["state.json"]
+
+
 # =============================================================================
 # copy_tree
 # =============================================================================
@@ -156,3 +176,33 @@ class TestIsWritable:
 
     def test_nonexistent_path(self, tmp_path: Path) -> None:
         assert is_writable(tmp_path / "nope") is False
+
+
+# ---------------------------------------------------------------------------
+# count_marker
+# ---------------------------------------------------------------------------
+
+
+class TestCountMarker:
+    def test_matches_str_count(self, tmp_path: Path) -> None:
+        text = "a---b------c--\n---\n-----"
+        f = tmp_path / "f.md"
+        f.write_text(text)
+        for chunk_size in (1, 2, 3, 4, 7, 1024):
+            assert count_marker(f, b"---", chunk_size=chunk_size) == (text.count("---"), len(text))
+
+    def test_stops_at_threshold(self, tmp_path: Path) -> None:
+        f = tmp_path / "big.md"
+        f.write_text("---\n" * 3 + "x" * 100_000)
+        count, read = count_marker(f, b"---", stop_at=2, chunk_size=16)
+        assert count == 2
+        assert read == 16
+
+    def test_max_bytes(self, tmp_path: Path) -> None:
+        f = tmp_path / "big.md"
+        f.write_text("x" * 1000 + "---")
+        assert count_marker(f, b"---", max_bytes=500, chunk_size=64) == (0, 500)
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(OSError):
+            count_marker(tmp_path / "nope", b"---")
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import shutil
+import subprocess
 from pathlib import Path
 from unittest.mock import patch
 
@@ -9,12 +11,57 @@ import pytest
 
 from jvis.utils.git import (
     _GITIGNORE_SECTIONS,
+    _parse_config,
+    _Unsupported,
+    current_branch,
+    find_repo,
     git_init,
+    git_init_async,
     is_git_repo,
+    remote_url,
     setup_git,
+    setup_git_async,
     write_gitignore,
 )
 
+HAS_GIT = shutil.which("git") is not None
+
+
+@pytest.fixture(autouse=True)
+def _isolated_git_config(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the developer's own git config out of init/remote lookups."""
+    home = tmp_path_factory.mktemp("home")
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+    for name in (
+        "GIT_DIR",
+        "GIT_WORK_TREE",
+        "GIT_CONFIG_GLOBAL",
+        "GIT_CEILING_DIRECTORIES",
+        "GIT_DEFAULT_HASH",
+        "GIT_DEFAULT_REF_FORMAT",
+    ):
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture
+def no_subprocess():
+    """Fail the test if anything forks git."""
+    with patch("jvis.utils.git.subprocess.run", side_effect=AssertionError("git was executed")) as mock_run:
+        yield mock_run
+
+
+def _repo(path: Path, branch: str = "main", config: str = "") -> Path:
+    """Create a minimal repository at *path* by hand."""
+    git_dir = path / ".git"
+    (git_dir / "objects").mkdir(parents=True)
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text(f"ref: refs/heads/{branch}\n")
+    (git_dir / "config").write_text("[core]\n\tbare = false\n" + config)
+    return path
+
+
 # =============================================================================
 # is_git_repo
 # =============================================================================
@@ -36,6 +83,148 @@ class TestIsGitRepo:
         with patch("jvis.utils.git.subprocess.run", side_effect=FileNotFoundError):
             assert is_git_repo(tmp_path) is False
 
+    def test_detects_repo_without_running_git(self, tmp_path: Path, no_subprocess) -> None:
+        _repo(tmp_path)
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        assert is_git_repo(tmp_path / "src" / "pkg") is True
+
+    def test_non_repo_without_running_git(self, tmp_path: Path, no_subprocess) -> None:
+        assert is_git_repo(tmp_path) is False
+
+    def test_git_dir_override_falls_back_to_git(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("GIT_DIR", str(tmp_path / "elsewhere.git"))
+        with patch("jvis.utils.git.subprocess.run") as mock_run:
+            mock_run.return_value.returncode = 0
+            assert is_git_repo(tmp_path) is True
+        mock_run.assert_called_once()
+
+
+# =============================================================================
+# find_repo
+# =============================================================================
+
+
+class TestFindRepo:
+    def test_walks_up_to_worktree_root(self, tmp_path: Path) -> None:
+        _repo(tmp_path)
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        repo = find_repo(tmp_path / "a" / "b")
+        assert repo is not None
+        assert repo.worktree == tmp_path.resolve()
+        assert repo.git_dir == repo.common_dir == (tmp_path / ".git").resolve()
+
+    def test_linked_worktree_gitfile(self, tmp_path: Path) -> None:
+        _repo(tmp_path / "main")
+        wt_git = tmp_path / "main" / ".git" / "worktrees" / "wt"
+        wt_git.mkdir(parents=True)
+        (wt_git / "HEAD").write_text("ref: refs/heads/topic\n")
+        (wt_git / "commondir").write_text("../..\n")
+        (tmp_path / "wt").mkdir()
+        (tmp_path / "wt" / ".git").write_text(f"gitdir: {wt_git}\n")
+
+        repo = find_repo(tmp_path / "wt")
+        assert repo is not None
+        assert repo.git_dir == wt_git.resolve()
+        assert repo.common_dir == (tmp_path / "main" / ".git").resolve()
+
+    def test_relative_gitfile(self, tmp_path: Path) -> None:
+        _repo(tmp_path / "parent")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / ".git").write_text("gitdir: ../parent/.git\n")
+        repo = find_repo(tmp_path / "sub")
+        assert repo is not None
+        assert repo.git_dir == (tmp_path / "parent" / ".git").resolve()
+
+    def test_bare_repository(self, tmp_path: Path) -> None:
+        bare = tmp_path / "repo.git"
+        (bare / "objects").mkdir(parents=True)
+        (bare / "refs").mkdir()
+        (bare / "HEAD").write_text("ref: refs/heads/main\n")
+        repo = find_repo(bare)
+        assert repo is not None
+        assert repo.worktree is None
+
+    def test_invalid_git_dir_is_unsupported(self, tmp_path: Path) -> None:
+        (tmp_path / ".git").mkdir()
+        with pytest.raises(_Unsupported):
+            find_repo(tmp_path)
+
+    def test_missing_path(self, tmp_path: Path) -> None:
+        assert find_repo(tmp_path / "missing") is None
+
+
+# =============================================================================
+# current_branch / remote_url
+# =============================================================================
+
+
+class TestCurrentBranch:
+    def test_reads_head(self, tmp_path: Path, no_subprocess) -> None:
+        assert current_branch(_repo(tmp_path, branch="feature/login")) == "feature/login"
+
+    def test_detached_head(self, tmp_path: Path, no_subprocess) -> None:
+        _repo(tmp_path)
+        (tmp_path / ".git" / "HEAD").write_text("0123456789abcdef0123456789abcdef01234567\n")
+        assert current_branch(tmp_path) is None
+
+    def test_outside_repo(self, tmp_path: Path, no_subprocess) -> None:
+        assert current_branch(tmp_path) is None
+
+    def test_ambiguous_name_falls_back_to_git(self, tmp_path: Path) -> None:
+        _repo(tmp_path, branch="release")
+        (tmp_path / ".git" / "refs" / "tags").mkdir()
+        (tmp_path / ".git" / "refs" / "tags" / "release").write_text("0" * 40 + "\n")
+        completed = subprocess.CompletedProcess([], 0, stdout="heads/release\n", stderr="")
+        with patch("jvis.utils.git.subprocess.run", return_value=completed) as mock_run:
+            assert current_branch(tmp_path) == "heads/release"
+        mock_run.assert_called_once()
+
+    @pytest.mark.parametrize("extension", ["refStorage = reftable", "objectFormat = sha256"])
+    def test_repository_extensions_fall_back_to_git(self, tmp_path: Path, extension: str) -> None:
+        _repo(tmp_path, branch=".invalid", config=f"[extensions]\n\t{extension}\n")
+        completed = subprocess.CompletedProcess([], 0, stdout="main\n", stderr="")
+        with patch("jvis.utils.git.subprocess.run", return_value=completed) as mock_run:
+            assert current_branch(tmp_path) == "main"
+        mock_run.assert_called_once()
+
+
+class TestRemoteUrl:
+    def test_reads_origin(self, tmp_path: Path, no_subprocess) -> None:
+        _repo(tmp_path, config='[remote "origin"]\n\turl = git@github.com:user/repo.git\n')
+        assert remote_url(tmp_path) == "git@github.com:user/repo.git"
+
+    def test_first_of_several_urls(self, tmp_path: Path, no_subprocess) -> None:
+        _repo(tmp_path, config='[remote "origin"]\n\turl = https://a/r.git\n\turl = https://b/r.git\n')
+        assert remote_url(tmp_path) == "https://a/r.git"
+
+    def test_not_configured(self, tmp_path: Path, no_subprocess) -> None:
+        assert remote_url(_repo(tmp_path)) is None
+
+    def test_url_rewrite_falls_back_to_git(self, tmp_path: Path) -> None:
+        _repo(tmp_path, config='[url "https://github.com/"]\n\tinsteadOf = gh:\n[remote "origin"]\n\turl = gh:u/r\n')
+        completed = subprocess.CompletedProcess([], 0, stdout="https://github.com/u/r\n", stderr="")
+        with patch("jvis.utils.git.subprocess.run", return_value=completed) as mock_run:
+            assert remote_url(tmp_path) == "https://github.com/u/r"
+        mock_run.assert_called_once()
+
+
+class TestParseConfig:
+    def test_sections_keys_and_subsections(self) -> None:
+        config = _parse_config('[Core]\n\tBare = false\n[remote "Origin"]\n\turl = x\n[branch.Main]\n\tremote = o\n')
+        assert config == {"core.bare": ["false"], "remote.Origin.url": ["x"], "branch.main.remote": ["o"]}
+
+    def test_quotes_comments_escapes_and_continuations(self) -> None:
+        config = _parse_config('[a]\n\tk = "x  y" ; comment\n\tq = a\\\n b\n\te = "tab\\there"\n\tflag\n')
+        assert config == {"a.k": ["x  y"], "a.q": ["a b"], "a.e": ["tab\there"], "a.flag": ["true"]}
+
+    def test_include_is_unsupported(self) -> None:
+        with pytest.raises(_Unsupported):
+            _parse_config("[include]\n\tpath = other.cfg\n")
+
+    def test_invalid_syntax(self) -> None:
+        with pytest.raises(ValueError):
+            _parse_config('[a]\n\tk = "unterminated\n')
+
 
 # =============================================================================
 # git_init
@@ -43,23 +232,86 @@ class TestIsGitRepo:
 
 
 class TestGitInit:
-    def test_success(self, tmp_path: Path) -> None:
+    def test_writes_skeleton_without_running_git(self, tmp_path: Path, no_subprocess) -> None:
         target = tmp_path / "new-project"
+        assert git_init(target) is True
+        git_dir = target / ".git"
+        assert (git_dir / "HEAD").read_text() == "ref: refs/heads/master\n"
+        assert "\tbare = false\n" in (git_dir / "config").read_text()
+        for sub in ("objects/info", "objects/pack", "refs/heads", "refs/tags", "info"):
+            assert (git_dir / sub).is_dir()
+        assert is_git_repo(target) is True
+        assert current_branch(target) == "master"
+
+    def test_skeleton_writes_are_counted(self, tmp_path: Path, no_subprocess) -> None:
+        from jvis.utils import perf
+
+        recorder = perf.start()
+        try:
+            with perf.span("git"):
+                assert git_init(tmp_path) is True
+        finally:
+            perf.stop()
+        assert recorder.spans[0].files == 4  # HEAD, description, info/exclude, config
+
+    def test_default_branch_from_global_config(self, tmp_path: Path, no_subprocess) -> None:
+        (Path.home() / ".gitconfig").write_text("[init]\n\tdefaultBranch = main\n")
+        assert git_init(tmp_path) is True
+        assert (tmp_path / ".git" / "HEAD").read_text() == "ref: refs/heads/main\n"
+
+    def test_template_dir_falls_back_to_git(self, tmp_path: Path) -> None:
+        (Path.home() / ".gitconfig").write_text("[init]\n\ttemplateDir = ~/.git-template\n")
+        with patch("jvis.utils.git.subprocess.run") as mock_run:
+            mock_run.return_value.returncode = 0
+            assert git_init(tmp_path) is True
+        mock_run.assert_called_once()
+        assert not (tmp_path / ".git").exists()
+
+    @pytest.mark.parametrize("setting", ["defaultObjectFormat = sha256", "defaultRefFormat = reftable"])
+    def test_format_settings_fall_back_to_git(self, tmp_path: Path, setting: str) -> None:
+        (Path.home() / ".gitconfig").write_text(f"[init]\n\t{setting}\n")
+        with patch("jvis.utils.git.subprocess.run") as mock_run:
+            mock_run.return_value.returncode = 0
+            assert git_init(tmp_path) is True
+        mock_run.assert_called_once()
+
+    @pytest.mark.parametrize("name", ["GIT_DEFAULT_HASH", "GIT_DEFAULT_REF_FORMAT"])
+    def test_format_env_falls_back_to_git(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, name: str) -> None:
+        monkeypatch.setenv(name, "sha256" if name == "GIT_DEFAULT_HASH" else "reftable")
         with patch("jvis.utils.git.subprocess.run") as mock_run:
             mock_run.return_value.returncode = 0
-            assert git_init(target) is True
-        assert target.is_dir()
+            assert git_init(tmp_path) is True
         mock_run.assert_called_once()
 
-    def test_failure(self, tmp_path: Path) -> None:
+    @pytest.mark.skipif(not HAS_GIT, reason="git not installed")
+    def test_sha256_matches_git_init(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("GIT_DEFAULT_HASH", "sha256")
+        assert git_init(tmp_path) is True
+        assert "objectformat = sha256" in (tmp_path / ".git" / "config").read_text()
+
+    def test_existing_repo_is_reinitialized_by_git(self, tmp_path: Path) -> None:
+        (tmp_path / ".git").mkdir()
         with patch("jvis.utils.git.subprocess.run") as mock_run:
             mock_run.return_value.returncode = 1
             assert git_init(tmp_path) is False
+        mock_run.assert_called_once()
 
     def test_git_not_installed(self, tmp_path: Path) -> None:
-        with patch("jvis.utils.git.subprocess.run", side_effect=FileNotFoundError):
+        with (
+            patch("jvis.utils.git.sys.platform", "win32"),
+            patch("jvis.utils.git.subprocess.run", side_effect=FileNotFoundError),
+        ):
             assert git_init(tmp_path) is False
 
+    @pytest.mark.skipif(not HAS_GIT, reason="git not installed")
+    def test_matches_git_init(self, tmp_path: Path) -> None:
+        git_init(tmp_path / "ours")
+        subprocess.run(["git", "init", "-q", str(tmp_path / "theirs")], check=True)
+        for rel in ("HEAD", "config", "description", "info/exclude"):
+            assert (tmp_path / "ours" / ".git" / rel).read_bytes() == (tmp_path / "theirs" / ".git" / rel).read_bytes()
+        status = subprocess.run(["git", "status", "--porcelain"], cwd=tmp_path / "ours", capture_output=True)
+        assert status.returncode == 0
+
 
 # =============================================================================
 # write_gitignore
@@ -143,3 +395,33 @@ class TestSetupGit:
             setup_git(tmp_path, stack_id)
             sections = mock_ignore.call_args[0][1]
             assert sections == ["general", "jvis"]
+
+
+# =============================================================================
+# git_init_async / setup_git_async
+# =============================================================================
+
+
+class TestGitAsync:
+    async def test_writes_skeleton_without_running_git(self, tmp_path: Path, no_subprocess) -> None:
+        with patch("asyncio.create_subprocess_exec", side_effect=AssertionError("git was executed")):
+            assert await git_init_async(tmp_path / "proj") is True
+        assert current_branch(tmp_path / "proj") == "master"
+
+    @pytest.mark.skipif(not HAS_GIT, reason="git not installed")
+    async def test_falls_back_to_git_subprocess(self, tmp_path: Path) -> None:
+        with patch("jvis.utils.git._init_skeleton", side_effect=_Unsupported("test")):
+            assert await git_init_async(tmp_path) is True
+        assert is_git_repo(tmp_path)
+
+    async def test_git_not_installed(self, tmp_path: Path) -> None:
+        with (
+            patch("jvis.utils.git._init_skeleton", side_effect=_Unsupported("test")),
+            patch("asyncio.create_subprocess_exec", side_effect=FileNotFoundError),
+        ):
+            assert await git_init_async(tmp_path) is False
+
+    async def test_setup_git_async(self, tmp_path: Path) -> None:
+        await setup_git_async(tmp_path, "python-fastapi")
+        assert is_git_repo(tmp_path)
+        assert "__pycache__/" in (tmp_path / ".gitignore").read_text()
@@ -0,0 +1,248 @@
+"""Tests for jvis.journey — artifact index, checkpoint evaluation, ``jvis journey status``."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from jvis.cli import cli
+from jvis.journey.artifacts import INDEX_PATH, ArtifactIndex
+from jvis.journey.progress import evaluate, journey_status
+
+_PHASES: dict[str, Any] = {
+    "phases": {
+        "build": {
+            "name": "Build",
+            "order": 2,
+            "checkpoints": {
+                "code": {"name": "Code", "artifacts": ["src/", "package.json or requirements.txt"]},
+                "deployed": {"name": "Deployed", "artifacts": ["deployment logs"], "manual": True},
+            },
+        },
+        "plan": {
+            "name": "Plan",
+            "order": 1,
+            "checkpoints": {
+                "prd": {"name": "PRD", "artifacts": ["docs/planning/prd.md"], "agent": "/pm", "command": "*prd"},
+                "stories": {"name": "Stories", "artifacts": ["docs/stories/", "docs/planning/epics.md"]},
+            },
+            "gate": {"name": "Plan Gate", "requirements": [{"checkpoint": "prd", "condition": "complete"}]},
+        },
+    },
+    "meta": {"status_icons": {"completed": "+"}},
+}
+
+
+def _write(path: Path, content: str = "x") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def _age(project: Path, seconds: float = 10) -> None:
+    """Push every mtime under docs/ into the past so the index can reuse directories."""
+    past = time.time() - seconds
+    for root, dirs, files in os.walk(project / "docs"):
+        for name in [*dirs, *files]:
+            os.utime(Path(root, name), (past, past))
+    os.utime(project / "docs", (past, past))
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / ".jvis" / "journey").mkdir(parents=True)
+    (tmp_path / ".jvis" / "journey" / "phases.yaml").write_text(yaml.safe_dump(_PHASES))
+    (tmp_path / "docs").mkdir()
+    return tmp_path
+
+
+class TestArtifactIndex:
+    def test_records_files_with_size(self, project: Path) -> None:
+        _write(project / "docs" / "planning" / "prd.md", "hello")
+        _write(project / "docs" / "stories" / "epic-1" / "s1.md")
+        index = ArtifactIndex(project)
+        stats = index.refresh()
+        assert stats.files == 2
+        assert index.file("docs/planning/prd.md")[1] == 5  # type: ignore[index]
+        assert index.files_under("docs/stories/") == ["docs/stories/epic-1/s1.md"]
+        assert index.is_dir("docs/stories/epic-1")
+        assert not index.covers("src/main.py")
+
+    def test_unchanged_dirs_reused(self, project: Path) -> None:
+        _write(project / "docs" / "planning" / "prd.md")
+        _write(project / "docs" / "notes" / "a.md")
+        _age(project)
+        index = ArtifactIndex(project)
+        index.refresh()
+        index.save()
+
+        reloaded = ArtifactIndex.load(project)
+        stats = reloaded.refresh()
+        assert stats.dirs_scanned == 0
+        assert stats.dirs_reused == 3
+        assert reloaded.files == index.files
+
+    def test_new_file_rescans_only_its_dir(self, project: Path) -> None:
+        _write(project / "docs" / "planning" / "prd.md")
+        _write(project / "docs" / "notes" / "a.md")
+        _age(project)
+        index = ArtifactIndex(project)
+        index.refresh()
+
+        _write(project / "docs" / "notes" / "b.md")
+        stats = index.refresh()
+        assert stats.dirs_scanned == 1
+        assert "docs/notes/b.md" in index.files
+
+    def test_in_place_edit_in_reused_dir(self, project: Path) -> None:
+        _write(project / "docs" / "planning" / "prd.md", "")
+        _age(project)
+        index = ArtifactIndex(project)
+        index.refresh()
+        index.save()
+
+        # Filling the file leaves docs/planning's mtime (long before the scan) alone.
+        (project / "docs" / "planning" / "prd.md").write_text("filled")
+        reloaded = ArtifactIndex.load(project)
+        stats = reloaded.refresh()
+        assert stats.dirs_scanned == 0
+        assert reloaded.file("docs/planning/prd.md")[1] == 6  # type: ignore[index]
+
+    def test_recent_dirs_always_rescanned(self, project: Path) -> None:
+        index = ArtifactIndex(project)
+        index.refresh()
+        # Same timestamp tick as the scan: must not be trusted.
+        _write(project / "docs" / "late.md")
+        os.utime(project / "docs", ns=(index.scanned_at, index.scanned_at))
+        index.refresh()
+        assert "docs/late.md" in index.files
+
+    def test_deleted_files_dropped(self, project: Path) -> None:
+        _write(project / "docs" / "a.md")
+        index = ArtifactIndex(project)
+        index.refresh()
+        (project / "docs" / "a.md").unlink()
+        index.refresh()
+        assert index.files == {}
+
+    def test_corrupt_index_ignored(self, project: Path) -> None:
+        _write(project / INDEX_PATH, "{not json")
+        assert ArtifactIndex.load(project).files == {}
+
+    def test_save_skipped_without_jvis_dir(self, tmp_path: Path) -> None:
+        ArtifactIndex(tmp_path).save()
+        assert not (tmp_path / ".jvis").exists()
+
+
+class TestEvaluate:
+    def _evaluate(self, project: Path, state: dict[str, Any] | None = None):
+        index = ArtifactIndex(project)
+        index.refresh()
+        return evaluate(project, _PHASES, index, state or {})
+
+    def _checkpoints(self, result) -> dict[str, str]:
+        return {cp.id: cp.status for phase in result.phases for cp in phase.checkpoints}
+
+    def test_nothing_present(self, project: Path) -> None:
+        result = self._evaluate(project)
+        assert [p.id for p in result.phases] == ["plan", "build"]
+        assert self._checkpoints(result) == {
+            "prd": "not_started",
+            "stories": "not_started",
+            "code": "not_started",
+            "deployed": "manual",
+        }
+        assert result.current_phase == "plan"
+        assert [cp.id for cp in result.next_checkpoints] == ["prd", "stories"]
+
+    def test_partial_and_complete(self, project: Path) -> None:
+        _write(project / "docs" / "planning" / "prd.md")
+        _write(project / "docs" / "stories" / "s1.md")
+        result = self._evaluate(project)
+        statuses = self._checkpoints(result)
+        assert statuses["prd"] == "completed"
+        assert statuses["stories"] == "in_progress"
+        plan = result.phases[0]
+        assert plan.status == "in_progress"
+        assert plan.gate is not None and plan.gate.ready
+
+    def test_empty_file_not_counted(self, project: Path) -> None:
+        _write(project / "docs" / "planning" / "prd.md", "")
+        assert self._checkpoints(self._evaluate(project))["prd"] == "not_started"
+
+    def test_alternatives_and_paths_outside_docs(self, project: Path) -> None:
+        _write(project / "src" / "app" / "main.py")
+        _write(project / "requirements.txt", "click\n")
+        result = self._evaluate(project)
+        code = result.phases[1].checkpoints[0]
+        assert code.status == "completed"
+        assert [a.files for a in code.artifacts] == [["src/app/main.py"], ["requirements.txt"]]
+
+    def test_state_file_overrides(self, project: Path) -> None:
+        state = {
+            "phases": {
+                "plan": {"checkpoints": {"prd": {"status": "completed"}, "stories": {"status": "skipped"}}},
+                "build": {"checkpoints": {"deployed": {"status": "completed"}}},
+            }
+        }
+        result = self._evaluate(project, state)
+        assert result.phases[0].status == "completed"
+        assert result.current_phase == "build"
+        assert self._checkpoints(result)["deployed"] == "completed"
+
+
+class TestJourneyStatus:
+    def test_phases_cached_in_index(self, project: Path) -> None:
+        journey_status(project)
+        saved = json.loads((project / INDEX_PATH).read_text())
+        assert saved["extra"]["phases"]["data"]["phases"]["plan"]["name"] == "Plan"
+
+    def test_missing_phases(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("jvis.utils.paths.get_jvis_home", lambda: tmp_path / "nowhere")
+        with pytest.raises(FileNotFoundError):
+            journey_status(tmp_path)
+
+    def test_cli_json(self, project: Path) -> None:
+        _write(project / "docs" / "planning" / "prd.md")
+        result = CliRunner().invoke(cli, ["journey", "status", str(project), "--json"])
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["current_phase"] == "plan"
+        assert data["phases"][0]["completed"] == 1
+        assert data["phases"][0]["total"] == 2
+        assert data["next_checkpoints"] == ["stories"]
+        assert data["scan"]["files"] == 1
+
+    def test_cli_sees_artifact_filled_in_place(self, project: Path) -> None:
+        _write(project / "docs" / "planning" / "prd.md", "")
+        _age(project)
+        runner = CliRunner()
+        first = json.loads(runner.invoke(cli, ["journey", "status", str(project), "--json"]).output)
+        assert first["phases"][0]["completed"] == 0
+
+        (project / "docs" / "planning" / "prd.md").write_text("# PRD\n")
+        second = json.loads(runner.invoke(cli, ["journey", "status", str(project), "--json"]).output)
+        assert second["phases"][0]["completed"] == 1
+
+    def test_cli_text(self, project: Path) -> None:
+        result = CliRunner().invoke(cli, ["journey", "status", str(project), "--all"])
+        assert result.exit_code == 0, result.output
+        assert "Plan Gate: " in result.output
+        assert "Deployed" in result.output
+        assert "[/pm *prd] -> docs/planning/prd.md" in result.output
+
+    def test_framework_phases_on_installed_project(self, tmp_path: Path) -> None:
+        from jvis.scaffold.framework import install_framework
+
+        install_framework(tmp_path)
+        result = CliRunner().invoke(cli, ["journey", "status", str(tmp_path), "--json"])
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["current_phase"] == "ideation"
+        assert len(data["phases"]) == 5
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import logging
+import threading
 
-from jvis.log_config import setup_logging
+import pytest
+
+from jvis.log_config import ThreadLogCapture, replay_records, setup_logging
 
 
 class TestSetupLogging:
@@ -49,3 +52,33 @@ class TestSetupLogging:
         setup_logging(verbose=False)
         setup_logging(verbose=True)
         assert len(root.handlers) == 1
+
+
+class TestThreadLogCapture:
+    """Records logged inside capture() are held back and replayed on demand."""
+
+    def test_captures_worker_records_and_replays(self, caplog: pytest.LogCaptureFixture) -> None:
+        log = logging.getLogger("jvis.test")
+        records: list[logging.LogRecord] = []
+
+        def worker() -> None:
+            with capture.capture(records):
+                log.warning("from worker")
+
+        with caplog.at_level(logging.WARNING, logger="jvis"), ThreadLogCapture() as capture:
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+            log.warning("from main")
+            assert [r.getMessage() for r in caplog.records] == ["from main"]
+            replay_records(records)
+
+        assert [r.getMessage() for r in caplog.records] == ["from main", "from worker"]
+        assert len(records) == 1
+
+    def test_filters_removed_on_exit(self) -> None:
+        setup_logging(verbose=False)
+        handler = logging.getLogger("jvis").handlers[0]
+        with ThreadLogCapture() as capture:
+            assert capture in handler.filters
+        assert capture not in handler.filters
@@ -0,0 +1,114 @@
+"""Tests for --metrics — Prometheus /metrics middleware in generated backends."""
+
+from __future__ import annotations
+
+import runpy
+from pathlib import Path
+
+import pytest
+
+from jvis.scaffold.options import ScaffoldOptions
+from jvis.scaffold.stack_runner import run_stack
+from jvis.stacks.registry import get_stack
+
+# stack id -> (file registering the middleware, generated test that scrapes /metrics)
+METRICS_STACKS = {
+    "python-fastapi": ("src/main.py", "tests/test_metrics.py"),
+    "python-flask": ("src/app.py", "tests/test_metrics.py"),
+    "python-django": ("config/settings.py", "tests/test_metrics.py"),
+    "nodejs-express": ("src/app.ts", "tests/unit/metrics.test.ts"),
+    "rust-axum": ("src/api/routes/mod.rs", "tests/metrics_test.rs"),
+}
+
+# stack id -> dependency manifest that must declare the Prometheus client
+DEPENDENCY_FILES = {
+    "python-fastapi": ("requirements.txt", "prometheus-client"),
+    "python-flask": ("requirements.txt", "prometheus-client"),
+    "python-django": ("requirements.txt", "prometheus-client"),
+    "nodejs-express": ("package.json", '"prom-client"'),
+    "rust-axum": ("Cargo.toml", "metrics-exporter-prometheus"),
+}
+
+
+def _scaffold(tmp_path: Path, stack_id: str, metrics: bool, **options: str) -> Path:
+    stack = get_stack(stack_id)
+    assert stack is not None
+    run_stack(stack, tmp_path, "demo-app", "", "postgresql", ScaffoldOptions(metrics=metrics, **options))
+    return tmp_path
+
+
+def _texts(project: Path) -> dict[str, str]:
+    return {str(p.relative_to(project)): p.read_text() for p in project.rglob("*") if p.is_file()}
+
+
+class TestDisabled:
+    @pytest.mark.parametrize("stack_id", METRICS_STACKS)
+    def test_no_metrics_code_generated(self, tmp_path: Path, stack_id: str) -> None:
+        project = _scaffold(tmp_path, stack_id, metrics=False)
+        assert not (project / METRICS_STACKS[stack_id][1]).exists()
+        for rel, text in _texts(project).items():
+            assert "http_request_duration_seconds" not in text, rel
+            assert "prometheus" not in text.lower(), rel
+            assert "prom-client" not in text, rel
+
+
+class TestEnabled:
+    @pytest.mark.parametrize("stack_id", METRICS_STACKS)
+    def test_middleware_registered_and_scrape_test_generated(self, tmp_path: Path, stack_id: str) -> None:
+        project = _scaffold(tmp_path, stack_id, metrics=True)
+        entry_file, test_file = METRICS_STACKS[stack_id]
+        assert "metrics" in (project / entry_file).read_text().lower()
+        assert "/metrics" in (project / test_file).read_text()
+
+    @pytest.mark.parametrize("stack_id", METRICS_STACKS)
+    def test_prometheus_client_dependency(self, tmp_path: Path, stack_id: str) -> None:
+        manifest, dependency = DEPENDENCY_FILES[stack_id]
+        assert dependency in (_scaffold(tmp_path, stack_id, metrics=True) / manifest).read_text()
+
+    @pytest.mark.parametrize("stack_id", METRICS_STACKS)
+    def test_same_metric_names_across_stacks(self, tmp_path: Path, stack_id: str) -> None:
+        texts = _texts(_scaffold(tmp_path, stack_id, metrics=True))
+        source = "\n".join(text for rel, text in texts.items() if "test" not in rel)
+        assert '"http_request_duration_seconds"' in source or "'http_request_duration_seconds'" in source
+        assert "http_requests_in_flight" in source
+        assert "unmatched" in source
+
+    @pytest.mark.parametrize("stack_id", ["python-fastapi", "python-flask", "python-django"])
+    @pytest.mark.parametrize("database", ["postgresql", "mysql", "dynamodb"])
+    def test_python_sources_compile(self, tmp_path: Path, stack_id: str, database: str) -> None:
+        stack = get_stack(stack_id)
+        assert stack is not None
+        run_stack(stack, tmp_path, "demo-app", "", database, ScaffoldOptions(metrics=True, server_profile="prod"))
+        for path in tmp_path.rglob("*.py"):
+            compile(path.read_text(), str(path), "exec")
+
+    def test_express_prisma_metrics_preview_feature(self, tmp_path: Path) -> None:
+        schema = (_scaffold(tmp_path, "nodejs-express", metrics=True) / "prisma/schema.prisma").read_text()
+        assert 'previewFeatures = ["metrics"]' in schema
+
+    def test_rust_test_uses_crate_name(self, tmp_path: Path) -> None:
+        test = (_scaffold(tmp_path, "rust-axum", metrics=True) / "tests/metrics_test.rs").read_text()
+        assert "use demo_app::api::routes::create_router;" in test
+
+
+class TestGunicornMultiprocess:
+    @pytest.mark.parametrize("stack_id", ["python-fastapi", "python-flask", "python-django"])
+    def test_prod_config_aggregates_worker_metrics(
+        self, tmp_path: Path, stack_id: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        project = _scaffold(tmp_path, stack_id, metrics=True, server_profile="prod")
+        metrics_dir = tmp_path / "prometheus"
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(metrics_dir))
+        conf = runpy.run_path(str(project / "gunicorn.conf.py"))
+
+        (metrics_dir / "stale").mkdir(parents=True)
+        conf["on_starting"](None)
+        assert metrics_dir.is_dir()
+        assert not (metrics_dir / "stale").exists()
+        assert callable(conf["child_exit"])
+
+    def test_prod_config_without_metrics_has_no_hooks(self, tmp_path: Path) -> None:
+        project = _scaffold(tmp_path, "python-fastapi", metrics=False, server_profile="prod")
+        conf = runpy.run_path(str(project / "gunicorn.conf.py"))
+        assert "on_starting" not in conf
+        assert "child_exit" not in conf
@@ -0,0 +1,155 @@
+"""Tests for jvis.notes.compaction and ``jvis notes compact``."""
+
+from __future__ import annotations
+
+import json
+from datetime import date
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from jvis.cli import cli
+from jvis.detection.project_state import detect_project_state
+from jvis.notes.compaction import (
+    compact_notes,
+    entry_date,
+    load_index,
+    parse_notes,
+    read_archive,
+    retention_days,
+)
+from jvis.scaffold.docs_structure import create_docs_structure
+
+TODAY = date(2026, 3, 20)
+
+
+def _log(*dates: str) -> str:
+    body = "".join(f"\n## [{d}] - Session {i}\n\n**Agent:** dev\n\n---\n" for i, d in enumerate(dates))
+    return "# Project Log\n\nCentral log. Entries older than 7 days should be cleaned.\n\n---\n" + body
+
+
+class TestParsing:
+    def test_parse_and_render_roundtrip(self) -> None:
+        text = _log("2026-03-01", "2026-03-19")
+        note = parse_notes(text)
+        assert note.header.startswith("# Project Log")
+        assert len(note.entries) == 2
+        assert note.render() == text
+
+    def test_entry_date(self) -> None:
+        assert entry_date("\n## [2026-02-03] - Fix\nbody") == date(2026, 2, 3)
+        assert entry_date("## Undated\n2026-02-03 in body") is None
+        assert entry_date("## [2026-13-45] bad") is None
+
+    def test_retention_from_header(self) -> None:
+        assert retention_days("from-dev.md", "Entries older than 3 days should be cleaned.") == 3
+        assert retention_days("project-log.md", "") == 7
+        assert retention_days("from-qa.md", "") == 14
+
+
+class TestCompactNotes:
+    def _notes(self, tmp_path: Path) -> Path:
+        notes = tmp_path / "docs" / "notes"
+        notes.mkdir(parents=True)
+        return notes
+
+    def test_archives_expired_entries(self, tmp_path: Path) -> None:
+        notes = self._notes(tmp_path)
+        (notes / "project-log.md").write_text(_log("2026-02-01", "2026-03-01", "2026-03-15", "2026-03-19"))
+        (notes / "from-dev.md").write_text(
+            "# Notes from Dev\n\nEntries older than 14 days should be cleaned.\n\n---\n"
+            "\n## [2026-02-10] handoff\n\nold\n\n---\n\n## no date\n\nkept\n\n---\n"
+        )
+        lessons = "# Lessons Learned\n\n---\n\n## [2020-01-01] ancient lesson\n\n---\n"
+        (notes / "lessons-learned.md").write_text(lessons)
+
+        result = compact_notes(notes, today=TODAY)
+
+        assert result.archived == {"project-log.md": 2, "from-dev.md": 1}
+        assert result.kept == {"from-dev.md": 1, "project-log.md": 2}
+        assert result.months == {"2026-02": 2, "2026-03": 1}
+        assert (notes / "lessons-learned.md").read_text() == lessons
+
+        log = (notes / "project-log.md").read_text()
+        assert "2026-03-15" in log and "2026-02-01" not in log
+        assert "## no date" in (notes / "from-dev.md").read_text()
+
+        february = read_archive(notes / "archive" / "2026-02.md.gz")
+        assert "<!-- source: project-log.md -->" in february
+        assert "<!-- source: from-dev.md -->" in february
+
+    def test_archive_appends_across_runs(self, tmp_path: Path) -> None:
+        notes = self._notes(tmp_path)
+        (notes / "project-log.md").write_text(_log("2026-02-01"))
+        compact_notes(notes, today=TODAY)
+        (notes / "project-log.md").write_text(_log("2026-02-02"))
+        compact_notes(notes, today=TODAY)
+
+        archive = read_archive(notes / "archive" / "2026-02.md.gz")
+        assert "Session 0" in archive and archive.count("## [2026-02-0") == 2
+        index = load_index(notes)
+        assert index is not None
+        assert index["archives"]["2026-02"] == {"entries": 2, "sources": {"project-log.md": 2}}
+        assert index["files"]["project-log.md"]["archived"] == 2
+
+    def test_dry_run_writes_nothing(self, tmp_path: Path) -> None:
+        notes = self._notes(tmp_path)
+        original = _log("2026-01-01")
+        (notes / "project-log.md").write_text(original)
+        result = compact_notes(notes, today=TODAY, dry_run=True)
+        assert result.total_archived == 1
+        assert (notes / "project-log.md").read_text() == original
+        assert not (notes / "archive").exists()
+
+    def test_days_override(self, tmp_path: Path) -> None:
+        notes = self._notes(tmp_path)
+        (notes / "project-log.md").write_text(_log("2026-03-19"))
+        assert compact_notes(notes, today=TODAY, days=0).total_archived == 1
+
+
+class TestHasContextUsesIndex:
+    def _project(self, tmp_path: Path) -> Path:
+        (tmp_path / ".jvis").mkdir()
+        create_docs_structure(tmp_path)
+        return tmp_path
+
+    def test_archived_history_still_counts_as_context(self, tmp_path: Path) -> None:
+        project = self._project(tmp_path)
+        notes = project / "docs" / "notes"
+        (notes / "project-log.md").write_text(_log("2026-01-01", "2026-01-02"))
+        assert detect_project_state(project) == "has_context"
+
+        compact_notes(notes, today=TODAY)
+        assert (notes / "project-log.md").read_text().count("---") == 1
+        assert detect_project_state(project) == "has_context"
+
+    def test_fresh_template_is_not_context(self, tmp_path: Path) -> None:
+        project = self._project(tmp_path)
+        compact_notes(project / "docs" / "notes", today=TODAY)
+        assert detect_project_state(project) == "has_aicore"
+
+    def test_stale_index_falls_back_to_reading(self, tmp_path: Path) -> None:
+        project = self._project(tmp_path)
+        notes = project / "docs" / "notes"
+        compact_notes(notes, today=TODAY)
+        with open(notes / "from-qa.md", "a") as f:
+            f.write("\n## [2026-03-20] review\n\n---\n")
+        assert detect_project_state(project) == "has_context"
+
+
+class TestCli:
+    def test_compact_json(self, tmp_path: Path) -> None:
+        notes = tmp_path / "docs" / "notes"
+        notes.mkdir(parents=True)
+        (notes / "project-log.md").write_text(_log("2000-01-01"))
+        result = CliRunner().invoke(cli, ["notes", "compact", str(tmp_path), "--json"])
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["archived"] == {"project-log.md": 1}
+        assert data["months"] == {"2000-01": 1}
+        assert (notes / "archive" / "2000-01.md.gz").is_file()
+
+    def test_compact_missing_notes(self, tmp_path: Path) -> None:
+        result = CliRunner().invoke(cli, ["notes", "compact", str(tmp_path)])
+        assert result.exit_code != 0
+        assert "No notes directory" in result.output
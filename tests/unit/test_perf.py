@@ -0,0 +1,159 @@
+"""Tests for jvis.utils.perf — spans, write counters, --timings/--profile/JVIS_TRACE."""
+
+from __future__ import annotations
+
+import json
+import pstats
+import threading
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from jvis.cli import cli
+from jvis.utils import perf
+from jvis.utils.fs import copy_file, copy_tree, write_file
+
+
+@pytest.fixture(autouse=True)
+def _no_leaked_recorder():
+    yield
+    perf.stop()
+
+
+class TestDisabled:
+    def test_span_is_noop(self) -> None:
+        assert not perf.is_recording()
+        with perf.span("stage") as span:
+            assert span is None
+
+    def test_record_write_is_noop(self, tmp_path: Path) -> None:
+        write_file(tmp_path / "a.txt", "hello")
+        assert perf.stop() is None
+
+
+class TestRecorder:
+    def test_nested_spans(self) -> None:
+        recorder = perf.start()
+        with perf.span("outer"), perf.span("inner"):
+            pass
+        perf.stop()
+        assert [(s.name, s.depth) for s in recorder.spans] == [("outer", 0), ("inner", 1)]
+        outer, inner = recorder.spans
+        assert outer.start <= inner.start
+        assert outer.duration >= inner.duration
+        assert recorder.elapsed >= outer.duration
+
+    def test_writes_counted_against_open_spans(self, tmp_path: Path) -> None:
+        recorder = perf.start()
+        with perf.span("outer"):
+            write_file(tmp_path / "a.txt", "12345")
+            with perf.span("inner"):
+                copy_file(tmp_path / "a.txt", tmp_path / "b.txt")
+        write_file(tmp_path / "c.txt", "xy")
+        perf.stop()
+
+        outer, inner = recorder.spans
+        assert (outer.files, outer.bytes) == (2, 10)
+        assert (inner.files, inner.bytes) == (1, 5)
+        assert (recorder.files, recorder.bytes) == (3, 12)
+
+    def test_copy_tree_counts_each_file(self, tmp_path: Path) -> None:
+        src = tmp_path / "src"
+        write_file(src / "one.txt", "1")
+        write_file(src / "nested" / "two.txt", "22")
+        recorder = perf.start()
+        with perf.span("copy"):
+            copy_tree(src, tmp_path / "dst")
+        perf.stop()
+        assert (recorder.spans[0].files, recorder.spans[0].bytes) == (2, 3)
+
+    def test_spans_nest_per_thread(self) -> None:
+        recorder = perf.start()
+
+        def worker() -> None:
+            with perf.span("worker"):
+                pass
+
+        with perf.span("main"):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+        perf.stop()
+        by_name = {s.name: s for s in recorder.spans}
+        assert by_name["worker"].depth == 0
+        assert by_name["worker"].thread_id != by_name["main"].thread_id
+
+    def test_bind_nests_worker_spans_under_caller(self, tmp_path: Path) -> None:
+        recorder = perf.start()
+
+        def worker() -> None:
+            with perf.span("worker"):
+                write_file(tmp_path / "w.txt", "abc")
+
+        with perf.span("parent"):
+            thread = threading.Thread(target=perf.bind(worker))
+            thread.start()
+            thread.join()
+        perf.stop()
+        parent, child = recorder.spans
+        assert child.depth == 1
+        assert (parent.files, parent.bytes) == (1, 3)
+
+    def test_format_table(self) -> None:
+        recorder = perf.start()
+        with perf.span("install_framework"), perf.span("copy"):
+            pass
+        perf.stop()
+        lines = recorder.format_table().splitlines()
+        assert lines[0].split() == ["stage", "ms", "%", "files", "bytes"]
+        assert lines[1].strip().startswith("install_framework")
+        assert lines[2].startswith("    copy")
+        assert lines[-1].strip().startswith("total")
+
+    def test_chrome_trace(self, tmp_path: Path) -> None:
+        recorder = perf.start()
+        with perf.span("stage"):
+            pass
+        perf.stop()
+        recorder.write_chrome_trace(tmp_path / "trace.json")
+        trace = json.loads((tmp_path / "trace.json").read_text())
+        (event,) = trace["traceEvents"]
+        assert event["name"] == "stage"
+        assert event["ph"] == "X"
+        assert event["dur"] >= 0
+        assert event["args"] == {"files": 0, "bytes": 0}
+
+
+class TestCliInstrumentation:
+    def _new(self, tmp_path: Path, *global_args: str, env: dict[str, str] | None = None):
+        args = [*global_args, "new", "--name", "demo", "--stack", "python-fastapi", "--path", str(tmp_path / "p"), "-y"]
+        return CliRunner().invoke(cli, args, env=env)
+
+    def test_timings_table(self, tmp_path: Path) -> None:
+        result = self._new(tmp_path, "--timings")
+        assert result.exit_code == 0, result.output
+        for stage in ("scaffold", "run_stack[python-fastapi]", "install_framework", "context_map", "git", "total"):
+            assert stage in result.output
+        assert not perf.is_recording()
+
+    def test_profile_written(self, tmp_path: Path) -> None:
+        out = tmp_path / "out.prof"
+        result = self._new(tmp_path, "--profile", str(out))
+        assert result.exit_code == 0, result.output
+        assert pstats.Stats(str(out)).total_calls > 0
+        assert "stage" not in result.output
+
+    def test_trace_env(self, tmp_path: Path) -> None:
+        trace = tmp_path / "trace.json"
+        result = self._new(tmp_path, env={perf.TRACE_ENV: str(trace)})
+        assert result.exit_code == 0, result.output
+        names = {event["name"] for event in json.loads(trace.read_text())["traceEvents"]}
+        assert {"scaffold", "install_framework", "docs_structure", "shared_files"} <= names
+
+    def test_add_stages(self, tmp_path: Path) -> None:
+        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'x'\n")
+        result = CliRunner().invoke(cli, ["--timings", "add", str(tmp_path), "-y"])
+        assert result.exit_code == 0, result.output
+        assert "detect" in result.output
+        assert "install_framework" in result.output
@@ -0,0 +1,185 @@
+"""Tests for jvis.plans.status and ``jvis plan status``."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from jvis.cli import cli
+from jvis.plans.status import parse_gate, plan_status
+
+PLAN = """\
+schema: 1
+plan: "Launch"
+status: in_progress
+steps:
+  - id: S1.1
+    title: "Install fixes"
+    story_ref: "docs/stories/1.1.story.md"
+    agent: dev
+    status: done
+    gate: qa
+    risk: high
+  - id: S1.2
+    title: "Packaging"
+    agent: dev
+    status: done
+    risk: high
+    depends_on: [S1.1]
+  - id: S1.3
+    title: "E2E test"
+    agent: dev
+    status: pending
+    gate: null
+    risk: low
+    depends_on: [S1.2]
+  - id: S1.4
+    title: "Docs"
+    agent: dev
+    status: pending
+    risk: low
+    depends_on: []
+checkpoints:
+  - id: CP1
+    title: "Epic 1"
+    after_steps: [S1.1, S1.2, S1.3]
+    reviewers: [architect, devsecops]
+    status: pending
+"""
+
+GATE = """\
+# JVIS QA Gate
+---
+gate_id: "{gate_id}"
+story_ref: "{story_ref}"
+created: "{created}"
+reviewed_by: "{reviewer}"
+decision: "{decision}"  # PASS | CONCERNS | FAIL
+---
+
+# QA Gate
+
+decision: "FAIL" in the body is not metadata.
+"""
+
+
+def _gate(project: Path, name: str, **fields: str) -> Path:
+    values = {"gate_id": name, "story_ref": "", "created": "2026-03-01 10:00", "reviewer": "QA Agent"} | fields
+    path = project / "docs" / "qa" / "gates" / f"{name}.yml"
+    path.write_text(GATE.format(**values))
+    return path
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / ".jvis").mkdir()
+    (tmp_path / ".jvis" / "core-config.yaml").write_text(
+        "qa:\n  qaLocation: docs/qa\nplans:\n  activePlan: docs/plans/active-plan.yaml\n"
+        "  reportsLocation: docs/plans/reports\n  checkpointFrequency: 2\n"
+        "  gateMatrix:\n    high: [qa, architect]\n    low: [self-review]\n"
+    )
+    (tmp_path / "docs" / "plans" / "reports").mkdir(parents=True)
+    (tmp_path / "docs" / "qa" / "gates").mkdir(parents=True)
+    (tmp_path / "docs" / "plans" / "active-plan.yaml").write_text(PLAN)
+    (tmp_path / "docs" / "plans" / "reports" / "S1.1-report.md").write_text("# Report\n")
+    return tmp_path
+
+
+class TestParseGate:
+    def test_reads_top_level_metadata_only(self) -> None:
+        fields = parse_gate(GATE.format(gate_id="1.1-x", story_ref="", created="", reviewer="QA", decision="PASS"))
+        assert fields["gate_id"] == "1.1-x"
+        assert fields["decision"] == "PASS"
+
+
+class TestPlanStatus:
+    def test_states_without_gates(self, project: Path) -> None:
+        result = plan_status(project)
+        states = {s.id: s.state for s in result.steps}
+        assert states == {"S1.1": "in_review", "S1.2": "in_review", "S1.3": "ready", "S1.4": "ready"}
+        step2 = result.steps[1]
+        assert step2.reviewers == ["qa", "architect"]  # from the gate matrix
+        assert step2.report_missing
+        assert result.awaiting_review() == {"qa": ["S1.1", "S1.2"], "architect": ["S1.2"]}
+        assert result.next_step is not None and result.next_step.id == "S1.3"
+
+    def test_gates_resolve_steps(self, project: Path) -> None:
+        _gate(project, "1.1-install", decision="PASS")
+        _gate(project, "packaging", story_ref="", decision="CONCERNS", gate_id="1.2-packaging")
+        _gate(project, "1.2-architect", decision="FAIL", reviewer="Winston (Architect)")
+        result = plan_status(project)
+        by_id = {s.id: s for s in result.steps}
+        assert by_id["S1.1"].state == "complete"
+        assert by_id["S1.2"].state == "rework"
+        assert {g.reviewer: g.decision for g in by_id["S1.2"].gates} == {"qa": "CONCERNS", "architect": "FAIL"}
+
+    def test_newest_gate_wins(self, project: Path) -> None:
+        _gate(project, "1.1-first", decision="FAIL", created="2026-03-01 10:00")
+        _gate(project, "1.1-second", decision="PASS", created="2026-03-02 10:00")
+        by_id = {s.id: s for s in plan_status(project).steps}
+        assert by_id["S1.1"].state == "complete"
+
+    def test_blocked_and_checkpoints(self, project: Path) -> None:
+        plan = project / "docs" / "plans" / "active-plan.yaml"
+        plan.write_text(
+            PLAN.replace(
+                "status: done\n    risk: high\n    depends_on", "status: pending\n    risk: high\n    depends_on"
+            )
+        )
+        result = plan_status(project)
+        by_id = {s.id: s for s in result.steps}
+        assert by_id["S1.3"].state == "blocked" and by_id["S1.3"].blocked_by == ["S1.2"]
+        checkpoint = result.checkpoints[0]
+        assert checkpoint.state == "waiting" and checkpoint.waiting_on == ["S1.1", "S1.2", "S1.3"]
+
+    def test_checkpoint_due(self, project: Path) -> None:
+        plan = project / "docs" / "plans" / "active-plan.yaml"
+        plan.write_text(PLAN.replace("after_steps: [S1.1, S1.2, S1.3]", "after_steps: [S1.3]"))
+        assert plan_status(project).checkpoint_due
+
+    def test_cached_and_incremental(self, project: Path) -> None:
+        _gate(project, "1.1-install", decision="FAIL")
+        assert plan_status(project).files_read == 2
+        assert plan_status(project).files_read == 0
+
+        gate = _gate(project, "1.1-install", decision="PASS")
+        os.utime(gate, ns=(0, 1))
+        result = plan_status(project)
+        assert result.files_read == 1
+        assert result.steps[0].state == "complete"
+
+        gate.unlink()
+        assert plan_status(project).steps[0].state == "in_review"
+
+    def test_missing_and_invalid_plan(self, project: Path) -> None:
+        plan = project / "docs" / "plans" / "active-plan.yaml"
+        plan.write_text("plan: x\n")
+        with pytest.raises(ValueError, match="no 'steps'"):
+            plan_status(project)
+        plan.unlink()
+        with pytest.raises(FileNotFoundError):
+            plan_status(project)
+
+
+class TestPlanCommand:
+    def test_json(self, project: Path) -> None:
+        result = CliRunner().invoke(cli, ["plan", "status", str(project), "--json"])
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert (data["done"], data["total"], data["next_step"]) == (2, 4, "S1.3")
+
+    def test_brief(self, project: Path) -> None:
+        result = CliRunner().invoke(cli, ["plan", "status", str(project), "--brief"])
+        assert result.exit_code == 0, result.output
+        assert result.output.startswith("Plan: 2/4 done · next S1.3")
+        assert "qa review: S1.1, S1.2" in result.output
+
+    def test_brief_without_plan_is_silent(self, tmp_path: Path) -> None:
+        result = CliRunner().invoke(cli, ["plan", "status", str(tmp_path), "--brief"])
+        assert result.exit_code == 0 and result.output == ""
+        result = CliRunner().invoke(cli, ["plan", "status", str(tmp_path)])
+        assert result.exit_code == 1 and "No active plan" in result.output
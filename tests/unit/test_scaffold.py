@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import subprocess
 from unittest.mock import patch
 
 import pytest
@@ -11,6 +10,7 @@ import yaml
 from jvis.scaffold.docs_structure import create_context_map, create_docs_structure
 from jvis.scaffold.framework import install_framework
 from jvis.scaffold.monorepo import create_monorepo_root
+from jvis.scaffold.options import ScaffoldOptions
 from jvis.scaffold.shared_files import create_shared_files
 from jvis.scaffold.stack_runner import run_stack
 from jvis.stacks.registry import get_stack
@@ -220,6 +220,27 @@ class TestStackRunner:
             assert "{{" not in f, "Jinja2 artifacts found in rendered file"
             assert "{%" not in f, "Jinja2 artifacts found in rendered file"
 
+    def test_python_fastapi_unit_of_work(self, tmp_path):
+        """Repositories only flush; get_session commits once per request."""
+        stack = get_stack("python-fastapi")
+        assert stack is not None
+        run_stack(stack, tmp_path, "my-api", "Test API", "postgresql", ScaffoldOptions(bulk_endpoints=True))
+
+        repo = (tmp_path / "src" / "infrastructure" / "repositories" / "item_repository.py").read_text()
+        assert "commit()" not in repo
+        assert "refresh(" not in repo
+        assert "flush()" in repo
+
+        db_content = (tmp_path / "src" / "infrastructure" / "database.py").read_text()
+        assert "session.begin()" in db_content
+        ctrl = (tmp_path / "src" / "controllers" / "api" / "items.py").read_text()
+        assert 'Depends(get_session, scope="function")' in ctrl
+        entity = (tmp_path / "src" / "domain" / "entities" / "item.py").read_text()
+        assert '"eager_defaults": True' in entity
+
+        uow_tests = (tmp_path / "tests" / "test_unit_of_work.py").read_text()
+        assert 'db_calls.verbs() == ["INSERT"]' in uow_tests
+
     def test_run_react_vite_stack(self, tmp_path):
         stack = get_stack("react-vite")
         assert stack is not None
@@ -1273,21 +1294,17 @@ class TestCreateContextMap:
         assert "dependencies" not in frontmatter
         assert "name" not in frontmatter  # project name lives in pyproject.toml
 
-    @patch("jvis.scaffold.docs_structure.subprocess.run")
-    def test_git_detection_with_valid_repo(self, mock_run, tmp_path):
-        """Test that git branch/remote are detected from a real repo."""
+    def test_git_detection_with_valid_repo(self, tmp_path):
+        """Branch and remote are read from .git without running git."""
         (tmp_path / "docs" / "notes").mkdir(parents=True)
-
-        def side_effect(cmd, **kwargs):
-            if "symbolic-ref" in cmd:
-                return subprocess.CompletedProcess(cmd, 0, stdout="develop\n", stderr="")
-            if "get-url" in cmd:
-                return subprocess.CompletedProcess(cmd, 0, stdout="git@github.com:user/repo.git\n", stderr="")
-            return subprocess.CompletedProcess(cmd, 1, stdout="", stderr="")
-
-        mock_run.side_effect = side_effect
-
-        create_context_map(tmp_path, "python-fastapi", "postgresql", "python")
+        git_dir = tmp_path / ".git"
+        (git_dir / "objects").mkdir(parents=True)
+        (git_dir / "refs").mkdir()
+        (git_dir / "HEAD").write_text("ref: refs/heads/develop\n")
+        (git_dir / "config").write_text('[remote "origin"]\n\turl = git@github.com:user/repo.git\n')
+
+        with patch("jvis.utils.git.subprocess.run", side_effect=AssertionError("git was executed")):
+            create_context_map(tmp_path, "python-fastapi", "postgresql", "python")
         content = (tmp_path / "docs" / "notes" / "context-map.md").read_text()
         parts = content.split("---")
         frontmatter = yaml.safe_load(parts[1])
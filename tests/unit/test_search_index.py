@@ -0,0 +1,93 @@
+"""Tests for jvis.search.index and ``jvis search``."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from jvis.cli import cli
+from jvis.search.index import SearchIndex, tokenize
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    files = {
+        "docs/stories/1.1.auth.md": "# Story 1.1: Login\n\nUsers authenticate with OAuth tokens.\n",
+        "docs/stories/1.2.cart.md": "# Story 1.2: Cart\n\nAdd items to the cart. Cart totals update.\n",
+        "docs/qa/gates/1.1-login.yml": "title: Login gate\ngate: PASS\nnotes: oauth flow verified\n",
+        "docs/notes/project-log.md": "# Project Log\n\nDiscussed the cart redesign.\n",
+        ".jvis/agents/core/qa.yaml": "id: qa\nname: Quinn\nwhenToUse: quality gates and test architecture\n",
+        "docs/image.png": "not indexed",
+    }
+    for rel, text in files.items():
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text(text)
+    return tmp_path
+
+
+def test_tokenize() -> None:
+    assert tokenize("The OAuth-2 flow, a 1.1 story") == ["oauth", "2", "flow", "1", "1", "story"]
+
+
+class TestSearchIndex:
+    def test_ranks_with_bm25(self, project: Path) -> None:
+        with SearchIndex(project) as index:
+            stats = index.refresh()
+            assert stats.added == 5
+            hits = index.search("cart")
+        assert [h.path for h in hits] == ["docs/stories/1.2.cart.md", "docs/notes/project-log.md"]
+        assert hits[0].title == "Story 1.2: Cart"
+        assert hits[0].snippet.startswith("# Story 1.2")
+
+    def test_prefix_and_within(self, project: Path) -> None:
+        with SearchIndex(project) as index:
+            index.refresh()
+            assert {h.path for h in index.search("oauth")} == {
+                "docs/stories/1.1.auth.md",
+                "docs/qa/gates/1.1-login.yml",
+            }
+            assert [h.path for h in index.search("authent*")] == ["docs/stories/1.1.auth.md"]
+            assert [h.path for h in index.search("oauth", within="docs/qa")] == ["docs/qa/gates/1.1-login.yml"]
+            assert [h.title for h in index.search("quality", within=".jvis/agents")] == ["Quinn"]
+            assert index.search("nonexistentterm") == []
+
+    def test_incremental_refresh(self, project: Path) -> None:
+        with SearchIndex(project) as index:
+            index.refresh()
+        story = project / "docs" / "stories" / "1.2.cart.md"
+        story.write_text("# Story 1.2: Checkout\n\nPay with stripe.\n")
+        os.utime(story, ns=(1, 1))
+        (project / "docs" / "notes" / "project-log.md").unlink()
+
+        with SearchIndex(project) as index:
+            stats = index.refresh()
+            assert (stats.added, stats.updated, stats.removed, stats.unchanged) == (0, 1, 1, 3)
+            assert index.search("cart") == []
+            assert [h.path for h in index.search("stripe")] == ["docs/stories/1.2.cart.md"]
+            assert index.refresh().changed == 0
+
+    def test_not_a_jvis_project_is_indexed_in_memory(self, tmp_path: Path) -> None:
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "readme.md").write_text("# Readme\n\nOAuth setup.\n")
+        with SearchIndex(tmp_path) as index:
+            assert index.refresh().added == 1
+            assert [h.path for h in index.search("oauth")] == ["docs/readme.md"]
+        assert not (tmp_path / ".jvis").exists()
+
+
+class TestSearchCommand:
+    def test_json(self, project: Path) -> None:
+        result = CliRunner().invoke(cli, ["search", "oauth login", str(project), "--json"])
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["documents"] == 5
+        assert data["hits"][0]["path"] in {"docs/stories/1.1.auth.md", "docs/qa/gates/1.1-login.yml"}
+
+    def test_no_matches(self, project: Path) -> None:
+        result = CliRunner().invoke(cli, ["search", "zebra", str(project)])
+        assert result.exit_code == 1
+        assert "No matches" in result.output
@@ -0,0 +1,211 @@
+"""Tests for jvis.serve (the ``jvis serve`` scaffold service)."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+import zipfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import click
+import pytest
+
+from jvis.commands.primary import ProjectConfig
+from jvis.serve import RequestError, ScaffoldResult, ScaffoldService, ServiceSettings, build_config, make_server
+
+
+class _Client:
+    def __init__(self, base: str) -> None:
+        self.base = base
+
+    def request(self, method: str, path: str, body: Any = None) -> tuple[int, dict[str, str], bytes]:
+        data = json.dumps(body).encode() if body is not None else None
+        req = urllib.request.Request(self.base + path, data=data, method=method)
+        try:
+            with urllib.request.urlopen(req, timeout=30) as resp:
+                return resp.status, dict(resp.headers), resp.read()
+        except urllib.error.HTTPError as exc:
+            return exc.code, dict(exc.headers), exc.read()
+
+
+def _blocking_run(release: threading.Event):
+    """A ``ScaffoldService._run`` stand-in that waits for *release*."""
+
+    def run(request_id: str, config: ProjectConfig, _archive_format: str, _expired: threading.Event) -> ScaffoldResult:
+        release.wait(5)
+        return ScaffoldResult(
+            id=request_id, name=config.project_name, project_dir=config.project_dir, files=0, elapsed_ms=0.0
+        )
+
+    return run
+
+
+@pytest.fixture
+def service(tmp_path: Path) -> Iterator[ScaffoldService]:
+    svc = ScaffoldService(ServiceSettings(output_root=tmp_path / "out", workers=1, queue=0, timeout=30))
+    yield svc
+    svc.close()
+
+
+@pytest.fixture
+def client(service: ScaffoldService) -> Iterator[_Client]:
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield _Client(f"http://{host}:{port}")
+    server.shutdown()
+    server.server_close()
+
+
+class TestBuildConfig:
+    def test_single_stack(self, tmp_path: Path) -> None:
+        config = build_config({"name": "demo", "stack": "python-fastapi"}, tmp_path / "r1")
+        assert config.project_dir == tmp_path / "r1" / "demo"
+        assert config.project_type == "single" and config.database == "postgresql"
+
+    def test_monorepo(self, tmp_path: Path) -> None:
+        config = build_config({"name": "demo", "backend": "python-fastapi", "frontend": "react-vite"}, tmp_path)
+        assert config.project_type == "fullstack"
+        assert config.stacks["backend"].id == "python-fastapi"
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"stack": "python-fastapi"},
+            {"name": "demo", "stack": "nope"},
+            {"name": "demo", "backend": "python-fastapi"},
+            {"name": "demo", "stack": "python-fastapi", "dockerfile": "huge"},
+            {"name": "demo", "stack": "python-fastapi", "database": ["pg"]},
+            {"name": "demo", "stack": "python-fastapi", "platforms": 5},
+            {"name": "demo", "stack": "python-fastapi", "platforms": [["claude"]]},
+            {"name": "demo", "stack": "python-fastapi", "dockerfile": ["static"]},
+            {"name": "demo", "stack": ["python-fastapi"]},
+            {"name": "demo", "backend": {"id": "python-fastapi"}, "frontend": "react-vite"},
+        ],
+    )
+    def test_invalid(self, tmp_path: Path, payload: dict[str, Any]) -> None:
+        with pytest.raises((ValueError, click.ClickException)):
+            build_config(payload, tmp_path)
+
+
+class TestScaffoldService:
+    def test_warm_loads_stacks_and_templates(self, service: ScaffoldService) -> None:
+        warmup = service.warm()
+        assert warmup["stacks"] > 0 and warmup["templates"] > 0
+        assert service.health()["warmup"] == warmup
+
+    def test_queue_full_is_rejected(self, service: ScaffoldService, monkeypatch: pytest.MonkeyPatch) -> None:
+        release = threading.Event()
+        monkeypatch.setattr(service, "_run", _blocking_run(release))
+        first = threading.Thread(target=service.scaffold, args=({"name": "one", "stack": "react-vite"},))
+        first.start()
+        while service.health()["busy"] == 0:
+            time.sleep(0.01)
+        with pytest.raises(RequestError) as exc:
+            service.scaffold({"name": "two", "stack": "react-vite"})
+        assert exc.value.status == 503
+        release.set()
+        first.join()
+        assert service.metrics.snapshot()["scaffolds"]["rejected"] == 1
+
+    def test_timeout(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        svc = ScaffoldService(ServiceSettings(output_root=tmp_path, workers=1, queue=0, timeout=0.05))
+        release = threading.Event()
+        monkeypatch.setattr(svc, "_run", _blocking_run(release))
+        with pytest.raises(RequestError) as exc:
+            svc.scaffold({"name": "slow", "stack": "react-vite"})
+        assert exc.value.status == 504
+        release.set()
+        svc.close()
+        assert svc.health()["busy"] == 0
+
+    def test_timed_out_requests_are_dropped(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        ran: list[str] = []
+
+        async def slow_scaffold(config: ProjectConfig, **_kwargs: Any) -> None:
+            ran.append(config.project_name)
+            await asyncio.sleep(0.4)
+
+        monkeypatch.setattr("jvis.api.scaffold", slow_scaffold)
+        svc = ScaffoldService(ServiceSettings(output_root=tmp_path, workers=1, queue=4, timeout=0.2))
+        statuses: list[int] = []
+
+        def request(name: str) -> None:
+            try:
+                svc.scaffold({"name": name, "stack": "react-vite"})
+            except RequestError as exc:
+                statuses.append(exc.status)
+
+        threads = [threading.Thread(target=request, args=(f"p{i}x",)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        svc.close()
+
+        assert statuses == [504, 504, 504]
+        assert len(ran) == 1  # only the scaffold already running when its request timed out
+        scaffolds = svc.metrics.snapshot()["scaffolds"]
+        assert scaffolds["timeout"] == 3 and scaffolds["ok"] == 0
+
+
+class TestHttp:
+    def test_health_and_stacks(self, client: _Client) -> None:
+        status, _, body = client.request("GET", "/health")
+        assert status == 200 and json.loads(body)["status"] == "ok"
+        status, _, body = client.request("GET", "/stacks")
+        assert status == 200 and "python-fastapi" in {s["id"] for s in json.loads(body)["stacks"]}
+
+    def test_unknown_route_and_bad_body(self, client: _Client) -> None:
+        assert client.request("GET", "/nope")[0] == 404
+        assert client.request("POST", "/nope", {})[0] == 404
+        status, _, body = client.request("POST", "/scaffold", {"name": "demo", "stack": "nope"})
+        assert status == 400 and "error" in json.loads(body)
+        assert client.request("POST", "/scaffold", [1, 2])[0] == 400
+
+    @pytest.mark.parametrize("field", [{"archive": ["zip"]}, {"database": ["pg"]}, {"platforms": 5}])
+    def test_wrong_field_types_are_bad_requests(self, client: _Client, field: dict[str, Any]) -> None:
+        status, _, body = client.request("POST", "/scaffold", {"name": "xx", "stack": "python-fastapi", **field})
+        assert status == 400 and "must be" in json.loads(body)["error"]
+
+    def test_unexpected_error_is_a_500(
+        self, client: _Client, service: ScaffoldService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def boom(_payload: dict[str, Any]) -> None:
+            raise TypeError("boom")
+
+        monkeypatch.setattr(service, "scaffold", boom)
+        status, _, body = client.request("POST", "/scaffold", {"name": "xx", "stack": "python-fastapi"})
+        assert status == 500 and json.loads(body) == {"error": "Internal server error."}
+
+    def test_scaffold_json(self, client: _Client, service: ScaffoldService) -> None:
+        status, headers, body = client.request("POST", "/scaffold", {"name": "demo", "stack": "python-fastapi"})
+        assert status == 201, body
+        data = json.loads(body)
+        assert headers["X-Jvis-Request-Id"] == data["id"]
+        project = Path(data["project_dir"])
+        assert project == service.settings.output_root / data["id"] / "demo"
+        assert (project / ".jvis").is_dir() and data["files"] > 0
+        assert "Initializing git..." in data["log"]
+
+        metrics = json.loads(client.request("GET", "/metrics")[2])
+        assert metrics["scaffolds"]["ok"] == 1
+        assert metrics["requests"]["POST /scaffold 201"] == 1
+
+    def test_scaffold_zip(self, client: _Client, service: ScaffoldService) -> None:
+        status, headers, body = client.request(
+            "POST", "/scaffold", {"name": "web", "stack": "react-vite", "archive": "zip"}
+        )
+        assert status == 200
+        assert headers["Content-Type"] == "application/zip"
+        names = zipfile.ZipFile(io.BytesIO(body)).namelist()
+        assert any(name.startswith("web/.jvis/") for name in names)
+        assert not any(service.settings.output_root.iterdir())  # archived output is not kept
@@ -0,0 +1,110 @@
+"""Tests for --server-profile — dev vs prod server setup for Python backends."""
+
+from __future__ import annotations
+
+import runpy
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from jvis.scaffold.options import ScaffoldOptions
+from jvis.scaffold.stack_runner import run_stack
+from jvis.stacks.registry import get_stack
+
+PYTHON_STACKS = ["python-fastapi", "python-flask", "python-django"]
+
+HEALTH_PATHS = {
+    "python-fastapi": "/api/health",
+    "python-flask": "/api/health",
+    "python-django": "/api/health/",
+}
+
+
+def _scaffold(tmp_path: Path, stack_id: str, profile: str, dockerfile: str = "static") -> Path:
+    stack = get_stack(stack_id)
+    assert stack is not None
+    run_stack(
+        stack, tmp_path, "demo-app", "", "postgresql", ScaffoldOptions(dockerfile=dockerfile, server_profile=profile)
+    )
+    return tmp_path
+
+
+def _load_gunicorn_conf(project: Path, env: dict[str, str] | None = None, cpus: int = 4) -> dict:
+    with patch("multiprocessing.cpu_count", return_value=cpus), patch.dict("os.environ", env or {}, clear=False):
+        return runpy.run_path(str(project / "gunicorn.conf.py"))
+
+
+class TestDevProfile:
+    @pytest.mark.parametrize("stack_id", PYTHON_STACKS)
+    def test_no_gunicorn_config(self, tmp_path: Path, stack_id: str) -> None:
+        project = _scaffold(tmp_path, stack_id, "dev")
+        assert not (project / "gunicorn.conf.py").exists()
+        assert "HEALTHCHECK" not in (project / "Dockerfile").read_text()
+        assert "serve:" not in (project / "Makefile").read_text()
+
+
+class TestProdProfile:
+    @pytest.mark.parametrize("stack_id", PYTHON_STACKS)
+    def test_dockerfile_runs_gunicorn_config_with_healthcheck(self, tmp_path: Path, stack_id: str) -> None:
+        content = (_scaffold(tmp_path, stack_id, "prod") / "Dockerfile").read_text()
+        assert 'CMD ["gunicorn", "-c", "gunicorn.conf.py"]' in content
+        assert f"http://127.0.0.1:8000{HEALTH_PATHS[stack_id]}" in content
+
+    @pytest.mark.parametrize("stack_id", PYTHON_STACKS)
+    def test_generated_dockerfile_uses_profile_overrides(self, tmp_path: Path, stack_id: str) -> None:
+        content = (_scaffold(tmp_path, stack_id, "prod", dockerfile="generated") / "Dockerfile").read_text()
+        production = content.split("AS production")[-1]
+        assert "HEALTHCHECK" in production
+        assert production.index("HEALTHCHECK") < production.index('CMD ["gunicorn", "-c", "gunicorn.conf.py"]')
+
+    @pytest.mark.parametrize("stack_id", PYTHON_STACKS)
+    def test_makefile_serve_target(self, tmp_path: Path, stack_id: str) -> None:
+        makefile = (_scaffold(tmp_path, stack_id, "prod") / "Makefile").read_text()
+        assert "serve:  ## Start production server" in makefile
+        assert "\tgunicorn -c gunicorn.conf.py" in makefile
+
+    @pytest.mark.parametrize("stack_id", PYTHON_STACKS)
+    def test_gunicorn_config_tuning(self, tmp_path: Path, stack_id: str) -> None:
+        conf = _load_gunicorn_conf(_scaffold(tmp_path, stack_id, "prod"))
+        assert conf["bind"] == "0.0.0.0:8000"
+        assert conf["keepalive"] == 5
+        assert conf["max_requests"] == 1000
+        assert conf["max_requests_jitter"] == 100
+
+    def test_fastapi_uses_one_uvicorn_worker_per_cpu(self, tmp_path: Path) -> None:
+        project = _scaffold(tmp_path, "python-fastapi", "prod")
+        conf = _load_gunicorn_conf(project, cpus=4)
+        assert conf["worker_class"] == "uvicorn_worker.UvicornWorker"
+        assert conf["wsgi_app"] == "src.main:app"
+        assert conf["workers"] == 4
+        requirements = (project / "requirements.txt").read_text()
+        assert "gunicorn>=" in requirements
+        assert "uvicorn-worker>=" in requirements
+        assert "uvicorn[standard]" in requirements
+
+    def test_flask_defaults_to_gthread_and_allows_gevent(self, tmp_path: Path) -> None:
+        project = _scaffold(tmp_path, "python-flask", "prod")
+        conf = _load_gunicorn_conf(project, cpus=4)
+        assert conf["worker_class"] == "gthread"
+        assert conf["workers"] == 9
+        assert conf["wsgi_app"] == "wsgi:app"
+        assert _load_gunicorn_conf(project, {"GUNICORN_WORKER_CLASS": "gevent"})["worker_class"] == "gevent"
+
+    def test_django_switches_to_asgi_for_uvicorn_workers(self, tmp_path: Path) -> None:
+        project = _scaffold(tmp_path, "python-django", "prod")
+        assert _load_gunicorn_conf(project)["wsgi_app"] == "config.wsgi:application"
+        conf = _load_gunicorn_conf(project, {"GUNICORN_WORKER_CLASS": "uvicorn_worker.UvicornWorker"}, cpus=4)
+        assert conf["wsgi_app"] == "config.asgi:application"
+        assert conf["workers"] == 4
+
+    def test_env_overrides_worker_count(self, tmp_path: Path) -> None:
+        project = _scaffold(tmp_path, "python-fastapi", "prod")
+        assert _load_gunicorn_conf(project, {"WEB_CONCURRENCY": "2", "PORT": "9000"})["workers"] == 2
+        assert _load_gunicorn_conf(project, {"PORT": "9000"})["bind"] == "0.0.0.0:9000"
+
+
+class TestNonPythonStacks:
+    def test_profile_is_ignored(self, tmp_path: Path) -> None:
+        project = _scaffold(tmp_path, "nodejs-express", "prod")
+        assert not (project / "gunicorn.conf.py").exists()
@@ -0,0 +1,130 @@
+"""Tests for jvis.sharding and ``jvis shard``."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from jvis.cli import cli
+from jvis.sharding import MANIFEST_FILE, shard_document, shard_targets, slugify, split_sections
+from jvis.utils.tokens import estimate_tokens
+
+PRD = """\
+# Product Requirements
+
+Intro paragraph.
+
+## Goals
+
+Ship it.
+
+### Success Metrics
+
+- fast
+
+## Requirements
+
+```markdown
+## Not a heading
+```
+
+FR1: things.
+
+## Goals
+
+Duplicate title.
+"""
+
+
+def _project(tmp_path: Path, config: str = "") -> Path:
+    (tmp_path / ".jvis").mkdir()
+    (tmp_path / ".jvis" / "core-config.yaml").write_text(config)
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "prd.md").write_text(PRD)
+    return tmp_path
+
+
+class TestSplitSections:
+    def test_splits_on_level_two_outside_fences(self) -> None:
+        preamble, sections = split_sections(PRD)
+        assert preamble == "# Product Requirements\n\nIntro paragraph."
+        assert [s.slug for s in sections] == ["goals", "requirements", "goals-2"]
+        assert sections[0].text.startswith("# Goals\n")
+        assert "## Success Metrics" in sections[0].text
+        assert "## Not a heading" in sections[1].text  # fenced code is left alone
+
+    def test_slugify(self) -> None:
+        assert slugify("3. Tech Stack") == "3-tech-stack"
+        assert slugify("`API` *Spec*") == "api-spec"
+        assert slugify("???") == "section"
+
+    def test_estimate_tokens(self) -> None:
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcde") == 2
+
+
+class TestShardDocument:
+    def test_writes_shards_and_index(self, tmp_path: Path) -> None:
+        project = _project(tmp_path)
+        target = shard_targets(project)["prd"]
+        result = shard_document(target, project)
+
+        shards = project / "docs" / "prd"
+        assert sorted(result.written) == ["goals-2.md", "goals.md", "index.md", "requirements.md"]
+        assert (shards / "goals.md").read_text().startswith("# Goals")
+        index = (shards / "index.md").read_text()
+        assert index.startswith("# Product Requirements")
+        assert "| [Requirements](./requirements.md) |" in index
+        assert json.loads((shards / MANIFEST_FILE).read_text())["source"] == "docs/prd.md"
+
+    def test_reshard_rewrites_only_changed_sections(self, tmp_path: Path) -> None:
+        project = _project(tmp_path)
+        target = shard_targets(project)["prd"]
+        shard_document(target, project)
+
+        again = shard_document(target, project)
+        assert again.written == [] and again.removed == []
+
+        edited = PRD.replace("Ship it.", "Ship it today.").replace("## Goals\n\nDuplicate title.\n", "")
+        (project / "docs" / "prd.md").write_text(edited)
+        result = shard_document(target, project)
+        assert result.written == ["goals.md", "index.md"]
+        assert result.removed == ["goals-2.md"]
+        assert not (project / "docs" / "prd" / "goals-2.md").exists()
+
+    def test_configured_locations(self, tmp_path: Path) -> None:
+        config = "prd:\n  prdFile: docs/product.md\n  prdSharded: true\n  prdShardedLocation: docs/shards/prd\n"
+        targets = shard_targets(_project(tmp_path, config))
+        assert targets["prd"].source == tmp_path / "docs" / "product.md"
+        assert targets["prd"].location == tmp_path / "docs" / "shards" / "prd"
+        assert targets["prd"].enabled
+        assert targets["architecture"].location == tmp_path / "docs" / "architecture"
+        assert not targets["architecture"].enabled
+
+
+class TestShardCommand:
+    def test_shards_enabled_documents(self, tmp_path: Path) -> None:
+        project = _project(tmp_path, "prd:\n  prdSharded: true\n")
+        result = CliRunner().invoke(cli, ["shard", str(project), "--json"])
+        assert result.exit_code == 0, result.output
+        (entry,) = json.loads(result.output)
+        assert entry["name"] == "prd"
+        assert entry["tokens"] == sum(s["tokens"] for s in entry["shards"])
+
+    def test_nothing_enabled(self, tmp_path: Path) -> None:
+        result = CliRunner().invoke(cli, ["shard", str(_project(tmp_path))])
+        assert result.exit_code == 1
+        assert "No documents to shard" in result.output
+
+    def test_dry_run_and_missing_source(self, tmp_path: Path) -> None:
+        project = _project(tmp_path)
+        result = CliRunner().invoke(cli, ["shard", str(project), "-d", "prd", "--dry-run"])
+        assert result.exit_code == 0, result.output
+        assert "Dry run" in result.output
+        assert not (project / "docs" / "prd").exists()
+
+        result = CliRunner().invoke(cli, ["shard", str(project), "--doc", "architecture"])
+        assert result.exit_code == 1
+        assert "not found" in result.output
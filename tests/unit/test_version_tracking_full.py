@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pytest
 import yaml
 
-from jvis.version_tracking import detect_source_mode, read_provenance, stamp_version
+from jvis.version_tracking import (
+    PROVENANCE_FILE,
+    detect_source_mode,
+    read_provenance,
+    read_provenance_many,
+    stamp_version,
+)
 
 
 @pytest.fixture
@@ -57,6 +64,57 @@ class TestReadProvenance:
         result = read_provenance(project_dir)
         assert result["jvis_installed_version"] == "3.0.0"
 
+    def test_prefers_provenance_json(self, project_dir: Path):
+        """provenance.json is the source of truth; core-config.yaml mirrors it."""
+        stamp_version(project_dir, "3.0.0", "pip", "abc123")
+        record = json.loads((project_dir / PROVENANCE_FILE).read_text())
+        assert record["jvis_installed_version"] == "3.0.0"
+        assert record["jvis_framework_hash"] == "abc123"
+        assert 'jvis_installed_version: "3.0.0"' in (project_dir / ".jvis" / "core-config.yaml").read_text()
+
+        record["jvis_installed_version"] = "4.0.0"
+        (project_dir / PROVENANCE_FILE).write_text(json.dumps(record))
+        result = read_provenance(project_dir)
+        assert result["jvis_installed_version"] == "4.0.0"
+        assert result["jvis_framework_hash"] == "abc123"
+
+    def test_legacy_core_config_fallback(self, project_dir: Path):
+        """Projects stamped before provenance.json still read from core-config.yaml."""
+        stamp_version(project_dir, "1.2.3", "dev")
+        (project_dir / PROVENANCE_FILE).unlink()
+        assert read_provenance(project_dir)["jvis_installed_version"] == "1.2.3"
+
+    def test_corrupt_json_falls_back(self, project_dir: Path):
+        stamp_version(project_dir, "1.2.3", "dev")
+        (project_dir / PROVENANCE_FILE).write_text("{not json")
+        assert read_provenance(project_dir)["jvis_installed_version"] == "1.2.3"
+
+
+class TestReadProvenanceMany:
+    def test_reads_in_order(self, tmp_path: Path):
+        targets = []
+        for i in range(5):
+            target = tmp_path / f"p{i}"
+            (target / ".jvis").mkdir(parents=True)
+            (target / ".jvis" / "core-config.yaml").write_text("project_name: x\n")
+            stamp_version(target, f"1.0.{i}", "pip")
+            targets.append(target)
+        targets.append(tmp_path / "missing")
+
+        result = read_provenance_many(targets, max_workers=3)
+        assert list(result) == targets
+        assert [r.get("jvis_installed_version") for r in result.values()] == [
+            "1.0.0",
+            "1.0.1",
+            "1.0.2",
+            "1.0.3",
+            "1.0.4",
+            None,
+        ]
+
+    def test_empty(self):
+        assert read_provenance_many([]) == {}
+
 
 class TestDetectSourceMode:
     def test_returns_dev_or_pip(self):
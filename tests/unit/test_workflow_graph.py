@@ -0,0 +1,205 @@
+"""Tests for jvis.workflow.graph and ``jvis workflow``."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from jvis.cli import cli
+from jvis.utils.paths import get_jvis_home
+from jvis.workflow import graph as graph_mod
+from jvis.workflow.graph import CACHE_PATH, compile_workflow, load_workflows, next_steps
+
+_LINEAR = """\
+workflow:
+  id: demo
+  name: Demo
+  type: greenfield
+  sequence:
+    - agent: analyst
+      creates: project-brief.md
+    - agent: pm
+      creates: prd.md
+      requires: project-brief.md
+    - agent: architect
+      creates: architecture.md
+      requires: prd.md
+    - agent: pm
+      updates: prd.md (if needed)
+      requires: architecture.md
+      condition: architecture_suggests_prd_changes
+    - agent: po
+      validates: all_artifacts
+    - agent: po
+      action: shard_documents
+      creates: sharded_docs
+      requires: all_artifacts_in_project
+    - agent: sm
+      action: create_story
+      creates: story.md
+      requires: sharded_docs
+    - agent: dev
+      action: implement_story
+      creates: implementation_files
+      requires: story.md
+"""
+
+_CYCLE = """\
+workflow:
+  id: loop
+  sequence:
+    - agent: a
+      creates: one.md
+      requires: two.md
+    - agent: b
+      creates: two.md
+      requires: one.md
+    - agent: c
+      creates: three.md
+      requires: nobody_makes_this
+"""
+
+
+def _ids(steps) -> list[str]:
+    return [s.id for s in steps]
+
+
+class TestCompile:
+    def test_steps_and_edges(self) -> None:
+        graph = compile_workflow(_LINEAR, "demo.yaml")
+        assert graph.id == "demo"
+        assert _ids(graph.steps)[:3] == ["analyst:project-brief.md", "pm:prd.md", "architect:architecture.md"]
+        assert (0, 1) in graph.edges and (1, 2) in graph.edges
+        # updates do not produce: no prd.md edge back from the update step.
+        assert not any(a == 3 for a, _ in graph.edges)
+        assert graph.valid
+
+    def test_names_normalized(self) -> None:
+        graph = compile_workflow(_LINEAR)
+        assert graph.steps[3].updates == ["prd.md"]
+        assert graph.steps[4].creates == ["all_artifacts"]
+        assert graph.steps[5].requires == [["all_artifacts"]]
+
+    def test_free_text_and_alternatives(self) -> None:
+        text = """\
+workflow:
+  sequence:
+    - agent: architect
+      creates: multiple documents per the document-project template
+    - agent: pm
+      creates: prd.md
+      requires: existing_documentation_or_analysis
+    - agent: sm
+      creates: story.md
+      requires: sharded_docs_or_prd.md
+"""
+        graph = compile_workflow(text)
+        assert graph.steps[0].creates == []
+        assert graph.steps[2].requires == [["sharded_docs", "prd.md"]]
+        assert graph.valid
+
+    def test_missing_producer_and_cycle(self) -> None:
+        graph = compile_workflow(_CYCLE)
+        assert graph.missing == [{"step": "c:three.md", "artifact": "nobody_makes_this"}]
+        assert graph.cycles == [["a:one.md", "b:two.md"]]
+        assert not graph.valid
+
+    def test_duplicate_ids_disambiguated(self) -> None:
+        text = "workflow:\n  sequence:\n    - agent: po\n      action: review\n    - agent: po\n      action: review\n"
+        assert _ids(compile_workflow(text).steps) == ["po:review", "po:review#2"]
+
+    def test_shipped_workflows_valid(self) -> None:
+        for path in sorted((get_jvis_home() / ".jvis" / "workflows").glob("*.yaml")):
+            graph = compile_workflow(path.read_text(encoding="utf-8"), path.name)
+            assert graph.valid, (path.name, graph.missing, graph.cycles)
+
+
+class TestNextSteps:
+    def test_start(self) -> None:
+        graph = compile_workflow(_LINEAR)
+        assert _ids(next_steps(graph, set()).runnable) == ["analyst:project-brief.md"]
+
+    def test_after_prd(self) -> None:
+        graph = compile_workflow(_LINEAR)
+        result = next_steps(graph, {"project-brief.md", "prd.md"})
+        assert _ids(result.runnable) == ["architect:architecture.md"]
+        assert result.done == ["analyst:project-brief.md", "pm:prd.md"]
+
+    def test_conditional_step_does_not_block(self) -> None:
+        graph = compile_workflow(_LINEAR)
+        result = next_steps(graph, {"project-brief.md", "prd.md", "architecture.md"})
+        assert _ids(result.runnable) == ["pm:prd.md#2", "po:all_artifacts"]
+
+    def test_later_artifact_marks_earlier_steps_done(self) -> None:
+        graph = compile_workflow(_LINEAR)
+        result = next_steps(graph, {"story.md"})
+        assert _ids(result.runnable) == ["dev:implement_story"]
+        assert "po:all_artifacts" in result.done
+
+
+class TestLoadWorkflows:
+    @pytest.fixture
+    def project(self, tmp_path: Path) -> Path:
+        workflows = tmp_path / ".jvis" / "workflows"
+        workflows.mkdir(parents=True)
+        (workflows / "demo.yaml").write_text(_LINEAR)
+        return tmp_path
+
+    def test_cache_keyed_by_hash(self, project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (graph,) = load_workflows(project)
+        cache = json.loads((project / CACHE_PATH).read_text())
+        assert list(cache["graphs"]) == [graph.sha256]
+
+        calls: list[str] = []
+        real = graph_mod.compile_workflow
+        monkeypatch.setattr(graph_mod, "compile_workflow", lambda text, source="": calls.append(source) or real(text))
+        assert load_workflows(project)[0].to_dict() == graph.to_dict()
+        assert calls == []
+
+        (project / ".jvis" / "workflows" / "demo.yaml").write_text(_LINEAR.replace("Demo", "Renamed"))
+        assert load_workflows(project)[0].name == "Renamed"
+        assert calls == ["demo.yaml"]
+        assert len(json.loads((project / CACHE_PATH).read_text())["graphs"]) == 1
+
+    def test_cli_next_json(self, project: Path) -> None:
+        (project / "docs").mkdir()
+        (project / "docs" / "project-brief.md").write_text("brief")
+        result = CliRunner().invoke(cli, ["workflow", "next", "demo", str(project), "--json"])
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert [s["id"] for s in data["runnable"]] == ["pm:prd.md"]
+        assert data["present"] == ["project-brief.md"]
+
+    def test_cli_next_sees_artifact_filled_in_place(self, project: Path) -> None:
+        brief = project / "docs" / "project-brief.md"
+        brief.parent.mkdir()
+        brief.write_text("")
+        past = time.time() - 10  # old enough for the artifact index to reuse docs/
+        os.utime(brief, (past, past))
+        os.utime(brief.parent, (past, past))
+
+        def runnable() -> list[str]:
+            result = CliRunner().invoke(cli, ["workflow", "next", "demo", str(project), "--json"])
+            assert result.exit_code == 0, result.output
+            return [s["id"] for s in json.loads(result.output)["runnable"]]
+
+        assert runnable() == ["analyst:project-brief.md"]
+        brief.write_text("brief")
+        assert runnable() == ["pm:prd.md"]
+
+    def test_cli_next_unknown(self, project: Path) -> None:
+        result = CliRunner().invoke(cli, ["workflow", "next", "nope", str(project)])
+        assert result.exit_code != 0
+        assert "Available: demo" in result.output
+
+    def test_cli_validate_fails_on_cycle(self, project: Path) -> None:
+        (project / ".jvis" / "workflows" / "loop.yaml").write_text(_CYCLE)
+        result = CliRunner().invoke(cli, ["workflow", "validate", str(project)])
+        assert result.exit_code == 1
+        assert "cycle: a:one.md -> b:two.md -> a:one.md" in result.output
+        assert "missing producer: nobody_makes_this" in result.output